@@ -0,0 +1,476 @@
+"""
+Modbus-Client auf Basis von asyncio für mehrere Antriebe gleichzeitig.
+
+Der ServoModbusClient arbeitet synchron: jede Anfrage blockiert den Thread, bis
+die Antwort da ist, und mehrere Antriebe werden nacheinander abgefragt. Hinter
+einem Modbus-TCP-Gateway oder bei mehreren TCP-Antrieben ist das unnötig
+langsam, weil jeder Teilnehmer seine Antwortzeit unabhängig von den anderen hat.
+
+AsyncServoModbusClient stellt dieselben Zugriffe als Coroutinen bereit. Über TCP
+erhält jede Slave-ID eine eigene Verbindung, so dass Anfragen an verschiedene
+Antriebe gleichzeitig unterwegs sind (pymodbus lässt je Verbindung nur eine
+offene Anfrage zu). Auf einer seriellen Leitung ist nur eine Anfrage zur Zeit
+möglich; dort werden die Anfragen aller Aufrufer über eine gemeinsame Verbindung
+nacheinander abgearbeitet.
+
+Für Qt-Oberfläche und QThread-Worker führt AsyncModbusBridge den Client in einer
+eigenen Ereignisschleife in einem Hintergrund-Thread aus::
+
+    bridge = AsyncModbusBridge()
+    bridge.start()
+    bridge.call(bridge.client.connect(transport='tcp', host='192.168.0.10', slave_ids=[1, 2, 3]))
+    results = bridge.call(bridge.client.read_blocks_all(blocks))      # blockierend (Worker)
+    future = bridge.submit(bridge.client.read_holding_register(2816, 3, slave=2))
+    future.add_done_callback(...)                                     # ohne Blockieren (GUI)
+"""
+
+import asyncio
+import threading
+import time
+
+from custom_exceptions import (
+    ServoToolException,
+    ModbusConnectionException,
+    ModbusReadException,
+    ModbusWriteException,
+    ModbusTimeoutException
+)
+from logger_config import logger
+from modbus_client import (
+    DEFAULT_TCP_PORT,
+    TRANSPORT_RTU_OVER_TCP,
+    TRANSPORT_SERIAL,
+    TRANSPORT_TCP,
+    parse_slave_ids
+)
+from utils.fleet_backup import MAX_INITIAL_FAILURES
+
+# Unterstützte Übertragungswege (eine Wiedergabe gibt es nur für den synchronen Client)
+ASYNC_TRANSPORTS = (TRANSPORT_SERIAL, TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP)
+
+# Exception-Codes eines Gateways, wenn der Ziel-Antrieb nicht antwortet
+GATEWAY_EXCEPTION_CODES = (10, 11)
+
+
+class AsyncServoModbusClient:
+    """Modbus-Zugriffe als Coroutinen, gleichzeitig an mehrere Antriebe (TCP)."""
+
+    def __init__(self, timeout=1.0, retries=0):
+        """
+        Args:
+            timeout: Wartezeit auf eine Antwort in Sekunden
+            retries: Wiederholungen einer Anfrage ohne Antwort
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.transport = TRANSPORT_SERIAL
+        self.slave_id = None
+        self.slave_ids = []
+        self.connected = False
+        self.last_error = None
+        # Slave-ID -> pymodbus-Client; bei seriellen Verbindungen teilen sich alle Slaves einen Client
+        self._clients = {}
+
+    async def connect(self, port=None, baudrate=19200, bytesize=8, parity='E', stopbits=2, slave_id=None,
+                      slave_ids=None, transport=TRANSPORT_SERIAL, host=None, tcp_port=DEFAULT_TCP_PORT):
+        """
+        Stellt die Verbindungen zu den Antrieben her.
+
+        Args:
+            port: Serieller Port (nur bei transport='serial')
+            baudrate, bytesize, parity, stopbits: Schnittstellenparameter der seriellen Leitung
+            slave_id: Standard-Slave-ID für Zugriffe ohne Angabe (Standard: erste aus slave_ids)
+            slave_ids: Liste der Slave-IDs oder Text wie "1-4" (Standard: [slave_id] bzw. [1])
+            transport: 'serial', 'tcp' oder 'rtu_over_tcp'
+            host: Hostname oder IP-Adresse (nur bei TCP)
+            tcp_port: TCP-Port (Standard: 502)
+
+        Returns:
+            bool: True bei erfolgreicher Verbindung
+
+        Raises:
+            ModbusConnectionException: Bei ungültigen Parametern oder Verbindungsfehlern
+        """
+        if transport not in ASYNC_TRANSPORTS:
+            raise ModbusConnectionException(f"Unbekannter Übertragungsweg: {transport}")
+        is_tcp = transport != TRANSPORT_SERIAL
+        if is_tcp and not host:
+            raise ModbusConnectionException("Kein Host angegeben")
+        if not is_tcp and not port:
+            raise ModbusConnectionException("Kein Port angegeben")
+        try:
+            if isinstance(slave_ids, str):
+                slave_ids = parse_slave_ids(slave_ids)
+            elif slave_ids:
+                slave_ids = [int(s) for s in slave_ids]
+            else:
+                slave_ids = [int(slave_id) if slave_id is not None else 1]
+        except (TypeError, ValueError) as e:
+            raise ModbusConnectionException(f"Ungültige Verbindungsparameter: {e}")
+
+        self.close()
+        target = f"{host}:{tcp_port}" if is_tcp else port
+        from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
+        from pymodbus import FramerType
+        if is_tcp:
+            # Eigene Verbindung je Antrieb: pymodbus wartet je Verbindung auf die Antwort,
+            # bevor die nächste Anfrage gesendet wird
+            framer = FramerType.SOCKET if transport == TRANSPORT_TCP else FramerType.RTU
+            clients = {s: AsyncModbusTcpClient(host, framer=framer, port=int(tcp_port), timeout=self.timeout,
+                                               retries=self.retries, reconnect_delay=0)
+                       for s in slave_ids}
+        else:
+            shared = AsyncModbusSerialClient(port, framer=FramerType.RTU, baudrate=int(baudrate),
+                                             bytesize=int(bytesize), parity=parity, stopbits=int(stopbits),
+                                             timeout=self.timeout, retries=self.retries, reconnect_delay=0)
+            clients = {s: shared for s in slave_ids}
+
+        start_time = time.time()
+        unique = list({id(c): c for c in clients.values()}.values())
+        results = await asyncio.gather(*(c.connect() for c in unique), return_exceptions=True)
+        failed = [r for r in results if r is not True]
+        if failed:
+            for client in unique:
+                client.close()
+            error = next((r for r in failed if isinstance(r, Exception)), None)
+            error_msg = f"Modbus-Verbindung konnte nicht hergestellt werden zu {target}"
+            if error is not None:
+                error_msg += f": {error}"
+            self.last_error = error_msg
+            logger.log_modbus_connection(target, False, error_msg)
+            raise ModbusConnectionException(error_msg)
+
+        self._clients = clients
+        self.transport = transport
+        self.slave_ids = slave_ids
+        self.slave_id = int(slave_id) if slave_id is not None else slave_ids[0]
+        self.connected = True
+        logger.log_modbus_connection(target, True)
+        logger.debug(f"Asynchrone Modbus-Verbindung zu {target} ({len(unique)} Verbindungen) "
+                     f"in {time.time() - start_time:.2f}s hergestellt.")
+        return True
+
+    def close(self):
+        """Schließt alle Verbindungen."""
+        for client in {id(c): c for c in self._clients.values()}.values():
+            try:
+                client.close()
+            except Exception as e:
+                logger.warning(f"Fehler beim Trennen der Verbindung: {e}")
+        if self._clients:
+            logger.info("Asynchrone Modbus-Verbindung getrennt.")
+        self._clients = {}
+        self.connected = False
+
+    def get_slave_ids(self):
+        """Gibt alle konfigurierten Slave-IDs zurück."""
+        return list(self.slave_ids)
+
+    def _client_for(self, slave, operation, address):
+        if not self.connected:
+            error_msg = "Keine Verbindung zum Gerät"
+            logger.log_modbus_operation(operation, address, False, error_msg=error_msg)
+            raise ModbusConnectionException(error_msg)
+        client = self._clients.get(slave)
+        if client is None:
+            # Nicht angemeldete Slave-ID: über die Verbindung der Standard-ID (z.B. Broadcast-fähige Gateways)
+            client = self._clients[self.slave_id] if self.slave_id in self._clients else next(iter(self._clients.values()))
+        return client
+
+    async def _execute(self, operation, address, slave, request, exception_type):
+        """
+        Führt eine Anfrage aus und bildet Fehler auf die eigenen Exceptions ab.
+
+        Args:
+            operation: Bezeichnung für das Log ("Lesen", "Schreiben")
+            address: Registeradresse (für Meldungen)
+            slave: Slave-ID
+            request: Funktion, die mit dem pymodbus-Client die Anfrage-Coroutine erzeugt
+            exception_type: Exception für vom Antrieb abgelehnte Anfragen
+
+        Returns:
+            Antwort von pymodbus
+        """
+        from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
+        client = self._client_for(slave, operation, address)
+        try:
+            result = await request(client)
+        except ConnectionException as e:
+            error_msg = f"Verbindungsfehler bei Register {address} (Slave {slave}): {e}"
+            self.last_error = error_msg
+            logger.log_modbus_operation(operation, address, False, error_msg=error_msg)
+            raise ModbusConnectionException(error_msg)
+        except (ModbusIOException, asyncio.TimeoutError) as e:
+            error_msg = f"Keine Antwort von Slave {slave} bei Register {address}: {e}"
+            self.last_error = error_msg
+            logger.log_modbus_operation(operation, address, False, error_msg=error_msg)
+            raise ModbusTimeoutException(error_msg)
+        except ModbusException as e:
+            error_msg = f"Modbus-Fehler bei Register {address} (Slave {slave}): {e}"
+            self.last_error = error_msg
+            logger.log_modbus_operation(operation, address, False, error_msg=error_msg)
+            raise exception_type(error_msg)
+
+        if isinstance(result, ModbusIOException) or result.isError():
+            code = getattr(result, 'exception_code', None)
+            if isinstance(result, ModbusIOException) or not code or code in GATEWAY_EXCEPTION_CODES:
+                # pymodbus meldet ausgebliebene Antworten als Exception-Antwort ohne Code
+                error_msg = f"Keine Antwort von Slave {slave} bei Register {address}"
+                self.last_error = error_msg
+                logger.log_modbus_operation(operation, address, False, error_msg=error_msg)
+                raise ModbusTimeoutException(error_msg)
+            if code == 2:
+                error_msg = f"Ungültige Registeradresse {address}. Das Register existiert nicht oder ist nicht zugreifbar."
+            elif code == 3:
+                error_msg = f"Ungültiger Datenwert für Register {address}."
+            else:
+                error_msg = f"Modbus-Fehler (Code {code}) bei Register {address}: {result}"
+            self.last_error = error_msg
+            logger.log_modbus_operation(operation, address, False, error_msg=error_msg)
+            raise exception_type(error_msg)
+        return result
+
+    async def read_holding_register(self, address, count=1, slave=None):
+        """
+        Liest Holding-Register.
+
+        Args:
+            address: Startadresse (wie in der JSON-Datei)
+            count: Anzahl der Register
+            slave: Slave-ID (Standard: Slave-ID der Verbindung)
+
+        Returns:
+            list: Registerwerte
+
+        Raises:
+            ModbusReadException: Wenn der Antrieb die Anfrage ablehnt
+            ModbusTimeoutException: Wenn keine Antwort kommt
+            ModbusConnectionException: Bei Verbindungsproblemen
+        """
+        slave = self.slave_id if slave is None else slave
+        result = await self._execute(
+            "Lesen", address, slave,
+            lambda client: client.read_holding_registers(address, count=count, slave=slave),
+            ModbusReadException)
+        logger.log_modbus_operation("Lesen", address, True, value=result.registers)
+        return result.registers
+
+    async def read_holding_register_32bit(self, address, is_signed=False, slave=None):
+        """
+        Liest einen 32-Bit-Wert (niederwertiges Wort zuerst).
+
+        Returns:
+            int: 32-Bit-Wert
+        """
+        low, high = await self.read_holding_register(address, count=2, slave=slave)
+        value = low | (high << 16)
+        if is_signed and value & 0x80000000:
+            value -= 0x100000000
+        return value
+
+    async def write_holding_register(self, address, value, slave=None):
+        """
+        Schreibt ein 16-Bit-Holding-Register (Funktionscode 6).
+
+        Args:
+            address: Registeradresse
+            value: Wert (negative Werte werden im Zweierkomplement gesendet)
+            slave: Slave-ID (Standard: Slave-ID der Verbindung)
+
+        Returns:
+            bool: True bei Erfolg
+
+        Raises:
+            ModbusWriteException: Wenn der Antrieb den Wert ablehnt
+            ModbusTimeoutException: Wenn keine Antwort kommt
+            ModbusConnectionException: Bei Verbindungsproblemen
+        """
+        slave = self.slave_id if slave is None else slave
+        register = int(value) & 0xFFFF
+        await self._execute(
+            "Schreiben", address, slave,
+            lambda client: client.write_register(address, register, slave=slave),
+            ModbusWriteException)
+        logger.log_modbus_operation("Schreiben", address, True, value=value)
+        return True
+
+    async def write_holding_register_32bit(self, address, value, slave=None):
+        """
+        Schreibt einen 32-Bit-Wert (Funktionscode 16, niederwertiges Wort zuerst).
+
+        Returns:
+            bool: True bei Erfolg
+        """
+        slave = self.slave_id if slave is None else slave
+        value = int(value) & 0xFFFFFFFF
+        registers = [value & 0xFFFF, value >> 16]
+        await self._execute(
+            "Schreiben", address, slave,
+            lambda client: client.write_registers(address, registers, slave=slave),
+            ModbusWriteException)
+        logger.log_modbus_operation("Schreiben", address, True, value=value)
+        return True
+
+    async def read_blocks(self, blocks, slave=None):
+        """
+        Liest die Blöcke eines Leseplans (utils.block_planner) von einem Antrieb.
+
+        Gleiches Verhalten wie utils.fleet_backup.read_parameters_blockwise: abgelehnte
+        Blöcke werden halbiert, Blöcke ohne Antwort gelten als nicht lesbar.
+
+        Args:
+            blocks: ReadBlock-Liste aus plan_blocks
+            slave: Slave-ID (Standard: Slave-ID der Verbindung)
+
+        Returns:
+            tuple: ({Parametercode: Rohwert}, [nicht lesbare Codes], Anzahl der Anfragen)
+
+        Raises:
+            ModbusConnectionException: Bei Verbindungsverlust
+            ModbusTimeoutException: Wenn der Antrieb auf die ersten Anfragen nicht antwortet
+        """
+        slave = self.slave_id if slave is None else slave
+        values = {}
+        errors = []
+        requests = 0
+        timeouts = 0
+        pending = list(blocks)
+        while pending:
+            block = pending.pop(0)
+            requests += 1
+            try:
+                registers = await self.read_holding_register(block.start, count=block.count, slave=slave)
+                values.update(block.decode(registers))
+            except ModbusConnectionException:
+                raise
+            except ModbusTimeoutException:
+                timeouts += 1
+                if not values and timeouts >= MAX_INITIAL_FAILURES:
+                    raise ModbusTimeoutException(f"Antrieb {slave} antwortet nicht")
+                errors.extend(item.code for item in block.items)
+            except ServoToolException:
+                parts = block.split()
+                if parts:
+                    pending[0:0] = parts
+                else:
+                    errors.extend(item.code for item in block.items)
+        return values, errors, requests
+
+    async def read_blocks_all(self, blocks, slave_ids=None):
+        """
+        Liest einen Leseplan von mehreren Antrieben gleichzeitig.
+
+        Args:
+            blocks: ReadBlock-Liste aus plan_blocks
+            slave_ids: Slave-IDs (Standard: alle der Verbindung)
+
+        Returns:
+            dict: {Slave-ID: (Werte, nicht lesbare Codes, Anfragen) oder ServoToolException}
+        """
+        slave_ids = list(slave_ids) if slave_ids else self.get_slave_ids()
+        results = await asyncio.gather(*(self.read_blocks(blocks, slave=s) for s in slave_ids),
+                                       return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception) and not isinstance(result, ServoToolException):
+                raise result
+        return dict(zip(slave_ids, results))
+
+    async def read_registers_all(self, address, count=1, slave_ids=None):
+        """
+        Liest denselben Registerbereich von mehreren Antrieben gleichzeitig (z.B. Überwachungswerte).
+
+        Returns:
+            dict: {Slave-ID: Registerwerte oder ServoToolException}
+        """
+        slave_ids = list(slave_ids) if slave_ids else self.get_slave_ids()
+        results = await asyncio.gather(
+            *(self.read_holding_register(address, count=count, slave=s) for s in slave_ids),
+            return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception) and not isinstance(result, ServoToolException):
+                raise result
+        return dict(zip(slave_ids, results))
+
+
+class AsyncModbusBridge:
+    """
+    Führt einen AsyncServoModbusClient in einer eigenen Ereignisschleife aus.
+
+    Aufrufe aus anderen Threads (Qt-Hauptthread, QThread-Worker) geben Coroutinen
+    an die Schleife ab. Ergebnisse kommen als concurrent.futures.Future zurück; ihre
+    Callbacks laufen im Thread der Schleife, Qt-Code meldet sie daher per Signal weiter.
+    """
+
+    def __init__(self, client=None):
+        self.client = client if client is not None else AsyncServoModbusClient()
+        self._loop = None
+        self._thread = None
+        self._started = threading.Event()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self._loop.close()
+
+    def start(self):
+        """Startet den Thread mit der Ereignisschleife."""
+        if self.running:
+            return
+        self._started.clear()
+        self._thread = threading.Thread(target=self._run, name="AsyncModbusBridge", daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+    def stop(self):
+        """Schließt die Verbindungen und beendet den Thread."""
+        if not self.running:
+            return
+        self._loop.call_soon_threadsafe(self.client.close)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5.0)
+        self._thread = None
+
+    def submit(self, coroutine):
+        """
+        Übergibt eine Coroutine an die Ereignisschleife, ohne zu warten.
+
+        Returns:
+            concurrent.futures.Future: Ergebnis der Coroutine
+        """
+        if not self.running:
+            coroutine.close()
+            raise ModbusConnectionException("Asynchroner Modbus-Client ist nicht gestartet")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def call(self, coroutine, timeout=None):
+        """
+        Führt eine Coroutine aus und wartet auf das Ergebnis (aus Worker-Threads).
+
+        Raises:
+            ModbusTimeoutException: Wenn das Ergebnis nicht innerhalb von timeout Sekunden vorliegt
+        """
+        future = self.submit(coroutine)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise ModbusTimeoutException(f"Keine Antwort innerhalb von {timeout}s")
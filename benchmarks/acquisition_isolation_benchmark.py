@@ -0,0 +1,148 @@
+"""
+Abtastabstände der Plot-Erfassung bei ausgelasteter Oberfläche: Thread gegen eigenen Prozess.
+
+Die Oberfläche wird durch Python-Code im Hauptthread nachgebildet, der den GIL
+in Stücken von --load-ms hält (wie Neuzeichnen oder Tabellenaufbau). Gemessen
+werden die Abstände der Abtasttermine bei festem Abtastintervall, einmal mit dem
+PlotDataWorker (QThread im selben Prozess) und einmal mit dem Erfassungsprozess
+(utils.acquisition_process). Ohne --port läuft die Messung gegen den virtuellen
+Antrieb über TCP; er läuft in einem eigenen Prozess, damit die nachgebildete Last
+nur die Erfassung trifft.
+
+Aufruf aus dem Projektverzeichnis::
+
+    python benchmarks/acquisition_isolation_benchmark.py
+    python benchmarks/acquisition_isolation_benchmark.py --interval 5 --load-ms 50 --duration 5
+    python benchmarks/acquisition_isolation_benchmark.py --port COM3 --baudrate 115200
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+os.chdir(PROJECT_DIR)
+
+import numpy as np  # noqa: E402
+
+from custom_exceptions import ServoToolException  # noqa: E402
+from logger_config import logger  # noqa: E402
+
+PLOT_CODES = ["P0B-00", "P0B-01", "P0B-15", "P0B-02"]
+
+
+def serve_virtual_drive(slave, conn, stop_event):
+    """Virtueller Antrieb in einem eigenen Prozess; meldet Host und Port über conn"""
+    from simulator.virtual_drive import LatencyModel, VirtualDriveServer
+    logger.set_console_level('CRITICAL')
+    # Ohne Servomodell, damit nur die Erfassung und nicht die Simulation Rechenzeit braucht
+    server = VirtualDriveServer(transport='tcp', port=0, slave_ids=[slave],
+                                latency=LatencyModel(seed=1), model_factory=None)
+    server.start()
+    conn.send((server.host, server.port))
+    stop_event.wait()
+    server.stop()
+
+
+def busy_gui(duration, load_ms):
+    """Hält den GIL abwechselnd load_ms lang und gibt ihn kurz frei"""
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        chunk_end = time.perf_counter() + load_ms / 1000.0
+        while time.perf_counter() < chunk_end:
+            sum(range(200))
+        time.sleep(0.001)
+
+
+def measure_thread(connection_params, interval, duration, load_ms):
+    from PyQt5.QtCore import Qt
+
+    from modbus_client import ServoModbusClient
+    from workers.plot_data_worker import PlotDataWorker
+
+    client = ServoModbusClient()
+    client.connect(**connection_params)
+    worker = PlotDataWorker(client, None)
+    worker.update_config({'sample_interval': interval})
+    worker.set_channel_rates({})
+    worker.update_visible_lines(PLOT_CODES)
+    stamps = []
+    worker.data_updated.connect(lambda values: stamps.append(worker.last_sample_time), Qt.DirectConnection)
+    worker.start()
+    try:
+        busy_gui(duration, load_ms)
+    finally:
+        worker.stop()
+        client.disconnect()
+    return np.array(stamps)
+
+
+def measure_process(connection_params, interval, duration, load_ms):
+    from utils.acquisition_process import AcquisitionProcess
+
+    process = AcquisitionProcess(PLOT_CODES)
+    process.start(connection_params, visible=PLOT_CODES, sample_interval=interval)
+    try:
+        process.ring.skip()
+        busy_gui(duration, load_ms)
+        stamps = np.concatenate([rows[:, 0].copy() for rows in process.ring.read()] or [np.empty(0)])
+    finally:
+        process.stop()
+    return stamps
+
+
+def summary(stamps, interval):
+    if len(stamps) < 2:
+        return "keine Abtastungen"
+    gaps = np.diff(stamps) * 1000.0
+    return (f"{len(stamps):6d} Abtastungen  Abstand {gaps.mean():6.2f} ms  "
+            f"Streuung {gaps.std():5.2f} ms  max {gaps.max():6.1f} ms  "
+            f"> 1,5 Intervalle: {np.count_nonzero(gaps > 1.5 * interval)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Abtastabstände bei ausgelasteter Oberfläche messen")
+    parser.add_argument('--port', help="Serieller Port des Antriebs; ohne Angabe der virtuelle Antrieb")
+    parser.add_argument('--baudrate', type=int, default=19200, help="Baudrate am --port (Standard: 19200)")
+    parser.add_argument('--slave', type=int, default=1, help="Slave-ID (Standard: 1)")
+    parser.add_argument('--interval', type=int, default=10, help="Abtastintervall in ms (Standard: 10)")
+    parser.add_argument('--load-ms', type=float, default=30.0,
+                        help="Dauer, die die Oberfläche den GIL am Stück hält, in ms (Standard: 30)")
+    parser.add_argument('--duration', type=float, default=3.0, help="Messdauer je Variante in s (Standard: 3)")
+    args = parser.parse_args(argv)
+    logger.set_console_level('CRITICAL')
+
+    server = None
+    if args.port:
+        connection_params = {'port': args.port, 'baudrate': args.baudrate, 'slave_id': args.slave}
+    else:
+        context = multiprocessing.get_context('spawn')
+        conn, child_conn = context.Pipe()
+        stop_event = context.Event()
+        server = context.Process(target=serve_virtual_drive, args=(args.slave, child_conn, stop_event), daemon=True)
+        server.start()
+        host, port = conn.recv()
+        connection_params = {'transport': 'tcp', 'host': host, 'tcp_port': port, 'slave_id': args.slave}
+    try:
+        results = {}
+        for name, measure in (('Thread', measure_thread), ('Prozess', measure_process)):
+            results[name] = measure(connection_params, args.interval, args.duration, args.load_ms)
+    except ServoToolException as e:
+        print(f"Fehler: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if server is not None:
+            stop_event.set()
+            server.join(5)
+
+    print(f"Abtastintervall {args.interval} ms, Oberfläche hält den GIL je {args.load_ms:g} ms:")
+    for name, stamps in results.items():
+        print(f"  {name:8s} {summary(stamps, args.interval)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
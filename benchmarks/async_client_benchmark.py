@@ -0,0 +1,124 @@
+"""
+Vergleich: synchroner Client (Antriebe nacheinander) gegen asynchronen Client
+(Antriebe gleichzeitig) hinter einem Modbus-TCP-Gateway.
+
+Gemessen wird eine vollständige Parametersicherung mit Blocklesezugriffen und
+eine Runde Überwachungswerte (P0B-00..02) aller Antriebe. Ohne --host läuft die
+Messung gegen den virtuellen Antrieb; dessen Reglermodell wird dabei
+abgeschaltet, damit die Rechenzeit der Simulation im selben Prozess die
+Messung des Clients nicht verfälscht.
+
+Aufruf aus dem Projektverzeichnis::
+
+    python benchmarks/async_client_benchmark.py --slaves 1-8 --line-baudrate 19200
+    python benchmarks/async_client_benchmark.py --host 192.168.0.10 --slaves 1,2,3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+os.chdir(PROJECT_DIR)
+
+from async_modbus_client import AsyncModbusBridge  # noqa: E402
+from custom_exceptions import ServoToolException  # noqa: E402
+from logger_config import logger  # noqa: E402
+from modbus_client import TRANSPORT_TCP, ServoModbusClient, parse_slave_ids  # noqa: E402
+from utils.block_planner import items_from_parameters, plan_blocks  # noqa: E402
+from utils.fleet_backup import read_parameters_blockwise  # noqa: E402
+
+# P0B-00..02: Drehzahl, Drehzahlsollwert, Momentensollwert
+MONITOR_ADDRESS = 2816
+MONITOR_COUNT = 3
+
+
+def measure_sync(connection, slave_ids, blocks, rounds):
+    client = ServoModbusClient()
+    client.connect(slave_id=slave_ids[0], slave_ids=slave_ids, **connection)
+    try:
+        start = time.perf_counter()
+        backups = {s: read_parameters_blockwise(client, blocks, slave=s) for s in slave_ids}
+        backup_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for slave_id in slave_ids:
+                client.read_holding_register(MONITOR_ADDRESS, count=MONITOR_COUNT, slave=slave_id)
+        monitor_time = (time.perf_counter() - start) / rounds
+    finally:
+        client.disconnect()
+    return backup_time, monitor_time, backups
+
+
+def measure_async(connection, slave_ids, blocks, rounds):
+    with AsyncModbusBridge() as bridge:
+        client = bridge.client
+        bridge.call(client.connect(slave_ids=slave_ids, **connection))
+        start = time.perf_counter()
+        backups = bridge.call(client.read_blocks_all(blocks))
+        backup_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(rounds):
+            bridge.call(client.read_registers_all(MONITOR_ADDRESS, count=MONITOR_COUNT))
+        monitor_time = (time.perf_counter() - start) / rounds
+    return backup_time, monitor_time, backups
+
+
+def _count_values(backups):
+    return sum(len(result[0]) for result in backups.values() if not isinstance(result, Exception))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Synchronen und asynchronen Modbus-Client vergleichen")
+    parser.add_argument('--slaves', default='1-4', help="Slave-IDs, z.B. 1-8 oder 1,2,5 (Standard: 1-4)")
+    parser.add_argument('--host', help="Modbus-TCP-Gateway; ohne Angabe der virtuelle Antrieb")
+    parser.add_argument('--tcp-port', type=int, default=502, help="TCP-Port (Standard: 502)")
+    parser.add_argument('--rounds', type=int, default=50, help="Runden der Überwachungswerte (Standard: 50)")
+    parser.add_argument('--line-baudrate', type=int, default=19200,
+                        help="Virtueller Antrieb: Übertragungszeit einer RTU-Leitung je Antrieb (Standard: 19200)")
+    args = parser.parse_args(argv)
+    logger.set_console_level('CRITICAL')
+
+    from simulator.virtual_drive import load_parameter_definitions
+    parameters = load_parameter_definitions()
+    blocks = plan_blocks(items_from_parameters(parameters))
+    try:
+        slave_ids = parse_slave_ids(args.slaves)
+    except ValueError as e:
+        parser.error(str(e))
+
+    server = None
+    if args.host:
+        connection = dict(transport=TRANSPORT_TCP, host=args.host, tcp_port=args.tcp_port)
+    else:
+        from simulator.virtual_drive import LatencyModel, VirtualDriveServer
+        server = VirtualDriveServer(port=0, slave_ids=slave_ids, parameters=parameters, model_factory=None,
+                                    latency=LatencyModel(line_baudrate=args.line_baudrate, seed=1))
+        server.start()
+        connection = dict(transport=TRANSPORT_TCP, host=server.host, tcp_port=server.port)
+    try:
+        results = {
+            'synchron': measure_sync(connection, slave_ids, blocks, args.rounds),
+            'asynchron': measure_async(connection, slave_ids, blocks, args.rounds),
+        }
+    except ServoToolException as e:
+        print(f"Fehler: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if server is not None:
+            server.stop()
+
+    print(f"{len(slave_ids)} Antriebe, {len(blocks)} Blöcke je Sicherung:")
+    for name, (backup_time, monitor_time, backups) in results.items():
+        print(f"  {name:10s} Sicherung {backup_time:6.2f} s ({_count_values(backups)} Werte), "
+              f"Überwachung {monitor_time * 1000:7.2f} ms je Runde")
+    sync_backup, async_backup = results['synchron'][0], results['asynchron'][0]
+    if async_backup > 0:
+        print(f"  Faktor Sicherung: {sync_backup / async_backup:.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
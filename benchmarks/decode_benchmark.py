@@ -0,0 +1,75 @@
+"""
+Rechenzeit je Abfragezyklus für Dekodierung und Wertprüfung der Plot-Kanäle.
+
+Vergleicht die Umrechnung Wert für Wert (ReadBlock.decode, PlotChannel.convert,
+Bereichsprüfung) mit utils.frame_decoder bei steigender Kanalzahl. Gemessen wird
+nur die Rechenzeit, die Register stammen aus einer festen Zufallsfolge.
+
+Aufruf aus dem Projektverzeichnis::
+
+    python benchmarks/decode_benchmark.py
+    python benchmarks/decode_benchmark.py --cycles 20000 --channels 4 8 16 42
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+os.chdir(PROJECT_DIR)
+
+from logger_config import logger  # noqa: E402
+from utils.block_planner import plan_blocks  # noqa: E402
+from utils.frame_decoder import FrameDecoder  # noqa: E402
+from utils.plot_channels import PLAUSIBLE_RANGES, ChannelRegistry  # noqa: E402
+
+
+def decode_per_value(blocks, block_registers, channels):
+    values = {}
+    for block, registers in zip(blocks, block_registers):
+        for code, raw in block.decode(registers).items():
+            channel = channels.get(code)
+            value = channel.convert(raw)
+            limits = PLAUSIBLE_RANGES.get(code)
+            if (limits[0] <= value <= limits[1]) if limits else channel.in_range(value):
+                values[code] = value
+    return values
+
+
+def measure(function, cycles):
+    start = time.perf_counter()
+    for _ in range(cycles):
+        function()
+    return (time.perf_counter() - start) / cycles
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dekodierung je Abfragezyklus messen")
+    parser.add_argument('--cycles', type=int, default=10000, help="Zyklen je Messung (Standard: 10000)")
+    parser.add_argument('--channels', type=int, nargs='+', default=[3, 6, 12, 24, 42],
+                        help="Kanalzahlen (Standard: 3 6 12 24 42)")
+    args = parser.parse_args(argv)
+    logger.set_console_level('CRITICAL')
+
+    channels = ChannelRegistry.from_file()
+    rng = random.Random(1)
+    print(f"{'Kanäle':>7} {'Blöcke':>7} {'je Wert':>10} {'Tabelle':>10}")
+    for count in args.channels:
+        codes = channels.codes()[:count]
+        blocks = plan_blocks([channels.get(code).item for code in codes])
+        block_registers = [[rng.randrange(100) for _ in range(block.count)] for block in blocks]
+        decoder = FrameDecoder(blocks, channels, limits=PLAUSIBLE_RANGES)
+        if decoder.decode(block_registers) != decode_per_value(blocks, block_registers, channels):
+            print(f"Fehler: Ergebnisse für {count} Kanäle weichen ab", file=sys.stderr)
+            return 1
+        per_value = measure(lambda: decode_per_value(blocks, block_registers, channels), args.cycles)
+        table = measure(lambda: decoder.decode(block_registers), args.cycles)
+        print(f"{len(codes):7d} {len(blocks):7d} {per_value * 1e6:8.1f}µs {table * 1e6:8.1f}µs")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
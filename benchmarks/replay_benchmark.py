@@ -0,0 +1,167 @@
+"""
+Reproduzierbarer Benchmark mit aufgezeichnetem Antriebsverhalten.
+
+Zeichnet eine Sitzung auf (Plot-Abfragen wie im Tuning-Tab und eine vollständige
+Parametersicherung mit Blocklesezugriffen) und spielt sie später ohne Hardware
+wieder ab. Die Wiedergabe liefert dieselben Antworten, Exception-Antworten und
+Timeouts wie die Aufnahme, wahlweise in Originalzeit, beschleunigt oder ohne
+Wartezeit. Damit lassen sich Änderungen an Plot-Worker, Client und Blockplanung
+gegen das Verhalten eines echten Antriebs vergleichen.
+
+Aufruf aus dem Projektverzeichnis::
+
+    # Aufnahme an einem Antrieb (oder ohne --port/--host gegen den virtuellen Antrieb)
+    python benchmarks/replay_benchmark.py record sitzung.jsonl --port COM3 --baudrate 57600
+    python benchmarks/replay_benchmark.py record sitzung.jsonl --line-baudrate 19200
+
+    # Wiedergabe in Originalzeit bzw. ohne Wartezeit
+    python benchmarks/replay_benchmark.py replay sitzung.jsonl
+    python benchmarks/replay_benchmark.py replay sitzung.jsonl --speed 0
+
+Aufzeichnungen aus der Oberfläche (Datei > Modbus-Verkehr aufzeichnen) lassen
+sich ebenso abspielen; Anfragen, die darin nicht vorkommen, werden als
+ausgebliebene Antworten gezählt.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+os.chdir(PROJECT_DIR)
+
+from custom_exceptions import ServoToolException  # noqa: E402
+from logger_config import logger  # noqa: E402
+from modbus_client import TRANSPORT_REPLAY, TRANSPORT_SERIAL, TRANSPORT_TCP, ServoModbusClient  # noqa: E402
+from utils.block_planner import items_from_parameters, plan_blocks  # noqa: E402
+from utils.fleet_backup import read_parameters_blockwise  # noqa: E402
+from workers.plot_data_worker import PlotDataWorker  # noqa: E402
+
+# Alle Linien des Tuning-Plots
+PLOT_CODES = ["P0B-00", "P0B-01", "P0B-15", "P0B-02", "P0B-24", "P0B-58"]
+
+
+def run_workload(client, parameters, cycles):
+    """
+    Führt die Plot-Abfragen und die Parametersicherung aus.
+
+    Returns:
+        dict: Dauer je Plot-Zyklus, Dauer der Sicherung und Fehlerzahlen
+    """
+    worker = PlotDataWorker(client, None)
+    worker.update_visible_lines(PLOT_CODES)
+    # Alle Kanäle in jedem Zyklus: die Anfragefolge hängt dann nicht von der Zeit ab
+    worker.set_channel_rates({})
+    incomplete = 0
+    start = time.perf_counter()
+    for _ in range(cycles):
+        # Der Plot-Worker fängt Lesefehler selbst ab und liefert dann weniger Werte
+        if len(worker._read_plot_values()) < len(PLOT_CODES):
+            incomplete += 1
+    cycle_time = (time.perf_counter() - start) / cycles
+
+    blocks = plan_blocks(items_from_parameters(parameters))
+    start = time.perf_counter()
+    try:
+        values, errors, requests = read_parameters_blockwise(client, blocks, slave=client.slave_id)
+    except ServoToolException as e:
+        logger.error(f"Sicherung abgebrochen: {e}")
+        values, errors, requests = {}, [], 0
+    return {
+        'cycle': cycle_time,
+        'incomplete_cycles': incomplete,
+        'backup': time.perf_counter() - start,
+        'backup_parameters': len(values),
+        'backup_errors': len(errors),
+        'backup_requests': requests,
+    }
+
+
+def _print_result(result):
+    print(f"  Plot:       {result['cycle'] * 1000:7.2f} ms je Zyklus, "
+          f"{result['incomplete_cycles']} unvollständige Zyklen")
+    print(f"  Sicherung:  {result['backup_parameters']} Parameter in {result['backup_requests']} Anfragen, "
+          f"{result['backup'] * 1000:.0f} ms ({result['backup_errors']} nicht lesbar)")
+
+
+def record(args, parameters):
+    client = ServoModbusClient()
+    server = None
+    if args.port:
+        connection = dict(transport=TRANSPORT_SERIAL, port=args.port, baudrate=args.baudrate,
+                          parity=args.parity, stopbits=args.stopbits)
+    elif args.host:
+        connection = dict(transport=TRANSPORT_TCP, host=args.host, tcp_port=args.tcp_port)
+    else:
+        from simulator.virtual_drive import LatencyModel, VirtualDriveServer
+        server = VirtualDriveServer(port=0, parameters=parameters,
+                                    latency=LatencyModel(line_baudrate=args.line_baudrate, seed=1))
+        server.start()
+        connection = dict(transport=TRANSPORT_TCP, host=server.host, tcp_port=server.port)
+    try:
+        client.connect(slave_id=args.slave, **connection)
+        client.start_recording(args.file)
+        result = run_workload(client, parameters, args.cycles)
+        count = client.stop_recording()
+    finally:
+        client.disconnect()
+        if server is not None:
+            server.stop()
+    print(f"Aufnahme ({count} Transaktionen in {args.file}):")
+    _print_result(result)
+
+
+def replay(args, parameters):
+    client = ServoModbusClient()
+    client.connect(transport=TRANSPORT_REPLAY, port=args.file, slave_id=args.slave, replay_speed=args.speed)
+    try:
+        result = run_workload(client, parameters, args.cycles)
+        replayed, unmatched = client.client.replayed, client.client.unmatched
+    finally:
+        client.disconnect()
+    speed = "ohne Wartezeit" if args.speed == 0 else f"Zeitfaktor {args.speed:g}"
+    print(f"Wiedergabe ({speed}, {replayed} Antworten, {unmatched} ohne Aufzeichnung):")
+    _print_result(result)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Plot und Parametersicherung gegen eine Aufzeichnung messen")
+    parser.add_argument('--cycles', type=int, default=200, help="Anzahl der Plot-Zyklen (Standard: 200)")
+    parser.add_argument('--slave', type=int, default=1, help="Slave-ID des Antriebs (Standard: 1)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record_cmd = commands.add_parser('record', help="Sitzung aufzeichnen")
+    record_cmd.add_argument('file', help="Zieldatei (JSON Lines)")
+    record_cmd.add_argument('--port', help="Serieller Port des Antriebs")
+    record_cmd.add_argument('--baudrate', type=int, default=19200, help="Baudrate (Standard: 19200)")
+    record_cmd.add_argument('--parity', default='E', choices=['N', 'E', 'O'], help="Parität (Standard: E)")
+    record_cmd.add_argument('--stopbits', type=int, default=2, choices=[1, 2], help="Stoppbits (Standard: 2)")
+    record_cmd.add_argument('--host', help="Antrieb über Modbus TCP")
+    record_cmd.add_argument('--tcp-port', type=int, default=502, help="TCP-Port (Standard: 502)")
+    record_cmd.add_argument('--line-baudrate', type=int, default=None,
+                            help="Virtueller Antrieb: Übertragungszeit einer RTU-Leitung nachbilden")
+
+    replay_cmd = commands.add_parser('replay', help="Aufzeichnung abspielen")
+    replay_cmd.add_argument('file', help="Aufzeichnung (JSON Lines)")
+    replay_cmd.add_argument('--speed', type=float, default=1.0,
+                            help="Zeitfaktor (1 = Originalzeit, 10 = zehnfach schneller, 0 = ohne Wartezeit)")
+    args = parser.parse_args(argv)
+    logger.set_console_level('CRITICAL')
+
+    from simulator.virtual_drive import load_parameter_definitions
+    parameters = load_parameter_definitions()
+    try:
+        if args.command == 'record':
+            record(args, parameters)
+        else:
+            replay(args, parameters)
+    except ServoToolException as e:
+        print(f"Fehler: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Vergleich: Plot-Abfragen über pymodbus gegen den schlanken RTU-Lesepfad (rtu_fast_reader).
+
+Gemessen werden die Blocklesezugriffe der Standard-Plot-Kanäle bei gleicher
+Leitung. Ohne --port läuft die Messung gegen den virtuellen Antrieb als
+RTU-über-TCP-Server; der Client öffnet ihn wie einen seriellen Port
+(socket://…), die Übertragungszeit der Rahmen bei --line-baudrate bildet der
+virtuelle Antrieb nach.
+
+Aufruf aus dem Projektverzeichnis::
+
+    python benchmarks/rtu_fast_path_benchmark.py
+    python benchmarks/rtu_fast_path_benchmark.py --line-baudrate 115200 --duration 5
+    python benchmarks/rtu_fast_path_benchmark.py --port COM3 --baudrate 115200 --parity N --stopbits 1
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+os.chdir(PROJECT_DIR)
+
+from custom_exceptions import ServoToolException  # noqa: E402
+from logger_config import logger  # noqa: E402
+from modbus_client import ServoModbusClient  # noqa: E402
+from utils.block_planner import plan_blocks  # noqa: E402
+from utils.plot_channels import ChannelRegistry  # noqa: E402
+
+PLOT_CODES = ["P0B-00", "P0B-01", "P0B-15", "P0B-02", "P0B-24", "P0B-58"]
+
+
+def measure(client, blocks, duration):
+    """
+    Returns:
+        tuple: (Zyklen pro Sekunde, Fehler)
+    """
+    cycles = errors = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        for block in blocks:
+            try:
+                client.read_holding_register_fast(block.start, count=block.count)
+            except ServoToolException:
+                errors += 1
+        cycles += 1
+    return cycles / (time.perf_counter() - start), errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="pymodbus und schlanken RTU-Lesepfad vergleichen")
+    parser.add_argument('--port', help="Serieller Port des Antriebs; ohne Angabe der virtuelle Antrieb")
+    parser.add_argument('--baudrate', type=int, default=19200, help="Baudrate am --port (Standard: 19200)")
+    parser.add_argument('--parity', default='E', help="Parität am --port (Standard: E)")
+    parser.add_argument('--stopbits', type=int, default=2, help="Stoppbits am --port (Standard: 2)")
+    parser.add_argument('--slave', type=int, default=1, help="Slave-ID (Standard: 1)")
+    parser.add_argument('--line-baudrate', type=int, default=19200,
+                        help="Virtueller Antrieb: nachgebildete Baudrate der Leitung (Standard: 19200)")
+    parser.add_argument('--duration', type=float, default=3.0, help="Messdauer je Lesepfad in s (Standard: 3)")
+    args = parser.parse_args(argv)
+    logger.set_console_level('CRITICAL')
+
+    channels = ChannelRegistry.from_file()
+    blocks = plan_blocks([channels.get(code).item for code in PLOT_CODES])
+
+    server = None
+    if args.port:
+        port, baudrate, parity, stopbits = args.port, args.baudrate, args.parity, args.stopbits
+    else:
+        from simulator.virtual_drive import LatencyModel, VirtualDriveServer
+        server = VirtualDriveServer(transport='rtu_over_tcp', port=0, slave_ids=[args.slave],
+                                    latency=LatencyModel(line_baudrate=args.line_baudrate, seed=1))
+        server.start()
+        port = f"socket://{server.host}:{server.port}"
+        baudrate, parity, stopbits = args.line_baudrate, 'E', 2
+    client = ServoModbusClient()
+    try:
+        client.connect(port=port, baudrate=baudrate, parity=parity, stopbits=stopbits, slave_id=args.slave)
+        results = {}
+        for name, fast in (('pymodbus', False), ('RTU-Lesepfad', True)):
+            client.fast_reads = fast
+            results[name] = measure(client, blocks, args.duration)
+    except ServoToolException as e:
+        print(f"Fehler: {e}", file=sys.stderr)
+        return 2
+    finally:
+        client.disconnect()
+        if server is not None:
+            server.stop()
+
+    print(f"{len(PLOT_CODES)} Kanäle in {len(blocks)} Blöcken, {baudrate} Baud:")
+    for name, (rate, errors) in results.items():
+        print(f"  {name:13s} {rate:7.1f} Zyklen/s  {rate * len(PLOT_CODES):8.1f} Werte/s  ({errors} Fehler)")
+    slow, fast = results['pymodbus'][0], results['RTU-Lesepfad'][0]
+    if slow > 0:
+        print(f"  Faktor: {fast / slow:.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
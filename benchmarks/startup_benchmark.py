@@ -0,0 +1,130 @@
+"""
+Startzeit-Benchmark der Oberfläche.
+
+Misst in jeweils frischen Prozessen:
+    - die Importzeit von main.py mit ``python -X importtime`` (inkl. der teuersten Module)
+    - die Zeit bis das Hauptfenster angezeigt ist (Import, QApplication, Fensteraufbau)
+
+Außerdem wird geprüft, dass pyqtgraph, numpy und pymodbus nicht beim Start geladen
+werden - sie werden erst mit dem Tuning-Tab bzw. dem ersten Verbindungsaufbau gebraucht.
+
+Aufruf aus dem Projektverzeichnis::
+
+    python benchmarks/startup_benchmark.py
+    python benchmarks/startup_benchmark.py --runs 7 --top 15 --offscreen
+
+Exit-Code 1, wenn das Startbudget überschritten wird oder ein schweres Modul beim Start geladen wird.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Startbudget in Sekunden (Median über alle Durchläufe)
+IMPORT_BUDGET_S = 0.25
+WINDOW_BUDGET_S = 0.5
+
+# Module, die erst bei Bedarf geladen werden dürfen
+DEFERRED_MODULES = ('pyqtgraph', 'numpy', 'pymodbus')
+
+_WINDOW_PROBE = """
+import time
+t0 = time.perf_counter()
+import main
+t1 = time.perf_counter()
+from PyQt5.QtWidgets import QApplication
+app = QApplication([])
+window = main.ServoTuningApp()
+window.show()
+app.processEvents()
+t2 = time.perf_counter()
+print(f"{t1 - t0:.6f} {t2 - t0:.6f}")
+"""
+
+
+def _run_python(args, env):
+    return subprocess.run([sys.executable] + args, cwd=PROJECT_DIR, env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def parse_importtime(stderr):
+    """
+    Wertet die Ausgabe von -X importtime aus.
+
+    Returns:
+        dict: {Modulname: (eigene Zeit in s, kumulierte Zeit in s)}
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            modules[name.strip()] = (int(self_us) / 1e6, int(cumulative_us) / 1e6)
+        except ValueError:
+            continue
+    return modules
+
+
+def measure_import(env):
+    result = _run_python(['-X', 'importtime', '-c', 'import main'], env)
+    return parse_importtime(result.stderr)
+
+
+def measure_window(env):
+    result = _run_python(['-c', _WINDOW_PROBE], env)
+    import_time, window_time = (float(v) for v in result.stdout.split()[-2:])
+    return import_time, window_time
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Startzeit der Oberfläche messen")
+    parser.add_argument('--runs', type=int, default=5, help="Anzahl der Durchläufe (Standard: 5)")
+    parser.add_argument('--top', type=int, default=10, help="Anzahl der teuersten Module in der Ausgabe")
+    parser.add_argument('--offscreen', action='store_true', help="Ohne Anzeige messen (QT_QPA_PLATFORM=offscreen)")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    if args.offscreen:
+        env['QT_QPA_PLATFORM'] = 'offscreen'
+
+    # Erster Lauf füllt die Bytecode-Caches und wird nicht gewertet
+    modules = measure_import(env)
+    import_times = []
+    window_times = []
+    for _ in range(args.runs):
+        modules = measure_import(env)
+        _import_time, window_time = measure_window(env)
+        import_times.append(modules.get('main', (0.0, 0.0))[1])
+        window_times.append(window_time)
+
+    import_median = statistics.median(import_times)
+    window_median = statistics.median(window_times)
+
+    print("Teuerste Importe (kumuliert, letzter Lauf):")
+    for name, (self_time, cumulative) in sorted(modules.items(), key=lambda m: m[1][1], reverse=True)[:args.top]:
+        print(f"  {cumulative * 1000:8.1f} ms  (eigen {self_time * 1000:6.1f} ms)  {name}")
+    print()
+    print(f"Import main.py:     {import_median * 1000:7.1f} ms  (Budget {IMPORT_BUDGET_S * 1000:.0f} ms, Median aus {args.runs})")
+    print(f"Fenster angezeigt:  {window_median * 1000:7.1f} ms  (Budget {WINDOW_BUDGET_S * 1000:.0f} ms, Median aus {args.runs})")
+
+    failed = False
+    loaded = sorted({name.split('.')[0] for name in modules} & set(DEFERRED_MODULES))
+    if loaded:
+        print(f"FEHLER: beim Start geladen: {', '.join(loaded)}")
+        failed = True
+    if import_median > IMPORT_BUDGET_S:
+        print("FEHLER: Importbudget überschritten")
+        failed = True
+    if window_median > WINDOW_BUDGET_S:
+        print("FEHLER: Startbudget überschritten")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,359 @@
+"""
+Benchmark-Suite für Erfassung, Darstellung und Massenzugriffe.
+
+Misst ohne Anzeige (QT_QPA_PLATFORM=offscreen) gegen den virtuellen Antrieb
+oder eine Aufzeichnung (siehe utils.modbus_recorder):
+    - plot_rate_*:        erreichte Plot-Abtastrate je Kanalauswahl (Werte/s)
+    - gui_frame_*:        Dauer von TuningTab.update_plot einschließlich Neuzeichnen
+    - export_s/import_s:  vollständiger Export bzw. Import (Datei lesen, anzeigen, schreiben)
+    - register_filter_ms: Dauer der Suche im Registerbaum
+    - startup_*:          Importzeit von main.py und Zeit bis zum angezeigten Fenster
+
+Die Ergebnisse werden als JSON geschrieben und mit einer gespeicherten Basislinie
+derselben Quelle verglichen; eine Verschlechterung über die Toleranz hinaus ergibt
+Exit-Code 1. Die Basislinie ist rechnerabhängig und wird daher auf dem Messrechner
+angelegt (--save-baseline).
+
+Aufruf aus dem Projektverzeichnis::
+
+    python benchmarks/suite.py --save-baseline
+    python benchmarks/suite.py --output ergebnis.json
+    python benchmarks/suite.py --record sitzung.jsonl
+    python benchmarks/suite.py --replay sitzung.jsonl --replay-speed 0 --only plot gui
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARK_DIR = os.path.join(PROJECT_DIR, 'benchmarks')
+sys.path.insert(0, PROJECT_DIR)
+sys.path.insert(0, BENCHMARK_DIR)
+os.chdir(PROJECT_DIR)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from logger_config import logger  # noqa: E402
+from modbus_client import TRANSPORT_REPLAY, TRANSPORT_TCP  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+RESULT_FORMAT = 'servo-tool-benchmark'
+
+# Kanalauswahlen für die Plot-Abtastrate
+CHANNEL_SETS = {
+    'speed': ["P0B-00"],
+    'basic': ["P0B-00", "P0B-01", "P0B-02"],
+    'all': ["P0B-00", "P0B-01", "P0B-15", "P0B-02", "P0B-24", "P0B-58"],
+}
+
+# Suchbegriffe für die Filterung im Registerbaum ('' zeigt alle Parameter)
+FILTER_TERMS = ['p08', 'speed', 'p0b-0', 'torque', '']
+
+GROUPS = ('plot', 'gui', 'io', 'filter', 'startup')
+
+
+def metric(value, unit, better):
+    """Ein Messwert; better ist 'lower' oder 'higher'."""
+    return {'value': round(value, 6), 'unit': unit, 'better': better}
+
+
+def _percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+class DriveSource:
+    """Verbindet Clients mit dem virtuellen Antrieb oder einer Aufzeichnung."""
+
+    def __init__(self, replay=None, replay_speed=1.0, line_baudrate=None, record=None):
+        self.replay = replay
+        self.replay_speed = replay_speed
+        self.line_baudrate = line_baudrate
+        self.record = record
+        self.server = None
+
+    def describe(self):
+        if self.replay:
+            return f"replay:{os.path.basename(self.replay)}@{self.replay_speed:g}"
+        return f"virtual:{self.line_baudrate or 'tcp'}"
+
+    def start(self):
+        if self.replay:
+            return
+        from simulator.virtual_drive import LatencyModel, VirtualDriveServer
+        self.server = VirtualDriveServer(transport=TRANSPORT_TCP, port=0,
+                                         latency=LatencyModel(line_baudrate=self.line_baudrate, seed=1))
+        self.server.start()
+
+    def connect(self, client):
+        if self.record:
+            client.start_recording(self.record)
+        if self.replay:
+            client.connect(transport=TRANSPORT_REPLAY, port=self.replay, replay_speed=self.replay_speed)
+        else:
+            client.connect(transport=TRANSPORT_TCP, host=self.server.host, tcp_port=self.server.port)
+
+    def stop(self):
+        if self.server is not None:
+            self.server.stop()
+            self.server = None
+
+
+def bench_plot(window, duration):
+    """Erreichte Abtastrate des Plot-Workers je Kanalauswahl."""
+    from workers.plot_data_worker import PlotDataWorker
+    worker = PlotDataWorker(window.modbus_client, window.parameter_manager)
+    # Alle Kanäle in jedem Zyklus, damit die Messungen vergleichbar bleiben
+    worker.set_channel_rates({})
+    results = {}
+    for name, codes in CHANNEL_SETS.items():
+        worker.update_visible_lines(codes)
+        samples = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < duration:
+            # Wie im Worker zählt nur ein vollständiger Satz als Abtastwert
+            if len(worker._read_plot_values()) == len(codes):
+                samples += 1
+        results[f'plot_rate_{name}'] = metric(samples / (time.perf_counter() - start), 'samples/s', 'higher')
+    return results
+
+
+def bench_gui(window, app, frames):
+    """Dauer von TuningTab.update_plot mit allen Kanälen, mit und ohne Neuzeichnen."""
+    import math
+    tab = window.tuning_tab
+    window.tabs.setCurrentWidget(tab)
+    for line in tab.lines.values():
+        line.setVisible(True)
+    tab.clear_plot(stopped_by_user=False)
+    app.processEvents()
+
+    update_times = []
+    frame_times = []
+    for i in range(frames):
+        angle = i / 50.0
+        values = {
+            "P0B-00": int(1500 * math.sin(angle)), "P0B-01": int(1500 * math.sin(angle)),
+            "P0B-02": int(300 * math.cos(angle)), "P0B-15": int(20 * math.sin(3 * angle)),
+            "P0B-24": int(abs(150 * math.cos(angle))), "P0B-58": i * 1000,
+        }
+        start = time.perf_counter()
+        tab.update_plot(values)
+        update_done = time.perf_counter()
+        app.processEvents()
+        frame_times.append(time.perf_counter() - start)
+        update_times.append(update_done - start)
+    return {
+        'gui_update_plot_ms': metric(statistics.mean(update_times) * 1000, 'ms', 'lower'),
+        'gui_frame_mean_ms': metric(statistics.mean(frame_times) * 1000, 'ms', 'lower'),
+        'gui_frame_p95_ms': metric(_percentile(frame_times, 0.95) * 1000, 'ms', 'lower'),
+    }
+
+
+def _wait_for(app, worker, timeout=600.0):
+    start = time.perf_counter()
+    while (worker.isRunning() or not worker.isFinished()) and time.perf_counter() - start < timeout:
+        app.processEvents()
+        time.sleep(0.001)
+    app.processEvents()
+
+
+def bench_io(window, app):
+    """Vollständiger Export und Import über die Worker und den Registerbaum der Oberfläche."""
+    from workers.export_worker import ExportWorker
+    from workers.import_worker import ImportWorker
+    results = {}
+    exported = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'export.json')
+
+        worker = ExportWorker(window.modbus_client, window.parameter_manager)
+        worker.file_path = path
+        worker.progress_updated.connect(window._on_export_progress)
+        worker.finished.connect(window._on_export_finished)
+        worker.finished.connect(lambda data, _path: exported.update(data))
+        start = time.perf_counter()
+        worker.start()
+        _wait_for(app, worker)
+        results['export_s'] = metric(time.perf_counter() - start, 's', 'lower')
+        results['export_parameters'] = metric(len(exported), 'parameters', 'higher')
+
+        register_tab = window.register_tab
+        start = time.perf_counter()
+        worker = ImportWorker()
+        worker.file_path = path
+        worker.finished.connect(window._on_import_finished)
+        worker.start()
+        _wait_for(app, worker)
+        register_tab.write_modified_parameters()
+        results['import_s'] = metric(time.perf_counter() - start, 's', 'lower')
+    return results
+
+
+def bench_filter(window, app, repeats):
+    """Dauer der Suche im Registerbaum (Eingabe bis aktualisierte Ansicht)."""
+    register_tab = window.register_tab
+    window.tabs.setCurrentWidget(register_tab)
+    times = []
+    for _ in range(repeats):
+        for term in FILTER_TERMS:
+            start = time.perf_counter()
+            register_tab.search_input.setText(term)
+            app.processEvents()
+            times.append(time.perf_counter() - start)
+    return {'register_filter_ms': metric(statistics.mean(times) * 1000, 'ms', 'lower')}
+
+
+def bench_startup(runs):
+    """Start der Oberfläche in frischen Prozessen (siehe startup_benchmark)."""
+    import startup_benchmark
+    env = dict(os.environ)
+    startup_benchmark.measure_import(env)  # Bytecode-Caches füllen
+    import_times = []
+    window_times = []
+    for _ in range(runs):
+        modules = startup_benchmark.measure_import(env)
+        import_times.append(modules.get('main', (0.0, 0.0))[1])
+        window_times.append(startup_benchmark.measure_window(env)[1])
+    return {
+        'startup_import_ms': metric(statistics.median(import_times) * 1000, 'ms', 'lower'),
+        'startup_window_ms': metric(statistics.median(window_times) * 1000, 'ms', 'lower'),
+    }
+
+
+def run_suite(groups, source, args):
+    """
+    Führt die gewählten Messungen aus.
+
+    Returns:
+        dict: {Messwertname: metric(...)}
+    """
+    metrics = {}
+    if 'startup' in groups:
+        # Vor dem Aufbau des eigenen Fensters messen, damit die Prozesse sich nicht stören
+        metrics.update(bench_startup(args.startup_runs))
+    if not set(groups) & {'plot', 'gui', 'io', 'filter'}:
+        return metrics
+
+    from PyQt5.QtWidgets import QApplication
+    import main
+    app = QApplication.instance() or QApplication([])
+    window = main.ServoTuningApp()
+    # Sichtbar wie im Betrieb, sonst entfallen Layout und Neuzeichnen der Widgets
+    window.show()
+    app.processEvents()
+    source.start()
+    try:
+        source.connect(window.modbus_client)
+        if 'plot' in groups:
+            metrics.update(bench_plot(window, args.duration))
+        if 'gui' in groups:
+            metrics.update(bench_gui(window, app, args.frames))
+        if 'io' in groups:
+            metrics.update(bench_io(window, app))
+        if 'filter' in groups:
+            metrics.update(bench_filter(window, app, args.filter_repeats))
+    finally:
+        window.modbus_client.stop_recording()
+        window.modbus_client.disconnect()
+        source.stop()
+        window.close()
+    return metrics
+
+
+def compare(metrics, baseline, tolerance):
+    """
+    Vergleicht die Messwerte mit einer Basislinie.
+
+    Returns:
+        dict: {Messwertname: {'baseline', 'change', 'regression'}}; change ist die
+        relative Änderung, positiv bedeutet schlechter
+    """
+    comparison = {}
+    for name, current in metrics.items():
+        reference = baseline.get('metrics', {}).get(name)
+        if not reference or not reference.get('value'):
+            continue
+        change = (current['value'] - reference['value']) / abs(reference['value'])
+        if current['better'] == 'higher':
+            change = -change
+        comparison[name] = {
+            'baseline': reference['value'],
+            'change': round(change, 4),
+            'regression': change > tolerance,
+        }
+    return comparison
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark-Suite mit Vergleich gegen eine Basislinie")
+    parser.add_argument('--only', nargs='+', choices=GROUPS, default=list(GROUPS), help="Nur diese Messungen")
+    parser.add_argument('--replay', metavar='FILE', help="Aufzeichnung statt des virtuellen Antriebs verwenden")
+    parser.add_argument('--replay-speed', type=float, default=1.0, help="Zeitfaktor der Wiedergabe (0 = ohne Wartezeit)")
+    parser.add_argument('--record', metavar='FILE', help="Modbus-Verkehr der Messung aufzeichnen")
+    parser.add_argument('--line-baudrate', type=int, default=None,
+                        help="Virtueller Antrieb: Übertragungszeit einer RTU-Leitung nachbilden")
+    parser.add_argument('--duration', type=float, default=2.0, help="Messdauer je Kanalauswahl in s (Standard: 2)")
+    parser.add_argument('--frames', type=int, default=1000, help="Anzahl der Plot-Aktualisierungen (Standard: 1000)")
+    parser.add_argument('--filter-repeats', type=int, default=5, help="Wiederholungen der Registersuche")
+    parser.add_argument('--startup-runs', type=int, default=3, help="Durchläufe der Startmessung")
+    parser.add_argument('--output', help="Ergebnisse als JSON in diese Datei schreiben")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Basislinie für den Vergleich")
+    parser.add_argument('--save-baseline', action='store_true', help="Ergebnisse als neue Basislinie speichern")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Erlaubte Verschlechterung gegenüber der Basislinie (Standard: 0.25 = 25 %%)")
+    args = parser.parse_args(argv)
+    logger.set_console_level('CRITICAL')
+
+    source = DriveSource(replay=args.replay, replay_speed=args.replay_speed,
+                         line_baudrate=args.line_baudrate, record=args.record)
+    metrics = run_suite(args.only, source, args)
+    result = {
+        'format': RESULT_FORMAT,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'source': source.describe(),
+        'metrics': metrics,
+    }
+
+    comparison = {}
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        # Messwerte gegen eine andere Quelle (z.B. Wiedergabe ohne Wartezeit) sind nicht vergleichbar
+        if baseline.get('source') != result['source']:
+            print(f"Hinweis: Basislinie wurde mit {baseline.get('source')} gemessen, kein Vergleich")
+        else:
+            comparison = compare(metrics, baseline, args.tolerance)
+            result['comparison'] = comparison
+
+    for name, current in metrics.items():
+        line = f"  {name:24s} {current['value']:12.3f} {current['unit']}"
+        if name in comparison:
+            entry = comparison[name]
+            line += f"   ({entry['change'] * 100:+.1f} %{'  VERSCHLECHTERT' if entry['regression'] else ''})"
+        print(line)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"Basislinie gespeichert: {args.baseline}")
+
+    regressions = [name for name, entry in comparison.items() if entry['regression']]
+    if regressions:
+        print(f"FEHLER: verschlechtert: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Durchsatz- und Latenz-Benchmark gegen den virtuellen Antrieb.
+
+Startet für jeden Übertragungsweg einen virtuellen Antrieb auf einem freien
+lokalen Port und misst mit dem normalen ServoModbusClient:
+    - Einzelzugriffe (1 Register, FC 3): Mittelwert, Median und 99. Perzentil
+    - Überwachungszyklen wie im Plot (P0B-00..02, P0B-15, P0B-24, P0B-58..61)
+    - eine vollständige Parametersicherung mit Blocklesezugriffen
+
+Damit lassen sich Änderungen an Client, Blockplanung und Timeouts auf einem
+Rechner ohne Antrieb vergleichen.
+
+Aufruf aus dem Projektverzeichnis::
+
+    python benchmarks/virtual_drive_benchmark.py
+    python benchmarks/virtual_drive_benchmark.py --requests 1000 --line-baudrate 115200
+    python benchmarks/virtual_drive_benchmark.py --no-latency --transports tcp
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+os.chdir(PROJECT_DIR)
+
+from custom_exceptions import ServoToolException  # noqa: E402
+from logger_config import logger  # noqa: E402
+from modbus_client import TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP, ServoModbusClient  # noqa: E402
+from simulator.virtual_drive import LatencyModel, VirtualDriveServer, load_parameter_definitions  # noqa: E402
+from utils.block_planner import items_from_parameters, plan_blocks  # noqa: E402
+from utils.fleet_backup import read_parameters_blockwise  # noqa: E402
+
+
+def _percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _monitoring_cycle(client):
+    client.read_holding_register(2816, count=3)
+    client.read_holding_register_32bit(2831, is_signed=True)
+    client.read_holding_register(2840)
+    client.read_holding_register(2874, count=4)
+
+
+def run_transport(transport, parameters, requests, latency):
+    """
+    Misst einen Übertragungsweg.
+
+    Returns:
+        dict: Messwerte in Sekunden bzw. Anfragen pro Sekunde
+    """
+    with VirtualDriveServer(transport=transport, port=0, latency=latency, parameters=parameters) as server:
+        client = ServoModbusClient()
+        client.connect(transport=transport, host=server.host, tcp_port=server.port, slave_id=1)
+        try:
+            # Aufwärmen: Verbindung und Timeout-Schätzung einschwingen lassen
+            for _ in range(20):
+                client.read_holding_register(2816)
+
+            # Fehlgeschlagene Zugriffe (z.B. zu knappe adaptive Timeouts) werden gezählt, nicht abgebrochen
+            samples = []
+            failures = 0
+            for _ in range(requests):
+                start = time.perf_counter()
+                try:
+                    client.read_holding_register(2816)
+                    samples.append(time.perf_counter() - start)
+                except ServoToolException:
+                    failures += 1
+
+            cycles = max(1, requests // 4)
+            start = time.perf_counter()
+            for _ in range(cycles):
+                try:
+                    _monitoring_cycle(client)
+                except ServoToolException:
+                    failures += 1
+            cycle_time = (time.perf_counter() - start) / cycles
+
+            blocks = plan_blocks(items_from_parameters(parameters))
+            start = time.perf_counter()
+            values, errors, block_requests = read_parameters_blockwise(client, blocks, slave=1)
+            backup_time = time.perf_counter() - start
+        finally:
+            client.disconnect()
+
+    return {
+        'mean': statistics.mean(samples),
+        'median': statistics.median(samples),
+        'p99': _percentile(samples, 0.99),
+        'throughput': len(samples) / sum(samples),
+        'cycle': cycle_time,
+        'backup': backup_time,
+        'backup_parameters': len(values),
+        'backup_requests': block_requests,
+        'backup_errors': len(errors),
+        'failures': failures,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Durchsatz und Latenz gegen den virtuellen Antrieb messen")
+    parser.add_argument('--requests', type=int, default=500, help="Anzahl der Einzelzugriffe (Standard: 500)")
+    parser.add_argument('--transports', nargs='+', default=[TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP],
+                        choices=[TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP], help="Zu messende Übertragungswege")
+    parser.add_argument('--line-baudrate', type=int, default=None,
+                        help="Übertragungszeit einer RTU-Leitung mit dieser Baudrate nachbilden")
+    parser.add_argument('--no-latency', action='store_true', help="Antrieb antwortet ohne Verzögerung")
+    args = parser.parse_args(argv)
+    logger.set_console_level('CRITICAL')
+
+    parameters = load_parameter_definitions()
+    latency = None if args.no_latency else LatencyModel(line_baudrate=args.line_baudrate, seed=1)
+    for transport in args.transports:
+        result = run_transport(transport, parameters, args.requests, latency)
+        print(f"{transport}:")
+        print(f"  Einzelzugriff:  Mittel {result['mean'] * 1000:6.2f} ms  Median {result['median'] * 1000:6.2f} ms  "
+              f"p99 {result['p99'] * 1000:6.2f} ms  ({result['throughput']:.0f} Anfragen/s)")
+        print(f"  Überwachung:    {result['cycle'] * 1000:6.2f} ms je Zyklus ({1.0 / result['cycle']:.0f} Zyklen/s)")
+        print(f"  Sicherung:      {result['backup_parameters']} Parameter in {result['backup_requests']} Anfragen, "
+              f"{result['backup'] * 1000:.0f} ms ({result['backup_errors']} nicht lesbar)")
+        print(f"  Fehler:         {result['failures']} fehlgeschlagene Zugriffe")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
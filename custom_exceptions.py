@@ -40,4 +40,9 @@ class FileOperationException(ServoToolException):
 
 class ConfigurationException(ServoToolException):
     """Exception für Fehler in der Konfiguration."""
+    pass
+
+
+class OperationCancelledException(ServoToolException):
+    """Exception für vom Benutzer abgebrochene, länger laufende Vorgänge."""
     pass
\ No newline at end of file
@@ -19,425 +19,676 @@ class LanguageManager:
         self.load_translations()
     
     def load_translations(self):
-        """Lädt die Übersetzungen für alle unterstützten Sprachen."""
+        """
+        Lädt die Übersetzungen der aktuellen Sprache.
+        
+        Weitere Sprachen werden erst beim Umschalten geladen, damit beim Programmstart
+        nur die Texte einer Sprache aufgebaut werden.
+        """
+        self.translations = {}
+        self._ensure_translations(self.current_language)
+    
+    def _ensure_translations(self, language_code):
+        """Lädt die Übersetzungen einer Sprache, falls noch nicht geschehen."""
+        if language_code not in self.translations:
+            loader = getattr(self, f"_translations_{language_code}", None)
+            self.translations[language_code] = loader() if loader else {}
+    
+    @staticmethod
+    def _translations_de():
+        """Deutsche Übersetzungen."""
         # Übersetzungen direkt im Code definieren
-        self.translations = {
-            'de': {
-                # Hauptfenster
-                'app_title': 'Servo Tuning & Diagnostic Tool',
-                
-                # Menü
-                'menu_file': 'Datei',
-                'menu_export_registers': 'Alle Register exportieren...',
-                'menu_import_registers': 'Alle Register importieren...',
-                
-                # Tab-Namen
-                'tab_tuning_plot': 'Tuning & Plot',
-                'tab_io_status': 'I/O Status',
-                'tab_vdi_vdo': 'VDI/VDO Status',
-                'tab_register_overview': 'Registerübersicht',
-                'tab_fault_list': 'Fehlerliste',
-                'tab_modbus_connection': 'Modbus-Verbindung',
-                
-                # Sprachauswahl
-                'language_label': 'Sprache',
-                
-                # Statusmeldungen
-                'status_app_started': 'Anwendung gestartet. Bitte verbinden.',
-                'status_plot_started': 'Plot gestartet.',
-                'status_plot_stopped': 'Plot gestoppt.',
-                'status_plot_cleared': 'Plot gelöscht.',
-                'status_connection_success': 'Verbindung erfolgreich.',
-                'status_simulation_started': 'Simulationsmodus gestartet.',
-                'status_connection_failed': 'Verbindung fehlgeschlagen.',
-                'status_connection_disconnected': 'Verbindung getrennt.',
-                'status_exporting_registers': 'Exportiere alle Register... Bitte warten.',
-                'status_plot_updated': 'Plot aktualisiert',
-                'status_values_missing': 'Werte fehlen',
-                'status_channels_without_data': 'Kanäle ohne Daten',
-                'status_all_values_present': 'alle Werte vorhanden',
-                'status_plot_error': 'Plot-Fehler',
-                'status_plot': 'Plot',
-                'status_connection': 'Verbindung',
-                'status_visible_lines': 'Sichtbare Linien',
-                'status_updates': 'Updates',
-                'status_runtime': 'Laufzeit',
-                'status_error': 'Fehler',
-                'status_connection_error': 'Verbindungsfehler',
-                'status_timeout': 'Timeout',
-                'status_export': 'Export',
-                'status_disconnected': 'Getrennt',
-                'status_worker_error': 'Worker-Fehler',
-                'status_plot_worker_config_updated': 'Plot-Worker-Konfiguration aktualisiert',
-                'status_invalid_input': 'Ungültige Eingabe',
-                'status_config_update_error': 'Fehler bei der Konfigurationsaktualisierung',
-                'status_inactive': 'Inaktiv',
-                'status_active': 'Aktiv',
-                'status_errors': 'Fehler',
-                
-                # Verbindung
-                'group_modbus_connection_settings': 'Modbus-Verbindungseinstellungen',
-                'button_connect': 'Verbinden',
-                'button_disconnect': 'Trennen',
-                'label_com_port': 'COM-Port',
-                'label_baud_rate': 'Baudrate',
-                'label_data_bits': 'Datenbits',
-                'label_parity': 'Parität',
-                'label_stop_bits': 'Stoppbits',
-                'label_modbus_address': 'Modbus-Adresse',
-                'checkbox_simulation_mode': 'Simulationsmodus',
-                'text_bps': 'bps',
-                
-                # Register
-                'placeholder_search_entire_list': 'Ganze Liste durchsuchen...',
-                'button_read_visible_parameters': 'Sichtbare Parameter lesen',
-                'button_write_modified_parameters': 'Geänderte Parameter schreiben',
-                'header_code': 'Code',
-                'header_name': 'Name',
-                'header_value': 'Wert',
-                'header_modbus_raw_value': 'Modbus-Rohwert',
-                'header_unit': 'Einheit',
-                'header_default': 'Default',
-                'header_hex': 'Hex',
-                'header_range_options': 'Bereich/Optionen',
-                'header_resettable': 'Zurücksetzbar',
-                'placeholder_select_parameter_for_details': 'Wählen Sie einen Parameter aus der Tabelle, um alle Details anzuzeigen.',
-                'text_no_description': 'Keine Beschreibung',
-                'details_code': 'Code',
-                'details_name': 'Name',
-                'details_unit': 'Einheit',
-                'details_default': 'Default',
-                'details_hex': 'Hex',
-                'details_decimal': 'Dezimal',
-                'details_di_function_details': 'DI Funktion Details',
-                'details_do_function_details': 'DO Funktion Details',
-                'details_function': 'Funktion',
-                'details_description': 'Beschreibung',
-                'details_remarks': 'Anmerkungen',
-                'details_validation': 'Validierung',
-                'details_type': 'Typ',
-                'details_range': 'Bereich',
-                'details_to': 'bis',
-                'details_data_type': 'Datentyp',
-                'details_decimal_places': 'Dezimalstellen',
-                'details_two_complement': 'Zweierkomplement',
-                'details_options': 'Optionen',
-                'details_bits': 'Bits',
-                'details_info': 'Info',
-                'details_handling': 'Details & Handhabung',
-                'status_no_modbus_connection': 'Keine Modbus-Verbindung.',
-                'status_reading_parameters': 'Lese',
-                'status_parameters': 'Parameter...',
-                'status_visible_parameters_read': 'sichtbare Parameter gelesen.',
-                'status_writing_modified_parameters': 'Schreibe modifizierte Parameter...',
-                'status_error_convert_to_number': 'Fehler: Konnte',
-                'status_for': 'für',
-                'status_modified_parameters_written': 'modifizierte(r) Parameter geschrieben.',
-                'status_read_errors': 'Lesefehler',
-                'status_write_errors': 'Schreibfehler',
-                'text_read_error': 'Lesefehler',
-                'text_options': 'Optionen',
-                'text_bitmask': 'Bitmaske',
-                'text_raw': 'Raw',
-                'text_unknown': 'Unbekannt',
-                'text_unknown_value': 'Unbekannter Wert',
-                'text_not_available': 'N/A',
-                
-                # Fehlerliste
-                'placeholder_select_fault_for_details': 'Wählen Sie einen Fehler aus der Liste für Details.',
-                'text_no_details_available': 'Keine Details verfügbar.',
-                
-                # I/O Status
-                'checkbox_enable_live_updates': 'Live-Updates aktivieren',
-                'group_live_io_status': 'Live I/O Status',
-                'group_virtual_io_status': 'VDI/VDO Status',
-                'group_digital_inputs_di': 'Digital Inputs (DI)',
-                'group_digital_outputs_do': 'Digital Outputs (DO)',
-                'group_virtual_digital_inputs_vdi': 'Virtual Digital Inputs (VDI)',
-                'group_virtual_digital_outputs_vdo': 'Virtual Digital Outputs (VDO)',
-                'group_assigned_functions': 'Zugewiesene Funktionen',
-                'text_no_functions_assigned': 'Keine Funktionen zugewiesen',
-                'text_input': 'Input',
-                'text_output': 'Output',
-                'text_not_assigned': 'Nicht zugewiesen',
-                'text_not_available': 'Nicht verfügbar',
-                'text_error': 'Fehler',
-                'text_function': 'Function',
-                'text_description': 'Description',
-                'text_number': 'Nr.',
-                'text_state': 'Status',
-                'text_action': 'Aktion',
-                'button_toggle': 'Umschalten',
-                
-                # Tuning-Tab
-                'group_tuning_parameters': 'Tuning-Parameter',
-                'group_virtual_digital_io_vdi_vdo': 'VDI/VDO Status',
-                'button_read': 'Lesen',
-                'button_write': 'Schreiben',
-                'button_switch_to_gain_set_2': 'Zu Gain Satz 2 wechseln',
-                'button_switch_to_gain_set_1': 'Zu Gain Satz 1 wechseln',
-                'label_note': 'Hinweis',
-                'text_gain_set_activation': 'Zur Aktivierung von Gain Satz 2 müssen P08-08 und P08-09 konfiguriert werden.',
-                'group_gain_parameter_set_1': 'Gain Parameter Set 1',
-                'group_gain_parameter_set_2': 'Gain Parameter Set 2',
-                'group_other_tuning_parameters': 'Weitere Tuning Parameter',
-                'group_direct_commands': 'Direktbefehle',
-                'button_send': 'Senden',
-                'button_set_all_commands_to_zero': 'Alle Befehle auf 0 setzen',
-                'group_plot_settings': 'Plot-Einstellungen',
-                'label_sampling_interval': 'Abtastintervall',
-                'label_number_of_data_points': 'Anzahl Datenpunkte',
-                'label_visible_time': 'Sichtbare Zeit',
-                'button_apply': 'Anwenden',
-                'button_apply_config': 'Konfiguration anwenden',
-                'label_watchdog_timeout': 'Watchdog-Timeout',
-                'label_manual_control': 'Manuelle Steuerung',
-                'button_start': 'Start',
-                'button_stop': 'Stop',
-                'button_clear': 'Löschen',
-                'checkbox_advanced_plot_features': 'Erweiterte Plot-Funktionen (Zoom/Cursor)',
-                'checkbox_vdo_polling': 'VDO-Status aktivieren',
-                'group_legend_visibility': 'Legendensichtbarkeit',
-                'group_realtime_data_plot': 'Echtzeit-Datenplot',
-                'group_live_values': 'Live-Werte',
-                'plot_actual_speed': 'Actual Speed',
-                'plot_speed_cmd': 'Speed Cmd',
-                'plot_pos_dev': 'Pos Dev',
-                'plot_torque_cmd': 'Torque Cmd',
-                'plot_current': 'Current',
-                'text_not_available': 'N/A',
-                'plot_title_realtime_servo_data': 'Echtzeit-Servodaten',
-                'plot_xlabel_time': 'Zeit',
-                'plot_ylabel_value': 'Wert',
-                'validation_not_available': 'Validierung: N/A',
-                'validation_range': 'Bereich',
-                'validation_options': 'Optionen',
-                'validation_see_register_overview': 'Validierung: Siehe Registerübersicht',
-                'text_cursor_position_default': 'X: --, Y: --',
-                'tooltip_sampling_interval': 'Abtastintervall in Millisekunden',
-                'tooltip_number_of_data_points': 'Anzahl der Datenpunkte im Plot',
-                
-                # Allgemeine Begriffe
-                'settings': 'Einstellungen',
-                'language': 'Sprache',
-                'error': 'Fehler',
-                'warning': 'Warnung',
-                'info': 'Information',
-                'success': 'Erfolg',
-                'failed': 'Fehlgeschlagen',
-                'yes': 'Ja',
-                'no': 'Nein',
-                'ok': 'OK',
-                'cancel': 'Abbrechen'
-            },
-            'en': {
-                # Main window
-                'app_title': 'Servo Tuning & Diagnostic Tool',
-                
-                # Menu
-                'menu_file': 'File',
-                'menu_export_registers': 'Export All Registers...',
-                'menu_import_registers': 'Import All Registers...',
-                
-                # Tab names
-                'tab_tuning_plot': 'Tuning & Plot',
-                'tab_io_status': 'I/O Status',
-                'tab_vdi_vdo': 'VDI/VDO Status',
-                'tab_register_overview': 'Register Overview',
-                'tab_fault_list': 'Fault List',
-                'tab_modbus_connection': 'Modbus Connection',
-                
-                # Language selection
-                'language_label': 'Language',
-                
-                # Status messages
-                'status_app_started': 'Application started. Please connect.',
-                'status_plot_started': 'Plot started.',
-                'status_plot_stopped': 'Plot stopped.',
-                'status_plot_cleared': 'Plot cleared.',
-                'status_connection_success': 'Connection successful.',
-                'status_simulation_started': 'Simulation mode started.',
-                'status_connection_failed': 'Connection failed.',
-                'status_connection_disconnected': 'Connection disconnected.',
-                'status_exporting_registers': 'Exporting all registers... Please wait.',
-                'status_plot_updated': 'Plot updated',
-                'status_values_missing': 'values missing',
-                'status_channels_without_data': 'channels without data',
-                'status_all_values_present': 'all values present',
-                'status_plot_error': 'Plot Error',
-                'status_plot': 'Plot',
-                'status_connection': 'Connection',
-                'status_visible_lines': 'Visible Lines',
-                'status_updates': 'Updates',
-                'status_runtime': 'Runtime',
-                'status_error': 'Error',
-                'status_connection_error': 'Connection Error',
-                'status_timeout': 'Timeout',
-                'status_export': 'Export',
-                'status_disconnected': 'Disconnected',
-                'status_worker_error': 'Worker Error',
-                'status_plot_worker_config_updated': 'Plot Worker Configuration Updated',
-                'status_invalid_input': 'Invalid Input',
-                'status_config_update_error': 'Configuration Update Error',
-                'status_inactive': 'Inactive',
-                'status_active': 'Active',
-                'status_errors': 'Errors',
-                
-                # Connection
-                'group_modbus_connection_settings': 'Modbus Connection Settings',
-                'button_connect': 'Connect',
-                'button_disconnect': 'Disconnect',
-                'label_com_port': 'COM Port',
-                'label_baud_rate': 'Baud Rate',
-                'label_data_bits': 'Data Bits',
-                'label_parity': 'Parity',
-                'label_stop_bits': 'Stop Bits',
-                'label_modbus_address': 'Modbus Address',
-                'checkbox_simulation_mode': 'Simulation Mode',
-                'text_bps': 'bps',
-                
-                # Register
-                'placeholder_search_entire_list': 'Search entire list...',
-                'button_read_visible_parameters': 'Read Visible Parameters',
-                'button_write_modified_parameters': 'Write Modified Parameters',
-                'header_code': 'Code',
-                'header_name': 'Name',
-                'header_value': 'Value',
-                'header_modbus_raw_value': 'Modbus Raw Value',
-                'header_unit': 'Unit',
-                'header_default': 'Default',
-                'header_hex': 'Hex',
-                'header_range_options': 'Range/Options',
-                'header_resettable': 'Resettable',
-                'placeholder_select_parameter_for_details': 'Select a parameter from the table to view all details.',
-                'text_no_description': 'No Description',
-                'details_code': 'Code',
-                'details_name': 'Name',
-                'details_unit': 'Unit',
-                'details_default': 'Default',
-                'details_hex': 'Hex',
-                'details_decimal': 'Decimal',
-                'details_di_function_details': 'DI Function Details',
-                'details_do_function_details': 'DO Function Details',
-                'details_function': 'Function',
-                'details_description': 'Description',
-                'details_remarks': 'Remarks',
-                'details_validation': 'Validation',
-                'details_type': 'Type',
-                'details_range': 'Range',
-                'details_to': 'to',
-                'details_data_type': 'Data Type',
-                'details_decimal_places': 'Decimal Places',
-                'details_two_complement': 'Two\'s Complement',
-                'details_options': 'Options',
-                'details_bits': 'Bits',
-                'details_info': 'Info',
-                'details_handling': 'Details & Handling',
-                'status_no_modbus_connection': 'No Modbus connection.',
-                'status_reading_parameters': 'Reading',
-                'status_parameters': 'parameters...',
-                'status_visible_parameters_read': 'visible parameters read.',
-                'status_writing_modified_parameters': 'Writing modified parameters...',
-                'status_error_convert_to_number': 'Error: Could not convert',
-                'status_for': 'for',
-                'status_modified_parameters_written': 'modified parameter(s) written.',
-                'status_read_errors': 'read errors',
-                'status_write_errors': 'write errors',
-                'text_read_error': 'Read Error',
-                'text_options': 'Options',
-                'text_bitmask': 'Bitmask',
-                'text_raw': 'Raw',
-                'text_unknown': 'Unknown',
-                'text_unknown_value': 'Unknown Value',
-                'text_not_available': 'N/A',
-                
-                # Fault list
-                'placeholder_select_fault_for_details': 'Select a fault from the list for details.',
-                'text_no_details_available': 'No details available.',
-                
-                # I/O Status
-                'checkbox_enable_live_updates': 'Enable Live Updates',
-                'group_live_io_status': 'Live I/O Status',
-                'group_virtual_io_status': 'VDI/VDO Status',
-                'group_digital_inputs_di': 'Digital Inputs (DI)',
-                'group_digital_outputs_do': 'Digital Outputs (DO)',
-                'group_virtual_digital_inputs_vdi': 'Virtual Digital Inputs (VDI)',
-                'group_virtual_digital_outputs_vdo': 'Virtual Digital Outputs (VDO)',
-                'group_assigned_functions': 'Assigned Functions',
-                'text_no_functions_assigned': 'No Functions Assigned',
-                'text_input': 'Input',
-                'text_output': 'Output',
-                'text_not_assigned': 'Not Assigned',
-                'text_not_available': 'Not Available',
-                'text_error': 'Error',
-                'text_function': 'Function',
-                'text_description': 'Description',
-                'text_number': 'No.',
-                'text_state': 'State',
-                'text_action': 'Action',
-                'button_toggle': 'Toggle',
-                
-                # Tuning Tab
-                'group_tuning_parameters': 'Tuning Parameters',
-                'group_virtual_digital_io_vdi_vdo': 'VDI/VDO Status',
-                'button_read': 'Read',
-                'button_write': 'Write',
-                'button_switch_to_gain_set_2': 'Switch to Gain Set 2',
-                'button_switch_to_gain_set_1': 'Switch to Gain Set 1',
-                'label_note': 'Note',
-                'text_gain_set_activation': 'To activate Gain Set 2, P08-08 and P08-09 must be configured.',
-                'group_gain_parameter_set_1': 'Gain Parameter Set 1',
-                'group_gain_parameter_set_2': 'Gain Parameter Set 2',
-                'group_other_tuning_parameters': 'Other Tuning Parameters',
-                'group_direct_commands': 'Direct Commands',
-                'button_send': 'Send',
-                'button_set_all_commands_to_zero': 'Set All Commands to Zero',
-                'group_plot_settings': 'Plot Settings',
-                'label_sampling_interval': 'Sampling Interval',
-                'label_number_of_data_points': 'Number of Data Points',
-                'label_visible_time': 'Visible Time',
-                'button_apply': 'Apply',
-                'button_apply_config': 'Apply Configuration',
-                'label_watchdog_timeout': 'Watchdog Timeout',
-                'label_manual_control': 'Manual Control',
-                'button_start': 'Start',
-                'button_stop': 'Stop',
-                'button_clear': 'Clear',
-                'checkbox_advanced_plot_features': 'Advanced Plot Features (Zoom/Cursor)',
-                'checkbox_vdo_polling': 'Enable VDO Status',
-                'group_legend_visibility': 'Legend Visibility',
-                'group_realtime_data_plot': 'Realtime Data Plot',
-                'group_live_values': 'Live Values',
-                'plot_actual_speed': 'Actual Speed',
-                'plot_speed_cmd': 'Speed Cmd',
-                'plot_pos_dev': 'Pos Dev',
-                'plot_torque_cmd': 'Torque Cmd',
-                'plot_current': 'Current',
-                'text_not_available': 'N/A',
-                'plot_title_realtime_servo_data': 'Realtime Servo Data',
-                'plot_xlabel_time': 'Time',
-                'plot_ylabel_value': 'Value',
-                'validation_not_available': 'Validation: N/A',
-                'validation_range': 'Range',
-                'validation_options': 'Options',
-                'validation_see_register_overview': 'Validation: See Register Overview',
-                'text_cursor_position_default': 'X: --, Y: --',
-                'tooltip_sampling_interval': 'Sampling interval in milliseconds',
-                'tooltip_number_of_data_points': 'Number of data points in the plot',
-                
-                # General terms
-                'settings': 'Settings',
-                'language': 'Language',
-                'error': 'Error',
-                'warning': 'Warning',
-                'info': 'Information',
-                'success': 'Success',
-                'failed': 'Failed',
-                'yes': 'Yes',
-                'no': 'No',
-                'ok': 'OK',
-                'cancel': 'Cancel'
-            }
+        return {
+            # Hauptfenster
+            'app_title': 'Servo Tuning & Diagnostic Tool',
+            
+            # Menü
+            'menu_file': 'Datei',
+            'menu_export_registers': 'Alle Register exportieren...',
+            'menu_import_registers': 'Alle Register importieren...',
+            'menu_fleet_backup': 'Flotten-Sicherung (mehrere Ports)...',
+            'menu_record_traffic': 'Modbus-Verkehr aufzeichnen...',
+            
+            # Tab-Namen
+            'tab_tuning_plot': 'Tuning & Plot',
+            'tab_io_status': 'I/O Status',
+            'tab_vdi_vdo': 'VDI/VDO Status',
+            'tab_register_overview': 'Registerübersicht',
+            'tab_fault_list': 'Fehlerliste',
+            'tab_modbus_connection': 'Modbus-Verbindung',
+            
+            # Sprachauswahl
+            'language_label': 'Sprache',
+            
+            # Statusmeldungen
+            'status_app_started': 'Anwendung gestartet. Bitte verbinden.',
+            'status_plot_started': 'Plot gestartet.',
+            'status_plot_stopped': 'Plot gestoppt.',
+            'status_plot_cleared': 'Plot gelöscht.',
+            'status_connection_success': 'Verbindung erfolgreich.',
+            'status_simulation_started': 'Simulationsmodus gestartet.',
+            'status_connection_failed': 'Verbindung fehlgeschlagen.',
+            'status_connection_disconnected': 'Verbindung getrennt.',
+            'status_exporting_registers': 'Exportiere alle Register... Bitte warten.',
+            'status_plot_updated': 'Plot aktualisiert',
+            'status_values_missing': 'Werte fehlen',
+            'status_channels_without_data': 'Kanäle ohne Daten',
+            'status_all_values_present': 'alle Werte vorhanden',
+            'status_plot_error': 'Plot-Fehler',
+            'status_plot': 'Plot',
+            'status_connection': 'Verbindung',
+            'status_visible_lines': 'Sichtbare Linien',
+            'status_updates': 'Updates',
+            'status_runtime': 'Laufzeit',
+            'status_error': 'Fehler',
+            'status_connection_error': 'Verbindungsfehler',
+            'status_timeout': 'Timeout',
+            'status_export': 'Export',
+            'status_disconnected': 'Getrennt',
+            'status_worker_error': 'Worker-Fehler',
+            'status_plot_worker_config_updated': 'Plot-Worker-Konfiguration aktualisiert',
+            'status_invalid_input': 'Ungültige Eingabe',
+            'status_config_update_error': 'Fehler bei der Konfigurationsaktualisierung',
+            'status_inactive': 'Inaktiv',
+            'status_active': 'Aktiv',
+            'status_errors': 'Fehler',
+            'status_overruns': 'Überläufe',
+            
+            # Verbindung
+            'group_modbus_connection_settings': 'Modbus-Verbindungseinstellungen',
+            'button_connect': 'Verbinden',
+            'button_disconnect': 'Trennen',
+            'label_com_port': 'COM-Port',
+            'label_baud_rate': 'Baudrate',
+            'label_data_bits': 'Datenbits',
+            'label_parity': 'Parität',
+            'label_stop_bits': 'Stoppbits',
+            'label_modbus_address': 'Modbus-Adresse',
+            'checkbox_simulation_mode': 'Simulationsmodus',
+            'text_bps': 'bps',
+            'label_transport': 'Übertragungsweg',
+            'text_transport_serial': 'Seriell (Modbus RTU)',
+            'text_transport_tcp': 'Modbus TCP',
+            'text_transport_rtu_over_tcp': 'RTU über TCP (Gateway)',
+            'label_host': 'Host',
+            'label_tcp_port': 'TCP-Port',
+            
+            # RTU-Zeitverhalten
+            'group_rtu_timing': 'RTU-Zeitverhalten',
+            'label_inter_frame_delay': 'Pause zwischen Rahmen (ms)',
+            'label_response_delay': 'Antwortverzögerung P0C-25 (ms)',
+            'label_min_transaction_time': 'Theoretisches Minimum (1 Register)',
+            'label_measured_transaction_time': 'Gemessen (Mittel / Minimum)',
+            'label_link_efficiency': 'Effizienz der Verbindung',
+            'button_default': 'Normwert',
+            'tooltip_modbus_addresses': 'Eine Adresse oder mehrere Antriebe an einer Leitung, z.B. "1,2,3" oder "1-3"',
+            
+            # Baudraten-Suche
+            'group_baud_discovery': 'Automatische Suche',
+            'label_soak_test_reads': 'Blocklesezugriffe im Dauertest',
+            'button_discover_drive': 'Antrieb suchen',
+            'button_optimize_baud_rate': 'Baudrate optimieren',
+            'title_optimize_baud_rate': 'Baudrate optimieren',
+            'msg_optimize_baud_rate_confirm': 'Die Baudrate des Antriebs (P0C-02) wird schrittweise erhöht und jede Stufe mit einem Dauertest geprüft. Der Antrieb bleibt auf der schnellsten fehlerfreien Baudrate. Fortfahren?',
+            
+            # Register
+            'placeholder_search_entire_list': 'Ganze Liste durchsuchen...',
+            'button_read_visible_parameters': 'Sichtbare Parameter lesen',
+            'button_write_modified_parameters': 'Geänderte Parameter schreiben',
+            'header_code': 'Code',
+            'header_name': 'Name',
+            'header_value': 'Wert',
+            'header_modbus_raw_value': 'Modbus-Rohwert',
+            'header_unit': 'Einheit',
+            'header_default': 'Default',
+            'header_hex': 'Hex',
+            'header_range_options': 'Bereich/Optionen',
+            'header_resettable': 'Zurücksetzbar',
+            'placeholder_select_parameter_for_details': 'Wählen Sie einen Parameter aus der Tabelle, um alle Details anzuzeigen.',
+            'text_no_description': 'Keine Beschreibung',
+            'details_code': 'Code',
+            'details_name': 'Name',
+            'details_unit': 'Einheit',
+            'details_default': 'Default',
+            'details_hex': 'Hex',
+            'details_decimal': 'Dezimal',
+            'details_di_function_details': 'DI Funktion Details',
+            'details_do_function_details': 'DO Funktion Details',
+            'details_function': 'Funktion',
+            'details_description': 'Beschreibung',
+            'details_remarks': 'Anmerkungen',
+            'details_validation': 'Validierung',
+            'details_type': 'Typ',
+            'details_range': 'Bereich',
+            'details_to': 'bis',
+            'details_data_type': 'Datentyp',
+            'details_decimal_places': 'Dezimalstellen',
+            'details_two_complement': 'Zweierkomplement',
+            'details_options': 'Optionen',
+            'details_bits': 'Bits',
+            'details_info': 'Info',
+            'details_handling': 'Details & Handhabung',
+            'status_no_modbus_connection': 'Keine Modbus-Verbindung.',
+            'status_reading_parameters': 'Lese',
+            'status_parameters': 'Parameter...',
+            'status_visible_parameters_read': 'sichtbare Parameter gelesen.',
+            'status_writing_modified_parameters': 'Schreibe modifizierte Parameter...',
+            'status_error_convert_to_number': 'Fehler: Konnte',
+            'status_for': 'für',
+            'status_modified_parameters_written': 'modifizierte(r) Parameter geschrieben.',
+            'status_read_errors': 'Lesefehler',
+            'status_write_errors': 'Schreibfehler',
+            'text_read_error': 'Lesefehler',
+            'text_options': 'Optionen',
+            'text_bitmask': 'Bitmaske',
+            'text_raw': 'Raw',
+            'text_unknown': 'Unbekannt',
+            'text_unknown_value': 'Unbekannter Wert',
+            'text_not_available': 'N/A',
+            
+            # Fehlerliste
+            'placeholder_select_fault_for_details': 'Wählen Sie einen Fehler aus der Liste für Details.',
+            'text_no_details_available': 'Keine Details verfügbar.',
+            
+            # I/O Status
+            'checkbox_enable_live_updates': 'Live-Updates aktivieren',
+            'group_live_io_status': 'Live I/O Status',
+            'group_virtual_io_status': 'VDI/VDO Status',
+            'group_digital_inputs_di': 'Digital Inputs (DI)',
+            'group_digital_outputs_do': 'Digital Outputs (DO)',
+            'group_virtual_digital_inputs_vdi': 'Virtual Digital Inputs (VDI)',
+            'group_virtual_digital_outputs_vdo': 'Virtual Digital Outputs (VDO)',
+            'group_assigned_functions': 'Zugewiesene Funktionen',
+            'text_no_functions_assigned': 'Keine Funktionen zugewiesen',
+            'text_input': 'Input',
+            'text_output': 'Output',
+            'text_not_assigned': 'Nicht zugewiesen',
+            'text_not_available': 'Nicht verfügbar',
+            'text_error': 'Fehler',
+            'text_function': 'Function',
+            'text_description': 'Description',
+            'text_number': 'Nr.',
+            'text_state': 'Status',
+            'text_action': 'Aktion',
+            'button_toggle': 'Umschalten',
+            
+            # Tuning-Tab
+            'group_tuning_parameters': 'Tuning-Parameter',
+            'group_virtual_digital_io_vdi_vdo': 'VDI/VDO Status',
+            'button_read': 'Lesen',
+            'button_write': 'Schreiben',
+            'button_switch_to_gain_set_2': 'Zu Gain Satz 2 wechseln',
+            'button_switch_to_gain_set_1': 'Zu Gain Satz 1 wechseln',
+            'label_note': 'Hinweis',
+            'text_gain_set_activation': 'Zur Aktivierung von Gain Satz 2 müssen P08-08 und P08-09 konfiguriert werden.',
+            'group_gain_parameter_set_1': 'Gain Parameter Set 1',
+            'group_gain_parameter_set_2': 'Gain Parameter Set 2',
+            'group_other_tuning_parameters': 'Weitere Tuning Parameter',
+            'group_direct_commands': 'Direktbefehle',
+            'button_send': 'Senden',
+            'button_set_all_commands_to_zero': 'Alle Befehle auf 0 setzen',
+            'group_plot_settings': 'Plot-Einstellungen',
+            'label_sampling_interval': 'Abtastintervall',
+            'label_number_of_data_points': 'Anzahl Datenpunkte',
+            'label_visible_time': 'Sichtbare Zeit',
+            'button_apply': 'Anwenden',
+            'button_apply_config': 'Konfiguration anwenden',
+            'label_watchdog_timeout': 'Watchdog-Timeout',
+            'label_manual_control': 'Manuelle Steuerung',
+            'button_start': 'Start',
+            'button_stop': 'Stop',
+            'button_clear': 'Löschen',
+            'checkbox_advanced_plot_features': 'Erweiterte Plot-Funktionen (Zoom/Cursor)',
+            'checkbox_vdo_polling': 'VDO-Status aktivieren',
+            'checkbox_process_acquisition': 'Erfassung in eigenem Prozess',
+            'tooltip_process_acquisition': 'Liest die Plot-Kanäle in einem eigenen Prozess, damit die Abtastung nicht von der Oberfläche gebremst wird. Gilt ab dem nächsten Plot-Start, nur für eine Achse',
+            'group_legend_visibility': 'Legendensichtbarkeit',
+            'group_realtime_data_plot': 'Echtzeit-Datenplot',
+            'group_live_values': 'Live-Werte',
+            'group_step_response': 'Sprungantwort',
+            'checkbox_step_analysis': 'Nach Senden von P06-03 auswerten',
+            'tooltip_step_analysis': 'Wertet nach dem Senden eines Drehzahlsollwerts Sollwert (P0B-01), Istwert (P0B-00) und Drehmoment (P0B-02) im Plot aus. Anstiegszeit 10-90 %, Ausregelzeit bis zum Band ±2 % der Sprunghöhe. Die Kanäle müssen im Plot sichtbar sein',
+            'label_step_capture': 'Erfassungsdauer',
+            'header_step_run': 'Nr.',
+            'header_step_command': 'Sollwert',
+            'header_step_gains': 'Verstärkungen (P08)',
+            'header_rise_time': 'Anstiegszeit (ms)',
+            'header_overshoot': 'Überschwingen (%)',
+            'header_settling_time': 'Ausregelzeit (ms)',
+            'header_steady_state_error': 'Bleibende Abw.',
+            'header_torque_peak': 'Drehmomentspitze (%)',
+            'status_step_no_data': 'Sprungantwort: keine Daten von {codes} - Kanäle im Plot sichtbar?',
+            'status_step_no_step': 'Sprungantwort: kein Sprung im Sollwert erkannt',
+            'status_step_evaluated': 'Sprungantwort {run} ausgewertet',
+            'group_gain_search': 'Reglersuche (Simulation)',
+            'button_gain_search': 'Suchen',
+            'tooltip_gain_search': 'Passt an die gewählte (sonst die letzte) Sprungantwort ein Streckenmodell an und bewertet daran Kombinationen von P08-00 und P08-01 parallel auf allen Kernen. Die besten Kandidaten an der Maschine mit einem Sprung bestätigen',
+            'button_gain_apply': 'Übernehmen',
+            'tooltip_gain_apply': 'Trägt den gewählten Kandidaten in P08-00 und P08-01 ein; geschrieben wird erst mit "Schreiben"',
+            'header_gain_cost': 'Bewertung',
+            'text_gain_fitting': 'Strecke aus Sprungantwort {run} anpassen...',
+            'text_gain_progress': 'Runde {round}: {count} Kandidaten bewertet',
+            'text_gain_plant': 'Strecke: Lastträgheit {inertia:.2f}-fach, Abweichung {error:.1f} rpm',
+            'status_gain_no_step': 'Reglersuche: zuerst eine Sprungantwort aufzeichnen',
+            'status_gain_finished': 'Reglersuche beendet: {count} Kandidaten',
+            'status_gain_failed': 'Reglersuche fehlgeschlagen: {error}',
+            'status_gain_applied': 'Kandidat eingetragen - mit "Schreiben" übernehmen und mit einem Sprung bestätigen',
+            'button_gain_sweep': 'An Maschine testen',
+            'tooltip_gain_sweep': 'Der Motor dreht! Schreibt nacheinander die Werte der Sprungantwort und jeden Kandidaten, wiederholt denselben Sprung und hängt die Kennwerte als Durchläufe an. Der Plot wird dafür angehalten, am Ende werden die vorherigen Werte zurückgeschrieben und P06-03 auf 0 gesetzt',
+            'text_gain_sweep_progress': '{count} von {total} Sätzen getestet',
+            'status_gain_sweep_not_connected': 'Test an der Maschine: keine Verbindung',
+            'status_gain_sweep_started': 'Test an der Maschine läuft - der Motor dreht',
+            'status_gain_sweep_finished': 'Test an der Maschine beendet: schnellster stabiler Satz ist Durchlauf {run} ({gains})',
+            'status_gain_sweep_unstable': 'Test an der Maschine beendet: kein Satz hat innerhalb der Erfassungsdauer ausgeregelt',
+            'status_gain_sweep_failed': 'Test an der Maschine fehlgeschlagen: {error}',
+            'checkbox_ram_mode': 'RAM-Modus (ohne EEPROM)',
+            'tooltip_ram_mode': 'Setzt P0C-13 auf 0: geschriebene Parameter ändern nur das RAM des Antriebs, das EEPROM wird geschont. Ungespeicherte Werte gehen beim Ausschalten verloren; beim Ausschalten des Modus wird P0C-13 wiederhergestellt',
+            'button_eeprom_commit': 'Ins EEPROM speichern',
+            'tooltip_eeprom_commit': 'Schreibt alle nur im RAM geänderten Parameter mit P0C-13 = 1 erneut und übernimmt sie damit ins EEPROM',
+            'text_ram_dirty': 'Nur im RAM: {codes}',
+            'status_ram_mode_on': 'RAM-Modus eingeschaltet - Parameter werden nicht ins EEPROM geschrieben',
+            'status_ram_mode_off': 'RAM-Modus ausgeschaltet',
+            'status_ram_mode_uncommitted': 'RAM-Modus ausgeschaltet, nicht ins EEPROM übernommen: {codes}',
+            'status_ram_mode_failed': 'RAM-Modus: P0C-13 konnte nicht geschrieben werden: {error}',
+            'status_eeprom_committed': 'Ins EEPROM übernommen: {codes}',
+            'status_eeprom_commit_failed': 'Speichern ins EEPROM fehlgeschlagen: {error}',
+            'group_spectrum': 'Spektrum',
+            'checkbox_spectrum': 'Berechnen',
+            'tooltip_spectrum': 'Leistungsdichtespektrum (Welch) des gewählten Kanals, fortlaufend im Hintergrund berechnet. Mit festem Abtastintervall liegen die Abtastungen auf einem gleichmäßigen Raster',
+            'label_spectrum_segment': 'Segment',
+            'label_spectrum_update_rate': 'Aktualisierung',
+            'plot_xlabel_frequency': 'Frequenz',
+            'plot_ylabel_psd': 'Leistungsdichte (Einheit²/Hz)',
+            'text_spectrum_info': 'fs {sample_rate:.1f} Hz, Auflösung {resolution:.2f} Hz, {segments} Segmente',
+            'text_spectrum_peak': 'Maximum bei {peak:.2f} Hz',
+            'text_spectrum_estimated': '(Abtastrate geschätzt - festes Abtastintervall empfohlen)',
+            'group_frequency_response': 'Frequenzgang',
+            'label_fr_signal': 'Anregung',
+            'text_fr_chirp': 'Gleitsinus',
+            'text_fr_prbs': 'PRBS',
+            'label_fr_offset': 'Arbeitspunkt',
+            'label_fr_amplitude': 'Amplitude',
+            'label_fr_duration': 'Dauer',
+            'label_fr_f_start': 'f Start',
+            'label_fr_f_end': 'f Ende',
+            'label_fr_period': 'Periode',
+            'tooltip_fr_period': 'Zyklusperiode aus Schreiben von P06-03 und Lesen von P0B-00. 0 = kürzeste zuverlässig erreichbare Periode, vor der Messung bestimmt',
+            'tooltip_fr_start': 'Der Motor dreht! Regt den Drehzahlregelkreis über P06-03 um den Arbeitspunkt an und misst P0B-00 im selben Buszyklus. Der Plot wird dafür angehalten, am Ende wird P06-03 auf 0 gesetzt',
+            'plot_ylabel_magnitude': 'Betrag (dB)',
+            'plot_ylabel_phase': 'Phase (°)',
+            'plot_ylabel_coherence': 'Kohärenz',
+            'text_fr_progress': 'Zyklus {cycle} von {count}',
+            'text_fr_result': 'fs {sample_rate:.1f} Hz, {cycles} Zyklen, {missed} ausgelassen, Laufzeit {delay:.1f} ms, Bandbreite (-3 dB) {bandwidth}',
+            'status_fr_not_connected': 'Frequenzgang: keine Verbindung',
+            'status_fr_range': 'Frequenzgang: Arbeitspunkt ± Amplitude muss in {min} bis {max} rpm liegen',
+            'status_fr_started': 'Frequenzgangmessung läuft - der Motor dreht',
+            'status_fr_finished': 'Frequenzgangmessung beendet',
+            'status_fr_failed': 'Frequenzgangmessung fehlgeschlagen: {error}',
+            'plot_actual_speed': 'Actual Speed',
+            'plot_speed_cmd': 'Speed Cmd',
+            'plot_pos_dev': 'Pos Dev',
+            'plot_torque_cmd': 'Torque Cmd',
+            'plot_current': 'Current',
+            'text_not_available': 'N/A',
+            'plot_title_realtime_servo_data': 'Echtzeit-Servodaten',
+            'plot_xlabel_time': 'Zeit',
+            'plot_ylabel_value': 'Wert',
+            'validation_not_available': 'Validierung: N/A',
+            'validation_range': 'Bereich',
+            'validation_options': 'Optionen',
+            'validation_see_register_overview': 'Validierung: Siehe Registerübersicht',
+            'text_cursor_position_default': 'X: --, Y: --',
+            'tooltip_sampling_interval': 'Abtastintervall in Millisekunden; 0 = so schnell wie der Bus erlaubt. Dauert ein Buszyklus länger, werden Abtastungen ausgelassen und als Überlauf gemeldet',
+            'tooltip_number_of_data_points': 'Anzahl der Datenpunkte im Plot',
+            'label_axis_display': 'Mehrere Achsen',
+            'text_axis_display_overlay': 'Überlagert',
+            'text_axis_display_stacked': 'Gestapelt',
+            'text_axis': 'Achse',
+            'label_add_channel': 'Kanal hinzufügen',
+            'label_channel_rate': 'Abtastrate',
+            'text_rate_full': 'Maximal',
+            'tooltip_channel_rate': 'Abtastrate des gewählten Kanals; langsame Kanäle lassen den übrigen mehr Busbandbreite',
+            
+            # Allgemeine Begriffe
+            'settings': 'Einstellungen',
+            'language': 'Sprache',
+            'error': 'Fehler',
+            'warning': 'Warnung',
+            'info': 'Information',
+            'success': 'Erfolg',
+            'failed': 'Fehlgeschlagen',
+            'yes': 'Ja',
+            'no': 'Nein',
+            'ok': 'OK',
+            'cancel': 'Abbrechen'
+        }
+    
+    @staticmethod
+    def _translations_en():
+        """Englische Übersetzungen."""
+        return {
+            # Main window
+            'app_title': 'Servo Tuning & Diagnostic Tool',
+            
+            # Menu
+            'menu_file': 'File',
+            'menu_export_registers': 'Export All Registers...',
+            'menu_import_registers': 'Import All Registers...',
+            'menu_fleet_backup': 'Fleet Backup (multiple ports)...',
+            'menu_record_traffic': 'Record Modbus Traffic...',
+            
+            # Tab names
+            'tab_tuning_plot': 'Tuning & Plot',
+            'tab_io_status': 'I/O Status',
+            'tab_vdi_vdo': 'VDI/VDO Status',
+            'tab_register_overview': 'Register Overview',
+            'tab_fault_list': 'Fault List',
+            'tab_modbus_connection': 'Modbus Connection',
+            
+            # Language selection
+            'language_label': 'Language',
+            
+            # Status messages
+            'status_app_started': 'Application started. Please connect.',
+            'status_plot_started': 'Plot started.',
+            'status_plot_stopped': 'Plot stopped.',
+            'status_plot_cleared': 'Plot cleared.',
+            'status_connection_success': 'Connection successful.',
+            'status_simulation_started': 'Simulation mode started.',
+            'status_connection_failed': 'Connection failed.',
+            'status_connection_disconnected': 'Connection disconnected.',
+            'status_exporting_registers': 'Exporting all registers... Please wait.',
+            'status_plot_updated': 'Plot updated',
+            'status_values_missing': 'values missing',
+            'status_channels_without_data': 'channels without data',
+            'status_all_values_present': 'all values present',
+            'status_plot_error': 'Plot Error',
+            'status_plot': 'Plot',
+            'status_connection': 'Connection',
+            'status_visible_lines': 'Visible Lines',
+            'status_updates': 'Updates',
+            'status_runtime': 'Runtime',
+            'status_error': 'Error',
+            'status_connection_error': 'Connection Error',
+            'status_timeout': 'Timeout',
+            'status_export': 'Export',
+            'status_disconnected': 'Disconnected',
+            'status_worker_error': 'Worker Error',
+            'status_plot_worker_config_updated': 'Plot Worker Configuration Updated',
+            'status_invalid_input': 'Invalid Input',
+            'status_config_update_error': 'Configuration Update Error',
+            'status_inactive': 'Inactive',
+            'status_active': 'Active',
+            'status_errors': 'Errors',
+            'status_overruns': 'Overruns',
+            
+            # Connection
+            'group_modbus_connection_settings': 'Modbus Connection Settings',
+            'button_connect': 'Connect',
+            'button_disconnect': 'Disconnect',
+            'label_com_port': 'COM Port',
+            'label_baud_rate': 'Baud Rate',
+            'label_data_bits': 'Data Bits',
+            'label_parity': 'Parity',
+            'label_stop_bits': 'Stop Bits',
+            'label_modbus_address': 'Modbus Address',
+            'checkbox_simulation_mode': 'Simulation Mode',
+            'text_bps': 'bps',
+            'label_transport': 'Transport',
+            'text_transport_serial': 'Serial (Modbus RTU)',
+            'text_transport_tcp': 'Modbus TCP',
+            'text_transport_rtu_over_tcp': 'RTU over TCP (gateway)',
+            'label_host': 'Host',
+            'label_tcp_port': 'TCP port',
+            
+            # RTU timing
+            'group_rtu_timing': 'RTU Timing',
+            'label_inter_frame_delay': 'Inter-frame delay (ms)',
+            'label_response_delay': 'Response delay P0C-25 (ms)',
+            'label_min_transaction_time': 'Theoretical minimum (1 register)',
+            'label_measured_transaction_time': 'Measured (average / minimum)',
+            'label_link_efficiency': 'Link efficiency',
+            'button_default': 'Default',
+            'tooltip_modbus_addresses': 'One address or several drives on one line, e.g. "1,2,3" or "1-3"',
+            
+            # Baud rate discovery
+            'group_baud_discovery': 'Automatic Discovery',
+            'label_soak_test_reads': 'Block reads in soak test',
+            'button_discover_drive': 'Discover Drive',
+            'button_optimize_baud_rate': 'Optimize Baud Rate',
+            'title_optimize_baud_rate': 'Optimize Baud Rate',
+            'msg_optimize_baud_rate_confirm': 'The drive baud rate (P0C-02) will be raised step by step and each step checked with a soak test. The drive stays at the fastest error-free baud rate. Continue?',
+            
+            # Register
+            'placeholder_search_entire_list': 'Search entire list...',
+            'button_read_visible_parameters': 'Read Visible Parameters',
+            'button_write_modified_parameters': 'Write Modified Parameters',
+            'header_code': 'Code',
+            'header_name': 'Name',
+            'header_value': 'Value',
+            'header_modbus_raw_value': 'Modbus Raw Value',
+            'header_unit': 'Unit',
+            'header_default': 'Default',
+            'header_hex': 'Hex',
+            'header_range_options': 'Range/Options',
+            'header_resettable': 'Resettable',
+            'placeholder_select_parameter_for_details': 'Select a parameter from the table to view all details.',
+            'text_no_description': 'No Description',
+            'details_code': 'Code',
+            'details_name': 'Name',
+            'details_unit': 'Unit',
+            'details_default': 'Default',
+            'details_hex': 'Hex',
+            'details_decimal': 'Decimal',
+            'details_di_function_details': 'DI Function Details',
+            'details_do_function_details': 'DO Function Details',
+            'details_function': 'Function',
+            'details_description': 'Description',
+            'details_remarks': 'Remarks',
+            'details_validation': 'Validation',
+            'details_type': 'Type',
+            'details_range': 'Range',
+            'details_to': 'to',
+            'details_data_type': 'Data Type',
+            'details_decimal_places': 'Decimal Places',
+            'details_two_complement': 'Two\'s Complement',
+            'details_options': 'Options',
+            'details_bits': 'Bits',
+            'details_info': 'Info',
+            'details_handling': 'Details & Handling',
+            'status_no_modbus_connection': 'No Modbus connection.',
+            'status_reading_parameters': 'Reading',
+            'status_parameters': 'parameters...',
+            'status_visible_parameters_read': 'visible parameters read.',
+            'status_writing_modified_parameters': 'Writing modified parameters...',
+            'status_error_convert_to_number': 'Error: Could not convert',
+            'status_for': 'for',
+            'status_modified_parameters_written': 'modified parameter(s) written.',
+            'status_read_errors': 'read errors',
+            'status_write_errors': 'write errors',
+            'text_read_error': 'Read Error',
+            'text_options': 'Options',
+            'text_bitmask': 'Bitmask',
+            'text_raw': 'Raw',
+            'text_unknown': 'Unknown',
+            'text_unknown_value': 'Unknown Value',
+            'text_not_available': 'N/A',
+            
+            # Fault list
+            'placeholder_select_fault_for_details': 'Select a fault from the list for details.',
+            'text_no_details_available': 'No details available.',
+            
+            # I/O Status
+            'checkbox_enable_live_updates': 'Enable Live Updates',
+            'group_live_io_status': 'Live I/O Status',
+            'group_virtual_io_status': 'VDI/VDO Status',
+            'group_digital_inputs_di': 'Digital Inputs (DI)',
+            'group_digital_outputs_do': 'Digital Outputs (DO)',
+            'group_virtual_digital_inputs_vdi': 'Virtual Digital Inputs (VDI)',
+            'group_virtual_digital_outputs_vdo': 'Virtual Digital Outputs (VDO)',
+            'group_assigned_functions': 'Assigned Functions',
+            'text_no_functions_assigned': 'No Functions Assigned',
+            'text_input': 'Input',
+            'text_output': 'Output',
+            'text_not_assigned': 'Not Assigned',
+            'text_not_available': 'Not Available',
+            'text_error': 'Error',
+            'text_function': 'Function',
+            'text_description': 'Description',
+            'text_number': 'No.',
+            'text_state': 'State',
+            'text_action': 'Action',
+            'button_toggle': 'Toggle',
+            
+            # Tuning Tab
+            'group_tuning_parameters': 'Tuning Parameters',
+            'group_virtual_digital_io_vdi_vdo': 'VDI/VDO Status',
+            'button_read': 'Read',
+            'button_write': 'Write',
+            'button_switch_to_gain_set_2': 'Switch to Gain Set 2',
+            'button_switch_to_gain_set_1': 'Switch to Gain Set 1',
+            'label_note': 'Note',
+            'text_gain_set_activation': 'To activate Gain Set 2, P08-08 and P08-09 must be configured.',
+            'group_gain_parameter_set_1': 'Gain Parameter Set 1',
+            'group_gain_parameter_set_2': 'Gain Parameter Set 2',
+            'group_other_tuning_parameters': 'Other Tuning Parameters',
+            'group_direct_commands': 'Direct Commands',
+            'button_send': 'Send',
+            'button_set_all_commands_to_zero': 'Set All Commands to Zero',
+            'group_plot_settings': 'Plot Settings',
+            'label_sampling_interval': 'Sampling Interval',
+            'label_number_of_data_points': 'Number of Data Points',
+            'label_visible_time': 'Visible Time',
+            'button_apply': 'Apply',
+            'button_apply_config': 'Apply Configuration',
+            'label_watchdog_timeout': 'Watchdog Timeout',
+            'label_manual_control': 'Manual Control',
+            'button_start': 'Start',
+            'button_stop': 'Stop',
+            'button_clear': 'Clear',
+            'checkbox_advanced_plot_features': 'Advanced Plot Features (Zoom/Cursor)',
+            'checkbox_vdo_polling': 'Enable VDO Status',
+            'checkbox_process_acquisition': 'Acquire in separate process',
+            'tooltip_process_acquisition': 'Reads the plot channels in a separate process so that sampling is not slowed down by the user interface. Takes effect at the next plot start, single axis only',
+            'group_legend_visibility': 'Legend Visibility',
+            'group_realtime_data_plot': 'Realtime Data Plot',
+            'group_live_values': 'Live Values',
+            'group_step_response': 'Step Response',
+            'checkbox_step_analysis': 'Evaluate after sending P06-03',
+            'tooltip_step_analysis': 'After sending a speed command, evaluates speed command (P0B-01), actual speed (P0B-00) and torque (P0B-02) in the plot. Rise time 10-90 %, settling time until within ±2 % of the step height. The channels must be visible in the plot',
+            'label_step_capture': 'Capture time',
+            'header_step_run': 'No.',
+            'header_step_command': 'Command',
+            'header_step_gains': 'Gains (P08)',
+            'header_rise_time': 'Rise time (ms)',
+            'header_overshoot': 'Overshoot (%)',
+            'header_settling_time': 'Settling time (ms)',
+            'header_steady_state_error': 'Steady-state error',
+            'header_torque_peak': 'Torque peak (%)',
+            'status_step_no_data': 'Step response: no data from {codes} - channels visible in the plot?',
+            'status_step_no_step': 'Step response: no step detected in the command',
+            'status_step_evaluated': 'Step response {run} evaluated',
+            'group_gain_search': 'Gain search (simulation)',
+            'button_gain_search': 'Search',
+            'tooltip_gain_search': 'Fits a plant model to the selected (otherwise the latest) step response and evaluates combinations of P08-00 and P08-01 on it in parallel on all cores. Confirm the best candidates on the machine with a step',
+            'button_gain_apply': 'Apply',
+            'tooltip_gain_apply': 'Enters the selected candidate into P08-00 and P08-01; it is only written with "Write"',
+            'header_gain_cost': 'Cost',
+            'text_gain_fitting': 'Fitting plant to step response {run}...',
+            'text_gain_progress': 'Round {round}: {count} candidates evaluated',
+            'text_gain_plant': 'Plant: load inertia {inertia:.2f}x, deviation {error:.1f} rpm',
+            'status_gain_no_step': 'Gain search: record a step response first',
+            'status_gain_finished': 'Gain search finished: {count} candidates',
+            'status_gain_failed': 'Gain search failed: {error}',
+            'status_gain_applied': 'Candidate entered - apply with "Write" and confirm with a step',
+            'button_gain_sweep': 'Test on machine',
+            'tooltip_gain_sweep': 'The motor turns! Writes the values of the step response and each candidate in turn, repeats the same step and appends the metrics as runs. The plot is paused for this; at the end the previous values are written back and P06-03 is set to 0',
+            'text_gain_sweep_progress': '{count} of {total} sets tested',
+            'status_gain_sweep_not_connected': 'Test on machine: not connected',
+            'status_gain_sweep_started': 'Test on machine running - the motor turns',
+            'status_gain_sweep_finished': 'Test on machine finished: fastest stable set is run {run} ({gains})',
+            'status_gain_sweep_unstable': 'Test on machine finished: no set settled within the capture time',
+            'status_gain_sweep_failed': 'Test on machine failed: {error}',
+            'checkbox_ram_mode': 'RAM mode (no EEPROM)',
+            'tooltip_ram_mode': 'Sets P0C-13 to 0: written parameters only change the RAM of the drive, sparing the EEPROM. Unsaved values are lost at power-off; P0C-13 is restored when the mode is switched off',
+            'button_eeprom_commit': 'Save to EEPROM',
+            'tooltip_eeprom_commit': 'Writes all parameters changed only in RAM again with P0C-13 = 1, storing them in the EEPROM',
+            'text_ram_dirty': 'RAM only: {codes}',
+            'status_ram_mode_on': 'RAM mode on - parameters are not written to the EEPROM',
+            'status_ram_mode_off': 'RAM mode off',
+            'status_ram_mode_uncommitted': 'RAM mode off, not saved to EEPROM: {codes}',
+            'status_ram_mode_failed': 'RAM mode: P0C-13 could not be written: {error}',
+            'status_eeprom_committed': 'Saved to EEPROM: {codes}',
+            'status_eeprom_commit_failed': 'Saving to EEPROM failed: {error}',
+            'group_spectrum': 'Spectrum',
+            'checkbox_spectrum': 'Compute',
+            'tooltip_spectrum': 'Power spectral density (Welch) of the selected channel, computed continuously in the background. With a fixed sampling interval the samples lie on an even grid',
+            'label_spectrum_segment': 'Segment',
+            'label_spectrum_update_rate': 'Update',
+            'plot_xlabel_frequency': 'Frequency',
+            'plot_ylabel_psd': 'Power density (unit²/Hz)',
+            'text_spectrum_info': 'fs {sample_rate:.1f} Hz, resolution {resolution:.2f} Hz, {segments} segments',
+            'text_spectrum_peak': 'peak at {peak:.2f} Hz',
+            'text_spectrum_estimated': '(sample rate estimated - fixed sampling interval recommended)',
+            'group_frequency_response': 'Frequency response',
+            'label_fr_signal': 'Excitation',
+            'text_fr_chirp': 'Chirp',
+            'text_fr_prbs': 'PRBS',
+            'label_fr_offset': 'Operating point',
+            'label_fr_amplitude': 'Amplitude',
+            'label_fr_duration': 'Duration',
+            'label_fr_f_start': 'f start',
+            'label_fr_f_end': 'f end',
+            'label_fr_period': 'Period',
+            'tooltip_fr_period': 'Cycle period for writing P06-03 and reading P0B-00. 0 = shortest reliably reachable period, determined before the measurement',
+            'tooltip_fr_start': 'The motor turns! Excites the speed loop through P06-03 around the operating point and reads P0B-00 in the same bus cycle. The plot is stopped for this, P06-03 is set to 0 at the end',
+            'plot_ylabel_magnitude': 'Magnitude (dB)',
+            'plot_ylabel_phase': 'Phase (°)',
+            'plot_ylabel_coherence': 'Coherence',
+            'text_fr_progress': 'Cycle {cycle} of {count}',
+            'text_fr_result': 'fs {sample_rate:.1f} Hz, {cycles} cycles, {missed} missed, latency {delay:.1f} ms, bandwidth (-3 dB) {bandwidth}',
+            'status_fr_not_connected': 'Frequency response: not connected',
+            'status_fr_range': 'Frequency response: operating point ± amplitude must be within {min} to {max} rpm',
+            'status_fr_started': 'Frequency response measurement running - the motor turns',
+            'status_fr_finished': 'Frequency response measurement finished',
+            'status_fr_failed': 'Frequency response measurement failed: {error}',
+            'plot_actual_speed': 'Actual Speed',
+            'plot_speed_cmd': 'Speed Cmd',
+            'plot_pos_dev': 'Pos Dev',
+            'plot_torque_cmd': 'Torque Cmd',
+            'plot_current': 'Current',
+            'text_not_available': 'N/A',
+            'plot_title_realtime_servo_data': 'Realtime Servo Data',
+            'plot_xlabel_time': 'Time',
+            'plot_ylabel_value': 'Value',
+            'validation_not_available': 'Validation: N/A',
+            'validation_range': 'Range',
+            'validation_options': 'Options',
+            'validation_see_register_overview': 'Validation: See Register Overview',
+            'text_cursor_position_default': 'X: --, Y: --',
+            'tooltip_sampling_interval': 'Sampling interval in milliseconds; 0 = as fast as the bus allows. If a bus cycle takes longer, samples are skipped and reported as overruns',
+            'tooltip_number_of_data_points': 'Number of data points in the plot',
+            'label_axis_display': 'Multiple axes',
+            'text_axis_display_overlay': 'Overlay',
+            'text_axis_display_stacked': 'Stacked',
+            'text_axis': 'Axis',
+            'label_add_channel': 'Add channel',
+            'label_channel_rate': 'Sample rate',
+            'text_rate_full': 'Maximum',
+            'tooltip_channel_rate': 'Sample rate of the selected channel; slow channels leave more bus bandwidth to the others',
+            
+            # General terms
+            'settings': 'Settings',
+            'language': 'Language',
+            'error': 'Error',
+            'warning': 'Warning',
+            'info': 'Information',
+            'success': 'Success',
+            'failed': 'Failed',
+            'yes': 'Yes',
+            'no': 'No',
+            'ok': 'OK',
+            'cancel': 'Cancel'
         }
     
     def get_text(self, key):
@@ -468,6 +719,7 @@ class LanguageManager:
             bool: True, wenn die Sprache erfolgreich gesetzt wurde, sonst False
         """
         if language_code in self.supported_languages:
+            self._ensure_translations(language_code)
             self.current_language = language_code
             return True
         return False
@@ -45,6 +45,7 @@ class ServoLogger:
         console_handler.setLevel(logging.DEBUG)  # Ändere zu DEBUG, um alle Debug-Meldungen anzuzeigen
         console_handler.setFormatter(formatter)
         self.logger.addHandler(console_handler)
+        self.console_handler = console_handler
         
         # File Handler, wenn gewünscht
         if self.log_to_file:
@@ -75,8 +76,9 @@ class ServoLogger:
         self.logger.warning(message, **kwargs)
     
     def error(self, message: str, **kwargs):
-        """Loggt eine Fehlermeldung."""
-        self.logger.error(message, exc_info=True, **kwargs)
+        """Loggt eine Fehlermeldung (mit Traceback, sofern nicht exc_info=False übergeben wird)."""
+        kwargs.setdefault('exc_info', True)
+        self.logger.error(message, **kwargs)
     
     def critical(self, message: str, **kwargs):
         """Loggt eine kritische Fehlermeldung."""
@@ -124,6 +126,12 @@ class ServoLogger:
     def log_general_error(self, message: str):
         """Loggt allgemeine Fehlermeldungen."""
         self.error(message)
+    
+    def set_console_level(self, log_level: str):
+        """Setzt das Level der Konsolenausgabe (z.B. für die Kommandozeile), die Log-Datei bleibt unverändert."""
+        console_handler = getattr(self, 'console_handler', None)
+        if console_handler is not None:
+            console_handler.setLevel(getattr(logging, log_level.upper()))
 
 
 # Globale Logger-Instanz
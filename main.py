@@ -1,22 +1,19 @@
-import sys, json, csv, math, random, os
+import sys, json, csv, math, random, os, time
 from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel, QTabWidget, QAction, QMessageBox, QFileDialog, QComboBox, QHBoxLayout
 from PyQt5.QtCore import QTimer, Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QFont
 from collections import deque
 from parameter_manager import ParameterManager
-from modbus_client import ServoModbusClient
+from modbus_client import ServoModbusClient, preload_pymodbus, TRANSPORT_REPLAY, TRANSPORT_SERIAL, TRANSPORT_TCP
 from ui_tabs.connection_tab import ConnectionTab
-from ui_tabs.fault_list_tab import FaultListTab
-from ui_tabs.io_status_tab import IOStatusTab
-from ui_tabs.register_tab import RegisterTab
-from ui_tabs.tuning_tab import TuningTab
-from ui_tabs.vdi_vdo_tab import VDIVDOTab
 from language_manager import LanguageManager
 from workers.export_worker import ExportWorker
 from workers.plot_data_worker import PlotDataWorker
 from workers.import_worker import ImportWorker
+from workers.baud_discovery_worker import BaudDiscoveryWorker
 from utils.modbus_helpers import ModbusHelper, UIHelper
 from utils.io_helpers import IOHelper
+from utils.parameter_store import ParameterStore
 from custom_exceptions import (
     ModbusConnectionException,
     ModbusReadException,
@@ -24,7 +21,8 @@ from custom_exceptions import (
     ModbusTimeoutException,
     ParameterValidationException,
     FileOperationException,
-    ConfigurationException
+    ConfigurationException,
+    ServoToolException
 )
 from logger_config import logger
 
@@ -68,10 +66,34 @@ class AppConfig:
     BASE_FONT_SIZE = 9
     MAX_DPI_SCALE = 1.5
     MIN_FONT_SIZE = 8
+    # Verzögerung nach dem Start, bevor die übrigen Tabs im Hintergrund aufgebaut werden
+    DEFERRED_TABS_DELAY_MS = 50
+
+
+def _deferred_tab(name):
+    """Eigenschaft für einen Tab, der erst beim ersten Zugriff aufgebaut wird"""
+    return property(lambda self: self.get_tab(name))
 
 
 class ServoTuningApp(QMainWindow):
     
+    # Tabs in Anzeigereihenfolge: (Attributname, Übersetzungsschlüssel des Tab-Namens)
+    TAB_DEFINITIONS = (
+        ('tuning_tab', 'tab_tuning_plot'),
+        ('io_tab', 'tab_io_status'),
+        ('vdi_vdo_tab', 'tab_vdi_vdo'),
+        ('register_tab', 'tab_register_overview'),
+        ('fault_tab', 'tab_fault_list'),
+        ('connection_tab', 'tab_modbus_connection'),
+    )
+    
+    tuning_tab = _deferred_tab('tuning_tab')
+    io_tab = _deferred_tab('io_tab')
+    vdi_vdo_tab = _deferred_tab('vdi_vdo_tab')
+    register_tab = _deferred_tab('register_tab')
+    fault_tab = _deferred_tab('fault_tab')
+    connection_tab = _deferred_tab('connection_tab')
+    
     def __init__(self):
         super().__init__()
         
@@ -85,14 +107,24 @@ class ServoTuningApp(QMainWindow):
         self.parameter_manager = ParameterManager()
         self.parameter_manager.load_parameters()
         self.modbus_client = ServoModbusClient()
+        # Last known parameter values shared by all tabs
+        self.parameter_store = ParameterStore()
         
-        # Load configuration data
-        self.fault_data = self._load_json_data("servo_faults.json")
-        self.pxx_mapping = self._load_json_data("servo_parameters_mapping.json")
+        # Configuration data is loaded when the tab that needs it is built
+        self.fault_data = None
+        self.pxx_mapping = None
+        
+        # Tabs: built tabs and placeholders of the tabs not built yet
+        self._tabs = {}
+        self._tab_placeholders = {}
+        self._io_helper = None
+        self._io_helper_failed = False
         
         # Initialize state
         self.simulation_mode = False
         self.simulation_time = 0
+        self.virtual_drive = None
+        self.connection_params = None
         
         # Setup IO timer (bleibt unverändert)
         self.io_timer = QTimer(self)
@@ -105,19 +137,23 @@ class ServoTuningApp(QMainWindow):
         self.vdo_polling_timer.timeout.connect(self.update_vdo_polling)
         
         # Setup plot worker thread (ersetzt den Timer)
-        self.plot_worker = PlotDataWorker(self.modbus_client, self.parameter_manager, self)
-        self.plot_worker.data_updated.connect(self.update_plot_with_data)
-        self.plot_worker.watchdog_triggered.connect(self.handle_plot_worker_watchdog)
+        self.plot_worker = None
+        self._create_plot_worker()
         
         # Initialize worker threads
         self.export_worker = None
         self.import_worker = None
+        self.baud_discovery_worker = None
+        self.fleet_export_worker = None
         
         # Initialize UI
         self.init_ui()
         
         # Set window title using language manager
         self.update_window_title()
+        
+        # Build the remaining tabs once the window is shown
+        QTimer.singleShot(AppConfig.DEFERRED_TABS_DELAY_MS, self._build_next_deferred_tab)
 
     def is_connected(self):
         """Prüft, ob eine Verbindung besteht oder der Simulationsmodus aktiv ist"""
@@ -224,16 +260,21 @@ class ServoTuningApp(QMainWindow):
         # Add widgets to layout
         self.main_layout.addWidget(self.tabs)
         self.main_layout.addWidget(self.status_label)
-        
-        # Initialize IO helper after tabs are created
-        try:
-            self.io_helper = IOHelper(self.parameter_manager, self.modbus_client, self.io_tab, self.vdi_vdo_tab, self.status_label, self.tuning_tab)
-            logger.info(f"io_helper initialisiert: {self.io_helper is not None}")
-            logger.debug(f"io_helper ID nach Initialisierung: {id(self.io_helper)}")
-        except Exception as e:
-            logger.error(f"Fehler bei der Initialisierung des IO-Helpers: {e}")
-            self.io_helper = None
-            QMessageBox.critical(self, "Fehler", f"IO-Helper konnte nicht initialisiert werden: {e}")
+    
+    @property
+    def io_helper(self):
+        """IO helper, created on first use (needs the IO, VDI/VDO and tuning tabs)"""
+        if self._io_helper is None and not self._io_helper_failed:
+            try:
+                self._io_helper = IOHelper(self.parameter_manager, self.modbus_client, self.io_tab, self.vdi_vdo_tab, self.status_label, self.tuning_tab,
+                                           parameter_store=self.parameter_store)
+                logger.info(f"io_helper initialisiert: {self._io_helper is not None}")
+                logger.debug(f"io_helper ID nach Initialisierung: {id(self._io_helper)}")
+            except Exception as e:
+                logger.error(f"Fehler bei der Initialisierung des IO-Helpers: {e}")
+                self._io_helper_failed = True
+                QMessageBox.critical(self, "Fehler", f"IO-Helper konnte nicht initialisiert werden: {e}")
+        return self._io_helper
 
     def create_menu_bar(self):
         """Create the application menu bar"""
@@ -252,6 +293,17 @@ class ServoTuningApp(QMainWindow):
         self.import_action.setEnabled(True)  # Import should always be enabled
         file_menu.addAction(self.import_action)
         
+        # Fleet backup action (uses its own connections, one process per serial port)
+        self.fleet_export_action = QAction(self.language_manager.get_text("menu_fleet_backup"), self)
+        self.fleet_export_action.triggered.connect(self.export_fleet)
+        file_menu.addAction(self.fleet_export_action)
+        
+        # Record all Modbus transactions for later replay (transport 'replay')
+        self.record_action = QAction(self.language_manager.get_text("menu_record_traffic"), self)
+        self.record_action.setCheckable(True)
+        self.record_action.toggled.connect(self.toggle_recording)
+        file_menu.addAction(self.record_action)
+        
         # Add language selection to menu bar
         language_label = QLabel(self.language_manager.get_text("language_label") + ":")
         self.language_combo = QComboBox()
@@ -279,77 +331,171 @@ class ServoTuningApp(QMainWindow):
         menubar.setCornerWidget(language_widget)
 
     def create_tabs(self):
-        """Create and setup all tabs"""
-        # Initialize tab objects
-        self.tuning_tab = TuningTab(self)
-        self.io_tab = IOStatusTab(self, self.language_manager)
-        self.vdi_vdo_tab = VDIVDOTab(self, self.language_manager)
-        self.register_tab = RegisterTab(self.parameter_manager, self.modbus_client, self)
-        self.fault_tab = FaultListTab(self.fault_data, self)
-        self.connection_tab = ConnectionTab(self)
-        
-        # Add tabs to widget
-        tabs_config = {
-            self.language_manager.get_text("tab_tuning_plot"): self.tuning_tab,
-            self.language_manager.get_text("tab_io_status"): self.io_tab,
-            self.language_manager.get_text("tab_vdi_vdo"): self.vdi_vdo_tab,
-            self.language_manager.get_text("tab_register_overview"): self.register_tab,
-            self.language_manager.get_text("tab_fault_list"): self.fault_tab,
-            self.language_manager.get_text("tab_modbus_connection"): self.connection_tab
-        }
-        
-        for name, tab in tabs_config.items():
-            self.tabs.addTab(tab, name)
-
-        # Connect signals
-        self.tuning_tab.plot_control_signal.connect(self.handle_plot_control)
-        self.io_tab.polling_checkbox.stateChanged.connect(self.toggle_io_polling)
-        self.vdi_vdo_tab.polling_checkbox.stateChanged.connect(self.toggle_io_polling)
-        self.vdi_vdo_tab.vdi_toggled.connect(self.handle_vdi_toggle)
-        self.tuning_tab.vdi_toggled.connect(self.handle_vdi_toggle)
-        self.tuning_tab.vdo_polling_toggled.connect(self.handle_vdo_polling_toggle)
-        self.connection_tab.connect_button.clicked.connect(self.toggle_connection)
-        self._connect_tuning_signals()
+        """Create the connection tab and placeholders for all other tabs"""
+        # Nur der Verbindungs-Tab wird sofort aufgebaut, die übrigen Tabs (Plot,
+        # Registerbaum, Fehlerliste) beim ersten Zugriff oder nach dem Anzeigen des Fensters
+        for name, text_key in self.TAB_DEFINITIONS:
+            if name == 'connection_tab':
+                widget = self._create_connection_tab()
+                self._tabs[name] = widget
+            else:
+                widget = QWidget()
+                self._tab_placeholders[name] = widget
+            self.tabs.addTab(widget, self.language_manager.get_text(text_key))
         
-        # Synchronisiere die Polling-Checkboxen
-        self.io_tab.polling_checkbox.stateChanged.connect(self.sync_polling_checkboxes)
-        self.vdi_vdo_tab.polling_checkbox.stateChanged.connect(self.sync_polling_checkboxes)
+        # Mit dem Verbindungs-Tab starten
+        self.tabs.setCurrentWidget(self._tabs['connection_tab'])
         
         # Verbinde das Tab-Wechsel-Signal
         self.tabs.currentChanged.connect(self.on_tab_changed)
 
-    def _connect_tuning_signals(self):
+    def get_tab(self, name):
+        """Return a tab, building it on first access"""
+        tab = self._tabs.get(name)
+        if tab is None:
+            tab = self._build_tab(name)
+        return tab
+
+    def get_created_tabs(self):
+        """Return the tabs built so far {attribute name: tab} without building others"""
+        return dict(self._tabs)
+
+    def get_tab_text_key(self, widget):
+        """Return the translation key of the tab name for a tab or placeholder widget"""
+        name = self._get_tab_name(widget)
+        return dict(self.TAB_DEFINITIONS).get(name)
+
+    def _get_tab_name(self, widget):
+        """Return the attribute name of a tab or placeholder widget without building it"""
+        for tabs in (self._tabs, self._tab_placeholders):
+            for name, tab in tabs.items():
+                if tab is widget:
+                    return name
+        return None
+
+    def _build_tab(self, name):
+        """Build a tab and put it in place of its placeholder"""
+        start_time = time.perf_counter()
+        tab = getattr(self, f"_create_{name}")()
+        self._tabs[name] = tab
+        
+        placeholder = self._tab_placeholders.pop(name, None)
+        if placeholder is not None:
+            index = self.tabs.indexOf(placeholder)
+            was_current = self.tabs.currentIndex() == index
+            text = self.tabs.tabText(index)
+            # Austausch ohne currentChanged, der Tab bleibt an seiner Position
+            self.tabs.blockSignals(True)
+            try:
+                self.tabs.removeTab(index)
+                self.tabs.insertTab(index, tab, text)
+                if was_current:
+                    self.tabs.setCurrentIndex(index)
+            finally:
+                self.tabs.blockSignals(False)
+            placeholder.deleteLater()
+        
+        if self.is_connected() and hasattr(tab, 'set_enabled'):
+            tab.set_enabled(True)
+        logger.debug(f"Tab {name} aufgebaut in {(time.perf_counter() - start_time) * 1000:.0f} ms")
+        return tab
+
+    def _build_next_deferred_tab(self):
+        """Build the remaining tabs one by one after the window is shown"""
+        for name, _ in self.TAB_DEFINITIONS:
+            if name not in self._tabs:
+                self.get_tab(name)
+                # Zwischen den Tabs die Ereignisschleife laufen lassen, damit das Fenster bedienbar bleibt
+                QTimer.singleShot(0, self._build_next_deferred_tab)
+                return
+        # Zuletzt pymodbus laden, damit der erste Verbindungsaufbau nicht darauf warten muss
+        preload_pymodbus()
+
+    def _create_connection_tab(self):
+        tab = ConnectionTab(self)
+        tab.connect_button.clicked.connect(self.toggle_connection)
+        tab.discover_button.clicked.connect(self.start_baud_discovery)
+        tab.optimize_baud_button.clicked.connect(self.start_baud_optimization)
+        return tab
+
+    def _create_tuning_tab(self):
+        from ui_tabs.tuning_tab import TuningTab
+        tab = TuningTab(self)
+        tab.plot_control_signal.connect(self.handle_plot_control)
+        tab.vdi_toggled.connect(self.handle_vdi_toggle)
+        tab.vdo_polling_toggled.connect(self.handle_vdo_polling_toggle)
+        self._connect_tuning_signals(tab)
+        return tab
+
+    def _create_io_tab(self):
+        from ui_tabs.io_status_tab import IOStatusTab
+        tab = IOStatusTab(self, self.language_manager)
+        tab.polling_checkbox.stateChanged.connect(self.toggle_io_polling)
+        # Synchronisiere die Polling-Checkboxen
+        tab.polling_checkbox.stateChanged.connect(self.sync_polling_checkboxes)
+        return tab
+
+    def _create_vdi_vdo_tab(self):
+        from ui_tabs.vdi_vdo_tab import VDIVDOTab
+        tab = VDIVDOTab(self, self.language_manager)
+        tab.polling_checkbox.stateChanged.connect(self.toggle_io_polling)
+        tab.vdi_toggled.connect(self.handle_vdi_toggle)
+        # Synchronisiere die Polling-Checkboxen
+        tab.polling_checkbox.stateChanged.connect(self.sync_polling_checkboxes)
+        return tab
+
+    def _create_register_tab(self):
+        from ui_tabs.register_tab import RegisterTab
+        if self.pxx_mapping is None:
+            self.pxx_mapping = self._load_json_data("servo_parameters_mapping.json")
+        return RegisterTab(self.parameter_manager, self.modbus_client, self)
+
+    def _create_fault_tab(self):
+        from ui_tabs.fault_list_tab import FaultListTab
+        if self.fault_data is None:
+            self.fault_data = self._load_json_data("servo_faults.json")
+        return FaultListTab(self.fault_data, self)
+
+    def _connect_tuning_signals(self, tuning_tab):
         """Connect all tuning-related signals"""
         # Connect parameter widgets
-        for widgets in self.tuning_tab.tuning_widgets.values():
+        for widgets in tuning_tab.tuning_widgets.values():
             p, w, r, w_btn, t = widgets.values()
             if t == "combobox":
                 r.clicked.connect(lambda _, p=p, w=w: self.read_parameter_combobox(p, w))
-                w_btn.clicked.connect(lambda _, p=p, w=w: self.write_parameter_combobox(p, w))
+                w_btn.clicked.connect(lambda _, p=p, w=w: self.write_tuning_parameter_combobox(p, w))
             else:
                 r.clicked.connect(lambda _, p=p, w=w: self.read_parameter(p, w))
-                w_btn.clicked.connect(lambda _, p=p, w=w: self.write_parameter(p, w))
+                w_btn.clicked.connect(lambda _, p=p, w=w: self.write_tuning_parameter(p, w))
         
         # Connect direct command widgets
-        for widgets in self.tuning_tab.direct_cmd_widgets.values():
+        for widgets in tuning_tab.direct_cmd_widgets.values():
             widgets["send_btn"].clicked.connect(
                 lambda _, p=widgets["param"], w=widgets["widget"]: 
                 self.write_parameter_and_start_plot(p, w)
             )
         
         # Connect stop button
-        self.tuning_tab.stop_all_btn.clicked.connect(self.send_zero_commands_and_start_plot)
+        tuning_tab.stop_all_btn.clicked.connect(self.send_zero_commands_and_start_plot)
     
     def handle_plot_control(self, action):
         """Handle plot control actions"""
         if action == "start":
+            # A frequency response measurement or gain sweep owns the bus until it has finished
+            if self.tuning_tab.is_bus_busy():
+                return
             if self.is_connected() and not self.plot_worker.isRunning():
                 # Aktualisiere die Liste der sichtbaren Linien
                 visible_lines = []
                 for code, line in self.tuning_tab.lines.items():
                     if line.isVisible():
                         visible_lines.append(code)
+                # Erfassung im GUI-Thread oder im eigenen Prozess (Einstellung im Tuning-Tab)
+                in_process = self._use_process_acquisition()
+                if in_process != (type(self.plot_worker) is not PlotDataWorker):
+                    self._create_plot_worker(in_process)
                 self.plot_worker.update_visible_lines(visible_lines)
+                self.plot_worker.set_channel_rates(self.tuning_tab.channel_rates)
                 
                 self.plot_worker.start()
                 self.status_label.setText("Plot gestartet.")
@@ -380,26 +526,29 @@ class ServoTuningApp(QMainWindow):
         
         if self.simulation_mode:
             is_connected = True
+            self._start_virtual_drive()
             logger.info("Simulationsmodus aktiviert")
         else:
             try:
                 connection_params = self.connection_tab.get_connection_parameters()
+                self.connection_params = connection_params
+                endpoint = connection_params.get('host') or connection_params.get('port', 'unbekannt')
                 # Timeouts konfigurieren, falls in den Verbindungseinstellungen angegeben
                 if 'timeout' in connection_params:
                     self.modbus_client.set_timeouts(default_timeout=connection_params['timeout'])
                 
                 is_connected = self.modbus_client.connect(**connection_params)
                 if is_connected:
-                    logger.log_modbus_connection(connection_params.get('host', 'unbekannt'), True)
+                    logger.log_modbus_connection(endpoint, True)
                 else:
-                    logger.log_modbus_connection(connection_params.get('host', 'unbekannt'), False, "Unbekannter Fehler")
+                    logger.log_modbus_connection(endpoint, False, "Unbekannter Fehler")
             except ModbusConnectionException as e:
-                logger.log_modbus_connection(connection_params.get('host', 'unbekannt'), False, str(e))
+                logger.log_modbus_connection(endpoint, False, str(e))
                 self.status_label.setText(f"Verbindungsfehler: {str(e)}")
                 self._disconnect()
                 return
             except ModbusTimeoutException as e:
-                logger.log_timeout("Verbindung", connection_params.get('host', 'unbekannt'), connection_params.get('timeout', 0))
+                logger.log_timeout("Verbindung", endpoint, connection_params.get('timeout', 0))
                 self.status_label.setText(f"Timeout bei Verbindung: {str(e)}")
                 self._disconnect()
                 return
@@ -410,6 +559,14 @@ class ServoTuningApp(QMainWindow):
                 return
         
         if is_connected:
+            # Alle Achsen am Bus im Plot abfragen
+            if self.modbus_client.connected:
+                slave_ids = self.modbus_client.get_slave_ids()
+            else:
+                slave_ids = self._simulation_slave_ids()
+            self.plot_worker.set_slave_ids(slave_ids)
+            self.tuning_tab.set_plot_axes(slave_ids)
+            
             status_msg = "Simulationsmodus gestartet." if self.simulation_mode else "Verbindung erfolgreich."
             self.status_label.setText(status_msg)
             self.set_ui_connected_state(True)
@@ -417,6 +574,47 @@ class ServoTuningApp(QMainWindow):
             self.status_label.setText("Verbindung fehlgeschlagen.")
             self._disconnect()
             
+    def _simulation_slave_ids(self):
+        """Slave IDs entered in the connection tab, used for the simulated axes"""
+        try:
+            return self.connection_tab.get_connection_parameters()["slave_ids"]
+        except ValueError:
+            return [1]
+
+    def _start_virtual_drive(self):
+        """
+        Start the in-process virtual drive and connect the Modbus client to it.
+
+        The plot then shows the response of the physical servo model, so parameter
+        writes from the tuning tab change the plotted behaviour. If the virtual drive
+        cannot be started, the plot worker falls back to synthetic curves.
+        """
+        # pymodbus-Server und NumPy-Modell erst bei Bedarf laden
+        from simulator.virtual_drive import LatencyModel, VirtualDriveServer
+        slave_ids = self._simulation_slave_ids()
+        try:
+            self.virtual_drive = VirtualDriveServer(transport=TRANSPORT_TCP, port=0, slave_ids=slave_ids,
+                                                    latency=LatencyModel())
+            self.virtual_drive.start()
+            self.connection_params = {
+                'transport': TRANSPORT_TCP, 'host': self.virtual_drive.host, 'tcp_port': self.virtual_drive.port,
+                'slave_id': slave_ids[0], 'slave_ids': slave_ids,
+            }
+            self.modbus_client.connect(**self.connection_params)
+            logger.info(f"Virtueller Antrieb auf Port {self.virtual_drive.port} gestartet")
+        except (OSError, ServoToolException) as e:
+            logger.warning(f"Virtueller Antrieb nicht verfügbar, Simulation mit synthetischen Daten: {e}")
+            if self.modbus_client.client:
+                self.modbus_client.disconnect()
+            self._stop_virtual_drive()
+            self.connection_params = None
+
+    def _stop_virtual_drive(self):
+        """Stop the virtual drive of the simulation mode, if running"""
+        if self.virtual_drive is not None:
+            self.virtual_drive.stop()
+            self.virtual_drive = None
+
     def _disconnect(self):
         """Disconnect and cleanup"""
         # Stop plot worker and IO timer
@@ -427,31 +625,40 @@ class ServoTuningApp(QMainWindow):
         if self.vdo_polling_timer.isActive():
             self.vdo_polling_timer.stop()
         
+        # Restore P0C-13 while the connection is still open
+        tuning_tab = self._tabs.get('tuning_tab')
+        if tuning_tab is not None:
+            tuning_tab.end_ram_mode()
+        
         # Always attempt to disconnect the client if it exists,
         # as a port might be open even if our logical connection failed.
         if self.modbus_client.client:
             self.modbus_client.disconnect()
+        self._stop_virtual_drive()
+        # The next connection may reach a different drive
+        self.parameter_store.invalidate()
              
         # Reset state
         self.simulation_mode = False
+        self.connection_params = None
         self.simulation_time = 0
         
         # Setze den Simulationsmodus im Plot-Worker zurück
         self.plot_worker.set_simulation_mode(False)
         
-        # Setze die Flags für das Lesen der Funktionen zurück
-        if self.io_helper:
-            self.io_helper.reset_function_flags()
+        # Setze die Flags für das Lesen der Funktionen zurück (ohne die Tabs dafür aufzubauen)
+        if self._io_helper is not None:
+            self._io_helper.reset_function_flags()
         
         self.set_ui_connected_state(False)
         self.status_label.setText("Verbindung getrennt.")
 
     def set_ui_connected_state(self, connected):
         """Update UI elements based on connection state"""
-        self.tuning_tab.set_enabled(connected)
-        self.io_tab.set_enabled(connected)
-        self.vdi_vdo_tab.set_enabled(connected)
-        self.register_tab.set_enabled(connected)
+        # Tabs, die noch nicht aufgebaut sind, übernehmen den Zustand beim Aufbau
+        for name, tab in self.get_created_tabs().items():
+            if name != 'connection_tab' and hasattr(tab, 'set_enabled'):
+                tab.set_enabled(connected)
         self.connection_tab.set_connected_state(connected)
         
         # Export is only possible with a real connection
@@ -574,6 +781,60 @@ class ServoTuningApp(QMainWindow):
             except Exception as e:
                 logger.error(f"Fehler beim Lesen der VDO-Daten: {e}")
     
+    def _create_plot_worker(self, in_process=False):
+        """
+        Create the plot worker and connect its signals.
+
+        Axes, configuration and simulation mode are taken over from the previous worker.
+        With in_process the plot channels are acquired in a separate process
+        (workers.acquisition_process_worker), otherwise in a QThread.
+        """
+        if in_process:
+            from workers.acquisition_process_worker import AcquisitionProcessWorker
+            worker = AcquisitionProcessWorker(self.modbus_client, self.parameter_manager, self)
+            worker.samples_updated.connect(self.update_plot_with_samples)
+        else:
+            worker = PlotDataWorker(self.modbus_client, self.parameter_manager, self)
+        worker.data_updated.connect(self.update_plot_with_data)
+        worker.axis_data_updated.connect(self.update_plot_with_axis_data)
+        worker.watchdog_triggered.connect(self.handle_plot_worker_watchdog)
+        
+        previous = self.plot_worker
+        if previous is not None:
+            worker.update_config(dict(previous.config))
+            worker.set_slave_ids(previous.slave_ids)
+            worker.set_simulation_mode(previous.simulation_mode)
+            worker.sample_listeners = previous.sample_listeners
+        self.plot_worker = worker
+        return worker
+    
+    def _use_process_acquisition(self):
+        """Whether the plot is acquired in a separate process (single axis over a real or virtual connection)"""
+        tuning_tab = getattr(self, 'tuning_tab', None)
+        if tuning_tab is None or not tuning_tab.process_acquisition_checkbox.isChecked():
+            return False
+        params = self.connection_params
+        return (self.modbus_client.connected and params is not None
+                and params.get('transport', TRANSPORT_SERIAL) != TRANSPORT_REPLAY
+                and self.modbus_client.recorder is None
+                and len(self.plot_worker.slave_ids) <= 1)
+    
+    def stop_plot_worker(self):
+        """Stop the plot worker (thread or acquisition process), the spectrum worker and a running
+        frequency response measurement or gain search, e.g. when the application quits"""
+        if self.plot_worker is not None and self.plot_worker.isRunning():
+            self.plot_worker.stop()
+        tuning_tab = getattr(self, 'tuning_tab', None)
+        if tuning_tab is not None:
+            tuning_tab.stop_background_workers()
+    
+    def update_plot_with_samples(self, times, columns):
+        """Passes samples from the acquisition process to the plot (NumPy views, only valid during the call)"""
+        try:
+            self.tuning_tab.update_plot_samples(times, columns)
+        except Exception as e:
+            logger.error(f"Fehler beim Aktualisieren des Plots: {e}")
+    
     def update_plot_with_data(self, values):
         """Aktualisiert den Plot mit den vom Worker-Thread erhaltenen Daten"""
         # Die Simulationsdaten werden jetzt direkt im PlotDataWorker generiert
@@ -585,6 +846,14 @@ class ServoTuningApp(QMainWindow):
             logger.error(f"Fehler beim Aktualisieren des Plots: {e}")
             # Nicht kritisch, fahre mit der nächsten Aktualisierung fort
     
+    def update_plot_with_axis_data(self, slave_id, values):
+        """Aktualisiert den Plot mit den Daten einer Achse im Multi-Drop-Betrieb"""
+        try:
+            self.tuning_tab.update_plot(values, slave_id)
+            QApplication.processEvents()  # Halte die GUI responsive
+        except Exception as e:
+            logger.error(f"Fehler beim Aktualisieren des Plots für Achse {slave_id}: {e}")
+    
     def handle_plot_worker_watchdog(self, message):
         """Handles watchdog events from the plot worker."""
         logger.warning(f"Plot Worker Watchdog: {message}")
@@ -602,10 +871,11 @@ class ServoTuningApp(QMainWindow):
                     self.plot_worker.stop()
                     self.plot_worker.wait(1000)  # Warte bis zu 1 Sekunde
                 
-                # Erstelle einen neuen Worker
-                self.plot_worker = PlotDataWorker(self.modbus_client, self.parameter_manager, self)
-                self.plot_worker.data_updated.connect(self.update_plot_with_data)
-                self.plot_worker.watchdog_triggered.connect(self.handle_plot_worker_watchdog)
+                # Erstelle einen neuen Worker gleicher Art (mit Achsen und Konfiguration des bisherigen)
+                self._create_plot_worker(in_process=type(self.plot_worker) is not PlotDataWorker)
+                self.plot_worker.set_channel_rates(self.tuning_tab.channel_rates)
+                self.plot_worker.update_visible_lines(
+                    [code for code, line in self.tuning_tab.lines.items() if line.isVisible()])
                 
                 # Starte den neuen Worker
                 self.plot_worker.start()
@@ -653,13 +923,15 @@ class ServoTuningApp(QMainWindow):
     
     def is_io_tab_active(self):
         """Prüft, ob einer der IO-Status-Tabs aktiv ist"""
-        current_tab = self.tabs.currentWidget()
-        return current_tab == self.io_tab or current_tab == self.vdi_vdo_tab
+        return self._get_tab_name(self.tabs.currentWidget()) in ('io_tab', 'vdi_vdo_tab')
     
     def on_tab_changed(self, index):
         """Wird aufgerufen, wenn der Tab gewechselt wird"""
-        current_tab = self.tabs.widget(index)
-        is_io_tab = current_tab == self.io_tab or current_tab == self.vdi_vdo_tab
+        name = self._get_tab_name(self.tabs.widget(index))
+        if name in self._tab_placeholders:
+            # Noch nicht aufgebauter Tab wurde ausgewählt
+            self.get_tab(name)
+        is_io_tab = name in ('io_tab', 'vdi_vdo_tab')
         
         # Wenn zu einem IO-Tab gewechselt wird und die Polling-Checkbox aktiv ist, starte das Polling
         if is_io_tab and (self.io_tab.polling_checkbox.isChecked() or self.vdi_vdo_tab.polling_checkbox.isChecked()):
@@ -673,33 +945,50 @@ class ServoTuningApp(QMainWindow):
     
     def read_parameter(self, p, w):
         """Read a parameter and update widget"""
-        ModbusHelper.read_parameter(self.modbus_client, p, w, self.status_label, self._disconnect)
+        ModbusHelper.read_parameter(self.modbus_client, p, w, self.status_label, self._disconnect,
+                                    store=self.parameter_store)
 
     def write_parameter(self, p, w):
-        """Write a parameter from widget value"""
+        """Write a parameter from widget value, returns True on success"""
         try:
             value_to_write = float(w.text())
             if not self._validate_parameter(p, value_to_write):
-                return  # Stop if validation fails
-            ModbusHelper.write_parameter(self.modbus_client, p, int(value_to_write), self.status_label, self._disconnect)
+                return False  # Stop if validation fails
+            return ModbusHelper.write_parameter(self.modbus_client, p, int(value_to_write), self.status_label, self._disconnect,
+                                                store=self.parameter_store)
         except ValueError:
             self.status_label.setText("Fehler: Ungültiger Wert für Eingabe.")
+            return False
 
     def read_parameter_combobox(self, p, w):
         """Read parameter for combobox widget"""
-        ModbusHelper.read_parameter_combobox(self.modbus_client, p, w, self.status_label, self._disconnect)
+        ModbusHelper.read_parameter_combobox(self.modbus_client, p, w, self.status_label, self._disconnect,
+                                             store=self.parameter_store)
 
     def write_parameter_combobox(self, p, w):
         """Write parameter from combobox widget"""
         value_to_write = w.currentData()
         display_text = w.currentText()
-        ModbusHelper.write_parameter(self.modbus_client, p, int(value_to_write), self.status_label, self._disconnect, display_text)
+        return ModbusHelper.write_parameter(self.modbus_client, p, int(value_to_write), self.status_label, self._disconnect, display_text,
+                                            store=self.parameter_store)
+
+    def write_tuning_parameter(self, p, w):
+        """Write a tuning parameter; in RAM mode it is remembered for the EEPROM commit"""
+        if self.write_parameter(p, w):
+            self.tuning_tab.record_ram_write(p, int(float(w.text())))
+
+    def write_tuning_parameter_combobox(self, p, w):
+        """Write a tuning parameter from a combobox; in RAM mode it is remembered for the EEPROM commit"""
+        if self.write_parameter_combobox(p, w):
+            self.tuning_tab.record_ram_write(p, int(w.currentData()))
     
     def write_parameter_and_start_plot(self, p, w):
         """Write parameter and start plot if successful"""
         self.write_parameter(p, w)
         # Check if write was successful before starting plot by checking status
         if "erfolgreich" in self.status_label.text():
+            # Evaluate the step response from this write on (speed command only)
+            self.tuning_tab.arm_step_capture(p.code)
             self.handle_plot_control("start")
 
     def send_zero_commands(self):
@@ -761,6 +1050,81 @@ class ServoTuningApp(QMainWindow):
             self._disconnect()
         self.export_worker = None
 
+    def toggle_recording(self, checked):
+        """Start or stop recording the Modbus transactions to a file"""
+        if not checked:
+            count = self.modbus_client.stop_recording()
+            self.status_label.setText(f"Aufzeichnung beendet: {count} Transaktionen.")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Modbus-Verkehr aufzeichnen", "modbus_aufzeichnung.jsonl",
+                                              "Aufzeichnungen (*.jsonl)")
+        if not path:
+            self._reset_record_action()
+            return
+        try:
+            self.modbus_client.start_recording(path)
+            self.status_label.setText(f"Aufzeichnung läuft: {os.path.basename(path)}")
+        except FileOperationException as e:
+            logger.error(f"Aufzeichnung konnte nicht gestartet werden: {e}")
+            self.status_label.setText(f"Aufzeichnung fehlgeschlagen: {e}")
+            self._reset_record_action()
+
+    def _reset_record_action(self):
+        """Uncheck the record action without triggering toggle_recording"""
+        self.record_action.blockSignals(True)
+        self.record_action.setChecked(False)
+        self.record_action.blockSignals(False)
+
+    def export_fleet(self):
+        """Back up several drives on several serial ports in parallel"""
+        if self.fleet_export_worker is not None:
+            return
+        # Erst bei Bedarf laden (Prozess-Pool und Archivierung werden beim Start nicht gebraucht)
+        from workers.fleet_export_worker import FleetExportWorker
+        from utils.fleet_backup import load_fleet_file
+        if self.is_connected() and not self.simulation_mode:
+            self.status_label.setText("Flotten-Sicherung: Bitte zuerst die Verbindung trennen.")
+            return
+
+        fleet_path, _ = QFileDialog.getOpenFileName(self, "Flottendatei öffnen", "", "JSON-Dateien (*.json)")
+        if not fleet_path:
+            return
+        try:
+            jobs = load_fleet_file(fleet_path)
+        except (ConfigurationException, FileOperationException) as e:
+            self.status_label.setText(str(e))
+            return
+
+        path, _ = QFileDialog.getSaveFileName(self, "Flotten-Sicherung speichern", "", "ZIP-Archive (*.zip)")
+        if not path:
+            return
+
+        self.fleet_export_worker = FleetExportWorker(jobs, self.parameter_manager.get_all_parameters_raw(), path)
+        self.fleet_export_worker.progress_updated.connect(self.status_label.setText)
+        self.fleet_export_worker.finished.connect(self._on_fleet_export_finished)
+        self.fleet_export_worker.error_occurred.connect(self._on_fleet_export_error)
+        self.fleet_export_action.setEnabled(False)
+        self.fleet_export_worker.start()
+        self.status_label.setText(f"Sichere {sum(len(j['slave_ids']) for j in jobs)} Antriebe an {len(jobs)} Ports... Bitte warten.")
+
+    def _on_fleet_export_finished(self, index, archive_path):
+        """Handler for fleet backup completion"""
+        saved = sum(1 for drive in index['drives'] if drive['file'])
+        failed = len(index['drives']) - saved
+        logger.log_file_operation("Flotten-Export", archive_path, True)
+        message = f"{saved} Antriebe in {index['total_duration']:.1f}s gesichert nach {archive_path}"
+        if failed:
+            message += f" ({failed} nicht erreichbar)"
+        self.status_label.setText(message)
+        self.fleet_export_action.setEnabled(True)
+        self.fleet_export_worker = None
+
+    def _on_fleet_export_error(self, error_message):
+        """Handler for fleet backup errors"""
+        self.status_label.setText(error_message)
+        self.fleet_export_action.setEnabled(True)
+        self.fleet_export_worker = None
+
     def import_all_registers(self):
         """Import registers from JSON file using worker thread"""
         path, _ = QFileDialog.getOpenFileName(self, "Register importieren", "", "JSON-Dateien (*.json)")
@@ -792,6 +1156,75 @@ class ServoTuningApp(QMainWindow):
         self.status_label.setText(error_message)
         self.import_worker = None
 
+    def start_baud_discovery(self):
+        """Search the drive's serial settings using worker thread"""
+        params = self.connection_tab.get_connection_parameters()
+        self._start_baud_discovery_worker(BaudDiscoveryWorker.MODE_DISCOVER, params)
+        self.status_label.setText("Suche Antrieb... Bitte warten.")
+
+    def start_baud_optimization(self):
+        """Raise the drive's baud rate to the fastest stable setting using worker thread"""
+        reply = QMessageBox.question(
+            self,
+            self.language_manager.get_text("title_optimize_baud_rate"),
+            self.language_manager.get_text("msg_optimize_baud_rate_confirm"),
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+
+        params = self.connection_tab.get_connection_parameters()
+        settings = {key: params[key] for key in ("baudrate", "parity", "stopbits")}
+        self._start_baud_discovery_worker(BaudDiscoveryWorker.MODE_OPTIMIZE, params, settings)
+        self.status_label.setText("Optimiere Baudrate... Bitte warten.")
+
+    def _start_baud_discovery_worker(self, mode, params, settings=None):
+        self.baud_discovery_worker = BaudDiscoveryWorker(
+            mode,
+            params["port"],
+            params["slave_id"],
+            settings=settings,
+            soak_reads=self.connection_tab.soak_reads_input.value()
+        )
+        self.baud_discovery_worker.progress_updated.connect(self.status_label.setText)
+        self.baud_discovery_worker.finished.connect(self._on_baud_discovery_finished)
+        self.baud_discovery_worker.error_occurred.connect(self._on_baud_discovery_error)
+        self.connection_tab.set_discovery_running(True)
+        self.baud_discovery_worker.start()
+
+    def _on_baud_discovery_finished(self, mode, result):
+        """Handler for discovery/optimization completion"""
+        self.connection_tab.set_discovery_running(False)
+        self.baud_discovery_worker = None
+
+        if mode == BaudDiscoveryWorker.MODE_DISCOVER:
+            self.connection_tab.apply_connection_settings(result)
+            self.status_label.setText(
+                f"Antrieb gefunden: {result['baudrate']} Baud, Parität {result['parity']}, "
+                f"{result['stopbits']} Stoppbits"
+            )
+            return
+
+        self.connection_tab.apply_connection_settings(result['settings'])
+        baseline = result['baseline']
+        best = result['best']
+        message = (
+            f"Baudrate: {result['settings']['baudrate']} Baud\n"
+            f"Durchsatz vorher: {baseline['registers_per_second']:.0f} Register/s\n"
+            f"Durchsatz jetzt: {best['registers_per_second']:.0f} Register/s"
+        )
+        if result['gain'] is not None:
+            message += f"\nGewinn: {(result['gain'] - 1) * 100:.0f} %"
+        self.status_label.setText(message.replace("\n", " | "))
+        QMessageBox.information(self, self.language_manager.get_text("title_optimize_baud_rate"), message)
+
+    def _on_baud_discovery_error(self, error_message):
+        """Handler for discovery/optimization errors"""
+        self.connection_tab.set_discovery_running(False)
+        self.status_label.setText(error_message)
+        self.baud_discovery_worker = None
+
     def _validate_parameter(self, param, value):
         """Validate parameter value against defined rules"""
         if not param.validation:
@@ -836,6 +1269,10 @@ class ServoTuningApp(QMainWindow):
 
 
 if __name__ == "__main__":
+    # Required for the fleet backup process pool in frozen (PyInstaller) builds
+    import multiprocessing
+    multiprocessing.freeze_support()
+    
     # CRITICAL: Setup High-DPI support BEFORE creating QApplication
     setup_high_dpi()
     
@@ -849,5 +1286,7 @@ if __name__ == "__main__":
         logger.info(f"Screen Size: {screen.size().width()}x{screen.size().height()}")
     
     window = ServoTuningApp()
+    # Erfassungsprozess bzw. -thread vor dem Beenden stoppen
+    app.aboutToQuit.connect(window.stop_plot_worker)
     window.show()
     sys.exit(app.exec_())
\ No newline at end of file
@@ -1,36 +1,144 @@
-from pymodbus.client import ModbusSerialClient as ModbusClient
-from pymodbus.exceptions import ModbusException, ConnectionException, ModbusIOException
-from pymodbus.payload import BinaryPayloadDecoder, BinaryPayloadBuilder
-from pymodbus.constants import Endian
 import time
 from custom_exceptions import (
+    ServoToolException,
+    FileOperationException,
     ModbusConnectionException,
     ModbusReadException,
     ModbusWriteException,
     ModbusTimeoutException
 )
 from logger_config import logger
+from utils.rtt_estimator import RttEstimator
+from utils.rtu_timing import LinkTimingStats, inter_frame_gap, min_transaction_time
+
+# Modbus-Funktionscodes, nach denen die Round-Trip-Zeiten getrennt geschätzt werden
+FC_READ_HOLDING_REGISTERS = 3
+FC_WRITE_SINGLE_REGISTER = 6
+FC_WRITE_MULTIPLE_REGISTERS = 16
+
+# P0C-25: Antwortverzögerung des Antriebs auf Modbus-Anfragen in ms
+RESPONSE_DELAY_ADDRESS = 3097
+RESPONSE_DELAY_MAX_MS = 5000
+
+# Übertragungswege: serielle Leitung (RTU), Modbus TCP und RTU-Rahmen über TCP (Gateways);
+# 'replay' beantwortet die Anfragen aus einer Aufzeichnung (siehe utils.modbus_recorder)
+TRANSPORT_SERIAL = 'serial'
+TRANSPORT_TCP = 'tcp'
+TRANSPORT_RTU_OVER_TCP = 'rtu_over_tcp'
+TRANSPORT_REPLAY = 'replay'
+TRANSPORTS = (TRANSPORT_SERIAL, TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP, TRANSPORT_REPLAY)
+DEFAULT_TCP_PORT = 502
+
+# pymodbus wird erst beim ersten Verbindungsaufbau geladen (verkürzt den Programmstart
+# um das Laden von pymodbus und asyncio). Bis dahin sind die Namen nicht belegt.
+ModbusClient = ModbusTcpClient = FramerType = None
+ModbusException = ConnectionException = ModbusIOException = None
+BinaryPayloadDecoder = BinaryPayloadBuilder = Endian = None
+
+
+def preload_pymodbus():
+    """Lädt pymodbus, falls noch nicht geschehen, und belegt die Modulnamen."""
+    global ModbusClient, ModbusTcpClient, FramerType, ModbusException, ConnectionException, ModbusIOException
+    global BinaryPayloadDecoder, BinaryPayloadBuilder, Endian
+    if ModbusClient is not None:
+        return
+    from pymodbus import FramerType as _FramerType
+    from pymodbus.client import ModbusSerialClient, ModbusTcpClient as _ModbusTcpClient
+    from pymodbus.exceptions import ModbusException as _ModbusException, ConnectionException as _ConnectionException, ModbusIOException as _ModbusIOException
+    from pymodbus.payload import BinaryPayloadDecoder as _BinaryPayloadDecoder, BinaryPayloadBuilder as _BinaryPayloadBuilder
+    from pymodbus.constants import Endian as _Endian
+    ModbusException, ConnectionException, ModbusIOException = _ModbusException, _ConnectionException, _ModbusIOException
+    BinaryPayloadDecoder, BinaryPayloadBuilder, Endian = _BinaryPayloadDecoder, _BinaryPayloadBuilder, _Endian
+    ModbusTcpClient, FramerType = _ModbusTcpClient, _FramerType
+    ModbusClient = ModbusSerialClient
+
+def parse_slave_ids(text):
+    """
+    Wertet eine Liste von Slave-IDs aus, z.B. "1", "1,2,3" oder "1-4".
+    
+    Args:
+        text: Slave-IDs, durch Komma getrennt; Bereiche mit Bindestrich
+        
+    Returns:
+        list: Eindeutige Slave-IDs in angegebener Reihenfolge
+        
+    Raises:
+        ValueError: Bei ungültigen oder fehlenden IDs
+    """
+    slave_ids = []
+    for part in str(text).replace(';', ',').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = (int(v) for v in part.split('-', 1))
+            ids = range(start, end + 1) if start <= end else range(start, end - 1, -1)
+        else:
+            ids = [int(part)]
+        for slave_id in ids:
+            if not 1 <= slave_id <= 247:
+                raise ValueError(f"Slave-ID {slave_id} außerhalb des gültigen Bereichs 1-247")
+            if slave_id not in slave_ids:
+                slave_ids.append(slave_id)
+    if not slave_ids:
+        raise ValueError("Keine Slave-ID angegeben")
+    return slave_ids
+
 
 class ServoModbusClient:
-    def __init__(self, default_timeout=1.0, read_timeout=2.0):
+    def __init__(self, default_timeout=1.0, read_timeout=2.0, adaptive_timeout=True, min_timeout=0.02):
         self.client = None
         self.connected = False
         self.default_timeout = default_timeout
         self.read_timeout = read_timeout
         self.slave_id = None
+        self.slave_ids = []
         self.last_error = None
+        
+        # Adaptive Timeouts aus gemessenen Round-Trip-Zeiten (EWMA + Streuung, wie TCP-RTO)
+        self.adaptive_timeout = adaptive_timeout
+        self.timeout_estimator = RttEstimator(
+            min_timeout=min_timeout,
+            max_timeout=read_timeout,
+            initial_timeout=default_timeout
+        )
+        self._applied_timeout = None
+        
+        # RTU-Zeitverhalten: Schnittstellenparameter, Pausen und Messwerte
+        self.transport = TRANSPORT_SERIAL
+        self.serial_settings = None
+        self.inter_frame_delay = None  # None = Normwert (3,5 Zeichen bzw. 1,75 ms)
+        self.response_delay = 0.0      # Zuletzt gelesener/geschriebener Wert von P0C-25 in s
+        self.link_timing = LinkTimingStats()
+        
+        # Aktive Aufzeichnung der Transaktionen (utils.modbus_recorder.TransactionRecorder)
+        self.recorder = None
+        
+        # Schlanker RTU-Lesepfad für zyklische Abfragen (rtu_fast_reader), nur bei serieller Verbindung
+        self.fast_reads = True
+        self._rtu_reader = None
+        
+        # Erfassungsprozess, der die serielle Schnittstelle übernommen hat (siehe hand_over_port)
+        self.remote = None
 
-    def connect(self, port, baudrate, bytesize, parity, stopbits, slave_id):
+    def connect(self, port=None, baudrate=19200, bytesize=8, parity='E', stopbits=2, slave_id=1, slave_ids=None,
+                transport=TRANSPORT_SERIAL, host=None, tcp_port=DEFAULT_TCP_PORT, replay_speed=1.0):
         """
         Stellt eine Verbindung zum Modbus-Gerät her.
         
         Args:
-            port: Serieller Port
+            port: Serieller Port (bei transport='serial') bzw. Aufzeichnungsdatei (bei transport='replay')
             baudrate: Baudrate
             bytesize: Anzahl der Datenbits
             parity: Parität (N/E/O/M/S)
             stopbits: Anzahl der Stoppbits
-            slave_id: Slave-ID des Geräts
+            slave_id: Slave-ID des Geräts (Standard für alle Zugriffe)
+            slave_ids: Optionale Liste aller Slave-IDs am Bus (Multi-Drop)
+            transport: 'serial', 'tcp' (Modbus TCP), 'rtu_over_tcp' (RTU-Rahmen über ein TCP-Gateway)
+                oder 'replay' (Wiedergabe einer Aufzeichnung)
+            host: Hostname oder IP-Adresse (nur bei TCP)
+            tcp_port: TCP-Port (Standard: 502)
+            replay_speed: Zeitfaktor der Wiedergabe (1 = Originalzeit, 0 = ohne Wartezeit)
             
         Returns:
             bool: True bei erfolgreicher Verbindung, False bei Fehler
@@ -39,10 +147,21 @@ class ServoModbusClient:
             ModbusConnectionException: Bei Verbindungsfehlern
             ModbusTimeoutException: Bei Timeouts während der Verbindung
         """
+        preload_pymodbus()
+        is_tcp = transport in (TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP)
+        if is_tcp:
+            port = f"{host}:{tcp_port}"
         try:
             # Parameter validieren
-            if not port:
-                error_msg = "Kein Port angegeben"
+            if transport not in TRANSPORTS:
+                error_msg = f"Unbekannter Übertragungsweg: {transport}"
+                logger.log_modbus_connection("unbekannt", False, error_msg)
+                raise ModbusConnectionException(error_msg)
+            if (is_tcp and not host) or (not is_tcp and not port):
+                if is_tcp:
+                    error_msg = "Kein Host angegeben"
+                else:
+                    error_msg = "Keine Aufzeichnung angegeben" if transport == TRANSPORT_REPLAY else "Kein Port angegeben"
                 logger.log_modbus_connection("unbekannt", False, error_msg)
                 raise ModbusConnectionException(error_msg)
                 
@@ -51,20 +170,17 @@ class ServoModbusClient:
                 bytesize = int(bytesize)
                 stopbits = int(stopbits)
                 slave_id = int(slave_id)
+                tcp_port = int(tcp_port)
             except ValueError as e:
                 error_msg = f"Ungültige Verbindungsparameter: {e}"
                 logger.log_modbus_connection(port, False, error_msg)
                 raise ModbusConnectionException(error_msg)
                 
             # Client mit Timeout erstellen
-            self.client = ModbusClient(
-                port=port,
-                baudrate=baudrate,
-                bytesize=bytesize,
-                parity=parity,
-                stopbits=stopbits,
-                timeout=self.default_timeout
-            )
+            self.client = self._create_client(transport, port, baudrate, bytesize, parity, stopbits, host, tcp_port,
+                                              replay_speed)
+            if self.recorder is not None:
+                self._wrap_recording_client()
             
             # Verbindung mit Timeout-Überwachung herstellen
             start_time = time.time()
@@ -78,8 +194,26 @@ class ServoModbusClient:
                 
             if self.connected:
                 self.slave_id = slave_id
+                self.slave_ids = [int(s) for s in slave_ids] if slave_ids else [slave_id]
+                # Messwerte einer früheren Verbindung gelten nicht für die neue Leitung
+                self.timeout_estimator.reset()
+                self._applied_timeout = None
+                self.transport = transport
+                # Über TCP ist die Leitungsgeschwindigkeit unbekannt, es gibt keine RTU-Zeitrechnung;
+                # eine Wiedergabe übernimmt die Schnittstellenparameter der Aufnahme
+                if transport == TRANSPORT_REPLAY:
+                    self.serial_settings = self.client.header.get('serial_settings')
+                else:
+                    self.serial_settings = None if is_tcp else {
+                        'baudrate': baudrate, 'bytesize': bytesize,
+                        'parity': parity, 'stopbits': stopbits
+                    }
+                if is_tcp:
+                    self._disable_nagle()
+                self.link_timing.reset()
+                self._apply_inter_frame_delay()
                 logger.log_modbus_connection(port, True)
-                print(f"Modbus-Verbindung erfolgreich hergestellt zu {port} in {connection_time:.2f}s.")
+                logger.debug(f"Modbus-Verbindung erfolgreich hergestellt zu {port} in {connection_time:.2f}s.")
                 return True
             else:
                 error_msg = f"Modbus-Verbindung konnte nicht hergestellt werden zu {port}"
@@ -101,29 +235,150 @@ class ServoModbusClient:
             self.last_error = str(e)
             logger.log_modbus_connection(port, False, str(e))
             raise ModbusConnectionException(f"Modbus-Fehler: {e}")
+        except ServoToolException:
+            # Eigene Exceptions unverändert weitergeben
+            self.connected = False
+            raise
         except Exception as e:
             self.connected = False
             self.last_error = str(e)
             logger.log_modbus_connection(port, False, str(e))
             raise ModbusConnectionException(f"Allgemeiner Verbindungsfehler: {e}")
 
+    def _create_client(self, transport, port, baudrate, bytesize, parity, stopbits, host, tcp_port, replay_speed=1.0):
+        """Erzeugt den pymodbus-Client für den gewählten Übertragungsweg."""
+        if transport == TRANSPORT_REPLAY:
+            from utils.modbus_recorder import ReplayClient
+            try:
+                return ReplayClient(port, speed=replay_speed)
+            except FileOperationException as e:
+                raise ModbusConnectionException(str(e))
+        if transport == TRANSPORT_SERIAL:
+            return ModbusClient(
+                port=port,
+                baudrate=baudrate,
+                bytesize=bytesize,
+                parity=parity,
+                stopbits=stopbits,
+                timeout=self.default_timeout
+            )
+        # Ein RTU-Gateway reicht die RTU-Rahmen unverändert weiter, ohne MBAP-Kopf
+        framer = FramerType.SOCKET if transport == TRANSPORT_TCP else FramerType.RTU
+        return ModbusTcpClient(host, framer=framer, port=tcp_port, timeout=self.default_timeout)
+
+    def _disable_nagle(self):
+        """Schaltet die Nagle-Verzögerung ab, damit kurze Anfragen sofort gesendet werden."""
+        sock = getattr(self.client, 'socket', None)
+        if sock is None:
+            return
+        try:
+            import socket
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            logger.debug(f"DEBUG: TCP_NODELAY konnte nicht gesetzt werden: {e}")
+
+    def start_recording(self, path):
+        """
+        Zeichnet ab jetzt alle Transaktionen in eine Datei auf (auch über Neuverbindungen hinweg).
+        
+        Args:
+            path: Zieldatei (JSON Lines, siehe utils.modbus_recorder)
+            
+        Raises:
+            FileOperationException: Wenn die Datei nicht angelegt werden kann
+        """
+        preload_pymodbus()
+        from utils.modbus_recorder import TransactionRecorder
+        self.stop_recording()
+        self.recorder = TransactionRecorder(
+            path,
+            transport=self.transport if self.connected else None,
+            serial_settings=self.serial_settings if self.connected else None,
+            slave_ids=self.get_slave_ids()
+        )
+        if self.client is not None:
+            self._wrap_recording_client()
+        logger.info(f"Aufzeichnung der Modbus-Transaktionen gestartet: {path}")
+    
+    def stop_recording(self):
+        """
+        Beendet die Aufzeichnung.
+        
+        Returns:
+            int: Anzahl der aufgezeichneten Transaktionen (0 ohne aktive Aufzeichnung)
+        """
+        if self.recorder is None:
+            return 0
+        recorder, self.recorder = self.recorder, None
+        wrapped = getattr(self.client, 'wrapped', None)
+        if wrapped is not None:
+            self.client = wrapped
+        recorder.close()
+        logger.info(f"Aufzeichnung beendet: {recorder.count} Transaktionen in {recorder.path}")
+        return recorder.count
+    
+    def _wrap_recording_client(self):
+        from utils.modbus_recorder import RecordingClient
+        self.client = RecordingClient(getattr(self.client, 'wrapped', self.client), self.recorder)
+
     def disconnect(self):
         """Trennt die Verbindung zum Modbus-Gerät."""
         if self.client and self.connected:
             try:
                 self.client.close()
             except Exception as e:
-                print(f"Fehler beim Trennen der Verbindung: {e}")
+                logger.warning(f"Fehler beim Trennen der Verbindung: {e}")
         self.connected = False
-        print("Modbus-Verbindung getrennt.")
+        self._rtu_reader = None
+        self.remote = None
+        logger.info("Modbus-Verbindung getrennt.")
 
-    def read_holding_register(self, address, count=1):
+    def hand_over_port(self, remote):
+        """
+        Schließt die serielle Schnittstelle, damit ein anderer Prozess (Erfassungsprozess) sie öffnen kann.
+        
+        Die Verbindung gilt weiter als hergestellt; bis take_back_port() werden alle
+        Registerzugriffe mit remote.call(Methodenname, ...) im anderen Prozess ausgeführt.
+        
+        Args:
+            remote: Objekt mit call(method, *args, **kwargs), z.B. utils.acquisition_process.AcquisitionProcess
+        """
+        if self.client is not None:
+            try:
+                self.client.close()
+            except Exception as e:
+                logger.warning(f"Fehler beim Schließen der Schnittstelle: {e}")
+        self._rtu_reader = None
+        self.remote = remote
+        logger.info("Serielle Schnittstelle an den Erfassungsprozess übergeben")
+
+    def take_back_port(self):
+        """
+        Öffnet die Schnittstelle nach hand_over_port() wieder in diesem Prozess.
+        
+        Raises:
+            ModbusConnectionException: Wenn die Schnittstelle nicht wieder geöffnet werden kann
+        """
+        if self.remote is None:
+            return
+        self.remote = None
+        if self.client is None or not self.connected:
+            return
+        if not self.client.connect():
+            self.connected = False
+            self.last_error = "Schnittstelle konnte nicht wieder geöffnet werden"
+            raise ModbusConnectionException(self.last_error)
+        self._apply_inter_frame_delay()
+        logger.info("Serielle Schnittstelle vom Erfassungsprozess zurückgenommen")
+
+    def read_holding_register(self, address, count=1, slave=None):
         """
         Liest Holding-Register vom Modbus-Gerät.
         
         Args:
             address: Startadresse des Registers (1-basiert, wie in der JSON-Datei)
             count: Anzahl der zu lesenden Register (Standard: 1)
+            slave: Slave-ID des Antriebs (Standard: Slave-ID der Verbindung)
             
         Returns:
             list: Liste der Registerwerte oder None bei Fehler
@@ -133,26 +388,35 @@ class ServoModbusClient:
             ModbusTimeoutException: Bei Timeouts während des Lesens
             ModbusConnectionException: Bei Verbindungsproblemen
         """
+        if self.remote is not None:
+            return self.remote.call('read_holding_register', address, count=count, slave=slave)
         if not self.connected:
             error_msg = "Keine Verbindung zum Gerät"
             logger.log_modbus_operation("Lesen", address, False, error_msg=error_msg)
             raise ModbusConnectionException(error_msg)
             
         try:
-            # Startzeit für Timeout-Überwachung
-            start_time = time.time()
+            # Timeout für diese Transaktion setzen und Startzeit für Timeout-Überwachung
+            timeout, start_time = self._begin_transaction(FC_READ_HOLDING_REGISTERS, count)
             
             # Konvertiere 1-basierte Adresse zu 0-basierter Modbus-Adresse
-            result = self.client.read_holding_registers(address, count=count, slave=self.slave_id)
+            result = self.client.read_holding_registers(address, count=count, slave=self.slave_id if slave is None else slave)
             
             # Überprüfen, ob die Operation zu lange gedauert hat
-            operation_time = time.time() - start_time
+            operation_time = self._end_transaction(FC_READ_HOLDING_REGISTERS, count, timeout, start_time, result)
             if operation_time > self.read_timeout:
                 error_msg = f"Timeout beim Lesen von Register {address} nach {self.read_timeout}s"
                 logger.log_timeout("Lesen", address, operation_time)
                 self.last_error = error_msg
                 raise ModbusTimeoutException(error_msg)
                 
+            if isinstance(result, ModbusIOException):
+                # Keine Antwort vom Gerät (pymodbus liefert den Fehler zurück statt ihn auszulösen)
+                error_msg = f"Keine Antwort beim Lesen von Register {address}: {result}"
+                self.last_error = error_msg
+                logger.log_modbus_operation("Lesen", address, False, error_msg=error_msg)
+                raise ModbusTimeoutException(error_msg)
+                
             if result.isError():
                 # Prüfe auf spezifische Modbus-Exception-Codes
                 if hasattr(result, 'exception_code'):
@@ -160,6 +424,11 @@ class ServoModbusClient:
                         error_msg = f"Ungültige Registeradresse {address}. Das Register existiert nicht oder ist nicht lesbar."
                     elif result.exception_code == 3:  # Illegal Data Value
                         error_msg = f"Ungültiger Datenwert für Register {address}."
+                    elif result.exception_code in (10, 11):  # Gateway: Ziel nicht erreichbar
+                        error_msg = f"Gateway meldet keine Antwort von Slave {slave if slave is not None else self.slave_id} beim Lesen von Register {address}."
+                        self.last_error = error_msg
+                        logger.log_modbus_operation("Lesen", address, False, error_msg=error_msg)
+                        raise ModbusTimeoutException(error_msg)
                     else:
                         error_msg = f"Modbus-Fehler (Code {result.exception_code}) beim Lesen von Register {address}: {result}"
                 else:
@@ -175,25 +444,115 @@ class ServoModbusClient:
             
         except ModbusIOException as e:
             self.last_error = str(e)
+            self.timeout_estimator.record_timeout(FC_READ_HOLDING_REGISTERS, count)
             logger.log_modbus_operation("Lesen", address, False, error_msg=str(e))
             raise ModbusTimeoutException(f"Modbus-IO-Fehler (Timeout) beim Lesen von Register {address}: {e}")
         except ModbusException as e:
             self.last_error = str(e)
             logger.log_modbus_operation("Lesen", address, False, error_msg=str(e))
             raise ModbusReadException(f"Modbus-Fehler beim Lesen von Register {address}: {e}")
+        except ServoToolException:
+            # Eigene Exceptions (z.B. Timeout) unverändert weitergeben
+            raise
         except Exception as e:
             self.last_error = str(e)
             logger.log_modbus_operation("Lesen", address, False, error_msg=str(e))
             raise ModbusReadException(f"Allgemeiner Fehler beim Lesen von Register {address}: {e}")
 
-    def read_holding_register_32bit(self, address, is_signed=False, byteorder=Endian.BIG):
+    def read_holding_register_fast(self, address, count=1, slave=None):
+        """
+        Liest Holding-Register über den schlanken RTU-Lesepfad (für zyklische Abfragen wie die Plot-Erfassung).
+        
+        Erfolgreiche Zugriffe werden nicht einzeln protokolliert. Ohne serielle Verbindung,
+        während einer Aufzeichnung oder mit fast_reads=False wird read_holding_register verwendet.
+        
+        Args:
+            address: Startadresse des Registers
+            count: Anzahl der zu lesenden Register (Standard: 1)
+            slave: Slave-ID des Antriebs (Standard: Slave-ID der Verbindung)
+            
+        Returns:
+            list: Liste der Registerwerte
+            
+        Raises:
+            ModbusReadException: Bei Fehlern beim Lesen
+            ModbusTimeoutException: Bei Timeouts während des Lesens
+            ModbusConnectionException: Bei Verbindungsproblemen
+        """
+        reader = self._fast_reader()
+        if reader is None:
+            return self.read_holding_register(address, count=count, slave=slave)
+        
+        timeout, start_time = self._begin_transaction(FC_READ_HOLDING_REGISTERS, count)
+        try:
+            registers = reader.read_holding_registers(address, count, self.slave_id if slave is None else slave)
+        except ServoToolException as e:
+            if isinstance(e, ModbusTimeoutException):
+                self.timeout_estimator.record_timeout(FC_READ_HOLDING_REGISTERS, count)
+            self.last_error = str(e)
+            logger.log_modbus_operation("Lesen", address, False, error_msg=str(e))
+            raise
+        self._record_success(FC_READ_HOLDING_REGISTERS, count, time.perf_counter() - start_time, timeout)
+        return registers
+    
+    def write_holding_register_fast(self, address, value, slave=None):
+        """
+        Schreibt ein Holding-Register über den schlanken RTU-Pfad (für zyklische Sollwerte wie die Frequenzgangmessung).
+        
+        Erfolgreiche Zugriffe werden nicht einzeln protokolliert. Ohne serielle Verbindung,
+        während einer Aufzeichnung oder mit fast_reads=False wird write_holding_register verwendet.
+        
+        Args:
+            address: Adresse des Registers
+            value: Zu schreibender 16-Bit-Wert
+            slave: Slave-ID des Antriebs (Standard: Slave-ID der Verbindung)
+            
+        Returns:
+            bool: True bei Erfolg
+            
+        Raises:
+            ModbusWriteException: Bei Fehlern beim Schreiben
+            ModbusTimeoutException: Bei Timeouts während des Schreibens
+            ModbusConnectionException: Bei Verbindungsproblemen
+        """
+        reader = self._fast_reader()
+        if reader is None:
+            return self.write_holding_register(address, value, slave=slave)
+        
+        timeout, start_time = self._begin_transaction(FC_WRITE_SINGLE_REGISTER, 1)
+        try:
+            reader.write_register(address, value, self.slave_id if slave is None else slave)
+        except ServoToolException as e:
+            if isinstance(e, ModbusTimeoutException):
+                self.timeout_estimator.record_timeout(FC_WRITE_SINGLE_REGISTER, 1)
+            self.last_error = str(e)
+            logger.log_modbus_operation("Schreiben", address, False, value, str(e))
+            raise
+        self._record_success(FC_WRITE_SINGLE_REGISTER, 1, time.perf_counter() - start_time, timeout)
+        return True
+    
+    def _fast_reader(self):
+        """RTU-Lesepfad auf dem Port des pymodbus-Clients oder None, wenn er nicht verwendet werden kann"""
+        if (not self.fast_reads or not self.connected or self.transport != TRANSPORT_SERIAL
+                or self.recorder is not None or self.remote is not None):
+            return None
+        port = getattr(self.client, 'socket', None)
+        if port is None:
+            return None
+        if self._rtu_reader is None or self._rtu_reader.port is not port:
+            from rtu_fast_reader import RtuFastReader
+            self._rtu_reader = RtuFastReader(port, inter_frame_delay=self.get_inter_frame_delay() or 0.0)
+        return self._rtu_reader
+
+    def read_holding_register_32bit(self, address, is_signed=False, byteorder=None, slave=None):
         """
         Liest ein 32-Bit-Holding-Register vom Modbus-Gerät.
         
         Args:
             address: Startadresse des Registers (1-basiert, wie in der JSON-Datei)
             is_signed: True, wenn der Wert als vorzeichenbehaftete Ganzzahl interpretiert werden soll
-            byteorder: Byte-Reihenfolge (Endian.Big oder Endian.Little)
+            byteorder: Byte-Reihenfolge (Endian.BIG oder Endian.LITTLE, Standard: Endian.BIG)
+            slave: Slave-ID des Antriebs (Standard: Slave-ID der Verbindung)
             
         Returns:
             int: 32-Bit-Registerwert oder None bei Fehler
@@ -203,10 +562,15 @@ class ServoModbusClient:
             ModbusTimeoutException: Bei Timeouts während des Lesens
             ModbusConnectionException: Bei Verbindungsproblemen
         """
+        if self.remote is not None:
+            return self.remote.call('read_holding_register_32bit', address, is_signed=is_signed,
+                                    byteorder=byteorder, slave=slave)
         if not self.connected:
             error_msg = "Keine Verbindung zum Gerät"
             logger.log_modbus_operation("Lesen 32bit", address, False, error_msg=error_msg)
             raise ModbusConnectionException(error_msg)
+        if byteorder is None:
+            byteorder = Endian.BIG
             
         try:
             # Debug-Information
@@ -214,16 +578,16 @@ class ServoModbusClient:
             byteorder_str = "Big-Endian" if byteorder == Endian.BIG else "Little-Endian"
             logger.debug(f"DEBUG: Lese 32-Bit-Register an Adresse {address} als {signed_str}, Byte-Reihenfolge: {byteorder_str}")
             
-            # Startzeit für Timeout-Überwachung
-            start_time = time.time()
+            # Timeout für diese Transaktion setzen und Startzeit für Timeout-Überwachung
+            timeout, start_time = self._begin_transaction(FC_READ_HOLDING_REGISTERS, 2)
             
             # Konvertiere 1-basierte Adresse zu 0-basierter Modbus-Adresse
             # Lese zwei aufeinanderfolgende 16-Bit-Register für ein 32-Bit-Register
             logger.debug(f"DEBUG: Sende Leseanfrage für 2 Register ab Modbus-Adresse {address}")
-            result = self.client.read_holding_registers(address, count=2, slave=self.slave_id)
+            result = self.client.read_holding_registers(address, count=2, slave=self.slave_id if slave is None else slave)
             
             # Überprüfen, ob die Operation zu lange gedauert hat
-            operation_time = time.time() - start_time
+            operation_time = self._end_transaction(FC_READ_HOLDING_REGISTERS, 2, timeout, start_time, result)
             if operation_time > self.read_timeout:
                 error_msg = f"Timeout beim Lesen von 32-Bit-Register {address} nach {self.read_timeout}s"
                 logger.log_timeout("Lesen 32bit", address, operation_time)
@@ -239,7 +603,7 @@ class ServoModbusClient:
                         # Versuche, das Register als 16-Bit-Register zu lesen
                         try:
                             logger.debug(f"DEBUG: Versuche Fallback mit 16-Bit-Lesen von Register {address}")
-                            single_result = self.client.read_holding_registers(address, count=1, slave=self.slave_id)
+                            single_result = self.client.read_holding_registers(address, count=1, slave=self.slave_id if slave is None else slave)
                             if not single_result.isError() and len(single_result.registers) >= 1:
                                 # Wenn das einzelne Register gelesen werden kann, gib es als 16-Bit-Wert zurück
                                 logger.debug(f"DEBUG: Erfolgreich als 16-Bit-Register gelesen: {single_result.registers[0]}")
@@ -318,12 +682,16 @@ class ServoModbusClient:
                 
         except ModbusIOException as e:
             self.last_error = str(e)
+            self.timeout_estimator.record_timeout(FC_READ_HOLDING_REGISTERS, 2)
             logger.log_modbus_operation("Lesen 32bit", address, False, error_msg=str(e))
             raise ModbusTimeoutException(f"Modbus-IO-Fehler (Timeout) beim Lesen von 32-Bit-Register {address}: {e}")
         except ModbusException as e:
             self.last_error = str(e)
             logger.log_modbus_operation("Lesen 32bit", address, False, error_msg=str(e))
             raise ModbusReadException(f"Modbus-Fehler beim Lesen von 32-Bit-Register {address}: {e}")
+        except ServoToolException:
+            # Eigene Exceptions (z.B. Timeout) unverändert weitergeben
+            raise
         except Exception as e:
             self.last_error = str(e)
             logger.error(f"DEBUG: Allgemeine Exception beim Lesen von 32-Bit-Register {address}: {str(e)}")
@@ -331,7 +699,7 @@ class ServoModbusClient:
             logger.log_modbus_operation("Lesen 32bit", address, False, error_msg=str(e))
             raise ModbusReadException(f"Allgemeiner Fehler beim Lesen von 32-Bit-Register {address}: {e}")
 
-    def write_holding_register_32bit(self, address, value, is_signed=False, byteorder=Endian.BIG):
+    def write_holding_register_32bit(self, address, value, is_signed=False, byteorder=None, slave=None):
         """
         Schreibt einen 32-Bit-Wert in zwei aufeinanderfolgende Holding-Register des Modbus-Geräts.
         
@@ -339,7 +707,8 @@ class ServoModbusClient:
             address: Adresse des ersten Registers (1-basiert, wie in der JSON-Datei)
             value: Zu schreibender 32-Bit-Wert
             is_signed: True, wenn der Wert als vorzeichenbehaftete Ganzzahl interpretiert werden soll
-            byteorder: Byte-Reihenfolge (Endian.Big oder Endian.Little)
+            byteorder: Byte-Reihenfolge (Endian.BIG oder Endian.LITTLE, Standard: Endian.BIG)
+            slave: Slave-ID des Antriebs (Standard: Slave-ID der Verbindung)
             
         Returns:
             bool: True bei Erfolg, False bei Fehler
@@ -349,10 +718,15 @@ class ServoModbusClient:
             ModbusTimeoutException: Bei Timeouts während des Schreibens
             ModbusConnectionException: Bei Verbindungsproblemen
         """
+        if self.remote is not None:
+            return self.remote.call('write_holding_register_32bit', address, value, is_signed=is_signed,
+                                    byteorder=byteorder, slave=slave)
         if not self.connected:
             error_msg = "Keine Verbindung zum Gerät"
             logger.log_modbus_operation("Schreiben 32bit", address, False, value, error_msg)
             raise ModbusConnectionException(error_msg)
+        if byteorder is None:
+            byteorder = Endian.BIG
             
         try:
             # Debug-Information
@@ -360,9 +734,6 @@ class ServoModbusClient:
             byteorder_str = "Big-Endian" if byteorder == Endian.BIG else "Little-Endian"
             logger.debug(f"DEBUG: Schreibe 32-Bit-Register an Adresse {address} als {signed_str}, Wert: {value}, Byte-Reihenfolge: {byteorder_str}")
             
-            # Startzeit für Timeout-Überwachung
-            start_time = time.time()
-            
             # Konvertiere 1-basierte Adresse zu 0-basierter Modbus-Adresse
             # Verwende BinaryPayloadBuilder, um die 32-Bit-Werte zu erstellen
             # Für 32-Bit-Register verwenden wir Big-Endian Byteorder mit Little-Endian Wordorder
@@ -399,10 +770,11 @@ class ServoModbusClient:
             
             # Schreibe die beiden 16-Bit-Werte in aufeinanderfolgende Register
             logger.debug(f"DEBUG: Sende Schreibanfrage für 2 Register ab Modbus-Adresse {address}")
-            result = self.client.write_registers(address, registers_to_write, slave=self.slave_id)
+            timeout, start_time = self._begin_transaction(FC_WRITE_MULTIPLE_REGISTERS, 2)
+            result = self.client.write_registers(address, registers_to_write, slave=self.slave_id if slave is None else slave)
             
             # Überprüfen, ob die Operation zu lange gedauert hat
-            operation_time = time.time() - start_time
+            operation_time = self._end_transaction(FC_WRITE_MULTIPLE_REGISTERS, 2, timeout, start_time, result)
             if operation_time > self.read_timeout:
                 error_msg = f"Timeout beim Schreiben von 32-Bit-Register {address} nach {self.read_timeout}s"
                 logger.log_timeout("Schreiben 32bit", address, operation_time)
@@ -418,7 +790,7 @@ class ServoModbusClient:
                         # Versuche, den Wert als 16-Bit-Wert zu schreiben
                         try:
                             logger.debug(f"DEBUG: Versuche Fallback mit 16-Bit-Schreiben von Register {address}")
-                            single_result = self.client.write_register(address, value, slave=self.slave_id)
+                            single_result = self.client.write_register(address, value, slave=self.slave_id if slave is None else slave)
                             if not single_result.isError():
                                 logger.debug(f"DEBUG: Erfolgreich als 16-Bit-Register geschrieben: {value}")
                                 logger.log_modbus_operation("Schreiben 32bit", address, True, value)
@@ -445,24 +817,29 @@ class ServoModbusClient:
             
         except ModbusIOException as e:
             self.last_error = str(e)
+            self.timeout_estimator.record_timeout(FC_WRITE_MULTIPLE_REGISTERS, 2)
             logger.log_modbus_operation("Schreiben 32bit", address, False, value, str(e))
             raise ModbusTimeoutException(f"Modbus-IO-Fehler (Timeout) beim Schreiben von 32-Bit-Register {address}: {e}")
         except ModbusException as e:
             self.last_error = str(e)
             logger.log_modbus_operation("Schreiben 32bit", address, False, value, str(e))
             raise ModbusWriteException(f"Modbus-Fehler beim Schreiben von 32-Bit-Register {address}: {e}")
+        except ServoToolException:
+            # Eigene Exceptions (z.B. Timeout) unverändert weitergeben
+            raise
         except Exception as e:
             self.last_error = str(e)
             logger.log_modbus_operation("Schreiben 32bit", address, False, value, str(e))
             raise ModbusWriteException(f"Allgemeiner Fehler beim Schreiben von 32-Bit-Register {address}: {e}")
 
-    def write_holding_register(self, address, value):
+    def write_holding_register(self, address, value, slave=None):
         """
         Schreibt einen Wert in ein Holding-Register des Modbus-Geräts.
         
         Args:
             address: Adresse des Registers (1-basiert, wie in der JSON-Datei)
             value: Zu schreibender Wert
+            slave: Slave-ID des Antriebs (Standard: Slave-ID der Verbindung)
             
         Returns:
             bool: True bei Erfolg, False bei Fehler
@@ -472,20 +849,22 @@ class ServoModbusClient:
             ModbusTimeoutException: Bei Timeouts während des Schreibens
             ModbusConnectionException: Bei Verbindungsproblemen
         """
+        if self.remote is not None:
+            return self.remote.call('write_holding_register', address, value, slave=slave)
         if not self.connected:
             error_msg = "Keine Verbindung zum Gerät"
             logger.log_modbus_operation("Schreiben", address, False, value, error_msg)
             raise ModbusConnectionException(error_msg)
             
         try:
-            # Startzeit für Timeout-Überwachung
-            start_time = time.time()
+            # Timeout für diese Transaktion setzen und Startzeit für Timeout-Überwachung
+            timeout, start_time = self._begin_transaction(FC_WRITE_SINGLE_REGISTER, 1)
             
             # Konvertiere 1-basierte Adresse zu 0-basierter Modbus-Adresse
-            result = self.client.write_register(address, value, slave=self.slave_id)
+            result = self.client.write_register(address, value, slave=self.slave_id if slave is None else slave)
             
             # Überprüfen, ob die Operation zu lange gedauert hat
-            operation_time = time.time() - start_time
+            operation_time = self._end_transaction(FC_WRITE_SINGLE_REGISTER, 1, timeout, start_time, result)
             if operation_time > self.read_timeout:
                 error_msg = f"Timeout beim Schreiben von Register {address} nach {self.read_timeout}s"
                 logger.log_timeout("Schreiben", address, operation_time)
@@ -514,34 +893,308 @@ class ServoModbusClient:
             
         except ModbusIOException as e:
             self.last_error = str(e)
+            self.timeout_estimator.record_timeout(FC_WRITE_SINGLE_REGISTER, 1)
             logger.log_modbus_operation("Schreiben", address, False, value, str(e))
             raise ModbusTimeoutException(f"Modbus-IO-Fehler (Timeout) beim Schreiben von Register {address}: {e}")
         except ModbusException as e:
             self.last_error = str(e)
             logger.log_modbus_operation("Schreiben", address, False, value, str(e))
             raise ModbusWriteException(f"Modbus-Fehler beim Schreiben von Register {address}: {e}")
+        except ServoToolException:
+            # Eigene Exceptions (z.B. Timeout) unverändert weitergeben
+            raise
         except Exception as e:
             self.last_error = str(e)
             logger.log_modbus_operation("Schreiben", address, False, value, str(e))
             raise ModbusWriteException(f"Allgemeiner Fehler beim Schreiben von Register {address}: {e}")
+
+    def write_holding_registers(self, address, values, slave=None):
+        """
+        Schreibt aufeinanderfolgende Holding-Register in einer Transaktion (Funktionscode 16).
+        
+        Args:
+            address: Adresse des ersten Registers
+            values: Zu schreibende 16-Bit-Werte
+            slave: Slave-ID des Antriebs (Standard: Slave-ID der Verbindung)
+            
+        Returns:
+            bool: True bei Erfolg
+            
+        Raises:
+            ModbusWriteException: Bei Fehlern beim Schreiben
+            ModbusTimeoutException: Bei Timeouts während des Schreibens
+            ModbusConnectionException: Bei Verbindungsproblemen
+        """
+        if self.remote is not None:
+            return self.remote.call('write_holding_registers', address, values, slave=slave)
+        values = [int(value) & 0xFFFF for value in values]
+        if not self.connected:
+            error_msg = "Keine Verbindung zum Gerät"
+            logger.log_modbus_operation("Schreiben", address, False, values, error_msg)
+            raise ModbusConnectionException(error_msg)
+            
+        count = len(values)
+        registers = f"{address}-{address + count - 1}"
+        try:
+            timeout, start_time = self._begin_transaction(FC_WRITE_MULTIPLE_REGISTERS, count)
+            result = self.client.write_registers(address, values, slave=self.slave_id if slave is None else slave)
+            
+            operation_time = self._end_transaction(FC_WRITE_MULTIPLE_REGISTERS, count, timeout, start_time, result)
+            if operation_time > self.read_timeout:
+                error_msg = f"Timeout beim Schreiben der Register {registers} nach {self.read_timeout}s"
+                logger.log_timeout("Schreiben", address, operation_time)
+                self.last_error = error_msg
+                raise ModbusTimeoutException(error_msg)
+                
+            if isinstance(result, ModbusIOException):
+                # Keine Antwort vom Gerät (pymodbus liefert den Fehler zurück statt ihn auszulösen)
+                error_msg = f"Keine Antwort beim Schreiben der Register {registers}: {result}"
+                self.last_error = error_msg
+                logger.log_modbus_operation("Schreiben", address, False, values, error_msg)
+                raise ModbusTimeoutException(error_msg)
+                
+            if result.isError():
+                exception_code = getattr(result, 'exception_code', None)
+                if exception_code == 2:  # Illegal Data Address
+                    error_msg = f"Ungültige Registeradressen {registers}. Mindestens ein Register existiert nicht oder ist nicht schreibbar."
+                elif exception_code == 3:  # Illegal Data Value
+                    error_msg = f"Ungültige Datenwerte {values} für die Register {registers}."
+                else:
+                    error_msg = f"Fehler beim Schreiben der Register {registers}: {result}"
+                self.last_error = error_msg
+                logger.log_modbus_operation("Schreiben", address, False, values, error_msg)
+                raise ModbusWriteException(error_msg)
+                
+            logger.log_modbus_operation("Schreiben", address, True, values)
+            return True
+            
+        except ModbusIOException as e:
+            self.last_error = str(e)
+            self.timeout_estimator.record_timeout(FC_WRITE_MULTIPLE_REGISTERS, count)
+            logger.log_modbus_operation("Schreiben", address, False, values, str(e))
+            raise ModbusTimeoutException(f"Modbus-IO-Fehler (Timeout) beim Schreiben der Register {registers}: {e}")
+        except ModbusException as e:
+            self.last_error = str(e)
+            logger.log_modbus_operation("Schreiben", address, False, values, str(e))
+            raise ModbusWriteException(f"Modbus-Fehler beim Schreiben der Register {registers}: {e}")
+        except ServoToolException:
+            # Eigene Exceptions (z.B. Timeout) unverändert weitergeben
+            raise
+        except Exception as e:
+            self.last_error = str(e)
+            logger.log_modbus_operation("Schreiben", address, False, values, str(e))
+            raise ModbusWriteException(f"Allgemeiner Fehler beim Schreiben der Register {registers}: {e}")
             
+    def get_slave_ids(self):
+        """
+        Gibt alle Slave-IDs der Verbindung zurück.
+        
+        Returns:
+            list: Slave-IDs in Abfragereihenfolge (erste = Standard-Slave)
+        """
+        return list(self.slave_ids)
+    
     def get_last_error(self):
         """Gibt die letzte Fehlermeldung zurück."""
         return self.last_error
         
-    def set_timeouts(self, default_timeout=None, read_timeout=None):
+    def set_timeouts(self, default_timeout=None, read_timeout=None, min_timeout=None, adaptive_timeout=None):
         """
         Konfiguriert die Timeouts für die Modbus-Operationen.
         
         Args:
-            default_timeout: Standard-Timeout in Sekunden
-            read_timeout: Lese-Timeout in Sekunden
+            default_timeout: Standard-Timeout in Sekunden (auch Startwert der adaptiven Timeouts)
+            read_timeout: Lese-Timeout in Sekunden (Obergrenze der adaptiven Timeouts)
+            min_timeout: Untergrenze der adaptiven Timeouts in Sekunden
+            adaptive_timeout: True, um Timeouts aus gemessenen Round-Trip-Zeiten abzuleiten
         """
         if default_timeout is not None:
             self.default_timeout = float(default_timeout)
+            self.timeout_estimator.initial_timeout = self.default_timeout
         if read_timeout is not None:
             self.read_timeout = float(read_timeout)
+            self.timeout_estimator.max_timeout = self.read_timeout
+        if min_timeout is not None:
+            self.timeout_estimator.min_timeout = float(min_timeout)
+        if adaptive_timeout is not None:
+            self.adaptive_timeout = bool(adaptive_timeout)
             
         # Wenn bereits verbunden, Timeout am Client aktualisieren
         if self.client and self.connected:
-            self.client.timeout = self.default_timeout
\ No newline at end of file
+            self.client.timeout = self.default_timeout
+            self._apply_client_timeout(self.default_timeout)
+    
+    def get_timeout_statistics(self):
+        """
+        Gibt die aktuellen Round-Trip-Schätzwerte und abgeleiteten Timeouts zurück.
+        
+        Returns:
+            dict: {(Funktionscode, Registeranzahl): {'srtt', 'rttvar', 'timeout', 'samples', 'timeouts'}}
+        """
+        return self.timeout_estimator.get_statistics()
+    
+    def _apply_client_timeout(self, timeout):
+        """Überträgt einen Timeout auf den pymodbus-Client und den offenen seriellen Port."""
+        if self.client is None:
+            return
+        # Den Port nur umkonfigurieren, wenn sich der Wert merklich ändert
+        if self._applied_timeout is not None and abs(self._applied_timeout - timeout) < 0.002:
+            return
+        comm_params = getattr(self.client, 'comm_params', None)
+        if comm_params is not None:
+            comm_params.timeout_connect = timeout
+        socket = getattr(self.client, 'socket', None)
+        # Der TCP-Client wartet selbst mit comm_params.timeout_connect, nur der serielle Port braucht den Wert
+        if socket is not None and hasattr(socket, 'timeout') and not hasattr(socket, 'settimeout'):
+            try:
+                socket.timeout = timeout
+            except Exception as e:
+                logger.debug(f"DEBUG: Timeout konnte nicht am Port gesetzt werden: {e}")
+                return
+        self._applied_timeout = timeout
+    
+    def _begin_transaction(self, function_code, count):
+        """
+        Setzt den Timeout für die nächste Transaktion.
+        
+        Returns:
+            tuple: (verwendeter Timeout in Sekunden, Startzeitpunkt)
+        """
+        timeout = self.default_timeout
+        if self.adaptive_timeout:
+            timeout = self.timeout_estimator.get_timeout(function_code, count)
+        self._apply_client_timeout(timeout)
+        return timeout, time.perf_counter()
+    
+    def _end_transaction(self, function_code, count, timeout, start_time, result):
+        """
+        Wertet eine abgeschlossene Transaktion für die Timeout-Schätzung aus.
+        
+        Returns:
+            float: Dauer der Transaktion in Sekunden
+        """
+        operation_time = time.perf_counter() - start_time
+        if isinstance(result, ModbusIOException):
+            # Keine Antwort innerhalb des Timeouts
+            self.timeout_estimator.record_timeout(function_code, count)
+        elif result is not None and not result.isError():
+            self._record_success(function_code, count, operation_time, timeout)
+        return operation_time
+    
+    def _record_success(self, function_code, count, operation_time, timeout):
+        """Übernimmt die Dauer einer erfolgreichen Transaktion in Timeout-Schätzung und Leitungsstatistik."""
+        self.timeout_estimator.record_success(function_code, count, operation_time, timeout)
+        theoretical = self.get_min_transaction_time(function_code, count)
+        if theoretical is not None:
+            self.link_timing.record(function_code, count, operation_time, theoretical)
+    
+    def get_min_transaction_time(self, function_code, count=1):
+        """
+        Berechnet die theoretisch minimale Dauer einer Transaktion auf der aktuellen Leitung.
+        
+        Args:
+            function_code: Modbus-Funktionscode (3, 6 oder 16)
+            count: Anzahl der Register
+            
+        Returns:
+            float oder None: Dauer in Sekunden, None ohne Verbindung
+        """
+        if not self.serial_settings:
+            return None
+        return min_transaction_time(
+            function_code, count,
+            response_delay=self.response_delay,
+            inter_frame_delay=self.get_inter_frame_delay(),
+            **self.serial_settings
+        )
+    
+    def get_link_timing(self):
+        """
+        Gibt gemessene und theoretische Transaktionszeiten sowie die Effizienz zurück.
+        
+        Returns:
+            dict: {'efficiency': float oder None, 'inter_frame_delay': float, 'response_delay': float,
+                   'transactions': {(Funktionscode, Registeranzahl): {...}}}
+        """
+        return {
+            'efficiency': self.link_timing.get_efficiency(),
+            'inter_frame_delay': self.get_inter_frame_delay(),
+            'response_delay': self.response_delay,
+            'transactions': self.link_timing.get_statistics()
+        }
+    
+    def reset_link_timing(self):
+        """Verwirft die gesammelten Messwerte der Verbindung."""
+        self.link_timing.reset()
+    
+    def get_inter_frame_delay(self):
+        """
+        Gibt die aktuell verwendete Pause zwischen zwei Rahmen zurück.
+        
+        Returns:
+            float oder None: Pause in Sekunden, None ohne Verbindung
+        """
+        if self.inter_frame_delay is not None:
+            return self.inter_frame_delay
+        if not self.serial_settings:
+            return None
+        return inter_frame_gap(**self.serial_settings)
+    
+    def set_inter_frame_delay(self, delay):
+        """
+        Setzt die Pause zwischen zwei Rahmen.
+        
+        Args:
+            delay: Pause in Sekunden; None stellt den Normwert der Baudrate wieder her
+        """
+        if delay is not None:
+            delay = float(delay)
+            if delay < 0:
+                raise ValueError("Die Pause zwischen den Rahmen darf nicht negativ sein")
+        self.inter_frame_delay = delay
+        self._apply_inter_frame_delay()
+        self.link_timing.reset()
+        logger.info(f"Pause zwischen den Rahmen: {self.get_inter_frame_delay()}s")
+    
+    def _apply_inter_frame_delay(self):
+        """Überträgt die Pause zwischen den Rahmen auf den pymodbus-Client."""
+        if self.client is None or self.transport != TRANSPORT_SERIAL or not hasattr(self.client, 'silent_interval'):
+            return
+        delay = self.get_inter_frame_delay()
+        if delay is not None:
+            self.client.silent_interval = round(delay, 6)
+            if self._rtu_reader is not None:
+                self._rtu_reader.inter_frame_delay = delay
+    
+    def read_response_delay(self):
+        """
+        Liest die Antwortverzögerung des Antriebs (P0C-25).
+        
+        Returns:
+            int: Antwortverzögerung in ms
+        """
+        delay_ms = self.read_holding_register(RESPONSE_DELAY_ADDRESS)[0]
+        self.response_delay = delay_ms / 1000.0
+        return delay_ms
+    
+    def write_response_delay(self, delay_ms):
+        """
+        Schreibt die Antwortverzögerung des Antriebs (P0C-25).
+        
+        Args:
+            delay_ms: Antwortverzögerung in ms (0-5000)
+            
+        Returns:
+            bool: True bei Erfolg
+            
+        Raises:
+            ValueError: Wenn der Wert außerhalb des gültigen Bereichs liegt
+        """
+        delay_ms = int(delay_ms)
+        if not 0 <= delay_ms <= RESPONSE_DELAY_MAX_MS:
+            raise ValueError(f"Antwortverzögerung muss zwischen 0 und {RESPONSE_DELAY_MAX_MS} ms liegen")
+        success = self.write_holding_register(RESPONSE_DELAY_ADDRESS, delay_ms)
+        if success:
+            self.response_delay = delay_ms / 1000.0
+            self.link_timing.reset()
+        return success
\ No newline at end of file
@@ -1,6 +1,7 @@
 import json
 import os
 import sys
+from logger_config import logger
 
 def resource_path(relative_path):
     """Holt den absoluten Pfad zur Ressource, funktioniert für Entwicklung und PyInstaller"""
@@ -54,13 +55,13 @@ class ParameterManager:
                         validation=param_data.get('validation')
                     )
                     self.parameters[code] = param
-            print(f"Parameters loaded successfully from {self.json_file_path}")
+            logger.info(f"Parameters loaded successfully from {self.json_file_path}")
         except FileNotFoundError:
-            print(f"Fehler: {self.json_file_path} nicht gefunden.")
+            logger.error(f"Fehler: {self.json_file_path} nicht gefunden.")
         except json.JSONDecodeError:
-            print(f"Fehler: {self.json_file_path} konnte nicht dekodiert werden.")
+            logger.error(f"Fehler: {self.json_file_path} konnte nicht dekodiert werden.")
         except Exception as e:
-            print(f"Fehler beim Laden der Parameter: {e}")
+            logger.error(f"Fehler beim Laden der Parameter: {e}")
 
         # Load FunIN definitions
         try:
@@ -68,13 +69,13 @@ class ParameterManager:
             with open(fun_in_path, mode='r', encoding='utf-8') as file:
                 fun_in_data = json.load(file)
                 self.fun_in_map = {item['Option']: item for item in fun_in_data}
-            print(f"FunIN definitions loaded successfully from {self.fun_in_path}")
+            logger.info(f"FunIN definitions loaded successfully from {self.fun_in_path}")
         except FileNotFoundError:
-            print(f"Fehler: {self.fun_in_path} nicht gefunden.")
+            logger.error(f"Fehler: {self.fun_in_path} nicht gefunden.")
         except json.JSONDecodeError:
-            print(f"Fehler: {self.fun_in_path} konnte nicht dekodiert werden.")
+            logger.error(f"Fehler: {self.fun_in_path} konnte nicht dekodiert werden.")
         except Exception as e:
-            print(f"Fehler beim Laden der FunIN-Definitionen: {e}")
+            logger.error(f"Fehler beim Laden der FunIN-Definitionen: {e}")
 
         # Load FunOUT definitions
         try:
@@ -82,13 +83,13 @@ class ParameterManager:
             with open(fun_out_path, mode='r', encoding='utf-8') as file:
                  fun_out_data = json.load(file)
                  self.fun_out_map = {item['Option']: item for item in fun_out_data}
-            print(f"FunOUT definitions loaded successfully from {self.fun_out_path}")
+            logger.info(f"FunOUT definitions loaded successfully from {self.fun_out_path}")
         except FileNotFoundError:
-            print(f"Fehler: {self.fun_out_path} nicht gefunden.")
+            logger.error(f"Fehler: {self.fun_out_path} nicht gefunden.")
         except json.JSONDecodeError:
-            print(f"Fehler: {self.fun_out_path} konnte nicht dekodiert werden.")
+            logger.error(f"Fehler: {self.fun_out_path} konnte nicht dekodiert werden.")
         except Exception as e:
-            print(f"Fehler beim Laden der FunOUT-Definitionen: {e}")
+            logger.error(f"Fehler beim Laden der FunOUT-Definitionen: {e}")
 
     def get_parameter(self, code):
         return self.parameters.get(code)
@@ -0,0 +1,224 @@
+"""
+Schlanker Modbus-RTU-Lesepfad für zyklische Abfragen (Plot-Erfassung).
+
+pymodbus erzeugt für jede Anfrage Request-Objekte, durchläuft den
+Transaktionsmanager und wartet beim Empfang, bis keine weiteren Bytes mehr
+ankommen. Für die immer gleichen Leseanfragen der Erfassung genügt weniger:
+
+    - Anfragerahmen (Slave, FC 3, Adresse, Anzahl, CRC) werden einmal erzeugt
+      und danach unverändert gesendet
+    - CRC16 über eine vorab berechnete Tabelle
+    - Die Antwort wird mit genau der erwarteten Länge gelesen: zuerst Slave,
+      Funktionscode und Bytezähler bzw. Exception-Code, dann der Rest
+    - Empfang in einen vorab angelegten Puffer
+
+Für zyklische Sollwerte (Frequenzgangmessung) schreibt write_register einzelne
+Register (FC 6) auf demselben Weg; die Antwort ist das Echo der Anfrage.
+
+Der Leser arbeitet auf dem seriellen Port, den der pymodbus-Client geöffnet hat
+(ServoModbusClient.read_holding_register_fast, write_holding_register_fast);
+alle übrigen Zugriffe laufen weiter über pymodbus.
+"""
+
+import struct
+import time
+
+from custom_exceptions import (
+    ModbusConnectionException, ModbusReadException, ModbusTimeoutException, ModbusWriteException
+)
+
+FC_READ_HOLDING_REGISTERS = 3
+FC_WRITE_SINGLE_REGISTER = 6
+
+# Größte Registeranzahl einer Leseanfrage (Modbus-Spezifikation)
+MAX_READ_REGISTERS = 125
+
+
+def _build_crc_table():
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+CRC_TABLE = _build_crc_table()
+
+
+def crc16(data, length=None):
+    """
+    Modbus-CRC16 über die ersten length Bytes (Standard: alle).
+
+    Returns:
+        int: CRC; im Rahmen wird das niederwertige Byte zuerst übertragen
+    """
+    crc = 0xFFFF
+    table = CRC_TABLE
+    for byte in data[:length] if length is not None else data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def read_request_frame(slave, address, count):
+    """Vollständiger RTU-Rahmen einer Leseanfrage (FC 3) einschließlich CRC."""
+    body = struct.pack('>BBHH', slave, FC_READ_HOLDING_REGISTERS, address, count)
+    return body + struct.pack('<H', crc16(body))
+
+
+def write_request_frame(slave, address, value):
+    """Vollständiger RTU-Rahmen einer Schreibanfrage für ein Register (FC 6) einschließlich CRC."""
+    body = struct.pack('>BBHH', slave, FC_WRITE_SINGLE_REGISTER, address, value & 0xFFFF)
+    return body + struct.pack('<H', crc16(body))
+
+
+class RtuFastReader:
+    """Liest Holding-Register mit vorab erzeugten Anfragerahmen über einen offenen seriellen Port."""
+
+    def __init__(self, port, inter_frame_delay=0.0):
+        """
+        Args:
+            port: Geöffneter pyserial-Port (Timeout wird vom Aufrufer gesetzt)
+            inter_frame_delay: Mindestpause zwischen Antwort und nächster Anfrage in Sekunden
+        """
+        self.port = port
+        self.inter_frame_delay = inter_frame_delay
+        self._frames = {}
+        self._formats = {}
+        self._buffer = bytearray(5 + 2 * MAX_READ_REGISTERS)
+        self._view = memoryview(self._buffer)
+        self._last_frame_end = 0.0
+
+    def _request(self, slave, address, count):
+        key = (slave, address, count)
+        frame = self._frames.get(key)
+        if frame is None:
+            if not 1 <= count <= MAX_READ_REGISTERS:
+                raise ModbusReadException(f"Ungültige Registeranzahl {count} (1 bis {MAX_READ_REGISTERS})")
+            frame = read_request_frame(slave, address, count)
+            self._frames[key] = frame
+            self._formats[count] = struct.Struct(f'>{count}H')
+        return frame
+
+    def _receive(self, start, end):
+        """Liest genau end - start Bytes in den Puffer; False bei Timeout"""
+        view = self._view
+        while start < end:
+            received = self.port.readinto(view[start:end])
+            if not received:
+                return False
+            start += received
+        return True
+
+    def _discard(self):
+        """Verwirft Reste einer gestörten Antwort, damit die nächste Anfrage sauber beginnt"""
+        try:
+            self.port.reset_input_buffer()
+        except Exception:
+            pass
+        self._last_frame_end = time.perf_counter()
+
+    def read_holding_registers(self, address, count, slave):
+        """
+        Liest count Holding-Register ab address.
+
+        Returns:
+            list: Registerwerte
+
+        Raises:
+            ModbusTimeoutException: Keine oder unvollständige Antwort, Gateway ohne Antwort (Code 10/11)
+            ModbusReadException: CRC-Fehler, unerwartete Antwort oder Exception-Antwort des Antriebs
+            ModbusConnectionException: Wenn der Port nicht mehr verfügbar ist
+        """
+        frame = self._request(slave, address, count)
+        buffer = self._buffer
+        try:
+            if self.port.in_waiting:
+                self.port.reset_input_buffer()
+            wait = self._last_frame_end + self.inter_frame_delay - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            self.port.write(frame)
+
+            if not self._receive(0, 3):
+                self._discard()
+                raise ModbusTimeoutException(f"Keine Antwort beim Lesen von Register {address}")
+            if buffer[0] != slave or buffer[1] & 0x7F != FC_READ_HOLDING_REGISTERS:
+                self._discard()
+                raise ModbusReadException(f"Unerwartete Antwort beim Lesen von Register {address}: "
+                                          f"{bytes(buffer[:3]).hex()}")
+            if buffer[1] & 0x80:
+                exception_code = buffer[2]
+                complete = self._receive(3, 5)
+                self._last_frame_end = time.perf_counter()
+                if not complete or crc16(buffer, 3) != buffer[3] | buffer[4] << 8:
+                    self._discard()
+                    raise ModbusReadException(f"Gestörte Exception-Antwort beim Lesen von Register {address}")
+                if exception_code in (10, 11):
+                    raise ModbusTimeoutException(f"Gateway meldet keine Antwort von Slave {slave} "
+                                                 f"beim Lesen von Register {address}.")
+                if exception_code == 2:
+                    raise ModbusReadException(f"Ungültige Registeradresse {address}. "
+                                              f"Das Register existiert nicht oder ist nicht lesbar.")
+                raise ModbusReadException(f"Modbus-Fehler (Code {exception_code}) beim Lesen von Register {address}")
+
+            end = 5 + 2 * count
+            if buffer[2] != 2 * count:
+                self._discard()
+                raise ModbusReadException(f"Unerwarteter Bytezähler {buffer[2]} beim Lesen von Register {address}")
+            if not self._receive(3, end):
+                self._discard()
+                raise ModbusTimeoutException(f"Unvollständige Antwort beim Lesen von Register {address}")
+            self._last_frame_end = time.perf_counter()
+            if crc16(buffer, end - 2) != buffer[end - 2] | buffer[end - 1] << 8:
+                self._discard()
+                raise ModbusReadException(f"CRC-Fehler beim Lesen von Register {address}")
+            return list(self._formats[count].unpack_from(buffer, 3))
+        except OSError as e:
+            # pyserial meldet einen geschlossenen oder entfernten Port als SerialException (OSError)
+            raise ModbusConnectionException(f"Serieller Port nicht verfügbar: {e}")
+
+    def write_register(self, address, value, slave):
+        """
+        Schreibt ein Holding-Register (FC 6); value wird als 16-Bit-Wert übertragen.
+
+        Raises:
+            ModbusTimeoutException: Keine oder unvollständige Antwort, Gateway ohne Antwort (Code 10/11)
+            ModbusWriteException: Antwort ist nicht das Echo der Anfrage oder Exception-Antwort des Antriebs
+            ModbusConnectionException: Wenn der Port nicht mehr verfügbar ist
+        """
+        frame = write_request_frame(slave, address, value)
+        buffer = self._buffer
+        try:
+            if self.port.in_waiting:
+                self.port.reset_input_buffer()
+            wait = self._last_frame_end + self.inter_frame_delay - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            self.port.write(frame)
+
+            if not self._receive(0, 5):
+                self._discard()
+                raise ModbusTimeoutException(f"Keine Antwort beim Schreiben von Register {address}")
+            if buffer[0] == slave and buffer[1] == FC_WRITE_SINGLE_REGISTER | 0x80:
+                exception_code = buffer[2]
+                self._last_frame_end = time.perf_counter()
+                if crc16(buffer, 3) != buffer[3] | buffer[4] << 8:
+                    self._discard()
+                    raise ModbusWriteException(f"Gestörte Exception-Antwort beim Schreiben von Register {address}")
+                if exception_code in (10, 11):
+                    raise ModbusTimeoutException(f"Gateway meldet keine Antwort von Slave {slave} "
+                                                 f"beim Schreiben von Register {address}.")
+                raise ModbusWriteException(f"Modbus-Fehler (Code {exception_code}) beim Schreiben von Register {address}")
+            if not self._receive(5, 8):
+                self._discard()
+                raise ModbusTimeoutException(f"Unvollständige Antwort beim Schreiben von Register {address}")
+            self._last_frame_end = time.perf_counter()
+            if buffer[:8] != frame:
+                self._discard()
+                raise ModbusWriteException(f"Unerwartete Antwort beim Schreiben von Register {address}: "
+                                           f"{bytes(buffer[:8]).hex()}")
+            return True
+        except OSError as e:
+            raise ModbusConnectionException(f"Serieller Port nicht verfügbar: {e}")
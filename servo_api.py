@@ -0,0 +1,414 @@
+"""
+Qt-freie Programmierschnittstelle für den Zugriff auf einen Antrieb.
+
+Stellt Lesen, Schreiben, Sichern, Wiederherstellen und Vergleichen von Parametern
+ohne PyQt5 und pyqtgraph bereit, z.B. für Skripte in der Fertigung oder an
+Prüfständen. Verwendet denselben ServoModbusClient, dieselben
+Parameterdefinitionen und dieselbe Blockleseplanung wie die Oberfläche.
+
+Parameterangaben (specs) können sein:
+    - ein einzelner Code: 'P08-00'
+    - ein Bereich: 'P08-00..P08-20'
+    - eine ganze Gruppe: 'P08'
+    - 'all' für alle Parameter außer Überwachungswerten (P0B) und Hilfsfunktionen (P0D)
+
+Beispiel::
+
+    with ServoDrive() as drive:
+        drive.connect('COM3', baudrate=19200, parity='E', stopbits=2, slave_id=1)
+        values, errors = drive.read(['P08-00..P08-05'])
+
+    # Über Modbus TCP, z.B. gegen den virtuellen Antrieb (python -m simulator)
+    with ServoDrive() as drive:
+        drive.connect(transport='tcp', host='127.0.0.1', tcp_port=5020)
+"""
+
+import json
+import re
+import time
+
+from modbus_client import DEFAULT_TCP_PORT, TRANSPORT_SERIAL, ServoModbusClient
+from parameter_manager import ParameterManager
+from custom_exceptions import (
+    ModbusConnectionException,
+    ParameterValidationException,
+    FileOperationException
+)
+from logger_config import logger
+from utils.block_planner import BlockItem, parse_number_type, plan_blocks
+from utils.fleet_backup import read_parameters_blockwise
+
+_CODE_PATTERN = re.compile(r'^P[0-9A-F]{2}-\d{2}$', re.IGNORECASE)
+_GROUP_PATTERN = re.compile(r'^P[0-9A-F]{2}$', re.IGNORECASE)
+
+# Gruppen, die nicht gesichert, verglichen oder wiederhergestellt werden: P0B enthält
+# Überwachungswerte, die sich im Betrieb laufend ändern, P0D löst beim Schreiben Aktionen
+# aus (Software-Reset, Fehlerquittierung, ...). Einzeln oder als Gruppe lesbar bleiben sie.
+NON_RESTORABLE_GROUPS = frozenset({'P0B', 'P0D'})
+
+# Wertebereiche der Registerbreiten (Anzahl Register, vorzeichenbehaftet).
+# 16-Bit-Werte stehen in Exportdateien als vorzeichenlose Registerwerte, daher
+# ist dort beides zulässig.
+_NUMBER_BOUNDS = {
+    (1, False): (-0x8000, 0xFFFF),
+    (1, True): (-0x8000, 0xFFFF),
+    (2, False): (0, 0xFFFFFFFF),
+    (2, True): (-0x80000000, 0x7FFFFFFF),
+}
+
+
+def is_restorable(code):
+    """True, wenn ein Parameter zu 'all', Vergleich und Wiederherstellung gehört"""
+    return str(code)[:3].upper() not in NON_RESTORABLE_GROUPS
+
+
+def load_values_file(file_path):
+    """
+    Liest eine Exportdatei im Format {Parametercode: Rohwert}.
+
+    Raises:
+        FileOperationException: Wenn die Datei nicht gelesen werden kann oder ungültig ist
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise FileOperationException(f"Datei {file_path} konnte nicht gelesen werden: {e}")
+    if not isinstance(data, dict):
+        raise FileOperationException(f"Datei {file_path} enthält keine Parameterwerte")
+    try:
+        return {str(code): int(value) for code, value in data.items()}
+    except (TypeError, ValueError) as e:
+        raise FileOperationException(f"Ungültiger Wert in {file_path}: {e}")
+
+
+def save_values_file(file_path, values):
+    """
+    Schreibt Parameterwerte im Format des Einzelexports der Oberfläche.
+
+    Raises:
+        FileOperationException: Wenn die Datei nicht geschrieben werden kann
+    """
+    try:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(values, f, indent=4)
+    except OSError as e:
+        raise FileOperationException(f"Datei {file_path} konnte nicht geschrieben werden: {e}")
+
+
+def diff_values(reference, actual):
+    """
+    Vergleicht zwei Wertesätze.
+
+    Args:
+        reference: {Parametercode: Rohwert} (z.B. aus einer Datei)
+        actual: {Parametercode: Rohwert} (z.B. vom Antrieb)
+
+    Returns:
+        list: [(Code, Referenzwert, Istwert)] für alle abweichenden Codes,
+              fehlende Werte sind None
+    """
+    differences = []
+    for code in sorted(set(reference) | set(actual)):
+        ref_value = reference.get(code)
+        act_value = actual.get(code)
+        if ref_value != act_value:
+            differences.append((code, ref_value, act_value))
+    return differences
+
+
+class ServoDrive:
+    """Zugriff auf einen Antrieb über Parametercodes statt Registeradressen."""
+
+    def __init__(self, parameter_manager=None, client=None):
+        """
+        Args:
+            parameter_manager: Geladener ParameterManager (Standard: Definitionen aus der JSON-Datei)
+            client: ServoModbusClient (Standard: neuer Client)
+        """
+        if parameter_manager is None:
+            parameter_manager = ParameterManager()
+            parameter_manager.load_parameters()
+        self.parameter_manager = parameter_manager
+        self.client = client or ServoModbusClient()
+        self._ordered_codes = sorted(
+            (p.code for p in parameter_manager.get_all_parameters() if p.decimal is not None),
+            key=lambda code: int(parameter_manager.get_parameter(code).decimal)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def connect(self, port=None, baudrate=19200, bytesize=8, parity='E', stopbits=2, slave_id=1,
+                transport=TRANSPORT_SERIAL, host=None, tcp_port=DEFAULT_TCP_PORT, replay_speed=1.0):
+        """
+        Verbindet mit dem Antrieb (seriell, über TCP oder als Wiedergabe einer Aufzeichnung,
+        siehe ServoModbusClient.connect).
+
+        Raises:
+            ModbusConnectionException: Wenn keine Verbindung hergestellt werden kann
+        """
+        self.client.connect(port=port, baudrate=baudrate, bytesize=bytesize, parity=parity,
+                            stopbits=stopbits, slave_id=slave_id,
+                            transport=transport, host=host, tcp_port=tcp_port, replay_speed=replay_speed)
+
+    def close(self):
+        """Trennt die Verbindung und beendet eine laufende Aufzeichnung."""
+        if self.client.connected:
+            self.client.disconnect()
+        self.client.stop_recording()
+
+    def start_recording(self, path):
+        """Zeichnet alle folgenden Modbus-Transaktionen auf (siehe utils.modbus_recorder)."""
+        self.client.start_recording(path)
+
+    def stop_recording(self):
+        """Beendet die Aufzeichnung und gibt die Anzahl der Transaktionen zurück."""
+        return self.client.stop_recording()
+
+    def resolve(self, specs=None):
+        """
+        Wandelt Parameterangaben in eine Liste von Parametern um.
+
+        Args:
+            specs: Liste von Angaben (siehe Moduldokumentation), None für alle Parameter
+
+        Returns:
+            list: Parameter in Adressreihenfolge, ohne Duplikate
+
+        Raises:
+            ParameterValidationException: Bei unbekannten Codes oder ungültigen Bereichen
+        """
+        if not specs:
+            specs = ['all']
+        codes = []
+        for spec in specs:
+            for part in str(spec).split(','):
+                part = part.strip().upper()
+                if part:
+                    codes.extend(self._resolve_spec(part))
+        seen = set()
+        unique = [code for code in codes if not (code in seen or seen.add(code))]
+        return [self.parameter_manager.get_parameter(code) for code in unique]
+
+    def _resolve_spec(self, spec):
+        if spec == 'ALL':
+            return [code for code in self._ordered_codes if is_restorable(code)]
+        if _GROUP_PATTERN.match(spec):
+            codes = [code for code in self._ordered_codes if code.startswith(spec + '-')]
+            if not codes:
+                raise ParameterValidationException(f"Unbekannte Parametergruppe {spec}")
+            return codes
+        if '..' in spec:
+            first, last = (s.strip() for s in spec.split('..', 1))
+            start = self._index_of(first)
+            end = self._index_of(last)
+            if end < start:
+                raise ParameterValidationException(f"Ungültiger Bereich {spec}: Ende liegt vor dem Anfang")
+            return self._ordered_codes[start:end + 1]
+        return [self._ordered_codes[self._index_of(spec)]]
+
+    def _index_of(self, code):
+        if not _CODE_PATTERN.match(code) or code not in self._ordered_codes:
+            raise ParameterValidationException(f"Unbekannter Parameter {code}")
+        return self._ordered_codes.index(code)
+
+    def read(self, specs=None, slave=None):
+        """
+        Liest Parameter mit Blocklesezugriffen.
+
+        Returns:
+            tuple: ({Parametercode: Rohwert}, [nicht lesbare Codes])
+
+        Raises:
+            ModbusConnectionException: Ohne Verbindung oder bei Verbindungsverlust
+            ModbusTimeoutException: Wenn der Antrieb nicht antwortet
+        """
+        params = self.resolve(specs)
+        items = []
+        for param in params:
+            width, is_signed = parse_number_type(param.validation.get('number_type'))
+            items.append(BlockItem(param.code, int(param.decimal), width, is_signed))
+        values, errors, _requests = read_parameters_blockwise(self.client, plan_blocks(items), slave=slave)
+        # Reihenfolge der Anfrage beibehalten
+        ordered = {param.code: values[param.code] for param in params if param.code in values}
+        return ordered, errors
+
+    def write(self, code, value, slave=None):
+        """
+        Prüft einen Rohwert gegen die Parameterdefinition und schreibt ihn.
+
+        Args:
+            code: Parametercode
+            value: Rohwert (ohne Nachkommaskalierung)
+
+        Raises:
+            ParameterValidationException: Bei unbekanntem Code oder unzulässigem Wert
+            ModbusWriteException, ModbusTimeoutException, ModbusConnectionException: Bei Kommunikationsfehlern
+        """
+        param = self.parameter_manager.get_parameter(str(code).upper())
+        if param is None or param.decimal is None:
+            raise ParameterValidationException(f"Unbekannter Parameter {code}")
+        value = int(value)
+        width, is_signed = parse_number_type(param.validation.get('number_type'))
+        self.validate(param, value)
+        if width == 2:
+            return self.client.write_holding_register_32bit(int(param.decimal), value, is_signed=is_signed, slave=slave)
+        # Vorzeichenbehaftete 16-Bit-Werte als Zweierkomplement übertragen
+        return self.client.write_holding_register(int(param.decimal), value & 0xFFFF, slave=slave)
+
+    @staticmethod
+    def validate(param, value):
+        """
+        Prüft einen Rohwert gegen Registerbreite und Wertebereich der Definition.
+
+        Raises:
+            ParameterValidationException: Bei unzulässigem Wert
+        """
+        validation = param.validation or {}
+        width, is_signed = parse_number_type(validation.get('number_type'))
+        low, high = _NUMBER_BOUNDS[(width, is_signed)]
+        if not low <= value <= high:
+            raise ParameterValidationException(f"Wert {value} für {param.code} ist außerhalb des Registerbereichs [{low}, {high}]")
+        if validation.get('type') == 'range':
+            min_val = validation.get('min')
+            max_val = validation.get('max')
+            signed_value = ServoDrive.to_signed(param, value)
+            if (min_val is not None and signed_value < min_val) or (max_val is not None and signed_value > max_val):
+                logger.log_parameter_validation(param.code, signed_value, False, min_val, max_val)
+                raise ParameterValidationException(
+                    f"Wert {signed_value} für {param.code} ist außerhalb des Bereichs [{min_val}, {max_val}]")
+        elif validation.get('type') == 'enum':
+            options = validation.get('options') or {}
+            if options and str(value) not in options:
+                raise ParameterValidationException(f"Wert {value} für {param.code} ist keine gültige Option")
+
+    @staticmethod
+    def to_signed(param, raw_value):
+        """Wandelt einen vorzeichenlosen 16-Bit-Registerwert bei vorzeichenbehafteten Parametern um."""
+        width, is_signed = parse_number_type((param.validation or {}).get('number_type'))
+        if width == 1 and is_signed and raw_value > 0x7FFF:
+            return raw_value - 0x10000
+        return raw_value
+
+    def format_value(self, code, raw_value):
+        """
+        Wandelt einen Rohwert in einen lesbaren Text um (Nachkommastellen, Einheit, Optionstext).
+
+        Returns:
+            str: z.B. '2.00 ms' oder '1 (Position mode)'
+        """
+        param = self.parameter_manager.get_parameter(code)
+        if param is None:
+            return str(raw_value)
+        validation = param.validation or {}
+        value = self.to_signed(param, raw_value)
+        if validation.get('type') == 'enum':
+            option = (validation.get('options') or {}).get(str(value))
+            return f"{value} ({option})" if option else str(value)
+        decimal_places = validation.get('decimal_places', 0) or 0
+        text = f"{value / (10 ** decimal_places):.{decimal_places}f}" if decimal_places > 0 else str(value)
+        if param.unit and param.unit != '-':
+            text += f" {param.unit}"
+        return text
+
+    def export(self, file_path, specs=None, slave=None):
+        """
+        Liest Parameter und speichert sie im Format des Einzelexports.
+
+        Returns:
+            tuple: ({Parametercode: Rohwert}, [nicht lesbare Codes])
+        """
+        values, errors = self.read(specs, slave=slave)
+        save_values_file(file_path, values)
+        logger.log_file_operation("Export", file_path, True)
+        return values, errors
+
+    def diff(self, reference, specs=None, slave=None):
+        """
+        Vergleicht Referenzwerte mit den aktuellen Werten des Antriebs.
+
+        Args:
+            reference: {Parametercode: Rohwert} oder Pfad zu einer Exportdatei
+            specs: Zu vergleichende Parameter (Standard: alle Codes der Referenz);
+                   P0B und P0D werden nie verglichen
+
+        Returns:
+            list: [(Code, Referenzwert, Istwert)] siehe diff_values
+        """
+        if isinstance(reference, str):
+            reference = load_values_file(reference)
+        params = self.resolve(specs) if specs else self.resolve(
+            [code for code in reference if self.parameter_manager.get_parameter(code)])
+        params = [p for p in params if is_restorable(p.code)]
+        actual, _errors = self.read([p.code for p in params], slave=slave)
+        reference = {p.code: reference[p.code] for p in params if p.code in reference}
+        return diff_values(reference, actual)
+
+    def import_values(self, values, dry_run=False, slave=None):
+        """
+        Schreibt Werte aus einer Exportdatei, aber nur die vom Antrieb abweichenden.
+        Werte aus P0B und P0D werden übergangen.
+
+        Args:
+            values: {Parametercode: Rohwert} oder Pfad zu einer Exportdatei
+            dry_run: Nur ermitteln, was geschrieben würde
+
+        Returns:
+            tuple: ([geschriebene Codes], {Code: Fehlermeldung})
+
+        Raises:
+            ModbusConnectionException: Bei Verbindungsverlust
+        """
+        if isinstance(values, str):
+            values = load_values_file(values)
+        skipped = [code for code in values if not is_restorable(code)]
+        if skipped:
+            logger.info(f"Import: {len(skipped)} Überwachungs- und Aktionsparameter (P0B, P0D) übergangen")
+        values = {code: value for code, value in values.items() if is_restorable(code)}
+        known = {code: value for code, value in values.items() if self.parameter_manager.get_parameter(code)}
+        failed = {code: "Unbekannter Parameter" for code in values if code not in known}
+        written = []
+        for code, _reference, _actual in self.diff(known, slave=slave):
+            if code not in known:
+                continue
+            if dry_run:
+                written.append(code)
+                continue
+            try:
+                self.write(code, known[code], slave=slave)
+                written.append(code)
+            except ModbusConnectionException:
+                raise
+            except Exception as e:
+                failed[code] = str(e)
+        return written, failed
+
+    def watch(self, specs, interval=0.5, count=None, slave=None):
+        """
+        Liest Parameter zyklisch.
+
+        Args:
+            specs: Zu lesende Parameter
+            interval: Abstand der Lesezyklen in Sekunden
+            count: Anzahl der Zyklen, None für endlos
+
+        Yields:
+            tuple: (Zeitstempel, {Parametercode: Rohwert})
+        """
+        codes = [param.code for param in self.resolve(specs)]
+        cycle = 0
+        next_time = time.monotonic()
+        while count is None or cycle < count:
+            values, _errors = self.read(codes, slave=slave)
+            yield time.time(), values
+            cycle += 1
+            next_time += interval
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_time = time.monotonic()
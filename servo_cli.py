@@ -0,0 +1,185 @@
+"""
+Kommandozeile für den Zugriff auf einen Antrieb ohne Oberfläche.
+
+Beispiele::
+
+    python servo_cli.py --port COM3 read P08-00..P08-20
+    python servo_cli.py --port COM3 export backup.json
+    python servo_cli.py --port COM3 import backup.json --dry-run
+    python servo_cli.py --port COM3 diff backup.json
+    python servo_cli.py --port COM3 watch P0B-00 P0B-15 --interval 0.2 --count 50
+    python servo_cli.py --transport tcp --host 127.0.0.1 --tcp-port 5020 read P06
+
+Exit-Code: 0 bei Erfolg, 1 bei Abweichungen (diff) oder Teilfehlern, 2 bei Fehlern.
+"""
+
+import argparse
+import json
+import sys
+
+from custom_exceptions import ServoToolException
+from logger_config import logger
+from modbus_client import DEFAULT_TCP_PORT, TRANSPORTS, TRANSPORT_REPLAY, TRANSPORT_SERIAL
+
+EXIT_OK = 0
+EXIT_PARTIAL = 1
+EXIT_ERROR = 2
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='servo-tool',
+        description="Parameter eines Servoantriebs per Modbus RTU oder TCP lesen, sichern, wiederherstellen und vergleichen."
+    )
+    parser.add_argument('--transport', default=TRANSPORT_SERIAL, choices=TRANSPORTS,
+                        help="Übertragungsweg: serial, tcp, rtu_over_tcp oder replay (Standard: serial)")
+    parser.add_argument('--port', help="Serieller Port, z.B. COM3 oder /dev/ttyUSB0 (bei --transport serial), "
+                                       "Aufzeichnungsdatei bei --transport replay")
+    parser.add_argument('--host', help="Hostname oder IP-Adresse (bei TCP)")
+    parser.add_argument('--tcp-port', type=int, default=DEFAULT_TCP_PORT, help=f"TCP-Port (Standard: {DEFAULT_TCP_PORT})")
+    parser.add_argument('--baudrate', type=int, default=19200, help="Baudrate (Standard: 19200)")
+    parser.add_argument('--parity', default='E', choices=['N', 'E', 'O'], help="Parität (Standard: E)")
+    parser.add_argument('--stopbits', type=int, default=2, choices=[1, 2], help="Stoppbits (Standard: 2)")
+    parser.add_argument('--bytesize', type=int, default=8, choices=[7, 8], help="Datenbits (Standard: 8)")
+    parser.add_argument('--slave', type=int, default=1, help="Slave-ID des Antriebs (Standard: 1)")
+    parser.add_argument('--record', metavar='FILE', help="Alle Modbus-Transaktionen in FILE aufzeichnen")
+    parser.add_argument('--replay-speed', type=float, default=1.0,
+                        help="Zeitfaktor bei --transport replay (1 = Originalzeit, 0 = ohne Wartezeit)")
+    parser.add_argument('--json', action='store_true', help="Ausgabe als JSON")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Log-Meldungen auf der Konsole ausgeben")
+
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    read_cmd = commands.add_parser('read', help="Parameter lesen")
+    read_cmd.add_argument('specs', nargs='*', help="Codes, Bereiche (P08-00..P08-20) oder Gruppen (P08), Standard: alle")
+
+    export_cmd = commands.add_parser('export', help="Parameter in eine Datei sichern")
+    export_cmd.add_argument('file', help="Zieldatei (JSON)")
+    export_cmd.add_argument('specs', nargs='*', help="Zu sichernde Parameter, Standard: alle")
+
+    import_cmd = commands.add_parser('import', help="Parameter aus einer Datei schreiben (nur abweichende)")
+    import_cmd.add_argument('file', help="Exportdatei (JSON)")
+    import_cmd.add_argument('--dry-run', action='store_true', help="Nur anzeigen, was geschrieben würde")
+
+    diff_cmd = commands.add_parser('diff', help="Antrieb mit einer Datei vergleichen")
+    diff_cmd.add_argument('file', help="Exportdatei (JSON)")
+    diff_cmd.add_argument('specs', nargs='*', help="Zu vergleichende Parameter, Standard: alle aus der Datei")
+
+    watch_cmd = commands.add_parser('watch', help="Parameter zyklisch lesen")
+    watch_cmd.add_argument('specs', nargs='+', help="Zu lesende Parameter")
+    watch_cmd.add_argument('--interval', type=float, default=0.5, help="Abstand der Lesezyklen in Sekunden")
+    watch_cmd.add_argument('--count', type=int, default=None, help="Anzahl der Zyklen (Standard: endlos)")
+
+    return parser
+
+
+def _print_json(data):
+    print(json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def _cmd_read(drive, args):
+    values, errors = drive.read(args.specs, slave=args.slave)
+    if args.json:
+        _print_json({'values': values, 'errors': errors})
+    else:
+        for code, raw in values.items():
+            param = drive.parameter_manager.get_parameter(code)
+            print(f"{code:8} {raw:>11}  {drive.format_value(code, raw):24} {param.name or ''}")
+        for code in errors:
+            print(f"{code:8} {'Lesefehler':>11}", file=sys.stderr)
+    return EXIT_PARTIAL if errors else EXIT_OK
+
+
+def _cmd_export(drive, args):
+    values, errors = drive.export(args.file, args.specs, slave=args.slave)
+    if args.json:
+        _print_json({'file': args.file, 'count': len(values), 'errors': errors})
+    else:
+        print(f"{len(values)} Parameter gesichert nach {args.file}")
+        if errors:
+            print(f"{len(errors)} Parameter nicht lesbar: {', '.join(errors)}", file=sys.stderr)
+    return EXIT_PARTIAL if errors else EXIT_OK
+
+
+def _cmd_import(drive, args):
+    written, failed = drive.import_values(args.file, dry_run=args.dry_run, slave=args.slave)
+    if args.json:
+        _print_json({'written': written, 'failed': failed, 'dry_run': args.dry_run})
+    else:
+        verb = "würde schreiben" if args.dry_run else "geschrieben"
+        for code in written:
+            print(f"{code:8} {verb}")
+        for code, message in failed.items():
+            print(f"{code:8} Fehler: {message}", file=sys.stderr)
+        print(f"{len(written)} Parameter {verb}, {len(failed)} Fehler")
+    return EXIT_PARTIAL if failed else EXIT_OK
+
+
+def _cmd_diff(drive, args):
+    differences = drive.diff(args.file, args.specs, slave=args.slave)
+    if args.json:
+        _print_json([{'code': code, 'file': ref, 'drive': act} for code, ref, act in differences])
+    else:
+        for code, ref, act in differences:
+            ref_text = drive.format_value(code, ref) if ref is not None else '-'
+            act_text = drive.format_value(code, act) if act is not None else 'Lesefehler'
+            print(f"{code:8} Datei: {ref_text:24} Antrieb: {act_text}")
+        print(f"{len(differences)} Abweichungen")
+    return EXIT_PARTIAL if differences else EXIT_OK
+
+
+def _cmd_watch(drive, args):
+    codes = [param.code for param in drive.resolve(args.specs)]
+    if not args.json:
+        print("Zeit           " + " ".join(f"{code:>12}" for code in codes))
+    for timestamp, values in drive.watch(codes, interval=args.interval, count=args.count, slave=args.slave):
+        if args.json:
+            print(json.dumps({'time': timestamp, 'values': values}), flush=True)
+        else:
+            cells = " ".join(f"{values.get(code, '-'):>12}" for code in codes)
+            print(f"{timestamp:14.3f} {cells}", flush=True)
+    return EXIT_OK
+
+
+COMMANDS = {
+    'read': _cmd_read,
+    'export': _cmd_export,
+    'import': _cmd_import,
+    'diff': _cmd_diff,
+    'watch': _cmd_watch,
+}
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.transport in (TRANSPORT_SERIAL, TRANSPORT_REPLAY) and not args.port:
+        parser.error(f"--port ist bei --transport {args.transport} erforderlich")
+    if args.transport not in (TRANSPORT_SERIAL, TRANSPORT_REPLAY) and not args.host:
+        parser.error(f"--host ist bei --transport {args.transport} erforderlich")
+    logger.set_console_level('DEBUG' if args.verbose else 'CRITICAL')
+
+    # Erst nach dem Parsen importieren, damit --help ohne pymodbus sofort antwortet
+    from servo_api import ServoDrive
+
+    try:
+        with ServoDrive() as drive:
+            # Parameterangaben vor dem Verbindungsaufbau prüfen
+            if getattr(args, 'specs', None):
+                drive.resolve(args.specs)
+            if args.record:
+                drive.start_recording(args.record)
+            drive.connect(args.port, baudrate=args.baudrate, bytesize=args.bytesize,
+                          parity=args.parity, stopbits=args.stopbits, slave_id=args.slave,
+                          transport=args.transport, host=args.host, tcp_port=args.tcp_port,
+                          replay_speed=args.replay_speed)
+            return COMMANDS[args.command](drive, args)
+    except ServoToolException as e:
+        print(f"Fehler: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    except KeyboardInterrupt:
+        return EXIT_OK
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,7 @@
+"""Virtueller A5-Antrieb für Tests und Benchmarks ohne Hardware."""
+
+from simulator.register_map import RegisterMap
+from simulator.servo_model import ServoModel
+from simulator.virtual_drive import LatencyModel, ServoDriveModel, VirtualDriveContext, VirtualDriveServer
+
+__all__ = ['RegisterMap', 'ServoModel', 'ServoDriveModel', 'LatencyModel', 'VirtualDriveContext', 'VirtualDriveServer']
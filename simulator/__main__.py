@@ -0,0 +1,82 @@
+"""
+Startet einen virtuellen Antrieb als eigenständigen Modbus-Server.
+
+Beispiele::
+
+    python -m simulator --transport tcp --port 5020 --slaves 1,2
+    python -m simulator --transport rtu_over_tcp --port 5021 --line-baudrate 19200
+    python -m simulator --transport serial --serial-port /dev/ttyUSB1 --baudrate 57600
+
+Beenden mit Strg+C.
+"""
+
+import argparse
+import sys
+import time
+
+from logger_config import logger
+from modbus_client import TRANSPORT_RTU_OVER_TCP, TRANSPORT_SERIAL, TRANSPORT_TCP, parse_slave_ids
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m simulator', description="Virtueller A5-Antrieb (Modbus-Server)")
+    parser.add_argument('--transport', default='tcp', choices=(TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP, TRANSPORT_SERIAL), help="Übertragungsweg (Standard: tcp)")
+    parser.add_argument('--host', default='127.0.0.1', help="Adresse des TCP-Servers (Standard: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=5020, help="TCP-Port (Standard: 5020)")
+    parser.add_argument('--serial-port', help="Serieller Port (nur bei --transport serial)")
+    parser.add_argument('--baudrate', type=int, default=19200, help="Baudrate (nur seriell, Standard: 19200)")
+    parser.add_argument('--parity', default='E', choices=['N', 'E', 'O'], help="Parität (nur seriell, Standard: E)")
+    parser.add_argument('--stopbits', type=int, default=2, choices=[1, 2], help="Stoppbits (nur seriell, Standard: 2)")
+    parser.add_argument('--slaves', default='1', help="Slave-IDs, z.B. 1,2,3 oder 1-3 (Standard: 1)")
+    parser.add_argument('--processing-ms', type=float, default=0.5, help="Bearbeitungszeit je Anfrage in ms")
+    parser.add_argument('--jitter-ms', type=float, default=0.2, help="Maximale Streuung der Bearbeitungszeit in ms")
+    parser.add_argument('--line-baudrate', type=int, default=None,
+                        help="Übertragungszeit einer RTU-Leitung mit dieser Baudrate nachbilden (nur TCP)")
+    parser.add_argument('--no-latency', action='store_true', help="Sofort antworten (ohne Bearbeitungszeit und P0C-25)")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Log-Meldungen auf der Konsole ausgeben")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logger.set_console_level('DEBUG' if args.verbose else 'INFO')
+    if args.transport == TRANSPORT_SERIAL and not args.serial_port:
+        print("Fehler: --serial-port fehlt", file=sys.stderr)
+        return 2
+    try:
+        slave_ids = parse_slave_ids(args.slaves)
+    except ValueError as e:
+        print(f"Fehler: {e}", file=sys.stderr)
+        return 2
+
+    # pymodbus erst nach dem Parsen laden, damit --help sofort antwortet
+    from simulator.virtual_drive import LatencyModel, VirtualDriveServer
+
+    latency = None
+    if not args.no_latency:
+        latency = LatencyModel(
+            processing_time=args.processing_ms / 1000.0,
+            jitter=args.jitter_ms / 1000.0,
+            line_baudrate=args.line_baudrate if args.transport != TRANSPORT_SERIAL else None
+        )
+    server = VirtualDriveServer(
+        transport=args.transport, host=args.host, port=args.port, slave_ids=slave_ids, latency=latency,
+        serial_port=args.serial_port, baudrate=args.baudrate, parity=args.parity, stopbits=args.stopbits
+    )
+    try:
+        server.start()
+    except OSError as e:
+        print(f"Fehler: {e}", file=sys.stderr)
+        return 2
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+Registerabbild eines virtuellen Antriebs.
+
+Baut aus servo_parameter_definitions.json dasselbe Registerbild auf, das ein
+A5-Antrieb über Modbus liefert:
+    - jeder Parameter liegt auf seiner Adresse ('decimal'), 32-Bit-Werte mit dem
+      niederwertigen Wort zuerst
+    - lesbar ist jede Gruppe vom Gruppenanfang bis zum letzten Parameter, Lücken
+      dazwischen liefern 0 (wie beim Antrieb, siehe utils.block_planner)
+    - schreibbar sind nur definierte Parameter außerhalb der Anzeigegruppen
+    - Werte außerhalb des Wertebereichs werden abgelehnt
+"""
+
+import threading
+
+from utils.block_planner import parse_number_type
+
+# Gruppen mit reinen Anzeigewerten (Versionen, Überwachung)
+READ_ONLY_GROUPS = ('P01', 'P0B')
+
+
+def _initial_value(default):
+    """Startwert aus dem 'default'-Feld; Texte wie 'Display' oder '-' ergeben 0."""
+    if isinstance(default, bool):
+        return int(default)
+    if isinstance(default, (int, float)):
+        return int(default)
+    try:
+        return int(str(default).strip(), 0)
+    except ValueError:
+        return 0
+
+
+class RegisterDefinition:
+    """Ein Parameter im Registerabbild."""
+
+    __slots__ = ('code', 'address', 'width', 'is_signed', 'minimum', 'maximum', 'read_only')
+
+    def __init__(self, code, address, width, is_signed, minimum=None, maximum=None, read_only=False):
+        self.code = code
+        self.address = address
+        self.width = width
+        self.is_signed = is_signed
+        self.minimum = minimum
+        self.maximum = maximum
+        self.read_only = read_only
+
+    def to_value(self, raw):
+        """Rohwert (16 bzw. 32 Bit ohne Vorzeichen) in den Parameterwert umrechnen."""
+        bits = 16 * self.width
+        if self.is_signed and raw & (1 << (bits - 1)):
+            return raw - (1 << bits)
+        return raw
+
+    def check(self, raw):
+        """
+        Prüft einen zu schreibenden Rohwert gegen den Wertebereich.
+
+        Raises:
+            ValueError: Wenn der Wert außerhalb des Bereichs liegt
+        """
+        value = self.to_value(raw)
+        if self.minimum is not None and value < self.minimum:
+            raise ValueError(f"{self.code}: {value} kleiner als Minimum {self.minimum}")
+        if self.maximum is not None and value > self.maximum:
+            raise ValueError(f"{self.code}: {value} größer als Maximum {self.maximum}")
+
+
+class RegisterMap:
+    """
+    Holding-Register eines virtuellen Antriebs.
+
+    Zugriffe sind threadsicher, damit Prüfprogramme und Benchmarks den Zustand
+    lesen können, während der Server in seinem eigenen Thread läuft.
+    """
+
+    def __init__(self, parameters, read_only_groups=READ_ONLY_GROUPS):
+        """
+        Args:
+            parameters: Parameterdefinitionen (Rohdaten aus der JSON-Datei)
+            read_only_groups: Gruppen, in die nicht geschrieben werden darf
+        """
+        self._lock = threading.RLock()
+        self.registers = {}
+        self.definitions = {}
+        self._by_address = {}
+        group_ends = {}
+        for param in parameters:
+            address = param.get('decimal')
+            if address is None:
+                continue
+            validation = param.get('validation') or {}
+            width, is_signed = parse_number_type(validation.get('number_type'))
+            if not is_signed and validation.get('two_complement'):
+                is_signed = True
+            range_check = validation.get('type') == 'range'
+            definition = RegisterDefinition(
+                param['code'], address, width, is_signed,
+                minimum=validation.get('min') if range_check else None,
+                maximum=validation.get('max') if range_check else None,
+                read_only=param['code'][:3] in read_only_groups
+            )
+            self.definitions[definition.code] = definition
+            for offset in range(width):
+                self._by_address[address + offset] = definition
+            self._store(address, width, _initial_value(param.get('default')))
+            group = address >> 8
+            group_ends[group] = max(group_ends.get(group, 0), address + width - 1)
+
+        # Lesbar: vom Gruppenanfang bis zum letzten Register der Gruppe
+        self.readable = set()
+        for group, end in group_ends.items():
+            self.readable.update(range(group << 8, end + 1))
+
+    def _store(self, address, width, value):
+        value &= (1 << (16 * width)) - 1
+        self.registers[address] = value & 0xFFFF
+        if width == 2:
+            self.registers[address + 1] = value >> 16
+
+    def _load(self, address, width):
+        value = self.registers.get(address, 0)
+        if width == 2:
+            value |= self.registers.get(address + 1, 0) << 16
+        return value
+
+    def is_readable(self, address, count=1):
+        return all(a in self.readable for a in range(address, address + count))
+
+    def is_writable(self, address, count=1):
+        for a in range(address, address + count):
+            definition = self._by_address.get(a)
+            if definition is None or definition.read_only:
+                return False
+        return True
+
+    def read(self, address, count=1):
+        """Liest count Register ab address (nicht belegte Adressen liefern 0)."""
+        with self._lock:
+            return [self.registers.get(a, 0) for a in range(address, address + count)]
+
+    def write(self, address, values):
+        """
+        Schreibt Register wie eine Modbus-Schreibanfrage (FC 6 / FC 16).
+
+        Alle betroffenen Parameter werden vor dem Schreiben geprüft; schlägt
+        eine Prüfung fehl, bleibt das Registerabbild unverändert.
+
+        Raises:
+            ValueError: Bei schreibgeschützten Adressen oder ungültigen Werten
+        """
+        with self._lock:
+            staged = dict(self.registers)
+            for offset, value in enumerate(values):
+                staged[address + offset] = int(value) & 0xFFFF
+            touched = {self._by_address.get(a) for a in range(address, address + len(values))}
+            for definition in touched:
+                if definition is None or definition.read_only:
+                    raise ValueError(f"Register {address} ist nicht beschreibbar")
+                raw = staged.get(definition.address, 0)
+                if definition.width == 2:
+                    raw |= staged.get(definition.address + 1, 0) << 16
+                definition.check(raw)
+            self.registers = staged
+
+    def get(self, code):
+        """Aktueller Wert eines Parameters (mit Vorzeichen)."""
+        definition = self.definitions[code]
+        with self._lock:
+            return definition.to_value(self._load(definition.address, definition.width))
+
+    def set(self, code, value):
+        """Setzt einen Parameter ohne Prüfung, z.B. Messwerte aus dem Antriebsmodell."""
+        definition = self.definitions[code]
+        with self._lock:
+            self._store(definition.address, definition.width, int(value))
+
+    def update(self, values):
+        """Setzt mehrere Parameter ohne Prüfung in einem Schritt ({Code: Wert})."""
+        with self._lock:
+            for code, value in values.items():
+                definition = self.definitions.get(code)
+                if definition is not None:
+                    self._store(definition.address, definition.width, int(value))
@@ -0,0 +1,267 @@
+"""
+Physikalisches Modell eines Servoantriebs mit Lage-, Drehzahl- und Momentenregelung.
+
+Nachgebildet wird die Reglerkaskade eines A5-Antriebs mit den echten Parametern:
+    - Lageregler (P-Regler, P08-02) mit Drehzahlvorsteuerung (P08-19)
+    - Drehzahlregler (PI, P08-00 / P08-01), Verstärkung skaliert mit dem
+      eingestellten Trägheitsverhältnis P08-15
+    - Drehmomentfilter (P07-05) und Drehmomentgrenzen (P07-09 / P07-10)
+    - Tiefpass der Drehzahlrückführung (P08-23)
+    - Rampen des Drehzahlsollwerts (P06-05 / P06-06)
+    - Mechanik: Motor- und Lastträgheit, viskose und Coulombsche Reibung
+
+Die wahre Lastträgheit der Mechanik ist eine Eigenschaft des Modells und kann vom
+eingestellten P08-15 abweichen - wie an einer echten Maschine ändern falsche
+Einstellungen dann das Einschwingverhalten.
+
+Alle Größen sind NumPy-Arrays mit einem Eintrag je Achse. Ein Schritt rechnet alle
+Achsen gleichzeitig, so lassen sich viele Achsen oder Parametersätze (z.B. für eine
+Reglersuche) mit mehreren kHz Abtastrate rechnen.
+
+Einheiten der Parameter wie im Antrieb (Rohwerte der Register):
+    P08-00, P08-02: 0,1 Hz; P08-01, P07-05, P08-15: 0,01 ms bzw. 0,01-fach;
+    P07-09, P07-10, P07-03: 0,1 %; P08-19: 0,1 %
+"""
+
+import math
+
+import numpy as np
+
+# Betriebsarten
+MODE_SPEED = 0
+MODE_POSITION = 1
+MODE_TORQUE = 2
+
+# Kenndaten des nachgebildeten Motors (400 W, 3000 rpm)
+RATED_TORQUE = 1.27          # Nm
+RATED_CURRENT = 2.8          # A eff
+ROTOR_INERTIA = 0.57e-4      # kg m²
+ENCODER_RESOLUTION = 1 << 20  # Inkremente je Umdrehung
+
+RPM_TO_RAD_S = 2.0 * math.pi / 60.0
+
+# Standardwerte der Parameter (Rohwerte wie in servo_parameter_definitions.json)
+DEFAULT_PARAMETERS = {
+    'P08-00': 250,    # Drehzahlreglerverstärkung, 0,1 Hz
+    'P08-01': 3183,   # Nachstellzeit Drehzahlregler, 0,01 ms
+    'P08-02': 400,    # Lagereglerverstärkung, 0,1 Hz
+    'P08-15': 100,    # Trägheitsverhältnis, 0,01-fach
+    'P08-19': 0,      # Drehzahlvorsteuerung, 0,1 %
+    'P08-23': 4000,   # Grenzfrequenz der Drehzahlrückführung, Hz
+    'P07-05': 79,     # Drehmomentfilter, 0,01 ms
+    'P07-09': 3000,   # positive Drehmomentgrenze, 0,1 %
+    'P07-10': 3000,   # negative Drehmomentgrenze, 0,1 %
+    'P06-05': 200,    # Beschleunigungsrampe, ms je 1000 rpm
+    'P06-06': 200,    # Verzögerungsrampe, ms je 1000 rpm
+    'P06-07': 5000,   # Maximaldrehzahl, rpm
+    'P05-04': 0,      # Tiefpass des Lagesollwerts, ms
+}
+
+
+class ServoModel:
+    """
+    Reglerkaskade und Mechanik für eine oder mehrere Achsen.
+
+    Beispiel::
+
+        model = ServoModel(n_axes=3, sample_rate=4000.0)
+        model.set_parameters({'P08-00': np.array([150, 250, 400])})
+        model.command_speed(1000.0)
+        trace = model.simulate(2000)   # 0,5 s, trace['speed'] hat die Form (3, 2000)
+    """
+
+    def __init__(self, n_axes=1, sample_rate=4000.0, load_inertia_ratio=1.0,
+                 viscous_friction=2.0e-4, coulomb_friction=0.01):
+        """
+        Args:
+            n_axes: Anzahl der gleichzeitig gerechneten Achsen
+            sample_rate: Abtastrate der Regelung in Hz
+            load_inertia_ratio: Wahres Verhältnis Last- zu Motorträgheit der Mechanik
+            viscous_friction: Viskose Reibung in Nm/(rad/s)
+            coulomb_friction: Coulombsche Reibung in Nm
+        """
+        self.n_axes = n_axes
+        self.dt = 1.0 / float(sample_rate)
+        self.load_inertia_ratio = np.full(n_axes, float(load_inertia_ratio))
+        self.viscous_friction = viscous_friction
+        self.coulomb_friction = coulomb_friction
+        self.parameters = {}
+        self.set_parameters(DEFAULT_PARAMETERS)
+        self.reset()
+
+    def reset(self):
+        """Setzt den Zustand aller Achsen auf Stillstand zurück."""
+        n = self.n_axes
+        self.time = 0.0
+        self.mode = np.full(n, MODE_SPEED)
+        self.speed_target = np.zeros(n)      # rad/s
+        self.torque_target = np.zeros(n)     # Nm
+        self.position_target = np.zeros(n)   # rad
+        self.speed_ramped = np.zeros(n)      # rad/s
+        self.position_command = np.zeros(n)  # rad (gefiltert)
+        self.speed_reference = np.zeros(n)   # rad/s, Ausgang des Lagereglers bzw. der Rampe
+        self.integral = np.zeros(n)          # rad/s, Integralanteil des Drehzahlreglers
+        self.torque = np.zeros(n)            # Nm, gefiltert und begrenzt
+        self.speed = np.zeros(n)             # rad/s, wahre Drehzahl
+        self.speed_feedback = np.zeros(n)    # rad/s, gefilterte Rückführung
+        self.position = np.zeros(n)          # rad
+
+    def set_parameters(self, values):
+        """
+        Übernimmt Parameter als Rohwerte ({Code: Wert oder Array je Achse}).
+
+        Unbekannte Codes werden ignoriert, fehlende behalten ihren Wert.
+        """
+        for code, value in values.items():
+            if code in DEFAULT_PARAMETERS:
+                self.parameters[code] = np.broadcast_to(np.asarray(value, dtype=float), (self.n_axes,)).copy()
+        p = self.parameters
+        dt = self.dt
+        # Eingestellte Gesamtträgheit, mit der der Antrieb seine Verstärkung rechnet
+        inertia_setting = ROTOR_INERTIA * (1.0 + p['P08-15'] / 100.0)
+        self._speed_gain = 2.0 * math.pi * (p['P08-00'] / 10.0) * inertia_setting
+        self._integral_rate = dt / np.maximum(p['P08-01'] / 100000.0, dt)
+        self._position_gain = p['P08-02'] / 10.0
+        self._speed_feedforward = p['P08-19'] / 1000.0
+        self._torque_alpha = dt / (p['P07-05'] / 100000.0 + dt)
+        self._feedback_alpha = 1.0 - np.exp(-2.0 * math.pi * p['P08-23'] * dt)
+        self._torque_max = p['P07-09'] / 1000.0 * RATED_TORQUE
+        self._torque_min = -p['P07-10'] / 1000.0 * RATED_TORQUE
+        self._max_speed = p['P06-07'] * RPM_TO_RAD_S
+        # Rampen in rad/s je Schritt; 0 ms bedeutet Sprung
+        self._accel_step = np.where(p['P06-05'] > 0, 1000.0 * RPM_TO_RAD_S / np.maximum(p['P06-05'], 1e-9) * 1000.0 * dt, np.inf)
+        self._decel_step = np.where(p['P06-06'] > 0, 1000.0 * RPM_TO_RAD_S / np.maximum(p['P06-06'], 1e-9) * 1000.0 * dt, np.inf)
+        self._position_alpha = np.where(p['P05-04'] > 0, dt / (p['P05-04'] / 1000.0 + dt), 1.0)
+        self._update_inertia()
+
+    def set_load_inertia_ratio(self, ratio):
+        """Ändert die wahre Lastträgheit der Mechanik (Verhältnis zur Motorträgheit)."""
+        self.load_inertia_ratio = np.broadcast_to(np.asarray(ratio, dtype=float), (self.n_axes,)).copy()
+        self._update_inertia()
+
+    def _update_inertia(self):
+        self._inertia = ROTOR_INERTIA * (1.0 + self.load_inertia_ratio)
+
+    def _select(self, axes):
+        return slice(None) if axes is None else axes
+
+    def command_speed(self, rpm, axes=None):
+        """Drehzahlbetrieb mit dem Sollwert in rpm (wie P06-03)."""
+        axes = self._select(axes)
+        self.mode[axes] = MODE_SPEED
+        self.speed_target[axes] = np.clip(np.asarray(rpm, dtype=float), -6000.0, 6000.0) * RPM_TO_RAD_S
+
+    def command_torque(self, percent, axes=None):
+        """Momentenbetrieb mit dem Sollwert in % des Nennmoments (wie P07-03 / 10)."""
+        axes = self._select(axes)
+        self.mode[axes] = MODE_TORQUE
+        self.torque_target[axes] = np.asarray(percent, dtype=float) / 100.0 * RATED_TORQUE
+
+    def command_position_step(self, increments, axes=None):
+        """Lagebetrieb: verschiebt den Lagesollwert um increments Geberinkremente."""
+        axes = self._select(axes)
+        if np.any(self.mode[axes] != MODE_POSITION):
+            # Beim Wechsel in den Lagebetrieb an der aktuellen Lage beginnen
+            switching = self.mode[axes] != MODE_POSITION
+            self.position_target[axes] = np.where(switching, self.position[axes], self.position_target[axes])
+            self.position_command[axes] = np.where(switching, self.position[axes], self.position_command[axes])
+        self.mode[axes] = MODE_POSITION
+        self.position_target[axes] += np.asarray(increments, dtype=float) * 2.0 * math.pi / ENCODER_RESOLUTION
+
+    def step(self):
+        """Rechnet einen Abtastschritt für alle Achsen."""
+        dt = self.dt
+        position_mode = self.mode == MODE_POSITION
+        torque_mode = self.mode == MODE_TORQUE
+
+        # Drehzahlsollwert über die Rampen (Beschleunigen weg von 0, Verzögern hin zu 0)
+        delta = self.speed_target - self.speed_ramped
+        accelerating = np.abs(self.speed_target) > np.abs(self.speed_ramped)
+        limit = np.where(accelerating, self._accel_step, self._decel_step)
+        self.speed_ramped += np.clip(delta, -limit, limit)
+
+        # Lageregler mit Drehzahlvorsteuerung aus der Änderung des Lagesollwerts
+        previous_command = self.position_command
+        self.position_command = previous_command + (self.position_target - previous_command) * self._position_alpha
+        command_rate = (self.position_command - previous_command) / dt
+        position_speed = self._position_gain * (self.position_command - self.position) + self._speed_feedforward * command_rate
+        self.speed_reference = np.clip(np.where(position_mode, position_speed, self.speed_ramped),
+                                       -self._max_speed, self._max_speed)
+
+        # PI-Drehzahlregler mit Begrenzung des Integralanteils bei begrenztem Moment
+        error = self.speed_reference - self.speed_feedback
+        integral = self.integral + error * self._integral_rate
+        torque_command = self._speed_gain * (error + integral)
+        saturated = (torque_command > self._torque_max) | (torque_command < self._torque_min)
+        self.integral = np.where(saturated, self.integral, integral)
+        torque_command = np.where(torque_mode, self.torque_target, torque_command)
+
+        # Drehmomentfilter und -grenzen
+        self.torque += (torque_command - self.torque) * self._torque_alpha
+        self.torque = np.clip(self.torque, self._torque_min, self._torque_max)
+
+        # Mechanik
+        friction = self.viscous_friction * self.speed + self.coulomb_friction * np.tanh(self.speed * 50.0)
+        self.speed += (self.torque - friction) / self._inertia * dt
+        self.position += self.speed * dt
+        self.speed_feedback += (self.speed - self.speed_feedback) * self._feedback_alpha
+        self.time += dt
+
+    def run(self, steps):
+        """Rechnet steps Abtastschritte ohne Aufzeichnung."""
+        for _ in range(int(steps)):
+            self.step()
+
+    def simulate(self, steps):
+        """
+        Rechnet steps Abtastschritte und zeichnet den Verlauf auf.
+
+        Returns:
+            dict: Arrays der Form (n_axes, steps) für 'speed' und 'speed_command' (rpm),
+                  'torque' (% Nennmoment), 'position' und 'deviation' (Geberinkremente)
+                  sowie 'time' (s, Form (steps,))
+        """
+        steps = int(steps)
+        trace = {key: np.empty((self.n_axes, steps)) for key in ('speed', 'speed_command', 'torque', 'position', 'deviation')}
+        times = np.empty(steps)
+        for i in range(steps):
+            self.step()
+            times[i] = self.time
+            trace['speed'][:, i] = self.speed_feedback
+            trace['speed_command'][:, i] = self.speed_reference
+            trace['torque'][:, i] = self.torque
+            trace['position'][:, i] = self.position
+            trace['deviation'][:, i] = np.where(self.mode == MODE_POSITION, self.position_command - self.position, 0.0)
+        trace['speed'] /= RPM_TO_RAD_S
+        trace['speed_command'] /= RPM_TO_RAD_S
+        trace['torque'] *= 100.0 / RATED_TORQUE
+        trace['position'] *= ENCODER_RESOLUTION / (2.0 * math.pi)
+        trace['deviation'] *= ENCODER_RESOLUTION / (2.0 * math.pi)
+        trace['time'] = times
+        return trace
+
+    def monitoring_values(self, axis=0):
+        """
+        Überwachungswerte einer Achse wie in der Gruppe P0B (Rohwerte; Moment in 0,1 %,
+        Strom in 0,01 A).
+
+        Returns:
+            dict: {Code: Wert}
+        """
+        def int32(value):
+            return ((int(value) + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+
+        counts = ENCODER_RESOLUTION / (2.0 * math.pi)
+        torque_percent = self.torque[axis] / RATED_TORQUE * 100.0
+        deviation = self.position_command[axis] - self.position[axis] if self.mode[axis] == MODE_POSITION else 0.0
+        current = abs(torque_percent) / 100.0 * RATED_CURRENT
+        return {
+            'P0B-00': round(self.speed_feedback[axis] / RPM_TO_RAD_S),
+            'P0B-01': round(self.speed_reference[axis] / RPM_TO_RAD_S),
+            'P0B-02': round(torque_percent * 10.0),
+            'P0B-15': int32(round(deviation * counts)),
+            'P0B-17': int32(round(self.position[axis] * counts)),
+            'P0B-24': round(current * 100.0),
+            'P0B-26': round(311.0 - 2.0 * current),
+            'P0B-58': int32(round(self.position[axis] * counts)),
+        }
@@ -0,0 +1,338 @@
+"""
+Virtueller A5-Antrieb als Modbus-Server.
+
+Der Server beantwortet Anfragen über Modbus TCP, RTU über TCP (wie ein
+Seriell-Ethernet-Gateway) oder eine serielle Schnittstelle. Jeder Slave hat
+ein eigenes Registerabbild (siehe register_map) und ein physikalisches
+Antriebsmodell (siehe servo_model), das die Überwachungswerte der Gruppe P0B
+aus den Sollwerten und den Reglerparametern berechnet.
+
+Die Antwortzeit setzt sich wie beim echten Antrieb zusammen aus
+    - Bearbeitungszeit des Antriebs (mit Streuung)
+    - Antwortverzögerung P0C-25 aus dem Registerabbild
+    - optional der Übertragungszeit der RTU-Rahmen bei einer angenommenen Baudrate,
+      damit sich ein TCP-Aufbau wie eine serielle Leitung verhält
+
+Ein Antrieb bearbeitet immer nur eine Anfrage gleichzeitig.
+
+Beispiel::
+
+    with VirtualDriveServer(transport='tcp', port=0, slave_ids=[1, 2]) as server:
+        client.connect(transport='tcp', host=server.host, tcp_port=server.port, slave_id=1)
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+from pymodbus import FramerType
+from pymodbus.datastore import ModbusBaseSlaveContext, ModbusServerContext
+from pymodbus.server import ModbusSerialServer, ModbusTcpServer
+
+from logger_config import logger
+from modbus_client import (
+    FC_READ_HOLDING_REGISTERS,
+    FC_WRITE_SINGLE_REGISTER,
+    FC_WRITE_MULTIPLE_REGISTERS,
+    RESPONSE_DELAY_ADDRESS,
+    TRANSPORT_SERIAL,
+    TRANSPORT_TCP,
+    TRANSPORT_RTU_OVER_TCP
+)
+from parameter_manager import ParameterManager
+from simulator.register_map import RegisterMap
+from simulator.servo_model import DEFAULT_PARAMETERS, ServoModel
+from utils.rtu_timing import char_time, inter_frame_gap, request_frame_bytes, response_frame_bytes
+
+
+class LatencyModel:
+    """Antwortzeit des virtuellen Antriebs."""
+
+    def __init__(self, processing_time=0.0005, jitter=0.0002, line_baudrate=None,
+                 bytesize=8, parity='N', stopbits=1, seed=None):
+        """
+        Args:
+            processing_time: Bearbeitungszeit je Anfrage in Sekunden
+            jitter: Maximale zusätzliche, gleichverteilte Streuung in Sekunden
+            line_baudrate: Baudrate der nachgebildeten RTU-Leitung; None ohne Leitungszeit
+            bytesize, parity, stopbits: Zeichenformat der nachgebildeten Leitung
+            seed: Startwert des Zufallsgenerators für reproduzierbare Messungen
+        """
+        self.processing_time = processing_time
+        self.jitter = jitter
+        self.line_settings = None
+        if line_baudrate:
+            self.line_settings = {'baudrate': line_baudrate, 'bytesize': bytesize,
+                                  'parity': parity, 'stopbits': stopbits}
+        self._random = random.Random(seed)
+
+    def delay(self, function_code, count, response_delay_ms=0):
+        """
+        Antwortzeit einer Anfrage.
+
+        Args:
+            function_code: Modbus-Funktionscode
+            count: Anzahl der Register
+            response_delay_ms: Aktueller Wert von P0C-25
+
+        Returns:
+            float: Zeit in Sekunden
+        """
+        delay = self.processing_time + response_delay_ms / 1000.0
+        if self.jitter:
+            delay += self._random.uniform(0.0, self.jitter)
+        if self.line_settings:
+            frame_bytes = request_frame_bytes(function_code, count) + response_frame_bytes(function_code, count)
+            delay += frame_bytes * char_time(**self.line_settings) + 2 * inter_frame_gap(**self.line_settings)
+        return delay
+
+
+class ServoDriveModel:
+    """
+    Verbindet das physikalische Servomodell mit dem Registerabbild eines Antriebs.
+
+    Vor jeder Anfrage wird das Modell bis zur aktuellen Zeit weitergerechnet; die
+    Reglerparameter (P05-04, P06-05..07, P07-05/09/10, P08-xx) werden dabei aus dem
+    Registerabbild übernommen, so dass geschriebene Parameter sofort wirken.
+
+    Der virtuelle Antrieb folgt immer dem zuletzt geschriebenen Direktbefehl wie im
+    Tuning-Tab, unabhängig von P02-00:
+        - P06-03: Drehzahlsollwert in rpm
+        - P07-03: Drehmomentsollwert in 0,1 %
+        - P05-05: Lageschritt in Befehlseinheiten (über das elektronische Getriebe P05-07/P05-09)
+    Nach dem Start steht der Motor, bis einer dieser Befehle geschrieben wird.
+    """
+
+    SPEED_COMMAND_ADDRESS = 1539     # P06-03
+    TORQUE_COMMAND_ADDRESS = 1795    # P07-03
+    POSITION_STEP_ADDRESS = 1285     # P05-05
+
+    def __init__(self, sample_rate=2000.0, load_inertia_ratio=1.0, max_catch_up=0.5):
+        """
+        Args:
+            sample_rate: Abtastrate des Modells in Hz
+            load_inertia_ratio: Wahres Trägheitsverhältnis der Mechanik
+            max_catch_up: Längste nachgerechnete Zeitspanne in Sekunden; längere
+                Pausen zwischen zwei Anfragen werden übersprungen
+        """
+        self.model = ServoModel(n_axes=1, sample_rate=sample_rate, load_inertia_ratio=load_inertia_ratio)
+        self.max_catch_up = max_catch_up
+        self._parameter_values = None
+        self._last_update = None
+
+    def on_write(self, registers, address, count):
+        """Übernimmt einen geschriebenen Direktbefehl."""
+        def written(command_address):
+            return address <= command_address < address + count
+
+        self._apply_parameters(registers)
+        if written(self.SPEED_COMMAND_ADDRESS):
+            self.model.command_speed(registers.get('P06-03'))
+        elif written(self.TORQUE_COMMAND_ADDRESS):
+            self.model.command_torque(registers.get('P07-03') / 10.0)
+        elif written(self.POSITION_STEP_ADDRESS):
+            numerator = registers.get('P05-07') or 1
+            denominator = registers.get('P05-09') or 1
+            self.model.command_position_step(registers.get('P05-05') * numerator / denominator)
+
+    def _apply_parameters(self, registers):
+        values = {code: registers.get(code) for code in DEFAULT_PARAMETERS if code in registers.definitions}
+        if values != self._parameter_values:
+            self.model.set_parameters(values)
+            self._parameter_values = values
+
+    def update(self, registers, now):
+        """Rechnet das Modell bis now weiter und schreibt die Messwerte in das Registerabbild."""
+        if self._last_update is None:
+            self._last_update = now
+        self._apply_parameters(registers)
+        elapsed = min(now - self._last_update, self.max_catch_up)
+        steps = int(elapsed / self.model.dt)
+        self.model.run(steps)
+        # Angefangene Schritte beim nächsten Mal nachholen, übersprungene Zeit verwerfen
+        self._last_update = now - (elapsed - steps * self.model.dt)
+        registers.update(self.model.monitoring_values())
+
+
+class VirtualDriveContext(ModbusBaseSlaveContext):
+    """Modbus-Slave-Kontext eines virtuellen Antriebs (nur Holding-Register)."""
+
+    def __init__(self, registers, model=None, latency=None):
+        """
+        Args:
+            registers: RegisterMap des Antriebs
+            model: Antriebsmodell mit update(registers, now) und on_write(registers, address, count); None ohne Modell
+            latency: LatencyModel; None antwortet ohne Verzögerung
+        """
+        self.registers = registers
+        self.model = model
+        self.latency = latency
+        self.requests = 0
+        self._busy = None
+
+    def __str__(self):
+        return "Virtual A5 drive"
+
+    def reset(self):
+        """Wird vom Server nicht verwendet."""
+
+    def validate(self, fc_as_hex, address, count=1):
+        if fc_as_hex == FC_READ_HOLDING_REGISTERS:
+            return self.registers.is_readable(address, count)
+        if fc_as_hex in (FC_WRITE_SINGLE_REGISTER, FC_WRITE_MULTIPLE_REGISTERS):
+            return self.registers.is_writable(address, count)
+        return False
+
+    def getValues(self, fc_as_hex, address, count=1):
+        if self.model is not None:
+            self.model.update(self.registers, time.monotonic())
+        return self.registers.read(address, count)
+
+    def setValues(self, fc_as_hex, address, values):
+        # ValueError wird vom Server als Slave Failure (Code 4) beantwortet
+        self.registers.write(address, values)
+        if self.model is not None:
+            self.model.on_write(self.registers, address, len(values))
+            self.model.update(self.registers, time.monotonic())
+
+    async def _respond_after(self, function_code, count):
+        if self._busy is None:
+            self._busy = asyncio.Lock()
+        self.requests += 1
+        if self.latency is None:
+            return
+        async with self._busy:
+            response_delay_ms = self.registers.read(RESPONSE_DELAY_ADDRESS)[0]
+            await asyncio.sleep(self.latency.delay(function_code, count, response_delay_ms))
+
+    async def async_getValues(self, fc_as_hex, address, count=1):
+        # FC 6 liest den geschriebenen Wert für die Antwort zurück, die Zeit zählt beim Schreiben
+        if fc_as_hex == FC_READ_HOLDING_REGISTERS:
+            await self._respond_after(fc_as_hex, count)
+        return self.getValues(fc_as_hex, address, count)
+
+    async def async_setValues(self, fc_as_hex, address, values):
+        await self._respond_after(fc_as_hex, len(values))
+        self.setValues(fc_as_hex, address, values)
+
+
+def load_parameter_definitions(json_file_path="servo_parameter_definitions.json"):
+    """Lädt die Parameterdefinitionen (Rohdaten) für das Registerabbild."""
+    parameter_manager = ParameterManager(json_file_path=json_file_path)
+    parameter_manager.load_parameters()
+    return parameter_manager.get_all_parameters_raw()
+
+
+class VirtualDriveServer:
+    """
+    Modbus-Server mit einem oder mehreren virtuellen Antrieben in einem eigenen Thread.
+    """
+
+    def __init__(self, transport=TRANSPORT_TCP, host='127.0.0.1', port=5020, slave_ids=(1,),
+                 latency=None, parameters=None, model_factory=ServoDriveModel, serial_port=None,
+                 baudrate=19200, bytesize=8, parity='E', stopbits=2):
+        """
+        Args:
+            transport: 'tcp', 'rtu_over_tcp' oder 'serial'
+            host: Adresse, an die der TCP-Server gebunden wird
+            port: TCP-Port; 0 wählt einen freien Port (siehe self.port nach start())
+            slave_ids: Slave-IDs der virtuellen Antriebe
+            latency: LatencyModel für alle Antriebe; None antwortet sofort
+            parameters: Parameterdefinitionen; Standard: servo_parameter_definitions.json
+            model_factory: Erzeugt das Antriebsmodell je Slave; None ohne Modell
+            serial_port: Serieller Port (nur bei transport='serial')
+            baudrate, bytesize, parity, stopbits: Schnittstellenparameter (nur seriell)
+        """
+        if transport not in (TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP, TRANSPORT_SERIAL):
+            raise ValueError(f"Unbekannter Übertragungsweg: {transport}")
+        if transport == TRANSPORT_SERIAL and not serial_port:
+            raise ValueError("Für den seriellen Server muss ein Port angegeben werden")
+        self.transport = transport
+        self.host = host
+        self.port = port
+        self.serial_settings = {'port': serial_port, 'baudrate': baudrate, 'bytesize': bytesize,
+                                'parity': parity, 'stopbits': stopbits}
+        if parameters is None:
+            parameters = load_parameter_definitions()
+        self.drives = {
+            int(slave_id): VirtualDriveContext(
+                RegisterMap(parameters),
+                model=model_factory() if model_factory else None,
+                latency=latency
+            )
+            for slave_id in slave_ids
+        }
+        self._server = None
+        self._loop = None
+        self._thread = None
+        self._started = threading.Event()
+        self._error = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def drive(self, slave_id):
+        """Registerabbild eines Antriebs, z.B. zum Prüfen geschriebener Werte."""
+        return self.drives[slave_id].registers
+
+    def _create_server(self, context):
+        if self.transport == TRANSPORT_SERIAL:
+            return ModbusSerialServer(context, framer=FramerType.RTU, **self.serial_settings)
+        framer = FramerType.SOCKET if self.transport == TRANSPORT_TCP else FramerType.RTU
+        return ModbusTcpServer(context, framer=framer, address=(self.host, self.port))
+
+    async def _serve(self):
+        context = ModbusServerContext(slaves=self.drives, single=False)
+        self._server = self._create_server(context)
+        if not await self._server.listen():
+            raise OSError(f"Server konnte nicht gestartet werden ({self.transport})")
+        if self.transport != TRANSPORT_SERIAL:
+            # Bei port=0 den vom Betriebssystem vergebenen Port übernehmen
+            self.port = self._server.transport.sockets[0].getsockname()[1]
+        self._started.set()
+        await self._server.serving
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._serve())
+        except Exception as e:
+            self._error = e
+            logger.error(f"Virtueller Antrieb: {e}")
+        finally:
+            self._started.set()
+            # Offene Aufgaben des Servers (z.B. erneutes Lauschen) vor dem Schließen beenden
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self._loop.close()
+
+    def start(self, timeout=5.0):
+        """
+        Startet den Server im Hintergrund und wartet, bis er Anfragen annimmt.
+
+        Raises:
+            OSError: Wenn der Server nicht gestartet werden kann
+        """
+        self._thread = threading.Thread(target=self._run, name="VirtualDriveServer", daemon=True)
+        self._thread.start()
+        if not self._started.wait(timeout) or self._error is not None:
+            raise OSError(f"Virtueller Antrieb konnte nicht gestartet werden: {self._error}")
+        endpoint = self.serial_settings['port'] if self.transport == TRANSPORT_SERIAL else f"{self.host}:{self.port}"
+        logger.info(f"Virtueller Antrieb ({self.transport}) an {endpoint}, Slaves {sorted(self.drives)}")
+
+    def stop(self):
+        """Beendet den Server."""
+        if self._loop is None or self._thread is None:
+            return
+        if self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._server.shutdown(), self._loop)
+        self._thread.join(timeout=5.0)
+        self._thread = None
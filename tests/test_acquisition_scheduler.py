@@ -0,0 +1,83 @@
+"""
+Abfrageplan mit Abtastraten und Anfragebudget je Zyklus (utils.acquisition_scheduler).
+"""
+
+import unittest
+
+from utils.acquisition_scheduler import AcquisitionScheduler
+from utils.block_planner import BlockItem
+
+FAST = BlockItem('P0B-00', 2816)
+NEIGHBOUR = BlockItem('P0B-01', 2817)      # passt in den Block von P0B-00
+FAR_A = BlockItem('P0B-40', 2856)          # je eine eigene Anfrage
+FAR_B = BlockItem('P0B-80', 2896)
+FAR_C = BlockItem('P30-00', 12288)
+
+
+def codes(blocks):
+    return sorted(item.code for block in blocks for item in block.items)
+
+
+class AcquisitionSchedulerTest(unittest.TestCase):
+    def _scheduler(self, rates, items, max_extra_requests=1):
+        scheduler = AcquisitionScheduler(max_extra_requests=max_extra_requests)
+        scheduler.set_channels(items)
+        scheduler.set_rates(rates)
+        return scheduler
+
+    def test_full_rate_channels_every_cycle(self):
+        scheduler = self._scheduler({}, [FAST, FAR_A])
+        for step in range(5):
+            self.assertEqual(codes(scheduler.next_cycle(step * 0.001)), ['P0B-00', 'P0B-40'])
+
+    def test_slow_channel_follows_its_rate(self):
+        scheduler = self._scheduler({'P0B-40': 10}, [FAST, FAR_A])
+        reads = sum('P0B-40' in codes(scheduler.next_cycle(step * 0.01)) for step in range(100))
+        # 1 s bei 10 Hz
+        self.assertEqual(reads, 10)
+        self.assertEqual(scheduler.get_statistics(), {'P0B-00': 100, 'P0B-40': 10})
+
+    def test_extra_requests_per_cycle_are_limited(self):
+        scheduler = self._scheduler({'P0B-40': 10, 'P0B-80': 10, 'P30-00': 10}, [FAST, FAR_A, FAR_B, FAR_C])
+        # Alle drei langsamen Kanäle sind fällig, aber je Zyklus ist nur eine weitere Anfrage erlaubt
+        first = scheduler.next_cycle(0.0)
+        self.assertEqual(len(first), 2)
+        second = scheduler.next_cycle(0.001)
+        third = scheduler.next_cycle(0.002)
+        self.assertEqual([len(second), len(third)], [2, 2])
+        slow_read = [set(codes(blocks)) - {'P0B-00'} for blocks in (first, second, third)]
+        self.assertEqual(set().union(*slow_read), {'P0B-40', 'P0B-80', 'P30-00'})
+        self.assertEqual(len(scheduler.next_cycle(0.003)), 1)
+
+    def test_budget_follows_max_extra_requests(self):
+        scheduler = self._scheduler({'P0B-40': 10, 'P0B-80': 10, 'P30-00': 10}, [FAST, FAR_A, FAR_B, FAR_C],
+                                    max_extra_requests=2)
+        self.assertEqual(len(scheduler.next_cycle(0.0)), 3)
+        self.assertEqual(len(scheduler.next_cycle(0.001)), 2)
+
+    def test_overdue_channels_go_first(self):
+        scheduler = self._scheduler({'P0B-40': 10, 'P0B-80': 10}, [FAST, FAR_A, FAR_B])
+        first = set(codes(scheduler.next_cycle(0.0))) - {'P0B-00'}
+        second = set(codes(scheduler.next_cycle(0.001))) - {'P0B-00'}
+        self.assertEqual(len(first | second), 2)
+
+    def test_due_channel_in_existing_block_ignores_budget(self):
+        scheduler = self._scheduler({'P0B-01': 10, 'P0B-40': 10}, [FAST, NEIGHBOUR, FAR_A])
+        blocks = scheduler.next_cycle(0.0)
+        self.assertEqual(codes(blocks), ['P0B-00', 'P0B-01', 'P0B-40'])
+        self.assertEqual(len(blocks), 2)
+
+    def test_channel_not_yet_due_is_not_read_early(self):
+        scheduler = self._scheduler({'P0B-01': 10}, [FAST, NEIGHBOUR])
+        self.assertEqual(codes(scheduler.next_cycle(0.0)), ['P0B-00', 'P0B-01'])
+        self.assertEqual(codes(scheduler.next_cycle(0.05)), ['P0B-00'])
+        self.assertEqual(codes(scheduler.next_cycle(0.1)), ['P0B-00', 'P0B-01'])
+
+    def test_nothing_due(self):
+        scheduler = self._scheduler({'P0B-40': 10}, [FAR_A])
+        self.assertEqual(len(scheduler.next_cycle(0.0)), 1)
+        self.assertEqual(scheduler.next_cycle(0.01), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
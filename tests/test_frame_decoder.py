@@ -0,0 +1,149 @@
+"""
+FrameDecoder gegen ReadBlock.decode und Fehlerbehandlung von FrameReader.read.
+"""
+
+import unittest
+
+import numpy as np
+
+from custom_exceptions import ModbusConnectionException, ModbusTimeoutException
+from utils.block_planner import plan_blocks
+from utils.frame_decoder import FrameDecoder, FrameReader
+from utils.plot_channels import ChannelRegistry
+
+# Kanäle aller Breiten; zwei Gruppen, damit der Plan aus mehreren Blöcken besteht
+PARAMETERS = [
+    {'code': 'P0B-00', 'name': 'Speed', 'decimal': 2816, 'validation': {'two_complement': True}},
+    {'code': 'P0B-01', 'name': 'Voltage', 'decimal': 2817,
+     'validation': {'type': 'range', 'min': 0, 'max': 6000, 'decimal_places': 1}},
+    {'code': 'P0B-02', 'name': 'Position', 'decimal': 2818, 'validation': {'number_type': 'signed_integer_32bit'}},
+    {'code': 'P0B-04', 'name': 'Counter', 'decimal': 2820,
+     'validation': {'number_type': 'unsigned_integer_32bit', 'decimal_places': 2}},
+    {'code': 'P0B-06', 'name': 'Encoder (lower 32 bits)', 'decimal': 2822,
+     'validation': {'number_type': 'unsigned_integer_32bit'}},
+    {'code': 'P0B-08', 'name': 'Encoder (upper 32 bits)', 'decimal': 2824,
+     'validation': {'number_type': 'signed_integer_32bit'}},
+    {'code': 'P30-00', 'name': 'Torque', 'decimal': 12288, 'validation': {'two_complement': True}},
+    {'code': 'P30-01', 'name': 'Status', 'decimal': 12289},
+]
+
+
+def reference_decode(blocks, block_registers, channels, limits=None):
+    """Bisheriger Weg: ReadBlock.decode, PlotChannel.convert und Bereichsprüfung je Kanal"""
+    limits = limits or {}
+    result = {}
+    for block, registers in zip(blocks, block_registers):
+        if registers is None:
+            continue
+        for code, raw in block.decode(registers).items():
+            channel = channels.get(code)
+            value = channel.convert(raw)
+            low, high = limits.get(code, (channel.minimum, channel.maximum))
+            if (low is None or value >= low) and (high is None or value <= high):
+                result[code] = value
+    return result
+
+
+class FakeClient:
+    def __init__(self, responses):
+        """responses: je Block eine Registerliste oder eine Exception"""
+        self.responses = list(responses)
+        self.requests = 0
+
+    def read_holding_register_fast(self, start, count=1, slave=None):
+        response = self.responses[self.requests]
+        self.requests += 1
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class FrameDecoderTest(unittest.TestCase):
+    def setUp(self):
+        self.channels = ChannelRegistry(PARAMETERS)
+        self.blocks = plan_blocks([channel.item for channel in self.channels.channels()])
+
+    def _random_frame(self, rng):
+        return [rng.integers(0, 0x10000, size=block.count).tolist() for block in self.blocks]
+
+    def test_channel_widths(self):
+        widths = {channel.code: (channel.width, channel.is_signed) for channel in self.channels.channels()}
+        self.assertEqual(widths, {'P0B-00': (1, True), 'P0B-01': (1, False), 'P0B-02': (2, True),
+                                  'P0B-04': (2, False), 'P0B-06': (4, True), 'P30-00': (1, True),
+                                  'P30-01': (1, False)})
+        self.assertEqual(len(self.blocks), 2)
+
+    def test_matches_readblock_decode(self):
+        decoder = FrameDecoder(self.blocks, self.channels)
+        rng = np.random.default_rng(1)
+        for _ in range(200):
+            frame = self._random_frame(rng)
+            self.assertEqual(decoder.decode(frame), reference_decode(self.blocks, frame, self.channels))
+
+    def test_extreme_values(self):
+        decoder = FrameDecoder(self.blocks, self.channels)
+        for word in (0, 0x7FFF, 0x8000, 0xFFFF):
+            frame = [[word] * block.count for block in self.blocks]
+            self.assertEqual(decoder.decode(frame), reference_decode(self.blocks, frame, self.channels))
+
+    def test_low_word_first(self):
+        decoder = FrameDecoder(self.blocks, self.channels)
+        frame = [[0] * block.count for block in self.blocks]
+        frame[0][2:4] = [0xFFFE, 0xFFFF]                   # P0B-02: -2
+        frame[0][4:6] = [0x0001, 0x0002]                   # P0B-04: 0x00020001 / 100
+        frame[0][6:10] = [0x0003, 0, 0, 0x8000]            # P0B-06: -2^63 + 3
+        values = decoder.decode(frame)
+        self.assertEqual(values['P0B-02'], -2)
+        self.assertEqual(values['P0B-04'], 0x00020001 / 100)
+        self.assertEqual(values['P0B-06'], -(1 << 63) + 3)
+
+    def test_plausibility_limits_reject_values(self):
+        limits = {'P0B-00': (-6000, 6000), 'P30-01': (0, 10)}
+        decoder = FrameDecoder(self.blocks, self.channels, limits=limits)
+        frame = [[0] * block.count for block in self.blocks]
+        frame[0][0] = (-7000) & 0xFFFF     # P0B-00 unter der Grenze
+        frame[0][1] = 6001                 # P0B-01 über dem Bereich der Definition (600,0)
+        frame[1][1] = 11                   # P30-01 über der Grenze
+        values = decoder.decode(frame)
+        self.assertEqual(values, reference_decode(self.blocks, frame, self.channels, limits))
+        self.assertNotIn('P0B-00', values)
+        self.assertNotIn('P0B-01', values)
+        self.assertNotIn('P30-01', values)
+        self.assertIn('P30-00', values)
+
+    def test_missing_block_drops_only_its_channels(self):
+        decoder = FrameDecoder(self.blocks, self.channels)
+        frame = [[1] * self.blocks[0].count, None]
+        self.assertEqual(decoder.decode(frame), reference_decode(self.blocks, frame, self.channels))
+        self.assertEqual(set(decoder.decode(frame)), {'P0B-00', 'P0B-01', 'P0B-02', 'P0B-04', 'P0B-06'})
+
+
+class FrameReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.channels = ChannelRegistry(PARAMETERS)
+        self.blocks = plan_blocks([channel.item for channel in self.channels.channels()])
+        self.reader = FrameReader(self.channels)
+
+    def test_reads_all_blocks(self):
+        client = FakeClient([[1] * block.count for block in self.blocks])
+        self.assertEqual(len(self.reader.read(client, self.blocks)), 7)
+
+    def test_connection_loss_is_raised_at_once(self):
+        client = FakeClient([ModbusConnectionException("Port weg")] * len(self.blocks))
+        with self.assertRaises(ModbusConnectionException):
+            self.reader.read(client, self.blocks)
+        self.assertEqual(client.requests, 1)
+
+    def test_timeout_on_all_blocks_is_raised(self):
+        client = FakeClient([ModbusTimeoutException("keine Antwort")] * len(self.blocks))
+        with self.assertRaises(ModbusTimeoutException):
+            self.reader.read(client, self.blocks)
+        self.assertEqual(client.requests, len(self.blocks))
+
+    def test_timeout_on_some_blocks_drops_their_channels(self):
+        client = FakeClient([ModbusTimeoutException("keine Antwort"), [1] * self.blocks[1].count])
+        self.assertEqual(set(self.reader.read(client, self.blocks)), {'P30-00', 'P30-01'})
+
+
+if __name__ == '__main__':
+    unittest.main()
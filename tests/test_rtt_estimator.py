@@ -0,0 +1,87 @@
+"""
+Timeout-Schätzung nach RFC 6298 (utils.rtt_estimator).
+"""
+
+import unittest
+
+from utils.rtt_estimator import RttEstimator
+
+FC_READ = 3
+
+
+class RttEstimatorTest(unittest.TestCase):
+    def setUp(self):
+        self.estimator = RttEstimator(min_timeout=0.0, max_timeout=1000.0, initial_timeout=1.0, min_samples=3)
+
+    def _entry(self, count=1):
+        return self.estimator.get_statistics()[(FC_READ, count)]
+
+    def test_first_sample_initializes_srtt_and_rttvar(self):
+        self.estimator.record_success(FC_READ, 1, 0.1)
+        entry = self._entry()
+        self.assertAlmostEqual(entry['srtt'], 0.1)
+        self.assertAlmostEqual(entry['rttvar'], 0.05)
+        self.assertEqual(entry['samples'], 1)
+
+    def test_update_uses_alpha_beta(self):
+        self.estimator.record_success(FC_READ, 1, 0.1)
+        self.estimator.record_success(FC_READ, 1, 0.2)
+        entry = self._entry()
+        # RTTVAR wird mit dem alten SRTT berechnet
+        self.assertAlmostEqual(entry['rttvar'], 0.75 * 0.05 + 0.25 * abs(0.1 - 0.2))
+        self.assertAlmostEqual(entry['srtt'], 0.875 * 0.1 + 0.125 * 0.2)
+
+    def test_initial_timeout_until_min_samples(self):
+        for _ in range(2):
+            self.estimator.record_success(FC_READ, 1, 0.1)
+            self.assertEqual(self.estimator.get_timeout(FC_READ, 1), 1.0)
+        self.estimator.record_success(FC_READ, 1, 0.1)
+        entry = self._entry()
+        self.assertAlmostEqual(self.estimator.get_timeout(FC_READ, 1), entry['srtt'] + 4 * entry['rttvar'])
+
+    def test_transaction_types_are_independent(self):
+        for _ in range(3):
+            self.estimator.record_success(FC_READ, 1, 0.1)
+        self.assertEqual(self.estimator.get_timeout(FC_READ, 16), 1.0)
+
+    def test_timeout_is_clamped(self):
+        estimator = RttEstimator(min_timeout=0.05, max_timeout=0.5, min_samples=1)
+        estimator.record_success(FC_READ, 1, 0.001)
+        self.assertEqual(estimator.get_timeout(FC_READ, 1), 0.05)
+        estimator.record_success(FC_READ, 2, 1.0)
+        self.assertEqual(estimator.get_timeout(FC_READ, 2), 0.5)
+
+    def test_backoff_doubles_up_to_64(self):
+        for _ in range(3):
+            self.estimator.record_success(FC_READ, 1, 0.1)
+        base = self.estimator.get_timeout(FC_READ, 1)
+        for expected in (2, 4, 8, 16, 32, 64, 64, 64):
+            self.estimator.record_timeout(FC_READ, 1)
+            self.assertAlmostEqual(self.estimator.get_timeout(FC_READ, 1), base * expected)
+        self.assertEqual(self._entry()['timeouts'], 8)
+        # Eine erfolgreiche Antwort setzt den Backoff zurück
+        self.estimator.record_success(FC_READ, 1, 0.1, timeout_used=base * 64)
+        entry = self._entry()
+        self.assertAlmostEqual(self.estimator.get_timeout(FC_READ, 1), entry['srtt'] + 4 * entry['rttvar'])
+
+    def test_karn_discards_samples_longer_than_timeout_used(self):
+        for _ in range(3):
+            self.estimator.record_success(FC_READ, 1, 0.1)
+        before = self._entry()
+        self.estimator.record_timeout(FC_READ, 1)
+        self.estimator.record_success(FC_READ, 1, 0.9, timeout_used=0.5)
+        after = self._entry()
+        self.assertEqual(after['samples'], before['samples'])
+        self.assertAlmostEqual(after['srtt'], before['srtt'])
+        self.assertAlmostEqual(after['rttvar'], before['rttvar'])
+        # Der Backoff wird trotzdem zurückgesetzt
+        self.assertAlmostEqual(self.estimator.get_timeout(FC_READ, 1), before['timeout'])
+
+    def test_reset_forgets_samples(self):
+        self.estimator.record_success(FC_READ, 1, 0.1)
+        self.estimator.reset()
+        self.assertEqual(self.estimator.get_statistics(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Sichern und Vergleichen mit servo_api gegen den virtuellen Antrieb.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+
+from servo_api import ServoDrive
+from simulator.virtual_drive import VirtualDriveServer
+
+SPEED_COMMAND = 'P06-03'
+
+
+class ExportDiffRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.server = VirtualDriveServer(port=0)
+        self.server.start()
+        self.drive = ServoDrive()
+        self.drive.connect(transport='tcp', host=self.server.host, tcp_port=self.server.port)
+        self.file_path = os.path.join(tempfile.mkdtemp(), 'backup.json')
+
+    def tearDown(self):
+        self.drive.write(SPEED_COMMAND, 0)
+        self.drive.close()
+        self.server.stop()
+
+    def test_export_diff_on_moving_drive_reports_no_differences(self):
+        # Motor drehen lassen, damit sich die Überwachungswerte zwischen Export und Vergleich ändern
+        self.drive.write(SPEED_COMMAND, 1000)
+        time.sleep(0.2)
+        values, errors = self.drive.export(self.file_path)
+        self.assertEqual(errors, [])
+        self.assertFalse(any(code[:3] in ('P0B', 'P0D') for code in values))
+        self.drive.write(SPEED_COMMAND, -500)
+        time.sleep(0.2)
+
+        # P06-03 ist ein Einstellparameter und weicht jetzt ab; sonst darf sich nichts unterscheiden
+        differences = self.drive.diff(self.file_path)
+        self.assertEqual([code for code, _ref, _act in differences], [SPEED_COMMAND])
+        self.drive.write(SPEED_COMMAND, 1000)
+        self.assertEqual(self.drive.diff(self.file_path), [])
+
+    def test_import_skips_monitoring_and_action_groups(self):
+        values, _errors = self.drive.export(self.file_path)
+        values.update({'P0B-00': 1234, 'P0D-00': 1})
+        written, failed = self.drive.import_values(values)
+        self.assertEqual(written, [])
+        self.assertEqual(failed, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Schreibfolge des RAM-Modus auf P0C-13 (utils.tuning_session).
+"""
+
+import unittest
+
+from custom_exceptions import ModbusWriteException
+from utils.tuning_session import EEPROM_UPDATE_ADDRESS, TuningSession
+
+
+class FakeClient:
+    """Protokolliert Zugriffe; fail_at lässt den n-ten Schreibzugriff (ab 0) fehlschlagen"""
+
+    def __init__(self, eeprom_update=1, fail_at=None):
+        self.eeprom_update = eeprom_update
+        self.fail_at = fail_at
+        self.calls = []
+        self.writes = 0
+
+    def read_holding_register(self, address, count=1):
+        self.calls.append(('read', address))
+        return [self.eeprom_update]
+
+    def _write(self, call):
+        if self.writes == self.fail_at:
+            self.writes += 1
+            raise ModbusWriteException("Schreibfehler")
+        self.writes += 1
+        self.calls.append(call)
+        return True
+
+    def write_holding_register(self, address, value):
+        return self._write(('write', address, value))
+
+    def write_holding_register_32bit(self, address, value, is_signed=False):
+        return self._write(('write32', address, value, is_signed))
+
+
+class TuningSessionTest(unittest.TestCase):
+    def test_start_reads_then_disables_eeprom_updates(self):
+        client = FakeClient()
+        session = TuningSession(client)
+        session.start()
+        self.assertEqual(client.calls, [('read', EEPROM_UPDATE_ADDRESS), ('write', EEPROM_UPDATE_ADDRESS, 0)])
+        self.assertTrue(session.active)
+        session.start()
+        self.assertEqual(len(client.calls), 2)
+
+    def test_record_only_in_ram_mode(self):
+        session = TuningSession(FakeClient())
+        session.record('P08-00', 2048, 300)
+        self.assertEqual(session.dirty_codes(), [])
+        session.start()
+        session.record('P08-00', 2048, 300)
+        self.assertEqual(session.dirty_codes(), ['P08-00'])
+
+    def test_commit_rewrites_dirty_values_between_enable_and_disable(self):
+        client = FakeClient()
+        session = TuningSession(client)
+        session.start()
+        session.record('P08-01', 2049, 2000)
+        session.record('P05-00', 1280, -70000, is_32bit=True, is_signed=True)
+        client.calls.clear()
+        self.assertEqual(session.commit(), ['P05-00', 'P08-01'])
+        self.assertEqual(client.calls, [
+            ('write', EEPROM_UPDATE_ADDRESS, 1),
+            ('write32', 1280, -70000, True),
+            ('write', 2049, 2000),
+            ('write', EEPROM_UPDATE_ADDRESS, 0),
+        ])
+        self.assertEqual(session.dirty_codes(), [])
+
+    def test_commit_without_dirty_values_writes_nothing(self):
+        client = FakeClient()
+        session = TuningSession(client)
+        session.start()
+        client.calls.clear()
+        self.assertEqual(session.commit(), [])
+        self.assertEqual(client.calls, [])
+
+    def test_commit_error_keeps_unsaved_values(self):
+        client = FakeClient()
+        session = TuningSession(client)
+        session.start()
+        session.record('P08-00', 2048, 300)
+        session.record('P08-01', 2049, 2000)
+        # Schreibzugriffe: 0 = start, 1 = P0C-13 = 1, 2 = P08-00, 3 = P08-01 schlägt fehl
+        client.fail_at = 3
+        client.calls.clear()
+        with self.assertRaises(ModbusWriteException):
+            session.commit()
+        self.assertEqual(session.dirty_codes(), ['P08-01'])
+        # Auch nach dem Fehler wird das EEPROM wieder abgeschaltet
+        self.assertEqual(client.calls[-1], ('write', EEPROM_UPDATE_ADDRESS, 0))
+
+    def test_stop_writes_previous_setting_twice(self):
+        client = FakeClient(eeprom_update=1)
+        session = TuningSession(client)
+        session.start()
+        session.record('P08-00', 2048, 300)
+        client.calls.clear()
+        self.assertEqual(session.stop(), ['P08-00'])
+        # Der erste Zugriff schaltet das EEPROM ein, erst der zweite speichert den Wert
+        self.assertEqual(client.calls, [('write', EEPROM_UPDATE_ADDRESS, 1), ('write', EEPROM_UPDATE_ADDRESS, 1)])
+        self.assertFalse(session.active)
+        self.assertEqual(session.dirty_codes(), [])
+
+    def test_stop_restores_disabled_setting(self):
+        client = FakeClient(eeprom_update=0)
+        session = TuningSession(client)
+        session.start()
+        client.calls.clear()
+        session.stop()
+        self.assertEqual(client.calls, [('write', EEPROM_UPDATE_ADDRESS, 0), ('write', EEPROM_UPDATE_ADDRESS, 0)])
+
+    def test_stop_without_start_writes_nothing(self):
+        client = FakeClient()
+        self.assertEqual(TuningSession(client).stop(), [])
+        self.assertEqual(client.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
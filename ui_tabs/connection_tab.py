@@ -1,5 +1,12 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QGroupBox, QFormLayout, 
-                             QComboBox, QLineEdit, QPushButton, QCheckBox)
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QFormLayout, 
+                             QComboBox, QLineEdit, QPushButton, QCheckBox, QLabel,
+                             QDoubleSpinBox, QSpinBox)
+from PyQt5.QtCore import QTimer
+
+from modbus_client import (FC_READ_HOLDING_REGISTERS, DEFAULT_TCP_PORT, TRANSPORT_SERIAL,
+                           TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP, parse_slave_ids)
+from custom_exceptions import ServoToolException
+from logger_config import logger
 
 class ConnectionTab(QWidget):
     def __init__(self, parent=None):
@@ -13,13 +20,47 @@ class ConnectionTab(QWidget):
         
         self.connect_button = QPushButton(self.main_app.language_manager.get_text("button_connect"))
 
+        self.discovery_group = QGroupBox(self.main_app.language_manager.get_text("group_baud_discovery"))
+        self.discovery_group.setLayout(self.create_discovery_layout())
+
+        self.timing_group = QGroupBox(self.main_app.language_manager.get_text("group_rtu_timing"))
+        self.timing_group.setLayout(self.create_timing_layout())
+        self.timing_group.setEnabled(False)
+
         layout.addWidget(self.connection_group)
         layout.addWidget(self.connect_button)
+        layout.addWidget(self.discovery_group)
+        layout.addWidget(self.timing_group)
         layout.addStretch(1)
 
+        # Messwerte der Verbindung regelmäßig anzeigen, solange eine Verbindung besteht
+        self.timing_timer = QTimer(self)
+        self.timing_timer.setInterval(1000)
+        self.timing_timer.timeout.connect(self.update_timing_display)
+
+        self.update_transport_fields()
+
     def create_form_layout(self):
+        lm = self.main_app.language_manager
         form_layout = QFormLayout()
 
+        self.transport_input = QComboBox()
+        for transport in (TRANSPORT_SERIAL, TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP):
+            self.transport_input.addItem(lm.get_text(f"text_transport_{transport}"), transport)
+        self.transport_input.currentIndexChanged.connect(self.update_transport_fields)
+        self.transport_label = QLabel(lm.get_text("label_transport") + ":")
+        form_layout.addRow(self.transport_label, self.transport_input)
+
+        self.host_input = QLineEdit("127.0.0.1")
+        self.host_label = QLabel(lm.get_text("label_host") + ":")
+        form_layout.addRow(self.host_label, self.host_input)
+
+        self.tcp_port_input = QSpinBox()
+        self.tcp_port_input.setRange(1, 65535)
+        self.tcp_port_input.setValue(DEFAULT_TCP_PORT)
+        self.tcp_port_label = QLabel(lm.get_text("label_tcp_port") + ":")
+        form_layout.addRow(self.tcp_port_label, self.tcp_port_input)
+
         self.com_port_input = QComboBox()
         self.com_port_input.addItems([f"COM{i}" for i in range(1, 10)])
         self.com_port_input.setEditable(True)
@@ -32,7 +73,8 @@ class ConnectionTab(QWidget):
             f"9600 {self.main_app.language_manager.get_text('text_bps')}": 9600,
             f"19200 {self.main_app.language_manager.get_text('text_bps')}": 19200,
             f"38400 {self.main_app.language_manager.get_text('text_bps')}": 38400,
-            f"57600 {self.main_app.language_manager.get_text('text_bps')}": 57600
+            f"57600 {self.main_app.language_manager.get_text('text_bps')}": 57600,
+            f"115200 {self.main_app.language_manager.get_text('text_bps')}": 115200
         }
         for text, rate in baud_rates.items():
             self.baud_rate_input.addItem(text, rate)
@@ -54,6 +96,7 @@ class ConnectionTab(QWidget):
         form_layout.addRow(self.main_app.language_manager.get_text("label_stop_bits") + ":", self.stop_bits_input)
 
         self.modbus_address_input = QLineEdit("1")
+        self.modbus_address_input.setToolTip(self.main_app.language_manager.get_text("tooltip_modbus_addresses"))
         form_layout.addRow(self.main_app.language_manager.get_text("label_modbus_address") + ":", self.modbus_address_input)
 
         self.simulation_checkbox = QCheckBox(self.main_app.language_manager.get_text("checkbox_simulation_mode"))
@@ -62,14 +105,165 @@ class ConnectionTab(QWidget):
         
         return form_layout
 
+    def create_discovery_layout(self):
+        lm = self.main_app.language_manager
+        form_layout = QFormLayout()
+
+        self.soak_reads_input = QSpinBox()
+        self.soak_reads_input.setRange(10, 10000)
+        self.soak_reads_input.setValue(200)
+        self.soak_reads_label = QLabel(lm.get_text("label_soak_test_reads") + ":")
+        form_layout.addRow(self.soak_reads_label, self.soak_reads_input)
+
+        self.discover_button = QPushButton(lm.get_text("button_discover_drive"))
+        self.optimize_baud_button = QPushButton(lm.get_text("button_optimize_baud_rate"))
+        row = QHBoxLayout()
+        row.addWidget(self.discover_button)
+        row.addWidget(self.optimize_baud_button)
+        form_layout.addRow(row)
+
+        return form_layout
+
+    def set_discovery_running(self, running):
+        """Sperrt die Verbindungseinstellungen, solange eine Suche läuft"""
+        self.connection_group.setEnabled(not running)
+        self.connect_button.setEnabled(not running)
+        self.discover_button.setEnabled(not running)
+        self.optimize_baud_button.setEnabled(not running)
+
+    def is_serial_transport(self):
+        return self.transport_input.currentData() == TRANSPORT_SERIAL
+
+    def update_transport_fields(self):
+        """Gibt nur die Eingabefelder des gewählten Übertragungswegs frei"""
+        serial = self.is_serial_transport()
+        for widget in (self.com_port_input, self.baud_rate_input, self.data_bits_input,
+                       self.parity_input, self.stop_bits_input):
+            widget.setEnabled(serial)
+        self.host_input.setEnabled(not serial)
+        self.tcp_port_input.setEnabled(not serial)
+        # Die Baudraten-Suche gibt es nur an einer seriellen Leitung
+        self.discovery_group.setEnabled(serial and not self.main_app.is_connected())
+
+    def apply_connection_settings(self, settings):
+        """Übernimmt gefundene Schnittstellenparameter in die Eingabefelder"""
+        index = self.baud_rate_input.findData(settings['baudrate'])
+        if index >= 0:
+            self.baud_rate_input.setCurrentIndex(index)
+        self.parity_input.setCurrentText(settings['parity'])
+        self.stop_bits_input.setCurrentText(str(settings['stopbits']))
+
+    def create_timing_layout(self):
+        lm = self.main_app.language_manager
+        form_layout = QFormLayout()
+
+        self.inter_frame_delay_input = QDoubleSpinBox()
+        self.inter_frame_delay_input.setRange(0.0, 100.0)
+        self.inter_frame_delay_input.setDecimals(2)
+        self.inter_frame_delay_input.setSingleStep(0.1)
+        self.inter_frame_delay_apply_button = QPushButton(lm.get_text("button_apply"))
+        self.inter_frame_delay_default_button = QPushButton(lm.get_text("button_default"))
+        self.inter_frame_delay_apply_button.clicked.connect(self.apply_inter_frame_delay)
+        self.inter_frame_delay_default_button.clicked.connect(self.reset_inter_frame_delay)
+        row = QHBoxLayout()
+        row.addWidget(self.inter_frame_delay_input)
+        row.addWidget(self.inter_frame_delay_apply_button)
+        row.addWidget(self.inter_frame_delay_default_button)
+        self.inter_frame_delay_label = QLabel(lm.get_text("label_inter_frame_delay") + ":")
+        form_layout.addRow(self.inter_frame_delay_label, row)
+
+        self.response_delay_input = QSpinBox()
+        self.response_delay_input.setRange(0, 5000)
+        self.response_delay_read_button = QPushButton(lm.get_text("button_read"))
+        self.response_delay_write_button = QPushButton(lm.get_text("button_write"))
+        self.response_delay_read_button.clicked.connect(self.read_response_delay)
+        self.response_delay_write_button.clicked.connect(self.write_response_delay)
+        row = QHBoxLayout()
+        row.addWidget(self.response_delay_input)
+        row.addWidget(self.response_delay_read_button)
+        row.addWidget(self.response_delay_write_button)
+        self.response_delay_label = QLabel(lm.get_text("label_response_delay") + ":")
+        form_layout.addRow(self.response_delay_label, row)
+
+        self.min_time_label = QLabel(lm.get_text("label_min_transaction_time") + ":")
+        self.min_time_value = QLabel("--")
+        form_layout.addRow(self.min_time_label, self.min_time_value)
+
+        self.measured_time_label = QLabel(lm.get_text("label_measured_transaction_time") + ":")
+        self.measured_time_value = QLabel("--")
+        form_layout.addRow(self.measured_time_label, self.measured_time_value)
+
+        self.efficiency_label = QLabel(lm.get_text("label_link_efficiency") + ":")
+        self.efficiency_value = QLabel("--")
+        form_layout.addRow(self.efficiency_label, self.efficiency_value)
+
+        return form_layout
+
+    def apply_inter_frame_delay(self):
+        self.main_app.modbus_client.set_inter_frame_delay(self.inter_frame_delay_input.value() / 1000.0)
+        self.update_timing_display()
+
+    def reset_inter_frame_delay(self):
+        self.main_app.modbus_client.set_inter_frame_delay(None)
+        self._show_inter_frame_delay()
+        self.update_timing_display()
+
+    def _show_inter_frame_delay(self):
+        delay = self.main_app.modbus_client.get_inter_frame_delay()
+        if delay is not None:
+            self.inter_frame_delay_input.setValue(delay * 1000.0)
+
+    def read_response_delay(self):
+        try:
+            self.response_delay_input.setValue(self.main_app.modbus_client.read_response_delay())
+            self.update_timing_display()
+        except ServoToolException as e:
+            logger.warning(f"P0C-25 konnte nicht gelesen werden: {e}")
+            self.main_app.status_label.setText(f"Fehler beim Lesen von P0C-25: {e}")
+
+    def write_response_delay(self):
+        try:
+            if self.main_app.modbus_client.write_response_delay(self.response_delay_input.value()):
+                self.main_app.status_label.setText(f"P0C-25 = {self.response_delay_input.value()} ms geschrieben.")
+            self.update_timing_display()
+        except (ServoToolException, ValueError) as e:
+            logger.warning(f"P0C-25 konnte nicht geschrieben werden: {e}")
+            self.main_app.status_label.setText(f"Fehler beim Schreiben von P0C-25: {e}")
+
+    def update_timing_display(self):
+        client = self.main_app.modbus_client
+        na = "--"
+        min_time = client.get_min_transaction_time(FC_READ_HOLDING_REGISTERS, 1)
+        self.min_time_value.setText(f"{min_time * 1000:.2f} ms" if min_time is not None else na)
+
+        timing = client.get_link_timing()
+        single = timing['transactions'].get((FC_READ_HOLDING_REGISTERS, 1))
+        if single:
+            self.measured_time_value.setText(
+                f"{single['measured_avg'] * 1000:.2f} ms / {single['measured_min'] * 1000:.2f} ms "
+                f"({single['transactions']})"
+            )
+        else:
+            self.measured_time_value.setText(na)
+
+        efficiency = timing['efficiency']
+        self.efficiency_value.setText(f"{efficiency * 100:.1f} %" if efficiency is not None else na)
+
     def get_connection_parameters(self):
+        # Mehrere Antriebe an einer Leitung: "1,2,3" oder "1-3", der erste ist der Standard-Slave
+        slave_ids = parse_slave_ids(self.modbus_address_input.text())
+        serial = self.is_serial_transport()
         return {
             "port": self.com_port_input.currentText(),
             "baudrate": self.baud_rate_input.currentData(),
             "bytesize": int(self.data_bits_input.currentText()),
             "parity": self.parity_input.currentText(),
             "stopbits": int(self.stop_bits_input.currentText()),
-            "slave_id": int(self.modbus_address_input.text())
+            "slave_id": slave_ids[0],
+            "slave_ids": slave_ids,
+            "transport": self.transport_input.currentData(),
+            "host": None if serial else self.host_input.text().strip(),
+            "tcp_port": self.tcp_port_input.value()
         }
 
     def set_connected_state(self, connected):
@@ -81,6 +275,17 @@ class ConnectionTab(QWidget):
         
         # Only the settings group gets disabled
         self.connection_group.setEnabled(not connected)
+        self.discovery_group.setEnabled(not connected and self.is_serial_transport())
+
+        # Timing is only meaningful on a real serial link
+        timing_enabled = connected and not getattr(self.main_app, 'simulation_mode', False)
+        self.timing_group.setEnabled(timing_enabled)
+        if timing_enabled:
+            self._show_inter_frame_delay()
+            self.update_timing_display()
+            self.timing_timer.start()
+        else:
+            self.timing_timer.stop()
     
     def update_language(self, language_manager):
         """Update all text elements with the selected language"""
@@ -95,6 +300,33 @@ class ConnectionTab(QWidget):
         
         # Update simulation checkbox
         self.simulation_checkbox.setText(language_manager.get_text("checkbox_simulation_mode"))
+        self.modbus_address_input.setToolTip(language_manager.get_text("tooltip_modbus_addresses"))
+        
+        # Update transport selection
+        self.transport_label.setText(language_manager.get_text("label_transport") + ":")
+        self.host_label.setText(language_manager.get_text("label_host") + ":")
+        self.tcp_port_label.setText(language_manager.get_text("label_tcp_port") + ":")
+        for index in range(self.transport_input.count()):
+            transport = self.transport_input.itemData(index)
+            self.transport_input.setItemText(index, language_manager.get_text(f"text_transport_{transport}"))
+        
+        # Update discovery group
+        self.discovery_group.setTitle(language_manager.get_text("group_baud_discovery"))
+        self.soak_reads_label.setText(language_manager.get_text("label_soak_test_reads") + ":")
+        self.discover_button.setText(language_manager.get_text("button_discover_drive"))
+        self.optimize_baud_button.setText(language_manager.get_text("button_optimize_baud_rate"))
+        
+        # Update timing group
+        self.timing_group.setTitle(language_manager.get_text("group_rtu_timing"))
+        self.inter_frame_delay_label.setText(language_manager.get_text("label_inter_frame_delay") + ":")
+        self.inter_frame_delay_apply_button.setText(language_manager.get_text("button_apply"))
+        self.inter_frame_delay_default_button.setText(language_manager.get_text("button_default"))
+        self.response_delay_label.setText(language_manager.get_text("label_response_delay") + ":")
+        self.response_delay_read_button.setText(language_manager.get_text("button_read"))
+        self.response_delay_write_button.setText(language_manager.get_text("button_write"))
+        self.min_time_label.setText(language_manager.get_text("label_min_transaction_time") + ":")
+        self.measured_time_label.setText(language_manager.get_text("label_measured_transaction_time") + ":")
+        self.efficiency_label.setText(language_manager.get_text("label_link_efficiency") + ":")
         
         # Update form labels
         form_layout = self.connection_group.layout()
@@ -106,7 +338,8 @@ class ConnectionTab(QWidget):
             f"9600 {language_manager.get_text('text_bps')}": 9600,
             f"19200 {language_manager.get_text('text_bps')}": 19200,
             f"38400 {language_manager.get_text('text_bps')}": 38400,
-            f"57600 {language_manager.get_text('text_bps')}": 57600
+            f"57600 {language_manager.get_text('text_bps')}": 57600,
+            f"115200 {language_manager.get_text('text_bps')}": 115200
         }
         
         # Save current selection
@@ -7,6 +7,7 @@ from PyQt5.QtGui import QFont, QColor, QDoubleValidator, QIntValidator
 
 from custom_exceptions import ModbusReadException, ModbusWriteException
 from logger_config import logger
+from utils.parameter_store import SOURCE_WRITE
 from contextlib import contextmanager
 
 @contextmanager
@@ -144,7 +145,12 @@ class RegisterTab(QWidget):
         self.modbus_client = modbus_client
         self.grouped_params = self._group_params_by_pxx()
         self.pxx_mapping = self.main_app.pxx_mapping
-        self.parameter_cache = {} # Cache for loaded parameter values
+        # Shared parameter store: values read or written by any tab show up here
+        self.parameter_store = self.main_app.parameter_store
+        self.imported_values = {} # Imported values not yet written to the drive
+        self._items_by_code = {}
+        unsubscribe = self.parameter_store.subscribe(self._on_store_changed)
+        self.destroyed.connect(lambda *_: unsubscribe())
         
         # Reference maps for options - defined once to avoid duplication
         self.ref_maps = {
@@ -281,9 +287,10 @@ class RegisterTab(QWidget):
         except TypeError:
             pass # Ignore if not connected
 
+        self._items_by_code = {}
         for param in params_to_display:
-            # Retrieve cached value if available
-            cached_value = self.parameter_cache.get(param.code, "")
+            # Retrieve last known value if available
+            cached_value = self._known_value(param.code)
             
             # Default-Wert mit Berücksichtigung der Dezimalstellen für die Tabelle
             default_display = param.default
@@ -311,6 +318,7 @@ class RegisterTab(QWidget):
             self._set_value_column_editable(item)
             item.setData(2, Qt.UserRole, param)
             item.setData(0, Qt.UserRole, param)
+            self._items_by_code[param.code] = item
             # Store the raw cached value in EditRole for the delegate
             if cached_value != "":
                 item.setData(2, Qt.EditRole, cached_value)
@@ -444,7 +452,7 @@ class RegisterTab(QWidget):
     
     def _revert_to_previous_value(self, item, param):
         """Revert item to previous cached value"""
-        previous_value = self.parameter_cache.get(param.code, "")
+        previous_value = self._known_value(param.code)
         readable_value = self._get_readable_value(param, previous_value) if previous_value != "" else ""
         item.setText(2, readable_value)
         item.setText(3, str(previous_value))  # Modbus-Rohwert in Spalte 3
@@ -453,6 +461,28 @@ class RegisterTab(QWidget):
         # Ensure only the value column is editable
         self._set_value_column_editable(item)
     
+    def _known_value(self, code):
+        """Imported value not yet written, else the last known value from the parameter store"""
+        if code in self.imported_values:
+            return self.imported_values[code]
+        return self.parameter_store.value(code, "")
+
+    def _on_store_changed(self, code, entry):
+        """Show values read or written by other tabs; modified or imported items keep their value"""
+        item = self._items_by_code.get(code)
+        if item is None or code in self.imported_values or item.background(0).color() == QColor("orange"):
+            return
+        param = item.data(0, Qt.UserRole)
+        previous = self.tree_widget.blockSignals(True)
+        try:
+            item.setText(3, str(entry.value))
+            item.setData(2, Qt.EditRole, entry.value)
+            item.setText(2, self._get_readable_value(param, entry.value))
+            self.update_item_color(item, str(entry.value))
+            self._set_value_column_editable(item)
+        finally:
+            self.tree_widget.blockSignals(previous)
+
     def _set_value_column_editable(self, item):
         """Ensure only the value column (column 2) is editable"""
         # First set all columns to non-editable
@@ -509,7 +539,8 @@ class RegisterTab(QWidget):
 
                 try:
                     # Use ModbusHelper to read parameter with proper decimal formatting
-                    result = ModbusHelper.read_parameter_safely(self.modbus_client, param, self.main_app.status_label)
+                    result = ModbusHelper.read_parameter_safely(self.modbus_client, param, self.main_app.status_label,
+                                                                store=self.parameter_store)
                     
                     if result and len(result) == 3:
                         raw_value, display_value, error = result
@@ -529,7 +560,7 @@ class RegisterTab(QWidget):
                             item.setText(2, readable_value)
                             # Aktualisiere auch die Spalte "Bereich/Optionen"
                             item.setText(7, self._get_readable_validation(param))
-                            self.parameter_cache[param.code] = raw_value # Store in cache
+                            self.imported_values.pop(param.code, None)
                             self.update_item_color(item, str(raw_value))
                             
                             # Stelle sicher, dass nur die Werte-Spalte editierbar ist
@@ -617,7 +648,8 @@ class RegisterTab(QWidget):
                         # After successful write, reset color to white/yellow
                         for j in range(item.columnCount()): item.setBackground(j, QColor("white"))
                         self.update_item_color(item, str(val_to_write))
-                        self.parameter_cache[param.code] = val_to_write # Update cache on write
+                        self.imported_values.pop(param.code, None)
+                        self.parameter_store.update(param.code, val_to_write, SOURCE_WRITE)
                         
                         # Update the raw value column
                         item.setText(3, str(val_to_write))
@@ -670,7 +702,7 @@ class RegisterTab(QWidget):
                     readable_val = self._get_readable_value(param, imported_val)
                     # Wichtig: Setze den Text, nicht nur das EditRole, um den formatierten Wert anzuzeigen
                     item.setText(2, readable_val)
-                    self.parameter_cache[param.code] = imported_val # Store imported value in cache
+                    self.imported_values[param.code] = imported_val
                     for j in range(item.columnCount()):
                         item.setBackground(j, QColor("orange"))
                     
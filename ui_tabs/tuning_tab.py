@@ -1,9 +1,10 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
                              QFormLayout, QComboBox, QLineEdit, QPushButton,
-                             QCheckBox, QSplitter, QGridLayout, QLabel, QApplication)
+                             QCheckBox, QSplitter, QGridLayout, QLabel, QApplication,
+                             QTreeWidget, QTreeWidgetItem, QHeaderView)
 import time
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer
-from PyQt5.QtGui import QIntValidator, QFont
+from PyQt5.QtGui import QIntValidator, QDoubleValidator, QFont
 import pyqtgraph as pg
 import numpy as np
 from collections import deque
@@ -16,8 +17,42 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 
-from modbus_client import ModbusClient
+from custom_exceptions import ServoToolException
 from logger_config import logger
+from simulator.servo_model import DEFAULT_PARAMETERS as MODEL_PARAMETERS
+from utils.plot_channels import ChannelRegistry
+from utils.frequency_response import MIN_COHERENCE, SIGNAL_CHIRP, SIGNAL_PRBS
+from utils.parameter_store import SOURCE_WRITE
+from utils.spectrum import DEFAULT_SEGMENT_LENGTH, SEGMENT_LENGTHS
+from utils.step_response import TORQUE_RAW_PER_PERCENT, analyze_step
+from utils.tuning_session import TuningSession
+from workers.plot_data_worker import ADDED_CHANNEL_RATE, DEFAULT_CHANNEL_RATES
+
+# Kanäle des Plots beim Start
+DEFAULT_PLOT_CODES = ["P0B-00", "P0B-01", "P0B-15", "P0B-02", "P0B-24", "P0B-58"]
+
+# Wählbare Abtastraten je Kanal in Hz (0 = jeder Buszyklus)
+CHANNEL_RATE_CHOICES = [0, 100, 50, 20, 10, 5, 2, 1]
+
+# Wählbare Aktualisierungsraten des Spektrums in Hz
+SPECTRUM_UPDATE_RATES = [1, 2, 5]
+
+# Sprungantwort: Direktbefehle, nach deren Senden ausgewertet wird, und die ausgewerteten Kanäle
+STEP_COMMAND_CODES = ("P06-03",)
+STEP_REFERENCE_CODE = "P0B-01"
+STEP_FEEDBACK_CODE = "P0B-00"
+STEP_TORQUE_CODE = "P0B-02"
+STEP_PRE_TRIGGER = 0.2  # s vor dem Senden, die mit ausgewertet werden (Anfangswert)
+DEFAULT_STEP_CAPTURE_MS = 1000
+
+# Frequenzgang: Voreinstellungen der Anregung (rpm, s, Hz, ms; Periode 0 = kürzeste erreichbare)
+FREQUENCY_RESPONSE_COMMAND_CODE = "P06-03"
+FREQUENCY_RESPONSE_DEFAULTS = {'offset': "300", 'amplitude': "100", 'duration': "10", 'f_start': "1",
+                               'f_end': "50", 'period': "0"}
+FREQUENCY_RESPONSE_SEGMENT_LENGTH = 256
+
+# Sichtbare Kanäle ohne Wert seit dieser Zeit (s) gelten in der Statuszeile als ohne Daten
+CHANNEL_STALE_TIME = 2.0
 
 class TuningTab(QWidget):
     plot_control_signal = pyqtSignal(str)
@@ -32,6 +67,36 @@ class TuningTab(QWidget):
         self.lines = {}
         self.start_time = None  # Startzeit für Realtime-Plot
         
+        # Multi-Drop: weitere Achsen als zusätzliche Kurven (überlagert) oder eigene Plots (gestapelt)
+        self.plot_slave_ids = []
+        self.axis_lines = {}  # (Slave-ID, Code) -> Kurve
+        self.axis_plot_widgets = {}  # Slave-ID -> PlotWidget (nur gestapelt)
+        
+        # Plot-Kanäle (alle Überwachungswerte aus P0B und P30 wählbar) und ihre Abtastraten in Hz
+        self.channels = ChannelRegistry(self.main_app.parameter_manager.raw_parameters)
+        self.plot_codes = list(DEFAULT_PLOT_CODES)
+        self.channel_rates = dict(DEFAULT_CHANNEL_RATES)
+        self.channel_last_seen = {}  # Code -> Zeitpunkt des letzten Werts
+        self.legend_checkboxes = {}
+        self.spectrum_worker = None  # SpectrumWorker, angelegt beim ersten Einschalten
+        self.frequency_response_worker = None  # FrequencyResponseWorker der laufenden Messung
+        
+        # Sprungantwort: Auswertung nach dem Senden eines Drehzahlsollwerts, Ergebnisse je Durchlauf
+        self.step_runs = []
+        self._step_trigger = None  # time.time() beim Senden
+        self._step_gains = ""
+        self._step_parameters = {}
+        self.gain_search_worker = None  # GainSearchWorker der laufenden Reglersuche
+        self.gain_candidates = []
+        self.gain_sweep_worker = None  # GainSweepWorker des laufenden Tests an der Maschine
+        # RAM-Modus: Schreiben ohne EEPROM, ungespeicherte Parameter gesammelt übernehmen
+        self.tuning_session = TuningSession(self.main_app.modbus_client)
+        self._gain_sweep_parameters = {}  # Parameter der Sprungantwort, auf der der Test aufsetzt
+        self._gain_sweep_runs = {}  # Index des Parametersatzes -> Durchlauf in der Tabelle
+        self.step_timer = QTimer(self)
+        self.step_timer.setSingleShot(True)
+        self.step_timer.timeout.connect(self.evaluate_step)
+        
         self.tuning_widgets = {}
         self.direct_cmd_widgets = {}
         self.vdi_buttons = []  # Speichert die VDI-Buttons
@@ -93,6 +158,24 @@ class TuningTab(QWidget):
         layout.addWidget(main_splitter)
         self.set_enabled(False)
 
+        # Werte, die andere Tabs lesen oder schreiben, direkt anzeigen statt erneut zu lesen
+        self._widgets_by_code = {info["param"].code: info for info in self.tuning_widgets.values()}
+        unsubscribe = self.main_app.parameter_store.subscribe(self._on_store_changed, self._widgets_by_code)
+        self.destroyed.connect(lambda *_: unsubscribe())
+
+
+    def _on_store_changed(self, code, entry):
+        """Zeigt einen neuen Wert aus dem Parameterspeicher an; ungeschriebene Eingaben bleiben, außer der Wert wurde geschrieben"""
+        info = self._widgets_by_code[code]
+        widget = info["widget"]
+        if info["type"] == "combobox":
+            index = widget.findData(str(entry.value))
+            if index < 0:
+                index = widget.findData(entry.value)
+            if index >= 0:
+                widget.setCurrentIndex(index)
+        elif entry.source == SOURCE_WRITE or not widget.isModified():
+            widget.setText(self._get_readable_value(entry.value, info["param"]))
 
     def _create_tuning_parameters_group(self):
         group = QGroupBox(self.main_app.language_manager.get_text("group_tuning_parameters"))
@@ -228,9 +311,76 @@ class TuningTab(QWidget):
             if label: other_layout.addRow(label, layout)
         main_layout.addWidget(self.other_group)
         
+        # --- RAM-Modus (P0C-13) ---
+        ram_layout = QHBoxLayout()
+        self.ram_mode_checkbox = QCheckBox(self.main_app.language_manager.get_text("checkbox_ram_mode"))
+        self.ram_mode_checkbox.setToolTip(self.main_app.language_manager.get_text("tooltip_ram_mode"))
+        self.ram_mode_checkbox.toggled.connect(self.toggle_ram_mode)
+        self.ram_dirty_label = QLabel("")
+        self.eeprom_commit_btn = QPushButton(self.main_app.language_manager.get_text("button_eeprom_commit"))
+        self.eeprom_commit_btn.setToolTip(self.main_app.language_manager.get_text("tooltip_eeprom_commit"))
+        self.eeprom_commit_btn.setEnabled(False)
+        self.eeprom_commit_btn.clicked.connect(self.commit_to_eeprom)
+        ram_layout.addWidget(self.ram_mode_checkbox)
+        ram_layout.addWidget(self.ram_dirty_label, 1)
+        ram_layout.addWidget(self.eeprom_commit_btn)
+        main_layout.addLayout(ram_layout)
+        
         main_layout.addStretch(1)
         return group
 
+    def toggle_ram_mode(self, checked):
+        """Schaltet den RAM-Modus (P0C-13 = 0) ein oder stellt P0C-13 wieder her"""
+        language_manager = self.main_app.language_manager
+        try:
+            if checked:
+                self.tuning_session.start()
+                self._show_status(language_manager.get_text("status_ram_mode_on"))
+            else:
+                uncommitted = self.tuning_session.stop()
+                if uncommitted:
+                    self._show_status(language_manager.get_text("status_ram_mode_uncommitted").format(
+                        codes=", ".join(uncommitted)), "warning")
+                else:
+                    self._show_status(language_manager.get_text("status_ram_mode_off"))
+        except ServoToolException as e:
+            self._show_status(language_manager.get_text("status_ram_mode_failed").format(error=e), "warning")
+        self._update_ram_mode_display()
+
+    def record_ram_write(self, param, value):
+        """Merkt einen im RAM-Modus geschriebenen Parameter für das Speichern ins EEPROM vor"""
+        if not self.tuning_session.active:
+            return
+        from utils.modbus_helpers import ModbusHelper
+        is_32bit, is_signed = ModbusHelper._get_parameter_type_info(param)
+        self.tuning_session.record(param.code, int(param.decimal), value, is_32bit, is_signed)
+        self._update_ram_mode_display()
+
+    def commit_to_eeprom(self):
+        """Übernimmt alle nur im RAM geschriebenen Parameter in einem Durchgang ins EEPROM"""
+        language_manager = self.main_app.language_manager
+        try:
+            committed = self.tuning_session.commit()
+        except ServoToolException as e:
+            self._show_status(language_manager.get_text("status_eeprom_commit_failed").format(error=e), "warning")
+        else:
+            self._show_status(language_manager.get_text("status_eeprom_committed").format(codes=", ".join(committed)))
+        self._update_ram_mode_display()
+
+    def end_ram_mode(self):
+        """Beendet den RAM-Modus vor dem Trennen der Verbindung"""
+        if self.tuning_session.active:
+            self.ram_mode_checkbox.setChecked(False)
+
+    def _update_ram_mode_display(self):
+        dirty = self.tuning_session.dirty_codes()
+        self.ram_mode_checkbox.blockSignals(True)
+        self.ram_mode_checkbox.setChecked(self.tuning_session.active)
+        self.ram_mode_checkbox.blockSignals(False)
+        self.ram_dirty_label.setText(
+            self.main_app.language_manager.get_text("text_ram_dirty").format(codes=", ".join(dirty)) if dirty else "")
+        self.eeprom_commit_btn.setEnabled(bool(dirty))
+
     def _create_direct_commands_group(self):
         group = QGroupBox(self.main_app.language_manager.get_text("group_direct_commands"))
         layout = QFormLayout()
@@ -282,6 +432,53 @@ class TuningTab(QWidget):
         self.watchdog_timeout_input.setValidator(QIntValidator(1, 60, self)) # 1s to 60s
         form_layout.addRow(self.main_app.language_manager.get_text("label_watchdog_timeout") + " (s):", self.watchdog_timeout_input)
         
+        # Fester Abtastabstand des Plot-Workers (0 = so schnell wie der Bus erlaubt)
+        self.sample_interval_input = QLineEdit("0")
+        self.sample_interval_input.setValidator(QIntValidator(0, 10000, self))
+        self.sample_interval_input.setToolTip(self.main_app.language_manager.get_text("tooltip_sampling_interval"))
+        self.sample_interval_label = QLabel(self.main_app.language_manager.get_text("label_sampling_interval") + " (ms):")
+        form_layout.addRow(self.sample_interval_label, self.sample_interval_input)
+        
+        # Plot-Erfassung in einem eigenen Prozess (gilt ab dem nächsten Start)
+        self.process_acquisition_checkbox = QCheckBox(self.main_app.language_manager.get_text("checkbox_process_acquisition"))
+        self.process_acquisition_checkbox.setToolTip(self.main_app.language_manager.get_text("tooltip_process_acquisition"))
+        form_layout.addRow(self.process_acquisition_checkbox)
+        
+        # Darstellung mehrerer Achsen (Multi-Drop)
+        self.axis_display_input = QComboBox()
+        self.axis_display_input.addItem(self.main_app.language_manager.get_text("text_axis_display_overlay"), "overlay")
+        self.axis_display_input.addItem(self.main_app.language_manager.get_text("text_axis_display_stacked"), "stacked")
+        self.axis_display_input.currentIndexChanged.connect(lambda _: self.clear_plot(stopped_by_user=False))
+        self.axis_display_label = QLabel(self.main_app.language_manager.get_text("label_axis_display") + ":")
+        form_layout.addRow(self.axis_display_label, self.axis_display_input)
+        
+        # Weitere Überwachungswerte (P0B, P30) als Plot-Kanal hinzufügen
+        add_channel_layout = QHBoxLayout()
+        self.add_channel_input = QComboBox()
+        self.add_channel_btn = QPushButton("+")
+        self.add_channel_btn.setFixedWidth(30)
+        self.add_channel_btn.clicked.connect(lambda: self.add_plot_channel(self.add_channel_input.currentData()))
+        add_channel_layout.addWidget(self.add_channel_input, 1)
+        add_channel_layout.addWidget(self.add_channel_btn)
+        self.add_channel_label = QLabel(self.main_app.language_manager.get_text("label_add_channel") + ":")
+        form_layout.addRow(self.add_channel_label, add_channel_layout)
+        
+        # Abtastrate je Kanal
+        rate_layout = QHBoxLayout()
+        self.rate_channel_input = QComboBox()
+        self.rate_input = QComboBox()
+        for rate in CHANNEL_RATE_CHOICES:
+            self.rate_input.addItem(self._rate_text(rate), rate)
+        self.rate_input.setToolTip(self.main_app.language_manager.get_text("tooltip_channel_rate"))
+        self.rate_channel_input.currentIndexChanged.connect(lambda _: self._show_channel_rate())
+        self.rate_input.activated.connect(lambda _: self.set_channel_rate(self.rate_channel_input.currentData(),
+                                                                          self.rate_input.currentData()))
+        rate_layout.addWidget(self.rate_channel_input, 1)
+        rate_layout.addWidget(self.rate_input)
+        self.channel_rate_label = QLabel(self.main_app.language_manager.get_text("label_channel_rate") + ":")
+        form_layout.addRow(self.channel_rate_label, rate_layout)
+        self._update_channel_inputs()
+        
         # Button zum Anwenden der Konfiguration
         self.apply_config_btn = QPushButton(self.main_app.language_manager.get_text("button_apply_config"))
         self.apply_config_btn.clicked.connect(self.apply_plot_worker_config)
@@ -476,35 +673,39 @@ class TuningTab(QWidget):
         # Enable antialiasing for prettier plots
         self.plot_widget.setAntialiasing(True)
         
-        plot_layout.addWidget(self.plot_widget)
+        # Zeitverlauf links, Spektrum und Frequenzgang rechts übereinander
+        plot_splitter = QSplitter(Qt.Horizontal)
+        plot_splitter.addWidget(self.plot_widget)
+        analysis_splitter = QSplitter(Qt.Vertical)
+        self.spectrum_group = self._create_spectrum_group()
+        analysis_splitter.addWidget(self.spectrum_group)
+        self.frequency_response_group = self._create_frequency_response_group()
+        analysis_splitter.addWidget(self.frequency_response_group)
+        plot_splitter.addWidget(analysis_splitter)
+        plot_splitter.setStretchFactor(0, 3)
+        plot_splitter.setStretchFactor(1, 2)
+        plot_layout.addWidget(plot_splitter, 2)
+        
+        # Sprungantworten und Reglersuche nebeneinander
+        step_layout = QHBoxLayout()
+        self.step_response_group = self._create_step_response_group()
+        step_layout.addWidget(self.step_response_group, 3)
+        self.gain_search_group = self._create_gain_search_group()
+        step_layout.addWidget(self.gain_search_group, 2)
+        plot_layout.addLayout(step_layout)
+        
+        # Platz für die Plots weiterer Achsen in der gestapelten Darstellung
+        self.axis_plots_layout = QVBoxLayout()
+        plot_layout.addLayout(self.axis_plots_layout, 1)
         
         # Add live values in a single horizontal row below the plot
         self.live_values_group = QGroupBox(self.main_app.language_manager.get_text("group_live_values"))
         live_values_layout = QHBoxLayout()  # Use QHBoxLayout for horizontal arrangement
+        self.live_values_layout = live_values_layout
         
         self.live_value_widgets = {}
-        self.plot_codes = ["P0B-00", "P0B-01", "P0B-15", "P0B-02", "P0B-24", "P0B-58"]
         for code in self.plot_codes:
-            param = self.main_app.parameter_manager.get_parameter(code)
-            if not param:
-                continue
-            
-            # Create a horizontal layout for each live value (label: value)
-            value_layout = QHBoxLayout()
-            value_layout.setSpacing(2)  # Small spacing between label and value
-            value_layout.setContentsMargins(2, 2, 2, 2)  # Small margins
-            
-            label = QLabel(f"{param.code} ({param.unit}):")  # Use param.code and param.unit
-            
-            value_edit = QLineEdit(self.main_app.language_manager.get_text("text_not_available"))
-            value_edit.setReadOnly(True)
-            value_edit.setFixedWidth(50)  # Compact width for the value
-            
-            value_layout.addWidget(label)
-            value_layout.addWidget(value_edit)
-            
-            live_values_layout.addLayout(value_layout)
-            self.live_value_widgets[code] = value_edit
+            self._add_live_value_widget(code)
         
         # Add stretch to push items to the left
         live_values_layout.addStretch(1)
@@ -523,13 +724,862 @@ class TuningTab(QWidget):
         self.clear_plot(stopped_by_user=False)
         return group
 
+    def _create_spectrum_group(self):
+        """Leistungsdichtespektrum (Welch) eines Plot-Kanals, berechnet im SpectrumWorker"""
+        language_manager = self.main_app.language_manager
+        group = QGroupBox(language_manager.get_text("group_spectrum"))
+        layout = QVBoxLayout()
+        
+        controls_layout = QHBoxLayout()
+        self.spectrum_checkbox = QCheckBox(language_manager.get_text("checkbox_spectrum"))
+        self.spectrum_checkbox.setToolTip(language_manager.get_text("tooltip_spectrum"))
+        self.spectrum_checkbox.toggled.connect(self.set_spectrum_enabled)
+        self.spectrum_channel_input = QComboBox()
+        self.spectrum_channel_input.currentIndexChanged.connect(lambda _: self.configure_spectrum())
+        self.spectrum_segment_input = QComboBox()
+        for length in SEGMENT_LENGTHS:
+            self.spectrum_segment_input.addItem(str(length), length)
+        self.spectrum_segment_input.setCurrentIndex(SEGMENT_LENGTHS.index(DEFAULT_SEGMENT_LENGTH))
+        self.spectrum_segment_input.currentIndexChanged.connect(lambda _: self.configure_spectrum())
+        self.spectrum_rate_input = QComboBox()
+        for rate in SPECTRUM_UPDATE_RATES:
+            self.spectrum_rate_input.addItem(f"{rate} Hz", rate)
+        self.spectrum_rate_input.setCurrentIndex(1)
+        self.spectrum_rate_input.currentIndexChanged.connect(lambda _: self.configure_spectrum())
+        self.spectrum_segment_label = QLabel(language_manager.get_text("label_spectrum_segment") + ":")
+        self.spectrum_rate_label = QLabel(language_manager.get_text("label_spectrum_update_rate") + ":")
+        controls_layout.addWidget(self.spectrum_checkbox)
+        controls_layout.addWidget(self.spectrum_channel_input, 1)
+        controls_layout.addWidget(self.spectrum_segment_label)
+        controls_layout.addWidget(self.spectrum_segment_input)
+        controls_layout.addWidget(self.spectrum_rate_label)
+        controls_layout.addWidget(self.spectrum_rate_input)
+        layout.addLayout(controls_layout)
+        
+        self.spectrum_plot = pg.PlotWidget()
+        self.spectrum_plot.setLogMode(x=False, y=True)
+        self.spectrum_plot.showGrid(x=True, y=True)
+        self.spectrum_plot.setLabel('bottom', language_manager.get_text("plot_xlabel_frequency") + " (Hz)")
+        self.spectrum_plot.setLabel('left', language_manager.get_text("plot_ylabel_psd"))
+        self.spectrum_curve = self.spectrum_plot.plot(pen=pg.mkPen('b', width=1))
+        layout.addWidget(self.spectrum_plot, 1)
+        
+        self.spectrum_info_label = QLabel("")
+        layout.addWidget(self.spectrum_info_label)
+        
+        group.setLayout(layout)
+        self._update_spectrum_channels()
+        return group
+
+    def _update_spectrum_channels(self):
+        """Füllt die Kanalauswahl des Spektrums mit den Plot-Kanälen"""
+        selected = self.spectrum_channel_input.currentData()
+        self.spectrum_channel_input.blockSignals(True)
+        self.spectrum_channel_input.clear()
+        for code in self.plot_codes:
+            self.spectrum_channel_input.addItem(code, code)
+        if selected in self.plot_codes:
+            self.spectrum_channel_input.setCurrentIndex(self.plot_codes.index(selected))
+        self.spectrum_channel_input.blockSignals(False)
+
+    def _spectrum_period(self, code):
+        """Abtastperiode des Kanals in s (0 = unbekannt, der SpectrumWorker schätzt sie)"""
+        plot_worker = getattr(self.main_app, 'plot_worker', None)
+        if plot_worker is None or self.channel_rates.get(code, 0):
+            return 0.0
+        return plot_worker.config.get('sample_interval', 0) / 1000.0
+
+    def set_spectrum_enabled(self, enabled):
+        """Startet bzw. beendet die Berechnung des Spektrums"""
+        plot_worker = getattr(self.main_app, 'plot_worker', None)
+        if enabled:
+            if self.spectrum_worker is None:
+                from workers.spectrum_worker import SpectrumWorker
+                self.spectrum_worker = SpectrumWorker(self)
+                self.spectrum_worker.spectrum_updated.connect(self.update_spectrum)
+            self.configure_spectrum()
+            if plot_worker is not None and self.spectrum_worker not in plot_worker.sample_listeners:
+                plot_worker.sample_listeners.append(self.spectrum_worker)
+            self.spectrum_worker.start()
+        else:
+            self.stop_spectrum()
+
+    def stop_spectrum(self):
+        """Beendet den SpectrumWorker (z.B. beim Beenden der Anwendung)"""
+        if self.spectrum_worker is None:
+            return
+        plot_worker = getattr(self.main_app, 'plot_worker', None)
+        if plot_worker is not None and self.spectrum_worker in plot_worker.sample_listeners:
+            plot_worker.sample_listeners.remove(self.spectrum_worker)
+        self.spectrum_worker.stop()
+
+    def configure_spectrum(self):
+        """Übergibt Kanal, Abtastperiode, Segmentlänge und Aktualisierungsrate; das Spektrum beginnt neu"""
+        if self.spectrum_worker is None:
+            return
+        code = self.spectrum_channel_input.currentData()
+        self.spectrum_worker.configure(
+            code=code,
+            period=self._spectrum_period(code),
+            segment_length=self.spectrum_segment_input.currentData(),
+            update_rate=self.spectrum_rate_input.currentData(),
+        )
+        self.spectrum_curve.setData([], [])
+        self.spectrum_info_label.setText("")
+
+    def update_spectrum(self, freqs, psd, info):
+        """Zeigt ein Spektrum des SpectrumWorker an"""
+        if info['code'] != self.spectrum_channel_input.currentData():
+            return
+        # Gleichanteil (Mittelwert abgezogen) und Nullwerte würden die logarithmische Achse stören
+        positive = psd[1:] > 0
+        self.spectrum_curve.setData(freqs[1:][positive], psd[1:][positive])
+        language_manager = self.main_app.language_manager
+        text = language_manager.get_text("text_spectrum_info").format(
+            sample_rate=info['sample_rate'], resolution=info['resolution'], segments=info['segments'])
+        if info['peak'] is not None:
+            text += ", " + language_manager.get_text("text_spectrum_peak").format(peak=info['peak'])
+        if info['estimated']:
+            text += " " + language_manager.get_text("text_spectrum_estimated")
+        self.spectrum_info_label.setText(text)
+
+    def _create_frequency_response_group(self):
+        """Frequenzgangmessung des Drehzahlregelkreises (Anregung über P06-03), berechnet im FrequencyResponseWorker"""
+        language_manager = self.main_app.language_manager
+        group = QGroupBox(language_manager.get_text("group_frequency_response"))
+        layout = QVBoxLayout()
+        
+        controls_layout = QGridLayout()
+        self.fr_signal_input = QComboBox()
+        self.fr_signal_input.addItem(language_manager.get_text("text_fr_chirp"), SIGNAL_CHIRP)
+        self.fr_signal_input.addItem(language_manager.get_text("text_fr_prbs"), SIGNAL_PRBS)
+        self.fr_signal_input.currentIndexChanged.connect(self._update_frequency_response_inputs)
+        self.fr_inputs = {}
+        self.fr_labels = {}
+        fields = [("offset", "label_fr_offset", "rpm", QIntValidator(-6000, 6000, self)),
+                  ("amplitude", "label_fr_amplitude", "rpm", QIntValidator(1, 6000, self)),
+                  ("duration", "label_fr_duration", "s", QDoubleValidator(1.0, 300.0, 1, self)),
+                  ("f_start", "label_fr_f_start", "Hz", QDoubleValidator(0.1, 1000.0, 1, self)),
+                  ("f_end", "label_fr_f_end", "Hz", QDoubleValidator(0.1, 1000.0, 1, self)),
+                  ("period", "label_fr_period", "ms", QDoubleValidator(0.0, 1000.0, 1, self))]
+        self.fr_signal_label = QLabel(language_manager.get_text("label_fr_signal") + ":")
+        controls_layout.addWidget(self.fr_signal_label, 0, 0)
+        controls_layout.addWidget(self.fr_signal_input, 0, 1)
+        for i, (key, text_key, unit, validator) in enumerate(fields, start=1):
+            line_edit = QLineEdit(FREQUENCY_RESPONSE_DEFAULTS[key])
+            line_edit.setValidator(validator)
+            line_edit.setMaximumWidth(60)
+            label = QLabel(f"{language_manager.get_text(text_key)} ({unit}):")
+            row, column = divmod(i, 4)
+            controls_layout.addWidget(label, row, 2 * column)
+            controls_layout.addWidget(line_edit, row, 2 * column + 1)
+            self.fr_inputs[key] = line_edit
+            self.fr_labels[key] = (label, text_key, unit)
+        self.fr_inputs["period"].setToolTip(language_manager.get_text("tooltip_fr_period"))
+        self.fr_start_btn = QPushButton(language_manager.get_text("button_start"))
+        self.fr_start_btn.setToolTip(language_manager.get_text("tooltip_fr_start"))
+        self.fr_start_btn.clicked.connect(self.start_frequency_response)
+        self.fr_stop_btn = QPushButton(language_manager.get_text("button_stop"))
+        self.fr_stop_btn.setEnabled(False)
+        self.fr_stop_btn.clicked.connect(self.stop_frequency_response)
+        controls_layout.addWidget(self.fr_start_btn, 1, 6)
+        controls_layout.addWidget(self.fr_stop_btn, 1, 7)
+        layout.addLayout(controls_layout)
+        
+        # Betrag, Phase und Kohärenz mit gemeinsamer logarithmischer Frequenzachse
+        self.fr_plots = {}
+        self.fr_curves = {}
+        for key, label_key in (("magnitude", "plot_ylabel_magnitude"), ("phase", "plot_ylabel_phase"),
+                               ("coherence", "plot_ylabel_coherence")):
+            plot = pg.PlotWidget()
+            plot.setLogMode(x=True, y=False)
+            plot.showGrid(x=True, y=True)
+            plot.setLabel('left', language_manager.get_text(label_key))
+            if self.fr_plots:
+                plot.setXLink(self.fr_plots["magnitude"])
+            self.fr_plots[key] = plot
+            self.fr_curves[key] = plot.plot(pen=pg.mkPen('b', width=1))
+            layout.addWidget(plot, 1 if key == "coherence" else 2)
+        self.fr_plots["coherence"].setYRange(0, 1.05)
+        self.fr_plots["coherence"].addLine(y=MIN_COHERENCE, pen=pg.mkPen('r', style=Qt.DashLine))
+        self.fr_plots["coherence"].setLabel('bottom', language_manager.get_text("plot_xlabel_frequency") + " (Hz)")
+        
+        self.fr_info_label = QLabel("")
+        self.fr_info_label.setWordWrap(True)
+        layout.addWidget(self.fr_info_label)
+        
+        group.setLayout(layout)
+        return group
+
+    def _update_frequency_response_inputs(self):
+        """Der Frequenzbereich gilt nur für den Gleitsinus"""
+        chirp = self.fr_signal_input.currentData() == SIGNAL_CHIRP
+        for key in ("f_start", "f_end"):
+            self.fr_inputs[key].setEnabled(chirp)
+
+    def _frequency_response_settings(self):
+        """Eingaben der Frequenzgangmessung (rpm, s, Hz); ValueError bei ungültigen Eingaben"""
+        values = {key: float(line_edit.text().replace(",", ".")) for key, line_edit in self.fr_inputs.items()}
+        return {
+            'signal': self.fr_signal_input.currentData(),
+            'offset': int(values['offset']),
+            'amplitude': int(values['amplitude']),
+            'duration': values['duration'],
+            'f_start': values['f_start'],
+            'f_end': values['f_end'],
+            'period': values['period'] / 1000.0,
+        }
+
+    def _show_status(self, message, level="info"):
+        getattr(logger, level)(message)
+        if hasattr(self.main_app, 'status_label'):
+            self.main_app.status_label.setText(message)
+
+    def start_frequency_response(self):
+        """Hält den Plot an und startet die Frequenzgangmessung mit den eingestellten Werten"""
+        language_manager = self.main_app.language_manager
+        if self.is_frequency_response_running():
+            return
+        if not self.main_app.modbus_client.connected:
+            self._show_status(language_manager.get_text("status_fr_not_connected"), "warning")
+            return
+        try:
+            settings = self._frequency_response_settings()
+        except ValueError:
+            return
+        validation = self.main_app.parameter_manager.get_parameter(FREQUENCY_RESPONSE_COMMAND_CODE).validation
+        low, high = validation.get('min', -6000), validation.get('max', 6000)
+        if not low <= settings['offset'] - settings['amplitude'] <= settings['offset'] + settings['amplitude'] <= high:
+            self._show_status(
+                language_manager.get_text("status_fr_range").format(min=low, max=high), "warning")
+            return
+        
+        # Der Bus gehört während der Messung dem Worker
+        self.plot_control_signal.emit("stop")
+        from workers.frequency_response_worker import FrequencyResponseWorker
+        worker = FrequencyResponseWorker(self.main_app.modbus_client,
+                                         segment_length=FREQUENCY_RESPONSE_SEGMENT_LENGTH, **settings)
+        worker.progress_updated.connect(self._on_frequency_response_progress)
+        worker.finished.connect(self._on_frequency_response_finished)
+        worker.error_occurred.connect(self._on_frequency_response_error)
+        self.frequency_response_worker = worker
+        for curve in self.fr_curves.values():
+            curve.setData([], [])
+        self.fr_info_label.setText("")
+        self.fr_start_btn.setEnabled(False)
+        self.fr_stop_btn.setEnabled(True)
+        worker.start()
+        self._show_status(language_manager.get_text("status_fr_started"))
+
+    def stop_frequency_response(self):
+        """Bricht eine laufende Frequenzgangmessung ab (z.B. beim Beenden der Anwendung)"""
+        if self.is_frequency_response_running():
+            self.frequency_response_worker.stop()
+
+    def is_frequency_response_running(self):
+        return self.frequency_response_worker is not None and self.frequency_response_worker.isRunning()
+
+    def stop_background_workers(self):
+        """Beendet Spektrum, Frequenzgangmessung, Reglersuche und Test an der Maschine"""
+        self.stop_spectrum()
+        self.stop_frequency_response()
+        self.stop_gain_search()
+        self.stop_gain_sweep()
+
+    def _on_frequency_response_progress(self, cycle, count):
+        self.fr_info_label.setText(self.main_app.language_manager.get_text("text_fr_progress").format(
+            cycle=cycle, count=count))
+
+    def _on_frequency_response_finished(self, result):
+        """Zeigt Betrag, Phase und Kohärenz der Messung an"""
+        self.fr_start_btn.setEnabled(True)
+        self.fr_stop_btn.setEnabled(False)
+        language_manager = self.main_app.language_manager
+        freqs = result['freqs']
+        for key in ("magnitude", "phase", "coherence"):
+            self.fr_curves[key].setData(freqs, result[key])
+        bandwidth = result['bandwidth']
+        self.fr_info_label.setText(language_manager.get_text("text_fr_result").format(
+            sample_rate=result['sample_rate'], cycles=result['cycles'], missed=result['missed'],
+            delay=result['delay'] * 1000.0, bandwidth="-" if bandwidth is None else f"{bandwidth:.1f} Hz"))
+        self._show_status(language_manager.get_text("status_fr_finished"))
+
+    def _on_frequency_response_error(self, message):
+        self.fr_start_btn.setEnabled(True)
+        self.fr_stop_btn.setEnabled(False)
+        self.fr_info_label.setText("")
+        self._show_status(
+            self.main_app.language_manager.get_text("status_fr_failed").format(error=message), "warning")
+
+    def _create_step_response_group(self):
+        """Kennwerte der Sprungantworten nach dem Senden eines Drehzahlsollwerts, eine Zeile je Durchlauf"""
+        language_manager = self.main_app.language_manager
+        group = QGroupBox(language_manager.get_text("group_step_response"))
+        layout = QVBoxLayout()
+        
+        controls_layout = QHBoxLayout()
+        self.step_analysis_checkbox = QCheckBox(language_manager.get_text("checkbox_step_analysis"))
+        self.step_analysis_checkbox.setToolTip(language_manager.get_text("tooltip_step_analysis"))
+        self.step_analysis_checkbox.setChecked(True)
+        self.step_capture_input = QLineEdit(str(DEFAULT_STEP_CAPTURE_MS))
+        self.step_capture_input.setValidator(QIntValidator(100, 20000, self))
+        self.step_capture_input.setMaximumWidth(60)
+        self.step_capture_label = QLabel(language_manager.get_text("label_step_capture") + " (ms):")
+        self.step_clear_btn = QPushButton(language_manager.get_text("button_clear"))
+        self.step_clear_btn.clicked.connect(self.clear_step_runs)
+        controls_layout.addWidget(self.step_analysis_checkbox)
+        controls_layout.addWidget(self.step_capture_label)
+        controls_layout.addWidget(self.step_capture_input)
+        controls_layout.addStretch(1)
+        controls_layout.addWidget(self.step_clear_btn)
+        layout.addLayout(controls_layout)
+        
+        self.step_tree = QTreeWidget()
+        self.step_tree.setRootIsDecorated(False)
+        self.step_tree.setHeaderLabels(self._step_headers(language_manager))
+        self.step_tree.header().setSectionResizeMode(QHeaderView.ResizeToContents)
+        layout.addWidget(self.step_tree)
+        
+        group.setLayout(layout)
+        group.setMaximumHeight(200)
+        return group
+
+    def _step_headers(self, language_manager):
+        return [language_manager.get_text(key) for key in (
+            "header_step_run", "header_step_command", "header_step_gains", "header_rise_time",
+            "header_overshoot", "header_settling_time", "header_steady_state_error", "header_torque_peak")]
+
+    def arm_step_capture(self, code):
+        """Merkt den Sendezeitpunkt eines Sollwerts vor; die Auswertung folgt nach der Erfassungsdauer"""
+        if code not in STEP_COMMAND_CODES or not self.step_analysis_checkbox.isChecked():
+            return
+        try:
+            capture_ms = int(self.step_capture_input.text())
+        except ValueError:
+            capture_ms = DEFAULT_STEP_CAPTURE_MS
+        self._step_trigger = time.time()
+        self._step_gains = self._gain_snapshot()
+        self._step_parameters = self._parameter_snapshot()
+        # Ein erneutes Senden während der Erfassung ersetzt die vorherige Auswertung
+        self.step_timer.start(capture_ms)
+
+    def _gain_snapshot(self):
+        """Aktuell angezeigte Werte der P08-Parameter, z.B. 'P08-00=40 P08-01=20'"""
+        values = []
+        for widgets in self.tuning_widgets.values():
+            code = widgets["param"].code
+            if code.startswith("P08-") and widgets["type"] == "lineedit" and widgets["widget"].text():
+                values.append(f"{code}={widgets['widget'].text()}")
+        return " ".join(values)
+
+    def _curve_window(self, code, start):
+        """Zeiten und Werte einer sichtbaren Kurve ab start (Plotzeit in s), sonst None"""
+        curve = self.lines.get(code)
+        if curve is None or not curve.isVisible():
+            return None
+        times, values = curve.getData()
+        if times is None or not len(times):
+            return None
+        keep = times >= start
+        return times[keep], values[keep]
+
+    def evaluate_step(self):
+        """Wertet das aufgezeichnete Fenster seit dem Senden aus und hängt eine Ergebniszeile an"""
+        if self._step_trigger is None:
+            return
+        trigger, self._step_trigger = self._step_trigger, None
+        language_manager = self.main_app.language_manager
+        start = trigger - self.start_time - STEP_PRE_TRIGGER if self.start_time is not None else 0.0
+        reference = self._curve_window(STEP_REFERENCE_CODE, start)
+        feedback = self._curve_window(STEP_FEEDBACK_CODE, start)
+        missing = [code for code, data in ((STEP_REFERENCE_CODE, reference), (STEP_FEEDBACK_CODE, feedback))
+                   if data is None or len(data[0]) < 3]
+        if missing:
+            message = language_manager.get_text("status_step_no_data").format(codes=", ".join(missing))
+            logger.warning(message)
+            if hasattr(self.main_app, 'status_label'):
+                self.main_app.status_label.setText(message)
+            return
+        
+        # Sollwert und Drehmoment auf die Zeitpunkte des Istwerts legen
+        times, feedback_values = feedback
+        reference_values = np.interp(times, *reference)
+        torque = self._curve_window(STEP_TORQUE_CODE, start)
+        # P0B-02 in 0,1 %, ausgewertet in % wie bei der Reglersuche
+        torque_values = np.interp(times, *torque) / TORQUE_RAW_PER_PERCENT if torque is not None and len(torque[0]) else None
+        metrics = analyze_step(times, reference_values, feedback_values, torque_values)
+        if metrics is None:
+            message = language_manager.get_text("status_step_no_step")
+            logger.info(message)
+            if hasattr(self.main_app, 'status_label'):
+                self.main_app.status_label.setText(message)
+            return
+        
+        run = len(self.step_runs) + 1
+        self.step_runs.append({'run': run, 'gains': self._step_gains, 'metrics': metrics,
+                               'parameters': self._step_parameters,
+                               'trace': {'times': times, 'reference': reference_values,
+                                         'feedback': feedback_values, 'torque': torque_values}})
+        self._add_step_row(run, self._step_gains, metrics)
+        logger.info(f"Sprungantwort {run} ({self._step_gains}): {metrics}")
+        if hasattr(self.main_app, 'status_label'):
+            self.main_app.status_label.setText(language_manager.get_text("status_step_evaluated").format(run=run))
+
+    def _add_step_row(self, run, gains, metrics):
+        def number(value, scale=1.0, digits=1):
+            return "-" if value is None else f"{value * scale:.{digits}f}"
+        
+        item = QTreeWidgetItem(self.step_tree, [
+            str(run),
+            number(metrics['final'], digits=0),
+            gains,
+            number(metrics['rise_time'], 1000.0),
+            number(metrics['overshoot']),
+            number(metrics['settling_time'], 1000.0),
+            number(metrics['steady_state_error']),
+            number(metrics['torque_peak']),
+        ])
+        for column in (0, 1, 3, 4, 5, 6, 7):
+            item.setTextAlignment(column, Qt.AlignRight | Qt.AlignVCenter)
+        self.step_tree.scrollToItem(item)
+
+    def clear_step_runs(self):
+        """Verwirft alle Ergebnisse der Sprungantwort"""
+        self.step_runs = []
+        self.step_tree.clear()
+
+    def _parameter_snapshot(self):
+        """Angezeigte Werte der Parameter, die das Streckenmodell kennt, als Rohwerte ({Code: Wert})"""
+        values = {}
+        for widgets in self.tuning_widgets.values():
+            param = widgets["param"]
+            if param.code in MODEL_PARAMETERS and widgets["type"] == "lineedit":
+                try:
+                    values[param.code] = int(self._convert_to_raw_value(widgets["widget"].text(), param))
+                except (TypeError, ValueError):
+                    pass
+        return values
+
+    def _create_gain_search_group(self):
+        """Suche von P08-00/P08-01 an einer aus der Sprungantwort angepassten, simulierten Strecke"""
+        language_manager = self.main_app.language_manager
+        group = QGroupBox(language_manager.get_text("group_gain_search"))
+        layout = QVBoxLayout()
+        
+        controls_layout = QHBoxLayout()
+        self.gain_search_btn = QPushButton(language_manager.get_text("button_gain_search"))
+        self.gain_search_btn.setToolTip(language_manager.get_text("tooltip_gain_search"))
+        self.gain_search_btn.clicked.connect(self.start_gain_search)
+        self.gain_apply_btn = QPushButton(language_manager.get_text("button_gain_apply"))
+        self.gain_apply_btn.setToolTip(language_manager.get_text("tooltip_gain_apply"))
+        self.gain_apply_btn.setEnabled(False)
+        self.gain_apply_btn.clicked.connect(self.apply_gain_candidate)
+        self.gain_sweep_btn = QPushButton(language_manager.get_text("button_gain_sweep"))
+        self.gain_sweep_btn.setToolTip(language_manager.get_text("tooltip_gain_sweep"))
+        self.gain_sweep_btn.setEnabled(False)
+        self.gain_sweep_btn.clicked.connect(self.toggle_gain_sweep)
+        self.gain_info_label = QLabel("")
+        controls_layout.addWidget(self.gain_search_btn)
+        controls_layout.addWidget(self.gain_info_label, 1)
+        controls_layout.addWidget(self.gain_sweep_btn)
+        controls_layout.addWidget(self.gain_apply_btn)
+        layout.addLayout(controls_layout)
+        
+        self.gain_tree = QTreeWidget()
+        self.gain_tree.setRootIsDecorated(False)
+        self.gain_tree.setHeaderLabels(self._gain_headers(language_manager))
+        self.gain_tree.header().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.gain_tree.itemSelectionChanged.connect(
+            lambda: self.gain_apply_btn.setEnabled(bool(self.gain_tree.selectedItems())))
+        layout.addWidget(self.gain_tree)
+        
+        group.setLayout(layout)
+        group.setMaximumHeight(200)
+        return group
+
+    def _gain_headers(self, language_manager):
+        return ["P08-00", "P08-01"] + [language_manager.get_text(key) for key in (
+            "header_rise_time", "header_overshoot", "header_settling_time", "header_gain_cost")]
+
+    def _selected_step_run(self):
+        """Im Ergebnis der Sprungantwort gewählter Durchlauf, sonst der letzte (None ohne Durchlauf)"""
+        selected = self.step_tree.selectedItems()
+        if selected:
+            run = int(selected[0].text(0))
+            for step_run in self.step_runs:
+                if step_run['run'] == run:
+                    return step_run
+        return self.step_runs[-1] if self.step_runs else None
+
+    def start_gain_search(self):
+        """Startet die Reglersuche mit der gewählten (oder letzten) Sprungantwort"""
+        language_manager = self.main_app.language_manager
+        if self.is_gain_search_running():
+            return
+        step_run = self._selected_step_run()
+        if step_run is None or 'trace' not in step_run:
+            message = language_manager.get_text("status_gain_no_step")
+            logger.info(message)
+            if hasattr(self.main_app, 'status_label'):
+                self.main_app.status_label.setText(message)
+            return
+        
+        limits = {}
+        for code in ("P08-00", "P08-01"):
+            param = self.main_app.parameter_manager.get_parameter(code)
+            if param is not None and param.validation.get('type') == 'range':
+                limits[code] = (param.validation['min'], param.validation['max'])
+        from workers.gain_search_worker import GainSearchWorker
+        worker = GainSearchWorker(step_run['trace'], step_run['parameters'], limits)
+        worker.progress_updated.connect(self._on_gain_search_progress)
+        worker.finished.connect(self._on_gain_search_finished)
+        worker.error_occurred.connect(self._on_gain_search_error)
+        self.gain_search_worker = worker
+        self.gain_candidates = []
+        self.gain_tree.clear()
+        self.gain_info_label.setText(language_manager.get_text("text_gain_fitting").format(run=step_run['run']))
+        self.gain_search_btn.setEnabled(False)
+        self.gain_sweep_btn.setEnabled(False)
+        worker.start()
+
+    def is_gain_search_running(self):
+        return self.gain_search_worker is not None and self.gain_search_worker.isRunning()
+
+    def stop_gain_search(self):
+        """Bricht eine laufende Reglersuche ab (z.B. beim Beenden der Anwendung)"""
+        if self.is_gain_search_running():
+            self.gain_search_worker.stop()
+
+    def _on_gain_search_progress(self, count, round_index):
+        self.gain_info_label.setText(self.main_app.language_manager.get_text("text_gain_progress").format(
+            count=count, round=round_index + 1))
+
+    def _on_gain_search_finished(self, result):
+        """Zeigt die angepasste Strecke und die besten Kandidaten an"""
+        def number(value, scale=1.0, digits=1):
+            return "-" if value is None else f"{value * scale:.{digits}f}"
+        
+        self.gain_search_btn.setEnabled(True)
+        language_manager = self.main_app.language_manager
+        plant = result['plant']
+        self.gain_info_label.setText(language_manager.get_text("text_gain_plant").format(
+            inertia=plant['load_inertia_ratio'], error=plant['rms_error']))
+        self.gain_candidates = result['candidates']
+        for candidate in self.gain_candidates:
+            item = QTreeWidgetItem(self.gain_tree, [
+                self._get_readable_value(candidate['parameters']['P08-00'], self.main_app.parameter_manager.get_parameter("P08-00")),
+                self._get_readable_value(candidate['parameters']['P08-01'], self.main_app.parameter_manager.get_parameter("P08-01")),
+                number(candidate.get('rise_time'), 1000.0),
+                number(candidate.get('overshoot')),
+                number(candidate.get('settling_time'), 1000.0),
+                number(candidate['cost'], digits=4),
+            ])
+            for column in range(6):
+                item.setTextAlignment(column, Qt.AlignRight | Qt.AlignVCenter)
+        self.gain_sweep_btn.setEnabled(bool(self.gain_candidates))
+        if hasattr(self.main_app, 'status_label'):
+            self.main_app.status_label.setText(language_manager.get_text("status_gain_finished").format(
+                count=len(self.gain_candidates)))
+
+    def _on_gain_search_error(self, message):
+        self.gain_search_btn.setEnabled(True)
+        self.gain_sweep_btn.setEnabled(bool(self.gain_candidates))
+        self.gain_info_label.setText("")
+        message = self.main_app.language_manager.get_text("status_gain_failed").format(error=message)
+        logger.warning(message)
+        if hasattr(self.main_app, 'status_label'):
+            self.main_app.status_label.setText(message)
+
+    def apply_gain_candidate(self):
+        """Trägt den gewählten Kandidaten in die Eingabefelder ein; geschrieben wird erst mit 'Schreiben'"""
+        selected = self.gain_tree.selectedItems()
+        if not selected:
+            return
+        candidate = self.gain_candidates[self.gain_tree.indexOfTopLevelItem(selected[0])]
+        for widgets in self.tuning_widgets.values():
+            param = widgets["param"]
+            if param.code in candidate['parameters'] and widgets["type"] == "lineedit":
+                widgets["widget"].setText(self._get_readable_value(candidate['parameters'][param.code], param))
+        if hasattr(self.main_app, 'status_label'):
+            self.main_app.status_label.setText(self.main_app.language_manager.get_text("status_gain_applied"))
+
+    def toggle_gain_sweep(self):
+        """Startet den Test der Kandidaten an der Maschine oder bricht ihn ab"""
+        if self.is_gain_sweep_running():
+            self.gain_sweep_worker.is_running = False
+            self.gain_sweep_btn.setEnabled(False)
+        else:
+            self.start_gain_sweep()
+
+    def start_gain_sweep(self):
+        """
+        Hält den Plot an und nimmt für die Werte der Sprungantwort und jeden Kandidaten denselben
+        Sprung auf; jedes Ergebnis wird als Durchlauf in der Tabelle der Sprungantwort angehängt.
+        """
+        language_manager = self.main_app.language_manager
+        if self.is_gain_sweep_running() or self.is_gain_search_running() or not self.gain_candidates:
+            return
+        if not self.main_app.modbus_client.connected:
+            self._show_status(language_manager.get_text("status_gain_sweep_not_connected"), "warning")
+            return
+        step_run = self._selected_step_run()
+        if step_run is None:
+            self._show_status(language_manager.get_text("status_gain_no_step"))
+            return
+        
+        codes = ("P08-00", "P08-01")
+        addresses = {code: int(self.main_app.parameter_manager.get_parameter(code).decimal) for code in codes}
+        parameter_sets = [{code: step_run['parameters'][code] for code in codes if code in step_run['parameters']}]
+        parameter_sets += [{code: candidate['parameters'][code] for code in codes} for candidate in self.gain_candidates]
+        parameter_sets = [values for values in parameter_sets if values]
+        try:
+            duration = int(self.step_capture_input.text()) / 1000.0
+        except ValueError:
+            duration = DEFAULT_STEP_CAPTURE_MS / 1000.0
+        metrics = step_run['metrics']
+        
+        # Der Bus gehört während des Tests dem Worker
+        self.plot_control_signal.emit("stop")
+        from workers.gain_sweep_worker import GainSweepWorker
+        worker = GainSweepWorker(self.main_app.modbus_client, parameter_sets, addresses,
+                                 int(round(metrics['initial'])), int(round(metrics['final'])), duration)
+        worker.progress_updated.connect(self._on_gain_sweep_progress)
+        worker.result_ready.connect(self._on_gain_sweep_result)
+        worker.finished.connect(self._on_gain_sweep_finished)
+        worker.error_occurred.connect(self._on_gain_sweep_error)
+        self.gain_sweep_worker = worker
+        self._gain_sweep_parameters = step_run['parameters']
+        self._gain_sweep_runs = {}
+        self.gain_search_btn.setEnabled(False)
+        self.gain_sweep_btn.setText(language_manager.get_text("button_stop"))
+        worker.start()
+        self._show_status(language_manager.get_text("status_gain_sweep_started"))
+
+    def is_gain_sweep_running(self):
+        return self.gain_sweep_worker is not None and self.gain_sweep_worker.isRunning()
+
+    def stop_gain_sweep(self):
+        """Bricht einen laufenden Test an der Maschine ab (z.B. beim Beenden der Anwendung)"""
+        if self.is_gain_sweep_running():
+            self.gain_sweep_worker.stop()
+
+    def is_bus_busy(self):
+        """True, solange eine Messung (Frequenzgang, Test an der Maschine) den Bus belegt"""
+        return self.is_frequency_response_running() or self.is_gain_sweep_running()
+
+    def _on_gain_sweep_progress(self, count, total):
+        self.gain_info_label.setText(self.main_app.language_manager.get_text("text_gain_sweep_progress").format(
+            count=count, total=total))
+
+    def _on_gain_sweep_result(self, result):
+        """Hängt die Messung eines Parametersatzes als Durchlauf an"""
+        metrics = result['metrics']
+        if metrics is None:
+            logger.warning(f"Verstärkungstest: kein Sprung erkannt für {result['parameters']}")
+            return
+        gains = " ".join(f"{code}={self._get_readable_value(value, self.main_app.parameter_manager.get_parameter(code))}"
+                         for code, value in result['parameters'].items())
+        parameters = dict(self._gain_sweep_parameters)
+        parameters.update(result['parameters'])
+        trace = result['trace']
+        run = len(self.step_runs) + 1
+        self.step_runs.append({'run': run, 'gains': gains, 'metrics': metrics, 'parameters': parameters,
+                               'trace': {key: trace[key] for key in ('times', 'reference', 'feedback', 'torque')}})
+        self._add_step_row(run, gains, metrics)
+        self._gain_sweep_runs[result['index']] = run
+
+    def _on_gain_sweep_finished(self, result):
+        """Wählt den stabilen Satz mit der kürzesten Ausregelzeit in der Tabelle aus"""
+        self._reset_gain_sweep_controls()
+        language_manager = self.main_app.language_manager
+        run = self._gain_sweep_runs.get(result['best'])
+        if run is None:
+            self._show_status(language_manager.get_text("status_gain_sweep_unstable"), "warning")
+            return
+        for index in range(self.step_tree.topLevelItemCount()):
+            item = self.step_tree.topLevelItem(index)
+            if item.text(0) == str(run):
+                self.step_tree.setCurrentItem(item)
+                break
+        gains = next((step_run['gains'] for step_run in self.step_runs if step_run['run'] == run), "")
+        self._show_status(language_manager.get_text("status_gain_sweep_finished").format(run=run, gains=gains))
+
+    def _on_gain_sweep_error(self, message):
+        self._reset_gain_sweep_controls()
+        self._show_status(
+            self.main_app.language_manager.get_text("status_gain_sweep_failed").format(error=message), "warning")
+
+    def _reset_gain_sweep_controls(self):
+        self.gain_info_label.setText("")
+        self.gain_search_btn.setEnabled(True)
+        self.gain_sweep_btn.setText(self.main_app.language_manager.get_text("button_gain_sweep"))
+        self.gain_sweep_btn.setEnabled(bool(self.gain_candidates))
+
+    def _add_live_value_widget(self, code):
+        """Legt die Live-Wert-Anzeige eines Kanals an (vor dem abschließenden Stretch)"""
+        param = self.main_app.parameter_manager.get_parameter(code)
+        if not param:
+            return
+        
+        # Create a horizontal layout for each live value (label: value)
+        value_layout = QHBoxLayout()
+        value_layout.setSpacing(2)  # Small spacing between label and value
+        value_layout.setContentsMargins(2, 2, 2, 2)  # Small margins
+        
+        label = QLabel(f"{param.code} ({param.unit}):")  # Use param.code and param.unit
+        
+        value_edit = QLineEdit(self.main_app.language_manager.get_text("text_not_available"))
+        value_edit.setReadOnly(True)
+        value_edit.setFixedWidth(50)  # Compact width for the value
+        
+        value_layout.addWidget(label)
+        value_layout.addWidget(value_edit)
+        
+        position = len(self.live_value_widgets)
+        self.live_values_layout.insertLayout(position, value_layout)
+        self.live_value_widgets[code] = value_edit
+
+    def _rate_text(self, rate):
+        return self.main_app.language_manager.get_text("text_rate_full") if not rate else f"{rate} Hz"
+
+    def _update_channel_inputs(self):
+        """Füllt die Auswahl der hinzufügbaren Kanäle und der Kanäle für die Abtastrate"""
+        self.add_channel_input.clear()
+        for channel in self.channels.channels():
+            if channel.code not in self.plot_codes:
+                self.add_channel_input.addItem(f"{channel.code} {channel.name}", channel.code)
+        self.add_channel_btn.setEnabled(self.add_channel_input.count() > 0)
+        
+        selected = self.rate_channel_input.currentData()
+        self.rate_channel_input.blockSignals(True)
+        self.rate_channel_input.clear()
+        for code in self.plot_codes:
+            self.rate_channel_input.addItem(code, code)
+        if selected in self.plot_codes:
+            self.rate_channel_input.setCurrentIndex(self.plot_codes.index(selected))
+        self.rate_channel_input.blockSignals(False)
+        self._show_channel_rate()
+
+    def _show_channel_rate(self):
+        rate = self.channel_rates.get(self.rate_channel_input.currentData(), 0)
+        index = self.rate_input.findData(rate)
+        self.rate_input.setCurrentIndex(index if index >= 0 else 0)
+
+    def set_channel_rate(self, code, rate):
+        """Setzt die Abtastrate eines Kanals in Hz (0 = jeder Buszyklus)"""
+        if code is None:
+            return
+        if rate:
+            self.channel_rates[code] = rate
+        else:
+            self.channel_rates.pop(code, None)
+        if hasattr(self.main_app, 'plot_worker'):
+            self.main_app.plot_worker.set_channel_rates(self.channel_rates)
+        if code == self.spectrum_channel_input.currentData():
+            self.configure_spectrum()
+        logger.info(f"Abtastrate für {code}: {self._rate_text(rate)}")
+
+    def add_plot_channel(self, code):
+        """Fügt einen Überwachungswert als Plot-Kanal hinzu (der Plot wird neu aufgebaut)"""
+        if not code or code in self.plot_codes or code not in self.channels:
+            return
+        hidden = [c for c, curve in self.lines.items() if not curve.isVisible()]
+        self.plot_codes.append(code)
+        self.channel_rates.setdefault(code, ADDED_CHANNEL_RATE)
+        self._add_live_value_widget(code)
+        self.clear_plot(stopped_by_user=False)
+        for c in hidden:
+            self.legend_checkboxes[c].setChecked(False)
+        self._update_channel_inputs()
+        self._update_spectrum_channels()
+        if hasattr(self.main_app, 'plot_worker'):
+            self.main_app.plot_worker.set_channel_rates(self.channel_rates)
+            self.main_app.plot_worker.update_visible_lines(
+                [c for c, curve in self.lines.items() if curve.isVisible()])
+        logger.info(f"Plot-Kanal {code} hinzugefügt ({self._rate_text(self.channel_rates.get(code, 0))})")
+
     def get_plot_settings(self):
         return int(self.time_window_input.text())
 
-    def update_plot(self, new_values):
+    def set_plot_axes(self, slave_ids):
+        """Legt fest, welche Achsen im Plot dargestellt werden (erste = Hauptachse)"""
+        slave_ids = list(slave_ids or [])
+        if slave_ids != self.plot_slave_ids:
+            self.plot_slave_ids = slave_ids
+            self.clear_plot(stopped_by_user=False)
+
+    def _get_visible_time_seconds(self):
+        """Liest die Zeitfenster-Breite aus der Eingabe"""
+        try:
+            # Nur noch die Zeitfenster-Breite verwenden
+            visible_time_seconds = int(self.time_window_input.text())
+            # Validierung des Zeitfensters
+            if visible_time_seconds < 1:
+                visible_time_seconds = 1
+            elif visible_time_seconds > 600:  # Max 10 Minuten
+                visible_time_seconds = 600
+        except (ValueError, TypeError):
+            # Fallback-Werte bei ungültigen Eingaben
+            visible_time_seconds = 20.0  # 20 Sekunden Standard
+        return visible_time_seconds
+
+    def _append_curve_point(self, curve, relative_time, value, visible_time_seconds, max_data_points):
+        """Hängt einen Datenpunkt (oder Felder von Datenpunkten) an eine Kurve an und begrenzt sie auf das Zeitfenster"""
+        # Hole die aktuellen Daten der Kurve
+        current_data = curve.getData()
+        if current_data[0] is not None and current_data[1] is not None:
+            # Füge den neuen Datenpunkt hinzu
+            time_data = np.append(current_data[0], relative_time)
+            value_data = np.append(current_data[1], value)
+            
+            # Begrenze die Daten auf das sichtbare Zeitfenster
+            if len(time_data) > 0 and time_data[-1] - time_data[0] > visible_time_seconds:
+                # Finde den Index, ab dem die Daten im sichtbaren Bereich liegen
+                min_time = time_data[-1] - visible_time_seconds
+                visible_indices = np.where(time_data >= min_time)[0]
+                if len(visible_indices) > 0:
+                    time_data = time_data[visible_indices[0]:]
+                    value_data = value_data[visible_indices[0]:]
+            
+            # Zusätzliche Begrenzung der Datenpunkte auf maximale Anzahl
+            if len(time_data) > max_data_points:
+                time_data = time_data[-max_data_points:]
+                value_data = value_data[-max_data_points:]
+            
+            # Aktualisiere die Kurve
+            curve.setData(time_data, value_data)
+        else:
+            # Erste Datenpunkte für die Kurve
+            curve.setData(np.atleast_1d(relative_time), np.atleast_1d(value))
+
+    def _update_axis_plot(self, slave_id, new_values):
+        """Aktualisiert die Kurven einer weiteren Achse im Multi-Drop-Betrieb"""
+        if self.start_time is None:
+            self.start_time = time.time()
+        relative_time = time.time() - self.start_time
+        visible_time_seconds = self._get_visible_time_seconds()
+        
+        for code, value in new_values.items():
+            curve = self.axis_lines.get((slave_id, code))
+            if curve is None or not curve.isVisible():
+                continue
+            if not self._validate_plot_value(code, value):
+                logger.warning(f"Ungültiger Wert für {code} (Achse {slave_id}): {value}")
+                continue
+            self._append_curve_point(curve, relative_time, value, visible_time_seconds, 1000000)
+
+    def update_plot(self, new_values, slave_id=None):
         """Receives new data values from main_app and updates the plot."""
         import time
         
+        # Weitere Achsen im Multi-Drop-Betrieb haben eigene Kurven und keine Live-Werte
+        if slave_id is not None and self.plot_slave_ids and slave_id != self.plot_slave_ids[0]:
+            try:
+                self._update_axis_plot(slave_id, new_values)
+            except Exception as e:
+                logger.error(f"Fehler bei der Plot-Aktualisierung für Achse {slave_id}: {e}", exc_info=True)
+            return
+        
         try:
             # Initialisiere die Startzeit beim ersten Aufruf
             if self.start_time is None:
@@ -543,23 +1593,15 @@ class TuningTab(QWidget):
             # Update live value displays
             missing_data_count = 0
             for code, val in new_values.items():
+                self.channel_last_seen[code] = current_time
                 if code in self.live_value_widgets:
-                    self.live_value_widgets[code].setText(str(val))
+                    channel = self.channels.get(code)
+                    self.live_value_widgets[code].setText(channel.format(val) if channel else str(val))
                 else:
                     missing_data_count += 1
 
             # Hole die aktuellen Plot-Einstellungen
-            try:
-                # Nur noch die Zeitfenster-Breite verwenden
-                visible_time_seconds = int(self.time_window_input.text())
-                # Validierung des Zeitfensters
-                if visible_time_seconds < 1:
-                    visible_time_seconds = 1
-                elif visible_time_seconds > 600:  # Max 10 Minuten
-                    visible_time_seconds = 600
-            except (ValueError, TypeError):
-                # Fallback-Werte bei ungültigen Eingaben
-                visible_time_seconds = 20.0  # 20 Sekunden Standard
+            visible_time_seconds = self._get_visible_time_seconds()
 
             # Setze die x-Achse auf den sichtbaren Zeitbereich, um die neuesten Daten anzuzeigen
             # Dies sorgt dafür, dass der Plot automatisch mit den neuesten Daten mitverschoben wird
@@ -576,41 +1618,18 @@ class TuningTab(QWidget):
                         logger.warning(f"Ungültiger Wert für {code}: {new_values[code]}")
                         continue
                     
-                    # Hole die aktuellen Daten der Kurve
-                    current_data = curve.getData()
-                    if current_data[0] is not None and current_data[1] is not None:
-                        # Füge den neuen Datenpunkt hinzu
-                        time_data = np.append(current_data[0], relative_time)
-                        value_data = np.append(current_data[1], new_values[code])
-                        
-                        # Begrenze die Daten auf das sichtbare Zeitfenster
-                        if len(time_data) > 0 and time_data[-1] - time_data[0] > visible_time_seconds:
-                            # Finde den Index, ab dem die Daten im sichtbaren Bereich liegen
-                            min_time = time_data[-1] - visible_time_seconds
-                            visible_indices = np.where(time_data >= min_time)[0]
-                            if len(visible_indices) > 0:
-                                time_data = time_data[visible_indices[0]:]
-                                value_data = value_data[visible_indices[0]:]
-                        
-                        # Zusätzliche Begrenzung der Datenpunkte auf maximale Anzahl
-                        if len(time_data) > max_data_points:
-                            time_data = time_data[-max_data_points:]
-                            value_data = value_data[-max_data_points:]
-                        
-                        # Aktualisiere die Kurve
-                        curve.setData(time_data, value_data)
-                    else:
-                        # Erste Datenpunkte für die Kurve
-                        curve.setData(np.array([relative_time]), np.array([new_values[code]]))
+                    self._append_curve_point(curve, relative_time, new_values[code], visible_time_seconds, max_data_points)
             
-            # Zeige den Status der Datenaktualisierung an
-            total_visible_codes = sum(1 for curve in self.lines.values() if curve.isVisible())
-            actual_data_count = len(new_values)
+            # Zeige den Status der Datenaktualisierung an; langsam abgetastete Kanäle
+            # liefern nicht in jedem Zyklus einen Wert und zählen erst nach CHANNEL_STALE_TIME als fehlend
+            stale_count = sum(1 for code, curve in self.lines.items()
+                              if curve.isVisible()
+                              and current_time - self.channel_last_seen.get(code, self.start_time) > CHANNEL_STALE_TIME)
             
             if missing_data_count > 0:
                 status_text = f"{self.main_app.language_manager.get_text('status_plot_updated')} ({missing_data_count} {self.main_app.language_manager.get_text('status_values_missing')})"
-            elif actual_data_count < total_visible_codes:
-                status_text = f"{self.main_app.language_manager.get_text('status_plot_updated')} ({total_visible_codes - actual_data_count} {self.main_app.language_manager.get_text('status_channels_without_data')})"
+            elif stale_count > 0:
+                status_text = f"{self.main_app.language_manager.get_text('status_plot_updated')} ({stale_count} {self.main_app.language_manager.get_text('status_channels_without_data')})"
             else:
                 status_text = f"{self.main_app.language_manager.get_text('status_plot_updated')} ({self.main_app.language_manager.get_text('status_all_values_present')})"
             
@@ -629,6 +1648,53 @@ class TuningTab(QWidget):
             except Exception as clear_error:
                 logger.error(f"Fehler bei der Plot-Neuinitialisierung: {clear_error}", exc_info=True)
     
+    def update_plot_samples(self, times, columns):
+        """
+        Hängt mehrere Abtastungen auf einmal an (Plot-Erfassung im eigenen Prozess).
+        
+        Args:
+            times: Abtastzeitpunkte (time.time) als NumPy-Feld
+            columns: {Code: Werte} als NumPy-Felder gleicher Länge; NaN = in dieser Abtastung nicht gelesen
+        """
+        if not len(times):
+            return
+        try:
+            if self.start_time is None:
+                self.start_time = float(times[0])
+            relative_times = times - self.start_time
+            visible_time_seconds = self._get_visible_time_seconds()
+            current_time = time.time()
+            
+            for code, values in columns.items():
+                valid = ~np.isnan(values)
+                channel = self.channels.get(code)
+                # Wertebereich des Kanals (wie _validate_plot_value)
+                if channel is not None and channel.minimum is not None:
+                    valid &= values >= channel.minimum
+                if channel is not None and channel.maximum is not None:
+                    valid &= values <= channel.maximum
+                if not valid.any():
+                    continue
+                values = values[valid]
+                
+                self.channel_last_seen[code] = current_time
+                if code in self.live_value_widgets:
+                    latest = values[-1].item()
+                    if channel is not None and not channel.decimal_places:
+                        latest = int(latest)
+                    self.live_value_widgets[code].setText(channel.format(latest) if channel else str(latest))
+                
+                curve = self.lines.get(code)
+                if curve is not None and curve.isVisible():
+                    self._append_curve_point(curve, relative_times[valid], values, visible_time_seconds, 1000000)
+            
+            latest_time = relative_times[-1]
+            self.plot_widget.setXRange(latest_time - visible_time_seconds, latest_time)
+        except Exception as e:
+            logger.error(f"Fehler bei der Plot-Aktualisierung: {e}", exc_info=True)
+            if hasattr(self.main_app, 'status_label'):
+                self.main_app.status_label.setText(f"{self.main_app.language_manager.get_text('status_plot_error')}: {str(e)}")
+    
     def update_status_feedback(self):
         """Aktualisiert das Status-Feedback für den Benutzer"""
         try:
@@ -659,6 +1725,11 @@ class TuningTab(QWidget):
                         failures = self.main_app.plot_worker.consecutive_failures
                         if failures > 0:
                             worker_status = f"{self.main_app.language_manager.get_text('status_active')} ({failures} {self.main_app.language_manager.get_text('status_errors')})"
+                    
+                    # Buszyklen, die länger als das Abtastintervall gedauert haben
+                    overruns = self.main_app.plot_worker.get_timing_statistics()['overruns']
+                    if overruns > 0:
+                        worker_status = f"{worker_status}, {overruns} {self.main_app.language_manager.get_text('status_overruns')}"
             
             # Anzahl der sichtbaren Linien zählen
             visible_lines = sum(1 for line in self.lines.values() if line.isVisible())
@@ -701,15 +1772,17 @@ class TuningTab(QWidget):
         try:
             # Werte aus den Eingabefeldern lesen
             watchdog_timeout = int(self.watchdog_timeout_input.text())
+            sample_interval = int(self.sample_interval_input.text() or 0)
             
             # Validierung der Werte
             if not (1 <= watchdog_timeout <= 60):
                 raise ValueError(f"Watchdog-Timeout muss zwischen 1 und 60 Sekunden liegen")
+            if not (0 <= sample_interval <= 10000):
+                raise ValueError(f"Abtastintervall muss zwischen 0 und 10000 ms liegen")
             
             # Konfigurations-Dictionary erstellen
             new_config = {
-                'min_update_interval': 1,  # Minimales Update-Intervall für maximale Geschwindigkeit
-                'max_update_interval': 10,  # Kurzes maximales Intervall
+                'sample_interval': sample_interval,  # Fester Abtastabstand in ms (0 = so schnell wie möglich)
                 'watchdog_timeout': watchdog_timeout,
                 'max_data_points': 1000000  # Sehr hohe Anzahl für maximale Datenaufzeichnung
             }
@@ -717,6 +1790,7 @@ class TuningTab(QWidget):
             # Konfiguration an den Plot-Worker übergeben
             if hasattr(self.main_app, 'plot_worker'):
                 self.main_app.plot_worker.update_config(new_config)
+                self.configure_spectrum()
                 
                 # Bestätigung in der Statusleiste anzeigen
                 if hasattr(self.main_app, 'status_label'):
@@ -743,6 +1817,7 @@ class TuningTab(QWidget):
         if stopped_by_user and hasattr(self.main_app, 'plot_worker') and self.main_app.plot_worker.isRunning():
             self.plot_control_signal.emit("stop")
         self.start_time = None  # Startzeit zurücksetzen für neuen Plot
+        self.channel_last_seen = {}
         while self.legend_layout.count():
             child = self.legend_layout.takeAt(0)
             if child.widget(): child.widget().deleteLater()
@@ -767,21 +1842,72 @@ class TuningTab(QWidget):
             curve = self.plot_widget.plot(pen=pg.mkPen(color, width=2), name=f"{param.code} ({param.unit})")
             self.lines[code] = curve
         
+        self._create_axis_curves(colors)
+        
+        self.legend_checkboxes = {}
         for i, (code, curve) in enumerate(self.lines.items()):
             checkbox = QCheckBox(curve.name()); checkbox.setChecked(True)
             checkbox.stateChanged.connect(lambda state, c=code: self.update_plot_visibility(c, state))
             row, col = divmod(i, 3)
             self.legend_layout.addWidget(checkbox, row, col)
+            self.legend_checkboxes[code] = checkbox
         
         # Zurücksetzen des Flags für den initialen Bereich
         if hasattr(self, 'initial_range_set'):
             delattr(self, 'initial_range_set')
         
 
+    def _create_axis_curves(self, colors):
+        """Erzeugt die Kurven der weiteren Achsen im Multi-Drop-Betrieb"""
+        # Bisherige gestapelte Plots entfernen
+        for plot_widget in self.axis_plot_widgets.values():
+            self.axis_plots_layout.removeWidget(plot_widget)
+            plot_widget.deleteLater()
+        self.axis_plot_widgets = {}
+        self.axis_lines = {}
+        
+        if len(self.plot_slave_ids) < 2:
+            return
+        
+        lm = self.main_app.language_manager
+        self.plot_widget.setTitle(
+            f"{lm.get_text('plot_title_realtime_servo_data')} - {lm.get_text('text_axis')} {self.plot_slave_ids[0]}"
+        )
+        stacked = self.axis_display_input.currentData() == "stacked"
+        dash_styles = [Qt.DashLine, Qt.DotLine, Qt.DashDotLine, Qt.DashDotDotLine]
+        
+        for axis_index, slave_id in enumerate(self.plot_slave_ids[1:]):
+            if stacked:
+                target = pg.PlotWidget()
+                target.setTitle(f"{lm.get_text('text_axis')} {slave_id}")
+                target.setLabel('left', lm.get_text("plot_ylabel_value"))
+                target.showGrid(x=True, y=True)
+                target.setXLink(self.plot_widget)
+                target.setAntialiasing(True)
+                self.axis_plots_layout.addWidget(target)
+                self.axis_plot_widgets[slave_id] = target
+                style = Qt.SolidLine
+            else:
+                target = self.plot_widget
+                style = dash_styles[axis_index % len(dash_styles)]
+            
+            for i, code in enumerate(self.plot_codes):
+                param = self.main_app.parameter_manager.get_parameter(code)
+                if not param or code not in self.lines:
+                    continue
+                color = colors[i % len(colors)]
+                curve = target.plot(pen=pg.mkPen(color, width=2, style=style),
+                                    name=f"{param.code} ({param.unit}) [{slave_id}]")
+                curve.setVisible(self.lines[code].isVisible())
+                self.axis_lines[(slave_id, code)] = curve
+            
     def update_plot_visibility(self, code, state):
         if code in self.lines:
             is_visible = (state == Qt.Checked)
             self.lines[code].setVisible(is_visible)
+            for (slave_id, axis_code), curve in self.axis_lines.items():
+                if axis_code == code:
+                    curve.setVisible(is_visible)
             
             # Aktualisiere auch die Sichtbarkeit der Live-Werte
             if code in self.live_value_widgets:
@@ -917,6 +2043,11 @@ class TuningTab(QWidget):
             self.main_app.language_manager.get_text("button_switch_to_gain_set_2") if self.gain_set1_group.isVisible()
             else self.main_app.language_manager.get_text("button_switch_to_gain_set_1")
         )
+        self.ram_mode_checkbox.setText(language_manager.get_text("checkbox_ram_mode"))
+        self.ram_mode_checkbox.setToolTip(language_manager.get_text("tooltip_ram_mode"))
+        self.eeprom_commit_btn.setText(language_manager.get_text("button_eeprom_commit"))
+        self.eeprom_commit_btn.setToolTip(language_manager.get_text("tooltip_eeprom_commit"))
+        self._update_ram_mode_display()
         
         # Update info label
         info_label = self.tuning_group.findChild(QLabel)
@@ -1043,6 +2174,7 @@ class TuningTab(QWidget):
         
         # Update legend checkboxes
         self._clear_layout(self.legend_layout)
+        self.legend_checkboxes = {}
         for i, (code, curve) in enumerate(self.lines.items()):
             param = self.main_app.parameter_manager.get_parameter(code)
             if not param: continue
@@ -1051,6 +2183,7 @@ class TuningTab(QWidget):
             checkbox.stateChanged.connect(lambda state, c=code: self.update_plot_visibility(c, state))
             row, col = divmod(i, 3)
             self.legend_layout.addWidget(checkbox, row, col)
+            self.legend_checkboxes[code] = checkbox
 
         # Update VDI button texts
         for i, button in enumerate(self.vdi_buttons):
@@ -1067,6 +2200,68 @@ class TuningTab(QWidget):
         # Update apply config button text
         if hasattr(self, 'apply_config_btn'):
             self.apply_config_btn.setText(language_manager.get_text("button_apply_config"))
+        
+        # Update sampling interval
+        self.sample_interval_label.setText(language_manager.get_text("label_sampling_interval") + " (ms):")
+        self.sample_interval_input.setToolTip(language_manager.get_text("tooltip_sampling_interval"))
+        self.process_acquisition_checkbox.setText(language_manager.get_text("checkbox_process_acquisition"))
+        self.process_acquisition_checkbox.setToolTip(language_manager.get_text("tooltip_process_acquisition"))
+        
+        # Update step response results
+        self.step_response_group.setTitle(language_manager.get_text("group_step_response"))
+        self.step_analysis_checkbox.setText(language_manager.get_text("checkbox_step_analysis"))
+        self.step_analysis_checkbox.setToolTip(language_manager.get_text("tooltip_step_analysis"))
+        self.step_capture_label.setText(language_manager.get_text("label_step_capture") + " (ms):")
+        self.step_clear_btn.setText(language_manager.get_text("button_clear"))
+        self.step_tree.setHeaderLabels(self._step_headers(language_manager))
+        
+        # Update gain search
+        self.gain_search_group.setTitle(language_manager.get_text("group_gain_search"))
+        self.gain_search_btn.setText(language_manager.get_text("button_gain_search"))
+        self.gain_search_btn.setToolTip(language_manager.get_text("tooltip_gain_search"))
+        self.gain_apply_btn.setText(language_manager.get_text("button_gain_apply"))
+        self.gain_apply_btn.setToolTip(language_manager.get_text("tooltip_gain_apply"))
+        self.gain_sweep_btn.setText(language_manager.get_text(
+            "button_stop" if self.is_gain_sweep_running() else "button_gain_sweep"))
+        self.gain_sweep_btn.setToolTip(language_manager.get_text("tooltip_gain_sweep"))
+        self.gain_tree.setHeaderLabels(self._gain_headers(language_manager))
+        
+        # Update spectrum panel
+        self.spectrum_group.setTitle(language_manager.get_text("group_spectrum"))
+        self.spectrum_checkbox.setText(language_manager.get_text("checkbox_spectrum"))
+        self.spectrum_checkbox.setToolTip(language_manager.get_text("tooltip_spectrum"))
+        self.spectrum_segment_label.setText(language_manager.get_text("label_spectrum_segment") + ":")
+        self.spectrum_rate_label.setText(language_manager.get_text("label_spectrum_update_rate") + ":")
+        self.spectrum_plot.setLabel('bottom', language_manager.get_text("plot_xlabel_frequency") + " (Hz)")
+        self.spectrum_plot.setLabel('left', language_manager.get_text("plot_ylabel_psd"))
+        
+        # Update frequency response panel
+        self.frequency_response_group.setTitle(language_manager.get_text("group_frequency_response"))
+        self.fr_signal_label.setText(language_manager.get_text("label_fr_signal") + ":")
+        self.fr_signal_input.setItemText(0, language_manager.get_text("text_fr_chirp"))
+        self.fr_signal_input.setItemText(1, language_manager.get_text("text_fr_prbs"))
+        for label, text_key, unit in self.fr_labels.values():
+            label.setText(f"{language_manager.get_text(text_key)} ({unit}):")
+        self.fr_inputs["period"].setToolTip(language_manager.get_text("tooltip_fr_period"))
+        self.fr_start_btn.setText(language_manager.get_text("button_start"))
+        self.fr_start_btn.setToolTip(language_manager.get_text("tooltip_fr_start"))
+        self.fr_stop_btn.setText(language_manager.get_text("button_stop"))
+        for key, label_key in (("magnitude", "plot_ylabel_magnitude"), ("phase", "plot_ylabel_phase"),
+                               ("coherence", "plot_ylabel_coherence")):
+            self.fr_plots[key].setLabel('left', language_manager.get_text(label_key))
+        self.fr_plots["coherence"].setLabel('bottom', language_manager.get_text("plot_xlabel_frequency") + " (Hz)")
+        
+        # Update channel selection and sample rates
+        self.add_channel_label.setText(language_manager.get_text("label_add_channel") + ":")
+        self.channel_rate_label.setText(language_manager.get_text("label_channel_rate") + ":")
+        self.rate_input.setToolTip(language_manager.get_text("tooltip_channel_rate"))
+        for i in range(self.rate_input.count()):
+            self.rate_input.setItemText(i, self._rate_text(self.rate_input.itemData(i)))
+        
+        # Update axis display selection
+        self.axis_display_label.setText(language_manager.get_text("label_axis_display") + ":")
+        self.axis_display_input.setItemText(0, language_manager.get_text("text_axis_display_overlay"))
+        self.axis_display_input.setItemText(1, language_manager.get_text("text_axis_display_stacked"))
 
         # Redraw canvas to update plot
         self.plot_widget.update()
@@ -1117,16 +2312,11 @@ class TuningTab(QWidget):
             if math.isnan(value) or math.isinf(value):
                 return False
             
-            # Codespezifische Validierung
-            param = self.main_app.parameter_manager.get_parameter(code)
-            if param and param.validation:
-                v_type = param.validation.get('type')
-                if v_type == 'range':
-                    min_val = param.validation.get('min', -math.inf)
-                    max_val = param.validation.get('max', math.inf)
-                    if not (min_val <= value <= max_val):
-                        logger.warning(f"Wert {value} für {code} ist außerhalb des Bereichs [{min_val}, {max_val}]")
-                        return False
+            # Wertebereich des Kanals (skaliert; 64-Bit-Kanäle ohne Grenzen)
+            channel = self.channels.get(code)
+            if channel is not None and not channel.in_range(value):
+                logger.warning(f"Wert {value} für {code} ist außerhalb des Bereichs [{channel.minimum}, {channel.maximum}]")
+                return False
             
             return True
         except Exception as e:
@@ -1166,7 +2356,8 @@ class TuningTab(QWidget):
             from utils.modbus_helpers import ModbusHelper
             
             # Use ModbusHelper to read parameter with proper decimal formatting
-            result = ModbusHelper.read_parameter_safely(self.main_app.modbus_client, param, self.main_app.status_label)
+            result = ModbusHelper.read_parameter_safely(self.main_app.modbus_client, param, self.main_app.status_label,
+                                                        store=self.main_app.parameter_store)
             
             if result and len(result) == 3:
                 raw_value, display_value, error = result
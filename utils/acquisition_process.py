@@ -0,0 +1,322 @@
+"""
+Plot-Erfassung in einem eigenen Prozess.
+
+Im Plot-Worker (QThread) teilt sich die Erfassung den GIL mit der
+Oberfläche: Neuzeichnen, Tabellen und Dialoge verzögern die Abtastung. Der
+Erfassungsprozess öffnet eine eigene Verbindung zum Antrieb, liest die Plot-Kanäle
+im festen Takt (utils.cycle_timer) und schreibt jede Abtastung in einen
+Ringpuffer im gemeinsamen Speicher (utils.sample_ring). Die Oberfläche liest den
+Ring über NumPy-Views, ohne die Erfassung anzuhalten.
+
+Eine serielle Schnittstelle kann nur ein Prozess öffnen. Solange die Erfassung
+läuft, übergibt ServoModbusClient sie deshalb an den Erfassungsprozess
+(hand_over_port); Registerzugriffe der Oberfläche (Parameter lesen/schreiben,
+Tuning) führt der Erfassungsprozess zwischen zwei Abtastungen aus (call).
+TCP-Verbindungen öffnet der Erfassungsprozess zusätzlich zu der der Oberfläche.
+
+Steuerung über eine Pipe:
+    ('rates', {Code: Hz})            Abtastraten
+    ('visible', [Code, ...])         abzufragende Kanäle
+    ('interval', ms)                 Abtastabstand (0 = so schnell wie der Bus erlaubt)
+    ('call', Nr., Methode, args, kwargs)
+                                     Registerzugriff, Antwort (Nr., 'ok', Ergebnis) oder (Nr., 'error', Exception)
+"""
+
+import logging
+import multiprocessing
+import threading
+import time
+
+from custom_exceptions import ModbusConnectionException, ModbusTimeoutException, ServoToolException
+from logger_config import logger
+from utils.sample_ring import (
+    CYCLES, DEFAULT_CAPACITY, FAILURES, MAX_CYCLE_TIME, MAX_LATENESS, MEAN_LATENESS, MISSED, OVERRUNS,
+    STATE_FAILED, STATE_RUNNING, STATE_STARTING, STATE_STOPPED, SampleRing
+)
+
+# Registerzugriffe, die die Oberfläche im Erfassungsprozess ausführen darf
+REMOTE_METHODS = (
+    'read_holding_register',
+    'read_holding_register_32bit',
+    'write_holding_register',
+    'write_holding_register_32bit',
+    'write_holding_registers',
+)
+
+# Fehlzyklen in Folge, nach denen der Erfassungsprozess aufgibt
+MAX_CONSECUTIVE_FAILURES = 10
+
+# Wartezeit auf den Start (Verbindungsaufbau) und auf Antworten von call() in Sekunden
+START_TIMEOUT = 10.0
+CALL_TIMEOUT = 5.0
+
+
+def _serve_command(message, client, scheduler, timer, channels, conn):
+    """Führt einen Befehl der Oberfläche aus"""
+    kind = message[0]
+    if kind == 'call':
+        _, call_id, method, args, kwargs = message
+        try:
+            if method not in REMOTE_METHODS:
+                raise ServoToolException(f"Methode {method} ist im Erfassungsprozess nicht verfügbar")
+            conn.send((call_id, 'ok', getattr(client, method)(*args, **kwargs)))
+        except ServoToolException as e:
+            conn.send((call_id, 'error', e))
+        except Exception as e:
+            # Nicht jede Exception lässt sich über die Pipe übertragen
+            conn.send((call_id, 'error', ServoToolException(f"{type(e).__name__}: {e}")))
+    elif kind == 'rates':
+        scheduler.set_rates(message[1])
+    elif kind == 'visible':
+        scheduler.set_channels([channels.get(code).item for code in message[1] if code in channels])
+    elif kind == 'interval':
+        timer.set_period(max(0, message[1]) / 1000.0)
+
+
+def _publish_statistics(ring, timer, failures):
+    """Überträgt die Statistik des Abtasttakts in den Kopf des Ringpuffers"""
+    stats = timer.get_statistics()
+    header = ring.header
+    header[CYCLES] = stats['cycles']
+    header[OVERRUNS] = stats['overruns']
+    header[MISSED] = stats['missed']
+    header[FAILURES] = failures
+    header[MAX_CYCLE_TIME] = int(stats['max_cycle_time'] * 1e6)
+    header[MAX_LATENESS] = int(stats['max_lateness'] * 1e6)
+    header[MEAN_LATENESS] = int(stats['mean_lateness'] * 1e6)
+
+
+def acquisition_main(ring_name, connection_params, settings, conn, stop_event):
+    """
+    Einstiegspunkt des Erfassungsprozesses.
+
+    Args:
+        ring_name: Name des Ringpuffers (SampleRing.create im aufrufenden Prozess)
+        connection_params: Parameter für ServoModbusClient.connect
+        settings: {'codes', 'visible', 'rates', 'sample_interval', 'timeouts', 'inter_frame_delay', 'console_level'}
+        conn: Pipe-Ende für Befehle und Antworten
+        stop_event: Beendet die Erfassung
+    """
+    import numpy as np
+
+    from modbus_client import ServoModbusClient
+    from utils.acquisition_scheduler import AcquisitionScheduler
+    from utils.cycle_timer import SPIN_TIME, CycleTimer
+    from utils.frame_decoder import FrameReader
+    from utils.plot_channels import PLAUSIBLE_RANGES, ChannelRegistry
+
+    if settings.get('console_level'):
+        logger.set_console_level(settings['console_level'])
+    ring = SampleRing.attach(ring_name)
+    client = ServoModbusClient()
+    try:
+        channels = ChannelRegistry.from_file()
+        client.set_timeouts(**settings.get('timeouts', {}))
+        client.connect(**connection_params)
+        if settings.get('inter_frame_delay') is not None:
+            client.set_inter_frame_delay(settings['inter_frame_delay'])
+    except (OSError, ServoToolException) as e:
+        logger.error(f"Erfassungsprozess: Verbindung fehlgeschlagen: {e}")
+        ring.set_state(STATE_FAILED, str(e))
+        client.disconnect()
+        ring.close()
+        return
+
+    columns = {code: index for index, code in enumerate(settings['codes'])}
+    scheduler = AcquisitionScheduler()
+    scheduler.set_rates(settings.get('rates'))
+    timer = CycleTimer(max(0, settings.get('sample_interval', 0)) / 1000.0)
+    reader = FrameReader(channels, limits=PLAUSIBLE_RANGES)
+    _serve_command(('visible', settings.get('visible', [])), client, scheduler, timer, channels, conn)
+    row = np.full(len(columns), np.nan)
+    failures = 0
+
+    ring.set_state(STATE_RUNNING)
+    logger.info(f"Erfassungsprozess gestartet (PID {multiprocessing.current_process().pid})")
+    try:
+        while not stop_event.is_set():
+            # Befehle bis kurz vor dem nächsten Termin annehmen, die letzte Strecke wartet der Takt
+            remaining = timer.remaining() - SPIN_TIME
+            while conn.poll(remaining if remaining > 0 else 0):
+                _serve_command(conn.recv(), client, scheduler, timer, channels, conn)
+                remaining = timer.remaining() - SPIN_TIME
+            deadline = timer.wait()
+            blocks = scheduler.next_cycle(time.perf_counter())
+            if not blocks:
+                # Nur langsame Kanäle sichtbar und gerade keiner fällig
+                timer.complete()
+                _publish_statistics(ring, timer, failures)
+                if not timer.period:
+                    conn.poll(0.001)
+                continue
+
+            try:
+                values = reader.read(client, blocks)
+            except ModbusTimeoutException as e:
+                logger.warning(f"Erfassungsprozess: {e}")
+                values = None
+            if values:
+                row.fill(np.nan)
+                for code, value in values.items():
+                    index = columns.get(code)
+                    if index is not None:
+                        row[index] = value
+                ring.append(deadline, row)
+                failures = 0
+            else:
+                failures += 1
+                timer.resync()
+            timer.complete()
+
+            _publish_statistics(ring, timer, failures)
+            if failures >= MAX_CONSECUTIVE_FAILURES:
+                message = f"Zu viele Fehler ({failures}) - Erfassung beendet"
+                logger.error(f"Erfassungsprozess: {message}")
+                ring.set_state(STATE_FAILED, message)
+                return
+        ring.set_state(STATE_STOPPED)
+    except ModbusConnectionException as e:
+        # Port verloren: die Oberfläche sieht den Zustand und die Meldung im Ring
+        logger.error(f"Erfassungsprozess: Verbindung zum Antrieb verloren: {e}")
+        ring.set_state(STATE_FAILED, str(e))
+    except (EOFError, OSError) as e:
+        # Oberfläche beendet oder Pipe geschlossen
+        logger.warning(f"Erfassungsprozess: Verbindung zur Oberfläche verloren: {e}")
+        ring.set_state(STATE_STOPPED)
+    except Exception as e:
+        logger.error(f"Erfassungsprozess: Unerwarteter Fehler: {e}", exc_info=True)
+        ring.set_state(STATE_FAILED, str(e))
+    finally:
+        client.disconnect()
+        ring.close()
+        logger.info("Erfassungsprozess beendet")
+
+
+class AcquisitionProcess:
+    """Startet, steuert und beendet den Erfassungsprozess (aus Sicht der Oberfläche)."""
+
+    def __init__(self, codes, capacity=DEFAULT_CAPACITY):
+        """
+        Args:
+            codes: Parametercodes der Ringspalten (alle Kanäle, die während der Erfassung sichtbar werden können)
+            capacity: Zeilen im Ringpuffer
+        """
+        self.codes = list(codes)
+        self.capacity = capacity
+        self.ring = None
+        self._process = None
+        self._conn = None
+        self._stop_event = None
+        self._lock = threading.Lock()
+        self._call_id = 0
+
+    def start(self, connection_params, visible=(), rates=None, sample_interval=0, timeouts=None,
+              inter_frame_delay=None):
+        """
+        Legt den Ringpuffer an und startet den Prozess; wartet, bis die Verbindung steht.
+
+        Raises:
+            ModbusConnectionException: Wenn der Erfassungsprozess keine Verbindung herstellen kann
+        """
+        # spawn statt fork: ein geforkter Qt-Prozess mit laufenden Threads ist nicht sicher
+        context = multiprocessing.get_context('spawn')
+        self.ring = SampleRing.create(len(self.codes), self.capacity)
+        self._conn, child_conn = context.Pipe()
+        self._stop_event = context.Event()
+        settings = {
+            'codes': self.codes,
+            'visible': list(visible),
+            'rates': dict(rates or {}),
+            'sample_interval': sample_interval,
+            'timeouts': dict(timeouts or {}),
+            'inter_frame_delay': inter_frame_delay,
+            # Konsolenausgabe wie in diesem Prozess (der neue Prozess beginnt mit der Voreinstellung)
+            'console_level': logging.getLevelName(logger.console_handler.level)
+            if getattr(logger, 'console_handler', None) is not None else None,
+        }
+        self._process = context.Process(
+            target=acquisition_main,
+            args=(self.ring.name, dict(connection_params), settings, child_conn, self._stop_event),
+            name="Plot-Erfassung",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+
+        deadline = time.monotonic() + START_TIMEOUT
+        while self.ring.state == STATE_STARTING:
+            if not self._process.is_alive() or time.monotonic() > deadline:
+                break
+            time.sleep(0.01)
+        if self.ring.state != STATE_RUNNING:
+            message = self.ring.error() or "Erfassungsprozess nicht gestartet"
+            self.stop()
+            raise ModbusConnectionException(message)
+        logger.info(f"Erfassungsprozess läuft (PID {self._process.pid})")
+
+    def stop(self, timeout=3.0):
+        """Beendet den Prozess und gibt den Ringpuffer frei"""
+        if self._process is not None:
+            self._stop_event.set()
+            self._process.join(timeout)
+            if self._process.is_alive():
+                logger.warning("Erfassungsprozess reagiert nicht und wird beendet")
+                self._process.terminate()
+                self._process.join(1.0)
+            self._process = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+
+    def is_alive(self):
+        return self._process is not None and self._process.is_alive()
+
+    def _send(self, message):
+        with self._lock:
+            if self._conn is None:
+                raise ModbusConnectionException("Erfassungsprozess läuft nicht")
+            self._conn.send(message)
+
+    def set_rates(self, rates):
+        self._send(('rates', dict(rates or {})))
+
+    def set_visible(self, codes):
+        self._send(('visible', list(codes)))
+
+    def set_sample_interval(self, interval_ms):
+        self._send(('interval', interval_ms))
+
+    def call(self, method, *args, **kwargs):
+        """
+        Führt einen Registerzugriff von ServoModbusClient im Erfassungsprozess aus.
+
+        Returns:
+            Rückgabewert der Methode
+
+        Raises:
+            ServoToolException: Fehler der Methode im Erfassungsprozess
+            ModbusTimeoutException: Wenn der Erfassungsprozess nicht rechtzeitig antwortet
+            ModbusConnectionException: Wenn der Erfassungsprozess nicht läuft
+        """
+        with self._lock:
+            if self._conn is None or not self.is_alive():
+                raise ModbusConnectionException("Erfassungsprozess läuft nicht")
+            self._call_id += 1
+            try:
+                self._conn.send(('call', self._call_id, method, args, kwargs))
+                deadline = time.monotonic() + CALL_TIMEOUT
+                while True:
+                    if not self._conn.poll(max(0.0, deadline - time.monotonic())):
+                        raise ModbusTimeoutException(f"Erfassungsprozess antwortet nicht ({method})")
+                    call_id, status, result = self._conn.recv()
+                    # Verspätete Antworten früherer Aufrufe verwerfen
+                    if call_id == self._call_id:
+                        break
+            except (EOFError, OSError) as e:
+                raise ModbusConnectionException(f"Verbindung zum Erfassungsprozess unterbrochen: {e}")
+        if status == 'error':
+            raise result
+        return result
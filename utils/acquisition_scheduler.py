@@ -0,0 +1,131 @@
+"""
+Abfrageplan für Plot-Kanäle mit unterschiedlichen Abtastraten.
+
+Nicht jeder Überwachungswert muss mit der höchsten Rate gelesen werden: Drehzahl
+und Moment ändern sich schnell, Phasenstrom-Effektivwert, Temperatur oder die
+absolute Position dagegen langsam. Kanäle mit voller Rate (Rate 0) werden in
+jedem Buszyklus gelesen, die übrigen nur, wenn ihr nächster Termin erreicht ist.
+
+Jeder Zyklus wird mit den fälligen Kanälen gefüllt und zu Blocklesezugriffen
+zusammengefasst (utils.block_planner). Langsame Kanäle dürfen dabei nur eine
+begrenzte Zahl zusätzlicher Anfragen je Zyklus verursachen; was nicht mehr
+hineinpasst, bleibt fällig und kommt im nächsten Zyklus zuerst an die Reihe.
+Fällige Kanäle, die ohne zusätzliche Anfrage in einen ohnehin gelesenen Block
+passen, werden unabhängig von dieser Grenze mitgenommen; noch nicht fällige
+Kanäle werden nie vorzeitig gelesen, auch wenn sie keine Anfrage kosten würden
+(jedes Register verlängert den Rahmen).
+"""
+
+import threading
+
+from utils.block_planner import DEFAULT_MAX_GAP, plan_blocks
+
+# Rate 0 (oder None): Kanal wird in jedem Buszyklus gelesen
+FULL_RATE = 0
+
+# Zusätzliche Anfragen je Zyklus, die langsame Kanäle belegen dürfen
+DEFAULT_MAX_EXTRA_REQUESTS = 1
+
+
+class _Channel:
+    __slots__ = ('item', 'period', 'next_due', 'reads')
+
+    def __init__(self, item, period):
+        self.item = item
+        self.period = period
+        self.next_due = 0.0
+        self.reads = 0
+
+
+class AcquisitionScheduler:
+    """Wählt je Buszyklus die fälligen Kanäle aus und plant ihre Leseblöcke."""
+
+    def __init__(self, max_extra_requests=DEFAULT_MAX_EXTRA_REQUESTS, max_gap=DEFAULT_MAX_GAP):
+        """
+        Args:
+            max_extra_requests: Zusätzliche Anfragen je Zyklus für langsame Kanäle (mindestens 1)
+            max_gap: Maximale mitgelesene Lücke innerhalb eines Blocks in Registern
+        """
+        self.max_extra_requests = max(1, int(max_extra_requests))
+        self.max_gap = max_gap
+        self._lock = threading.Lock()
+        self._channels = {}
+        self._rates = {}
+
+    def set_channels(self, items):
+        """
+        Setzt die abzufragenden Kanäle. Termine bereits bekannter Kanäle bleiben erhalten.
+
+        Args:
+            items: BlockItem-Liste (Code, Adresse, Breite, Vorzeichen)
+        """
+        with self._lock:
+            channels = {}
+            for item in items:
+                channel = self._channels.get(item.code)
+                if channel is None or channel.item.address != item.address or channel.item.width != item.width:
+                    channel = _Channel(item, self._period(item.code))
+                else:
+                    channel.item = item
+                channels[item.code] = channel
+            self._channels = channels
+
+    def set_rates(self, rates):
+        """
+        Setzt die Abtastraten. Kanäle ohne Eintrag werden mit voller Rate gelesen.
+
+        Args:
+            rates: {Parametercode: Rate in Hz}, 0 oder None für volle Rate
+        """
+        with self._lock:
+            self._rates = {code: float(rate) for code, rate in (rates or {}).items() if rate}
+            for code, channel in self._channels.items():
+                channel.period = self._period(code)
+                channel.next_due = 0.0
+
+    def get_rate(self, code):
+        """Abtastrate eines Kanals in Hz (0 = volle Rate)."""
+        return self._rates.get(code, FULL_RATE)
+
+    def _period(self, code):
+        rate = self._rates.get(code)
+        return 1.0 / rate if rate and rate > 0 else 0.0
+
+    def next_cycle(self, now):
+        """
+        Plant den nächsten Buszyklus und verbucht die ausgewählten Kanäle als gelesen.
+
+        Args:
+            now: Aktuelle Zeit in Sekunden (time.perf_counter oder time.time)
+
+        Returns:
+            list: ReadBlock-Liste; leer, wenn in diesem Zyklus nichts fällig ist
+        """
+        with self._lock:
+            fast = [c for c in self._channels.values() if c.period == 0.0]
+            # Am längsten überfällige Kanäle zuerst
+            slow = sorted((c for c in self._channels.values() if 0.0 < c.period and c.next_due <= now),
+                          key=lambda c: c.next_due)
+            selected = list(fast)
+            base_requests = len(plan_blocks([c.item for c in fast], max_gap=self.max_gap)) if fast else 0
+            budget = base_requests + self.max_extra_requests
+            for channel in slow:
+                candidate = selected + [channel]
+                if len(plan_blocks([c.item for c in candidate], max_gap=self.max_gap)) <= budget:
+                    selected = candidate
+            for channel in selected:
+                channel.reads += 1
+                if channel.period:
+                    # Fester Takt; nach längerer Pause (z.B. Timeout) nicht nachholen
+                    channel.next_due += channel.period
+                    if channel.next_due <= now:
+                        channel.next_due = now + channel.period
+            return plan_blocks([c.item for c in selected], max_gap=self.max_gap) if selected else []
+
+    def get_statistics(self):
+        """
+        Returns:
+            dict: {Parametercode: Anzahl der Lesevorgänge}
+        """
+        with self._lock:
+            return {code: channel.reads for code, channel in self._channels.items()}
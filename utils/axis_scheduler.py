@@ -0,0 +1,74 @@
+"""
+Verteilung der Busbandbreite auf mehrere Antriebe an einer RS-485-Leitung.
+
+Die Achsen werden reihum abgefragt. Jede Achse bekommt denselben Anteil an
+Buszeit: abgefragt wird immer die Achse mit der bisher geringsten Buszeit, so
+dass eine Achse mit aufwendigerem Abfrageplan (mehr Register, langsamere
+Antwort) die übrigen nicht verdrängt.
+"""
+
+import threading
+
+
+class FairAxisScheduler:
+    """Wählt die nächste abzufragende Achse nach belegter Buszeit aus."""
+
+    def __init__(self, slave_ids=None):
+        """
+        Args:
+            slave_ids: Liste der Slave-IDs in Abfragereihenfolge
+        """
+        self._lock = threading.Lock()
+        self.set_slave_ids(slave_ids or [])
+
+    def set_slave_ids(self, slave_ids):
+        """Setzt die Achsenliste neu und verwirft die bisherige Buszeit."""
+        with self._lock:
+            self.slave_ids = [int(s) for s in slave_ids]
+            self._bus_time = {slave_id: 0.0 for slave_id in self.slave_ids}
+            self._cycles = {slave_id: 0 for slave_id in self.slave_ids}
+            self._next_index = 0
+
+    def next_slave(self):
+        """
+        Liefert die Slave-ID der nächsten Abfrage.
+
+        Returns:
+            int oder None: Slave-ID, None ohne Achsen
+        """
+        with self._lock:
+            if not self.slave_ids:
+                return None
+            count = len(self.slave_ids)
+            # Reihum ab der nächsten Achse suchen, damit Gleichstände fair aufgelöst werden
+            order = [self.slave_ids[(self._next_index + i) % count] for i in range(count)]
+            slave_id = min(order, key=lambda s: self._bus_time[s])
+            self._next_index = (self.slave_ids.index(slave_id) + 1) % count
+            return slave_id
+
+    def record(self, slave_id, bus_time):
+        """
+        Verbucht die Buszeit einer Abfrage.
+
+        Args:
+            slave_id: Abgefragte Achse
+            bus_time: Dauer der Abfrage in Sekunden
+        """
+        with self._lock:
+            if slave_id not in self._bus_time:
+                return
+            self._bus_time[slave_id] += max(0.0, bus_time)
+            self._cycles[slave_id] += 1
+            # Gemeinsamen Sockel abziehen, damit die Summen nicht unbegrenzt wachsen
+            floor = min(self._bus_time.values())
+            if floor > 1.0:
+                for key in self._bus_time:
+                    self._bus_time[key] -= floor
+
+    def get_statistics(self):
+        """
+        Returns:
+            dict: {slave_id: Anzahl der Abfragezyklen}
+        """
+        with self._lock:
+            return dict(self._cycles)
@@ -0,0 +1,286 @@
+"""
+Automatische Erkennung der seriellen Schnittstellenparameter des Antriebs und
+Auswahl der schnellsten stabilen Baudrate.
+
+Die Suche probiert Baudrate, Parität und Stoppbits durch und liest dabei die
+Achsadresse (P0C-00). Die Optimierung stellt die Baudrate des Antriebs (P0C-02)
+schrittweise höher, prüft jede Stufe mit einem Dauertest aus Blocklesezugriffen
+und bleibt bei der schnellsten Stufe ohne Fehler.
+"""
+
+import time
+
+from modbus_client import ServoModbusClient
+from custom_exceptions import (
+    ServoToolException,
+    ModbusConnectionException,
+    OperationCancelledException
+)
+from logger_config import logger
+
+# P0C-00: Achsadresse, P0C-02: Baudrate
+AXIS_ADDRESS_REGISTER = 3072
+BAUD_RATE_REGISTER = 3074
+
+# P0C-02-Auswahlwert je Baudrate
+BAUD_RATE_CODES = {
+    2400: 0,
+    4800: 1,
+    9600: 2,
+    19200: 3,
+    38400: 4,
+    57600: 5,
+    115200: 6,
+}
+
+# Reihenfolge der Suche: übliche Einstellungen zuerst
+DEFAULT_SEARCH_BAUDRATES = [19200, 9600, 57600, 115200, 38400, 4800, 2400]
+DEFAULT_SEARCH_FRAMINGS = [('E', 2), ('E', 1), ('N', 2), ('N', 1), ('O', 2), ('O', 1)]
+
+# Dauertest: P0B-00 ff. (Überwachungsgruppe) als Block lesen
+SOAK_TEST_ADDRESS = 2816
+SOAK_TEST_BLOCK_SIZE = 16
+
+
+def _open_client(port, settings, slave_id, timeout):
+    """Öffnet eine Verbindung mit festem Timeout für Suchzwecke."""
+    client = ServoModbusClient(default_timeout=timeout, read_timeout=max(timeout * 4, 0.5),
+                               adaptive_timeout=False)
+    client.connect(port=port, slave_id=slave_id, bytesize=8, **settings)
+    # Bei der Suche keine Wiederholungen - ein Fehlversuch reicht als Antwort
+    if hasattr(client.client, 'retries'):
+        client.client.retries = 0
+    return client
+
+
+def probe(port, baudrate, parity, stopbits, slave_id=1, timeout=0.1):
+    """
+    Prüft, ob der Antrieb mit den angegebenen Parametern antwortet.
+
+    Args:
+        port: Serieller Port
+        baudrate, parity, stopbits: Zu prüfende Schnittstellenparameter
+        slave_id: Modbus-Adresse des Antriebs
+        timeout: Wartezeit auf eine Antwort in Sekunden
+
+    Returns:
+        bool: True, wenn eine gültige Antwort empfangen wurde
+    """
+    settings = {'baudrate': baudrate, 'parity': parity, 'stopbits': stopbits}
+    client = None
+    try:
+        client = _open_client(port, settings, slave_id, timeout)
+        client.read_holding_register(AXIS_ADDRESS_REGISTER)
+        return True
+    except ModbusConnectionException:
+        # Port selbst nicht verfügbar - weitere Versuche sind sinnlos
+        raise
+    except ServoToolException:
+        return False
+    finally:
+        if client is not None:
+            client.disconnect()
+
+
+def discover(port, slave_id=1, baudrates=None, framings=None, timeout=0.1,
+             progress_callback=None, is_cancelled=None):
+    """
+    Sucht die Schnittstellenparameter, mit denen der Antrieb antwortet.
+
+    Args:
+        port: Serieller Port
+        slave_id: Modbus-Adresse des Antriebs
+        baudrates: Zu prüfende Baudraten in Suchreihenfolge
+        framings: Zu prüfende (Parität, Stoppbits)-Paare in Suchreihenfolge
+        timeout: Wartezeit je Versuch in Sekunden
+        progress_callback: Optionaler Aufruf mit (aktuell, gesamt, Beschreibung)
+        is_cancelled: Optionaler Aufruf, der True liefert, wenn abgebrochen werden soll
+
+    Returns:
+        dict oder None: {'baudrate', 'parity', 'stopbits'} oder None, wenn nichts gefunden wurde
+    """
+    baudrates = baudrates or DEFAULT_SEARCH_BAUDRATES
+    framings = framings or DEFAULT_SEARCH_FRAMINGS
+    combinations = [(b, p, s) for b in baudrates for p, s in framings]
+
+    for index, (baudrate, parity, stopbits) in enumerate(combinations, start=1):
+        if is_cancelled and is_cancelled():
+            raise OperationCancelledException("Suche abgebrochen")
+        if progress_callback:
+            progress_callback(index, len(combinations), f"{baudrate} {parity} {stopbits}")
+        if probe(port, baudrate, parity, stopbits, slave_id, timeout):
+            logger.info(f"Antrieb gefunden: {baudrate} Baud, Parität {parity}, {stopbits} Stoppbits")
+            return {'baudrate': baudrate, 'parity': parity, 'stopbits': stopbits}
+    return None
+
+
+def soak_test(client, reads=200, address=SOAK_TEST_ADDRESS, block_size=SOAK_TEST_BLOCK_SIZE,
+              is_cancelled=None):
+    """
+    Dauertest: liest wiederholt einen Registerblock und zählt Fehler.
+
+    Args:
+        client: Verbundener ServoModbusClient
+        reads: Anzahl der Blocklesezugriffe
+        address: Startadresse des Blocks
+        block_size: Anzahl der Register je Zugriff
+        is_cancelled: Optionaler Abbruch-Aufruf
+
+    Returns:
+        dict: {'reads', 'errors', 'duration', 'registers_per_second', 'passed'}
+    """
+    errors = 0
+    start = time.perf_counter()
+    for _ in range(reads):
+        if is_cancelled and is_cancelled():
+            raise OperationCancelledException("Dauertest abgebrochen")
+        try:
+            client.read_holding_register(address, count=block_size)
+        except ServoToolException:
+            errors += 1
+    duration = time.perf_counter() - start
+    good_registers = (reads - errors) * block_size
+    return {
+        'reads': reads,
+        'errors': errors,
+        'duration': duration,
+        'registers_per_second': good_registers / duration if duration > 0 else 0.0,
+        'passed': errors == 0,
+    }
+
+
+def _switch_baudrate(port, settings, slave_id, new_baudrate, timeout):
+    """
+    Schreibt P0C-02 und prüft, ob der Antrieb unter der neuen Baudrate antwortet.
+
+    Returns:
+        bool: True, wenn der Antrieb mit der neuen Baudrate antwortet
+    """
+    client = _open_client(port, settings, slave_id, timeout)
+    try:
+        client.write_holding_register(BAUD_RATE_REGISTER, BAUD_RATE_CODES[new_baudrate])
+    except ServoToolException:
+        # Manche Antriebe schalten sofort um und antworten bereits mit der neuen Baudrate
+        pass
+    finally:
+        client.disconnect()
+    # Antrieb Zeit zum Umschalten geben
+    time.sleep(0.1)
+    return probe(port, new_baudrate, settings['parity'], settings['stopbits'], slave_id, timeout)
+
+
+def _write_baudrate_code(port, settings, slave_id, timeout):
+    """
+    Schreibt den P0C-02-Wert der Baudrate aus settings, ohne umzuschalten.
+
+    Raises:
+        ServoToolException: Wenn der Antrieb den Wert nicht übernimmt
+    """
+    client = _open_client(port, settings, slave_id, timeout)
+    try:
+        client.write_holding_register(BAUD_RATE_REGISTER, BAUD_RATE_CODES[settings['baudrate']])
+    except ServoToolException as e:
+        raise ServoToolException(
+            f"P0C-02 konnte nicht auf {settings['baudrate']} Baud zurückgesetzt werden: {e}"
+        )
+    finally:
+        client.disconnect()
+
+
+def find_fastest_stable_baudrate(port, settings, slave_id=1, soak_reads=200, timeout=0.2,
+                                 candidates=None, progress_callback=None, is_cancelled=None):
+    """
+    Erhöht die Baudrate des Antriebs stufenweise, solange der Dauertest fehlerfrei bleibt.
+
+    Der Antrieb bleibt am Ende auf der schnellsten bestandenen Baudrate. Schlägt eine Stufe
+    fehl, wird auf die zuletzt bestandene Baudrate zurückgeschaltet.
+
+    Args:
+        port: Serieller Port
+        settings: Aktuelle Parameter {'baudrate', 'parity', 'stopbits'}
+        slave_id: Modbus-Adresse des Antriebs
+        soak_reads: Anzahl der Blocklesezugriffe je Stufe
+        timeout: Wartezeit je Anfrage in Sekunden
+        candidates: Zu prüfende Baudraten (Standard: alle über der aktuellen)
+        progress_callback: Optionaler Aufruf mit (Beschreibung)
+        is_cancelled: Optionaler Abbruch-Aufruf
+
+    Returns:
+        dict: {'settings', 'baseline', 'best', 'results', 'gain'}
+
+    Raises:
+        ServoToolException: Wenn der Antrieb bei keiner Baudrate mehr antwortet oder P0C-02
+                            nicht auf die zuletzt bestandene Baudrate zurückgesetzt werden kann
+    """
+    def report(message):
+        logger.info(message)
+        if progress_callback:
+            progress_callback(message)
+
+    current = dict(settings)
+    if candidates is None:
+        candidates = sorted(b for b in BAUD_RATE_CODES if b > current['baudrate'])
+
+    client = _open_client(port, current, slave_id, timeout)
+    try:
+        report(f"Dauertest bei {current['baudrate']} Baud...")
+        baseline = soak_test(client, soak_reads, is_cancelled=is_cancelled)
+    finally:
+        client.disconnect()
+    if not baseline['passed']:
+        raise ServoToolException(
+            f"Dauertest bei der aktuellen Baudrate fehlgeschlagen ({baseline['errors']} Fehler)"
+        )
+
+    best = baseline
+    best_settings = dict(current)
+    results = {current['baudrate']: baseline}
+
+    for baudrate in candidates:
+        if is_cancelled and is_cancelled():
+            break
+        report(f"Umschalten auf {baudrate} Baud...")
+        if not _switch_baudrate(port, best_settings, slave_id, baudrate, timeout):
+            if not probe(port, best_settings['baudrate'], best_settings['parity'],
+                         best_settings['stopbits'], slave_id, timeout):
+                raise ServoToolException(
+                    f"Keine Antwort bei {baudrate} Baud und bei {best_settings['baudrate']} Baud"
+                )
+            # P0C-02 steht schon auf der ungeprüften Baudrate und würde beim nächsten
+            # Einschalten gelten - zurück auf die zuletzt bestandene
+            report("Antrieb übernimmt die Baudrate nicht sofort - Optimierung beendet")
+            _write_baudrate_code(port, best_settings, slave_id, timeout)
+            break
+
+        trial_settings = dict(best_settings, baudrate=baudrate)
+        client = _open_client(port, trial_settings, slave_id, timeout)
+        try:
+            report(f"Dauertest bei {baudrate} Baud...")
+            result = soak_test(client, soak_reads, is_cancelled=is_cancelled)
+        except OperationCancelledException:
+            result = {'passed': False, 'errors': None}
+        finally:
+            client.disconnect()
+        results[baudrate] = result
+
+        if result['passed']:
+            best = result
+            best_settings = trial_settings
+            continue
+
+        report(f"Dauertest bei {baudrate} Baud fehlgeschlagen - zurück auf {best_settings['baudrate']} Baud")
+        if not _switch_baudrate(port, trial_settings, slave_id, best_settings['baudrate'], timeout):
+            raise ServoToolException(
+                f"Antrieb antwortet nach Rückschalten nicht mehr bei {best_settings['baudrate']} Baud"
+            )
+        break
+
+    gain = best['registers_per_second'] / baseline['registers_per_second'] \
+        if baseline['registers_per_second'] > 0 else None
+    return {
+        'settings': best_settings,
+        'baseline': baseline,
+        'best': best,
+        'results': results,
+        'gain': gain,
+    }
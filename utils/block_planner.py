@@ -0,0 +1,155 @@
+"""
+Zusammenfassen einzelner Parameter zu Blocklesezugriffen.
+
+Statt jeden Parameter mit einer eigenen Anfrage zu lesen, werden benachbarte
+Registeradressen zu Blöcken von höchstens 125 Registern (Grenze von Modbus
+Funktionscode 3) zusammengefasst. Kleine Lücken zwischen Parametern werden
+mitgelesen, wenn das billiger ist als eine weitere Anfrage. Blöcke überschreiten
+nie eine Parametergruppe (oberes Byte der Adresse), da der Antrieb zwischen den
+Gruppen keine lesbaren Register hat.
+"""
+
+# Maximale Registeranzahl einer Leseanfrage (Modbus FC 3)
+MAX_BLOCK_REGISTERS = 125
+
+# Maximal mitgelesene Lücke zwischen zwei Parametern in Registern
+DEFAULT_MAX_GAP = 4
+
+
+def parse_number_type(number_type):
+    """
+    Ermittelt Registerbreite und Vorzeichen aus dem number_type der Parameterdefinition.
+
+    Args:
+        number_type: z.B. 'signed_integer_32bit', 'unsigned_integer_16bit' oder None
+
+    Returns:
+        tuple: (Anzahl der Register, vorzeichenbehaftet)
+    """
+    number_type = (number_type or '').lower()
+    width = 2 if '32bit' in number_type else 1
+    is_signed = number_type.startswith('signed')
+    return width, is_signed
+
+
+class BlockItem:
+    """Ein Parameter innerhalb eines Leseblocks."""
+
+    __slots__ = ('code', 'address', 'width', 'is_signed')
+
+    def __init__(self, code, address, width=1, is_signed=False):
+        self.code = code
+        self.address = address
+        self.width = width
+        self.is_signed = is_signed
+
+
+class ReadBlock:
+    """Zusammenhängender Registerbereich mit den darin enthaltenen Parametern."""
+
+    def __init__(self, start, count, items):
+        self.start = start
+        self.count = count
+        self.items = items
+
+    def __repr__(self):
+        return f"ReadBlock(start={self.start}, count={self.count}, items={len(self.items)})"
+
+    def decode(self, registers):
+        """
+        Wandelt die gelesenen Register in Parameterwerte um.
+
+        32- und 64-Bit-Werte: Big-Endian-Bytes, niederwertiges Wort zuerst.
+
+        Args:
+            registers: Liste der Registerwerte ab self.start
+
+        Returns:
+            dict: {Parametercode: Wert}
+        """
+        values = {}
+        for item in self.items:
+            offset = item.address - self.start
+            if item.width == 1:
+                value = registers[offset]
+            else:
+                value = 0
+                for word in range(item.width):
+                    value |= registers[offset + word] << (16 * word)
+                if item.is_signed and value >> (16 * item.width - 1):
+                    value -= 1 << (16 * item.width)
+            values[item.code] = value
+        return values
+
+    def split(self):
+        """
+        Teilt den Block in zwei Hälften, z.B. wenn der Antrieb den ganzen Block ablehnt.
+
+        Returns:
+            list: Zwei Teilblöcke oder leere Liste bei nur einem Parameter
+        """
+        if len(self.items) < 2:
+            return []
+        middle = len(self.items) // 2
+        return [_block_from_items(self.items[:middle]), _block_from_items(self.items[middle:])]
+
+
+def _block_from_items(items):
+    start = items[0].address
+    end = max(item.address + item.width for item in items)
+    return ReadBlock(start, end - start, list(items))
+
+
+def items_from_parameters(parameters):
+    """
+    Erzeugt Blockeinträge aus Parameterdefinitionen (Rohdaten aus der JSON-Datei).
+
+    Args:
+        parameters: Liste von Dicts mit 'code', 'decimal' und 'validation'
+
+    Returns:
+        list: BlockItem-Liste, Parameter ohne gültige Adresse werden übersprungen
+    """
+    items = []
+    for param in parameters:
+        try:
+            address = int(param.get('decimal'))
+        except (TypeError, ValueError):
+            continue
+        validation = param.get('validation') or {}
+        width, is_signed = parse_number_type(validation.get('number_type'))
+        items.append(BlockItem(param.get('code'), address, width, is_signed))
+    return items
+
+
+def plan_blocks(items, max_registers=MAX_BLOCK_REGISTERS, max_gap=DEFAULT_MAX_GAP):
+    """
+    Fasst Parameter zu möglichst wenigen Leseblöcken zusammen.
+
+    Args:
+        items: BlockItem-Liste
+        max_registers: Maximale Registeranzahl je Block
+        max_gap: Maximale Lücke in Registern, die innerhalb eines Blocks mitgelesen wird
+
+    Returns:
+        list: ReadBlock-Liste in aufsteigender Adressreihenfolge
+    """
+    blocks = []
+    current = []
+    current_end = None
+    for item in sorted(items, key=lambda i: i.address):
+        if current:
+            start = current[0].address
+            same_group = (item.address >> 8) == (start >> 8)
+            gap = item.address - current_end
+            fits = item.address + item.width - start <= max_registers
+            if same_group and 0 <= gap <= max_gap and fits:
+                current.append(item)
+                current_end = max(current_end, item.address + item.width)
+                continue
+            blocks.append(_block_from_items(current))
+        current = [item]
+        current_end = item.address + item.width
+    if current:
+        blocks.append(_block_from_items(current))
+    return blocks
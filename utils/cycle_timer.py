@@ -0,0 +1,140 @@
+"""
+Fester Abtasttakt für die Plot-Erfassung.
+
+Die Abtastzeitpunkte liegen auf einem festen Raster (Start + n * Periode,
+time.perf_counter). Vor jedem Buszyklus wird bis zum nächsten Rasterpunkt
+gewartet: grob mit time.sleep, die letzte Strecke aktiv, da sleep je nach
+Betriebssystem mehrere Millisekunden zu spät zurückkehren kann. Die Termine
+werden nicht relativ zum Ende des letzten Zyklus berechnet, Latenzschwankungen
+des Busses verschieben das Raster daher nicht.
+
+Dauert ein Zyklus länger als die Periode (Überlauf), werden die verpassten
+Rasterpunkte übersprungen und gezählt; der nächste Zyklus beginnt wieder auf dem
+Raster. Periode 0 bedeutet: so schnell wie der Bus erlaubt, ohne Raster.
+"""
+
+import threading
+import time
+
+# Restzeit vor einem Termin, die aktiv statt mit time.sleep gewartet wird (s)
+SPIN_TIME = 0.002
+
+
+class CycleTimer:
+    """Wartet auf die Termine eines festen Abtastrasters und erkennt Überläufe."""
+
+    def __init__(self, period=0.0, clock=time.perf_counter, sleep=time.sleep):
+        """
+        Args:
+            period: Abtastperiode in Sekunden (0 = ohne festen Takt)
+            clock: Zeitquelle in Sekunden
+            sleep: Wartefunktion in Sekunden
+        """
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.period = max(0.0, float(period))
+        self.reset()
+
+    def set_period(self, period):
+        """Setzt die Abtastperiode in Sekunden; das Raster beginnt neu"""
+        with self._lock:
+            self.period = max(0.0, float(period))
+        self.reset()
+
+    def reset(self):
+        """Beginnt ein neues Raster beim nächsten Zyklus (z.B. nach Fehlern oder Pausen) und verwirft die Statistik"""
+        with self._lock:
+            self._deadline = None
+            self.cycles = 0
+            self.overruns = 0
+            self.missed = 0
+            self.max_cycle_time = 0.0
+            self.last_cycle_time = 0.0
+            self.max_lateness = 0.0
+            self._lateness_total = 0.0
+            self._cycle_start = None
+
+    def resync(self):
+        """Setzt das Raster beim nächsten Zyklus neu auf, ohne die Statistik zu verwerfen"""
+        with self._lock:
+            self._deadline = None
+
+    def remaining(self):
+        """Zeit bis zum nächsten Termin in Sekunden (0, wenn der Zyklus sofort beginnen kann)"""
+        with self._lock:
+            if self._deadline is None or self.period <= 0.0:
+                return 0.0
+            return max(0.0, self._deadline - self._clock())
+
+    def wait(self):
+        """
+        Wartet bis zum nächsten Abtasttermin.
+
+        Returns:
+            float: Termin des Zyklus (Zeitbasis der clock); ohne festen Takt der aktuelle Zeitpunkt
+        """
+        now = self._clock()
+        with self._lock:
+            period = self.period
+            if self._deadline is None or period <= 0.0:
+                self._deadline = now
+            deadline = self._deadline
+        remaining = deadline - now
+        if remaining > SPIN_TIME:
+            self._sleep(remaining - SPIN_TIME)
+        while self._clock() < deadline:
+            # sleep(0) gibt den Prozessor (und den GIL) für andere Threads frei
+            self._sleep(0)
+        start = self._clock()
+        with self._lock:
+            lateness = start - deadline
+            self._lateness_total += lateness
+            if lateness > self.max_lateness:
+                self.max_lateness = lateness
+            self._cycle_start = start
+        return deadline
+
+    def complete(self):
+        """
+        Schließt einen Zyklus ab und legt den nächsten Termin fest.
+
+        Returns:
+            int: Anzahl der übersprungenen Rasterpunkte (0 = kein Überlauf)
+        """
+        now = self._clock()
+        with self._lock:
+            self.cycles += 1
+            if self._cycle_start is not None:
+                cycle_time = now - self._cycle_start
+                self.last_cycle_time = cycle_time
+                if cycle_time > self.max_cycle_time:
+                    self.max_cycle_time = cycle_time
+            if self._deadline is None or self.period <= 0.0:
+                return 0
+            next_deadline = self._deadline + self.period
+            if now <= next_deadline:
+                self._deadline = next_deadline
+                return 0
+            # Überlauf: auf den nächsten Rasterpunkt nach jetzt springen
+            skipped = int((now - next_deadline) // self.period) + 1
+            self._deadline = next_deadline + skipped * self.period
+            self.overruns += 1
+            self.missed += skipped
+            return skipped
+
+    def get_statistics(self):
+        """
+        Returns:
+            dict: {'period', 'cycles', 'overruns', 'missed', 'max_cycle_time', 'max_lateness', 'mean_lateness'}
+        """
+        with self._lock:
+            return {
+                'period': self.period,
+                'cycles': self.cycles,
+                'overruns': self.overruns,
+                'missed': self.missed,
+                'max_cycle_time': self.max_cycle_time,
+                'max_lateness': self.max_lateness,
+                'mean_lateness': self._lateness_total / self.cycles if self.cycles else 0.0,
+            }
@@ -0,0 +1,308 @@
+"""
+Paralleles Sichern mehrerer Antriebe an mehreren seriellen Ports.
+
+Für jeden seriellen Port läuft ein eigener Prozess, der alle Antriebe an diesem
+Port nacheinander mit Blocklesezugriffen ausliest. Die Gesamtdauer wird damit vom
+langsamsten Port bestimmt und nicht von der Summe aller Ports. Die Ergebnisse
+werden in einem ZIP-Archiv mit Index gespeichert; jede Antriebsdatei hat dasselbe
+Format wie der Einzelexport und kann wie dieser importiert werden.
+
+Format der Flottendatei (JSON)::
+
+    [
+        {"port": "COM3", "baudrate": 19200, "parity": "E", "stopbits": 2, "slave_ids": [1, 2]},
+        {"port": "COM4", "baudrate": 57600, "parity": "N", "stopbits": 1, "slave_ids": [1]}
+    ]
+"""
+
+import json
+import multiprocessing
+import queue
+import re
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from modbus_client import ServoModbusClient, parse_slave_ids
+from custom_exceptions import (
+    ServoToolException,
+    ModbusConnectionException,
+    ModbusTimeoutException,
+    ConfigurationException,
+    FileOperationException
+)
+from logger_config import logger
+from utils.block_planner import items_from_parameters, plan_blocks
+
+ARCHIVE_INDEX_NAME = "index.json"
+ARCHIVE_FORMAT_VERSION = 1
+
+# Fehlgeschlagene Anfragen ohne jede Antwort, nach denen ein Antrieb als nicht erreichbar gilt
+MAX_INITIAL_FAILURES = 3
+
+
+def load_fleet_file(file_path):
+    """
+    Liest und prüft eine Flottendatei.
+
+    Args:
+        file_path: Pfad zur JSON-Datei
+
+    Returns:
+        list: Aufträge je Port mit 'port', 'baudrate', 'bytesize', 'parity', 'stopbits', 'slave_ids'
+
+    Raises:
+        ConfigurationException: Bei ungültigem Inhalt
+        FileOperationException: Wenn die Datei nicht gelesen werden kann
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise FileOperationException(f"Flottendatei konnte nicht gelesen werden: {e}")
+
+    if not isinstance(entries, list) or not entries:
+        raise ConfigurationException("Flottendatei muss eine nicht-leere Liste von Ports enthalten")
+    return merge_jobs_by_port(entries)
+
+
+def merge_jobs_by_port(entries):
+    """
+    Fasst Einträge mit demselben Port zu einem Auftrag zusammen (ein Prozess je Port).
+
+    Raises:
+        ConfigurationException: Bei fehlenden Angaben oder widersprüchlichen Einstellungen
+    """
+    jobs = {}
+    for entry in entries:
+        try:
+            job = {
+                'port': str(entry['port']),
+                'baudrate': int(entry.get('baudrate', 19200)),
+                'bytesize': int(entry.get('bytesize', 8)),
+                'parity': str(entry.get('parity', 'E')).upper(),
+                'stopbits': int(entry.get('stopbits', 2)),
+                'slave_ids': parse_slave_ids(
+                    ','.join(str(s) for s in entry['slave_ids'])
+                    if isinstance(entry.get('slave_ids'), list) else entry.get('slave_ids', 1)
+                ),
+            }
+        except (KeyError, TypeError, ValueError) as e:
+            raise ConfigurationException(f"Ungültiger Eintrag in der Flottendatei {entry}: {e}")
+
+        existing = jobs.get(job['port'])
+        if existing is None:
+            jobs[job['port']] = job
+            continue
+        settings = ('baudrate', 'bytesize', 'parity', 'stopbits')
+        if any(existing[key] != job[key] for key in settings):
+            raise ConfigurationException(f"Widersprüchliche Schnittstellenparameter für Port {job['port']}")
+        existing['slave_ids'].extend(s for s in job['slave_ids'] if s not in existing['slave_ids'])
+    return list(jobs.values())
+
+
+def read_parameters_blockwise(client, blocks, slave=None):
+    """
+    Liest alle Parameter eines Antriebs mit Blocklesezugriffen.
+
+    Lehnt der Antrieb einen Block ab, wird er halbiert und erneut gelesen, bis
+    einzelne nicht lesbare Parameter übrig bleiben. Blöcke ohne Antwort werden
+    nicht wiederholt, ihre Parameter gelten als nicht lesbar.
+
+    Args:
+        client: Verbundener ServoModbusClient
+        blocks: ReadBlock-Liste aus plan_blocks
+        slave: Slave-ID des Antriebs
+
+    Returns:
+        tuple: ({Parametercode: Rohwert}, [nicht lesbare Codes], Anzahl der Anfragen)
+
+    Raises:
+        ModbusConnectionException: Bei Verbindungsverlust
+        ModbusTimeoutException: Wenn der Antrieb auf die ersten Anfragen nicht antwortet
+    """
+    values = {}
+    errors = []
+    requests = 0
+    timeouts = 0
+    pending = list(blocks)
+    while pending:
+        block = pending.pop(0)
+        requests += 1
+        try:
+            registers = client.read_holding_register(block.start, count=block.count, slave=slave)
+            values.update(block.decode(registers))
+        except ModbusConnectionException:
+            raise
+        except ModbusTimeoutException:
+            timeouts += 1
+            if not values and timeouts >= MAX_INITIAL_FAILURES:
+                raise ModbusTimeoutException(f"Antrieb {slave} antwortet nicht")
+            errors.extend(item.code for item in block.items)
+        except ServoToolException:
+            # Der Antrieb lehnt den Block ab (z.B. nicht lesbare Adresse darin)
+            parts = block.split()
+            if parts:
+                pending[0:0] = parts
+            else:
+                errors.extend(item.code for item in block.items)
+    return values, errors, requests
+
+
+def backup_port(job, parameters, progress_queue=None):
+    """
+    Sichert alle Antriebe an einem seriellen Port. Läuft in einem eigenen Prozess.
+
+    Args:
+        job: Auftrag aus load_fleet_file
+        parameters: Parameterdefinitionen (Rohdaten)
+        progress_queue: Optionale Queue für Fortschrittsmeldungen (Port, Slave-ID, Text)
+
+    Returns:
+        dict: {'port', 'settings', 'drives', 'duration', 'error'}
+    """
+    def report(slave_id, message):
+        if progress_queue is not None:
+            progress_queue.put((job['port'], slave_id, message))
+
+    start = time.perf_counter()
+    settings = {key: job[key] for key in ('baudrate', 'bytesize', 'parity', 'stopbits')}
+    result = {'port': job['port'], 'settings': settings, 'drives': [], 'duration': 0.0, 'error': None}
+    blocks = plan_blocks(items_from_parameters(parameters))
+
+    client = ServoModbusClient()
+    try:
+        client.connect(port=job['port'], slave_id=job['slave_ids'][0], slave_ids=job['slave_ids'], **settings)
+        for slave_id in job['slave_ids']:
+            report(slave_id, "Lese Parameter...")
+            drive_start = time.perf_counter()
+            try:
+                values, errors, requests = read_parameters_blockwise(client, blocks, slave=slave_id)
+                error = None
+                report(slave_id, f"{len(values)} Parameter in {requests} Anfragen gelesen")
+            except ModbusTimeoutException as e:
+                # Nicht erreichbarer Antrieb - mit dem nächsten am selben Port weitermachen
+                values, errors, requests, error = {}, [], MAX_INITIAL_FAILURES, str(e)
+                report(slave_id, f"Fehler: {e}")
+            result['drives'].append({
+                'slave_id': slave_id,
+                'values': values,
+                'errors': errors,
+                'requests': requests,
+                'duration': time.perf_counter() - drive_start,
+                'error': error,
+            })
+    except ServoToolException as e:
+        result['error'] = str(e)
+        report(None, f"Fehler: {e}")
+    finally:
+        client.disconnect()
+    result['duration'] = time.perf_counter() - start
+    return result
+
+
+def _drive_file_name(port, slave_id):
+    safe_port = re.sub(r'[^A-Za-z0-9]+', '_', port).strip('_') or 'port'
+    return f"drives/{safe_port}_slave{slave_id}.json"
+
+
+def write_fleet_archive(archive_path, port_results, total_duration=None):
+    """
+    Schreibt die Ergebnisse aller Ports in ein ZIP-Archiv mit Index.
+
+    Args:
+        archive_path: Zielpfad des Archivs
+        port_results: Ergebnisse von backup_port
+        total_duration: Gesamtdauer in Sekunden
+
+    Returns:
+        dict: Inhalt des Index
+
+    Raises:
+        FileOperationException: Wenn das Archiv nicht geschrieben werden kann
+    """
+    index = {
+        'format_version': ARCHIVE_FORMAT_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'total_duration': total_duration,
+        'ports': [],
+        'drives': [],
+    }
+    try:
+        with zipfile.ZipFile(archive_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for port_result in port_results:
+                index['ports'].append({
+                    'port': port_result['port'],
+                    'settings': port_result['settings'],
+                    'duration': port_result['duration'],
+                    'error': port_result['error'],
+                })
+                for drive in port_result['drives']:
+                    entry = {
+                        'port': port_result['port'],
+                        'slave_id': drive['slave_id'],
+                        'settings': port_result['settings'],
+                        'parameter_count': len(drive['values']),
+                        'unreadable': drive['errors'],
+                        'requests': drive['requests'],
+                        'duration': drive['duration'],
+                        'error': drive['error'],
+                        'file': None,
+                    }
+                    if drive['values']:
+                        entry['file'] = _drive_file_name(port_result['port'], drive['slave_id'])
+                        archive.writestr(entry['file'], json.dumps(drive['values'], indent=4))
+                    index['drives'].append(entry)
+            archive.writestr(ARCHIVE_INDEX_NAME, json.dumps(index, indent=4))
+    except OSError as e:
+        raise FileOperationException(f"Archiv konnte nicht geschrieben werden: {e}")
+    return index
+
+
+def run_fleet_backup(jobs, parameters, archive_path, progress_callback=None, max_workers=None):
+    """
+    Sichert alle Antriebe der Flotte parallel, ein Prozess je seriellem Port.
+
+    Args:
+        jobs: Aufträge je Port (siehe load_fleet_file)
+        parameters: Parameterdefinitionen (Rohdaten)
+        archive_path: Zielpfad des ZIP-Archivs
+        progress_callback: Optionaler Aufruf mit einer Fortschrittsmeldung (str)
+        max_workers: Maximale Anzahl paralleler Prozesse (Standard: ein Prozess je Port)
+
+    Returns:
+        dict: Index des geschriebenen Archivs
+    """
+    start = time.perf_counter()
+    results = []
+    # spawn statt fork: ein geforkter Qt-Prozess mit laufenden Threads ist nicht sicher
+    context = multiprocessing.get_context('spawn')
+    with context.Manager() as manager:
+        progress_queue = manager.Queue()
+        with ProcessPoolExecutor(max_workers=max_workers or len(jobs), mp_context=context) as executor:
+            futures = {executor.submit(backup_port, job, parameters, progress_queue): job for job in jobs}
+            pending = set(futures)
+            while pending:
+                try:
+                    port, slave_id, message = progress_queue.get(timeout=0.2)
+                    if progress_callback:
+                        slave_text = f" / Slave {slave_id}" if slave_id is not None else ""
+                        progress_callback(f"{port}{slave_text}: {message}")
+                except queue.Empty:
+                    pass
+                for future in [f for f in pending if f.done()]:
+                    pending.discard(future)
+                    job = futures[future]
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        logger.error(f"Sicherung von Port {job['port']} fehlgeschlagen: {e}")
+                        results.append({'port': job['port'], 'settings': {}, 'drives': [],
+                                        'duration': 0.0, 'error': str(e)})
+
+    results.sort(key=lambda r: r['port'])
+    total_duration = time.perf_counter() - start
+    index = write_fleet_archive(archive_path, results, total_duration)
+    logger.info(f"Flotten-Sicherung: {len(index['drives'])} Antriebe an {len(results)} Ports in {total_duration:.1f}s")
+    return index
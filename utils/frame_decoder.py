@@ -0,0 +1,187 @@
+"""
+Dekodierung und Prüfung eines ganzen Abfragezyklus mit NumPy.
+
+Statt jeden Kanal einzeln umzurechnen (Zweierkomplement, Skalierung,
+Bereichsprüfung mit Python-Verzweigungen je Wert), werden die Register aller
+Blöcke eines Zyklus zu einem Feld zusammengefügt und über eine vorab berechnete
+Tabelle (Position, Breite, Vorzeichen, Skalierung, Grenzen je Kanal) in wenigen
+NumPy-Operationen dekodiert. Der Aufwand je Zyklus wächst dadurch kaum mit der
+Kanalzahl.
+
+64-Bit-Werte werden als int64 dekodiert; vorzeichenlose 64-Bit-Kanäle mit
+gesetztem höchstem Bit kommen in den Parameterdefinitionen nicht vor.
+
+Der Abfrageplan ändert sich je nach fälligen Kanälen von Zyklus zu Zyklus; für
+jede Blockfolge wird einmal ein FrameDecoder erzeugt und danach wiederverwendet
+(siehe plan_key). FrameReader liest die Blöcke eines Zyklus und verwaltet diese
+Decoder; er wird vom Plot-Worker und vom Erfassungsprozess verwendet.
+"""
+
+import numpy as np
+
+from custom_exceptions import ModbusConnectionException, ModbusTimeoutException
+from logger_config import logger
+
+
+# Höchstzahl zwischengespeicherter Decoder je FrameReader
+MAX_CACHED_DECODERS = 64
+
+
+def plan_key(blocks):
+    """Schlüssel einer Blockfolge für den Decoder-Cache"""
+    return tuple((block.start, block.count, tuple(item.code for item in block.items)) for block in blocks)
+
+
+class FrameDecoder:
+    """Dekodiert die Register einer festen Blockfolge in einem Schritt."""
+
+    def __init__(self, blocks, channels, limits=None):
+        """
+        Args:
+            blocks: ReadBlock-Liste eines Zyklus
+            channels: ChannelRegistry (Breite, Vorzeichen, Skalierung, Wertebereich)
+            limits: Optionale Bereiche {Code: (min, max)}, die den Wertebereich des Kanals ersetzen
+        """
+        limits = limits or {}
+        self.counts = [block.count for block in blocks]
+        # Letztes Feldelement ist immer 0 und füllt die Wortspalten schmaler Kanäle
+        padding = sum(self.counts)
+
+        codes, gather, sign_bits, divisors, minimum, maximum, block_of_channel = [], [], [], [], [], [], []
+        base = 0
+        for block_index, block in enumerate(blocks):
+            for item in block.items:
+                channel = channels.get(item.code)
+                if channel is None or channel.width not in (1, 2, 4):
+                    continue
+                offset = base + item.address - block.start
+                codes.append(channel.code)
+                gather.append([offset + i if i < channel.width else padding for i in range(4)])
+                # 64-Bit-Werte erhalten ihr Vorzeichen bereits durch den int64-Überlauf
+                sign_bits.append(1 << (16 * channel.width - 1) if channel.is_signed and channel.width < 4 else 0)
+                divisor = 10 ** channel.decimal_places
+                divisors.append(divisor)
+                low, high = limits.get(channel.code, (channel.minimum, channel.maximum))
+                # Grenzen in Rohwert-Einheiten, damit nur skalierte Kanäle umgerechnet werden müssen
+                minimum.append(-np.inf if low is None else low * divisor)
+                maximum.append(np.inf if high is None else high * divisor)
+                block_of_channel.append(block_index)
+            base += block.count
+
+        self.codes = codes
+        self._gather = np.array(gather, dtype=np.intp).reshape(-1, 4)
+        self._shifts = np.array([0, 16, 32, 48], dtype=np.int64)
+        self._sign_bits = np.array(sign_bits, dtype=np.int64)
+        self._minimum = np.array(minimum, dtype=np.float64)
+        self._maximum = np.array(maximum, dtype=np.float64)
+        self._block_of_channel = np.array(block_of_channel, dtype=np.intp)
+        # Nur skalierte Kanäle werden als Gleitkommazahl ausgegeben
+        self._scaled = [(i, divisor) for i, divisor in enumerate(divisors) if divisor != 1]
+
+    def decode(self, block_registers):
+        """
+        Dekodiert und prüft die gelesenen Register eines Zyklus.
+
+        Args:
+            block_registers: Registerlisten in Blockreihenfolge; None für nicht gelesene Blöcke
+
+        Returns:
+            dict: {Parametercode: Wert} aller gültigen Kanäle
+        """
+        flat = []
+        failed = []
+        for block_index, (registers, count) in enumerate(zip(block_registers, self.counts)):
+            if registers is None or len(registers) < count:
+                failed.append(block_index)
+                flat.extend([0] * count)
+            else:
+                flat.extend(registers[:count])
+        flat.append(0)
+        frame = np.array(flat, dtype=np.int64)
+
+        # Niederwertiges Wort zuerst; die Wortspalten überlappen nicht, die Summe entspricht dem ODER
+        raw = (frame[self._gather] << self._shifts).sum(axis=1)
+        raw -= (raw & self._sign_bits) << 1
+        valid = (raw >= self._minimum) & (raw <= self._maximum)
+        if failed:
+            valid &= ~np.isin(self._block_of_channel, failed)
+
+        values = raw.tolist()
+        for position, divisor in self._scaled:
+            values[position] = values[position] / divisor
+        if not failed and valid.all():
+            return dict(zip(self.codes, values))
+
+        result = {}
+        read = np.isin(self._block_of_channel, failed, invert=True).tolist()
+        for code, value, ok, was_read in zip(self.codes, values, valid.tolist(), read):
+            if ok:
+                result[code] = value
+            elif was_read:
+                logger.warning(f"{code} Wert außerhalb des erwarteten Bereichs: {value}")
+        return result
+
+
+class FrameReader:
+    """Liest die Blöcke eines Abfragezyklus und dekodiert sie mit einem FrameDecoder je Blockfolge."""
+
+    def __init__(self, channels, limits=None):
+        """
+        Args:
+            channels: ChannelRegistry
+            limits: Optionale Bereiche {Code: (min, max)} (siehe FrameDecoder)
+        """
+        self.channels = channels
+        self.limits = limits
+        self._decoders = {}
+
+    def decoder(self, blocks):
+        """Dekodiertabelle der Blockfolge (einmal je Blockfolge erzeugt)"""
+        key = plan_key(blocks)
+        decoder = self._decoders.get(key)
+        if decoder is None:
+            if len(self._decoders) >= MAX_CACHED_DECODERS:
+                self._decoders.clear()
+            decoder = FrameDecoder(blocks, self.channels, limits=self.limits)
+            self._decoders[key] = decoder
+        return decoder
+
+    def read(self, modbus_client, blocks, slave=None):
+        """
+        Liest alle Blöcke; Fehler einzelner Blöcke werden protokolliert und lassen nur deren Kanäle aus.
+
+        Returns:
+            dict: {Parametercode: Wert} aller gültigen Kanäle (leer, wenn kein Block gelesen wurde)
+
+        Raises:
+            ModbusConnectionException: Bei Verbindungsverlust (sofort, ohne die übrigen Blöcke)
+            ModbusTimeoutException: Wenn bei keinem Block eine Antwort kam
+        """
+        block_registers = []
+        timeouts = []
+        for block in blocks:
+            try:
+                registers = modbus_client.read_holding_register_fast(block.start, count=block.count, slave=slave)
+            except ModbusConnectionException:
+                raise
+            except ModbusTimeoutException as e:
+                # Kein Traceback: im schnellen Abfragezyklus würde jeder Fehlzyklus das Protokoll fluten
+                logger.warning(f"Timeout beim Lesen der Register {block.start} bis {block.start + block.count - 1}: {e}")
+                timeouts.append(e)
+                registers = None
+            except Exception as e:
+                logger.error(f"Fehler beim Lesen der Register {block.start} bis {block.start + block.count - 1}: {e}")
+                # Verwende keinen Standardwert, um Fehler besser zu erkennen
+                registers = None
+            else:
+                if not registers or len(registers) < block.count:
+                    logger.warning(f"Unvollständige Antwort für Register {block.start} bis {block.start + block.count - 1}: {registers}")
+                    registers = None
+            block_registers.append(registers)
+
+        if blocks and len(timeouts) == len(blocks):
+            # Der Aufrufer entscheidet über Neusynchronisierung und Wartezeit
+            raise timeouts[-1]
+        if all(registers is None for registers in block_registers):
+            return {}
+        return self.decoder(blocks).decode(block_registers)
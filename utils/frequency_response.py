@@ -0,0 +1,275 @@
+"""
+Frequenzgang des Drehzahlregelkreises aus einer Anregung über den Drehzahlsollwert.
+
+Die Messung schreibt in jedem Buszyklus einen Sollwert der Anregung (Gleitsinus
+oder PRBS um einen Arbeitspunkt) nach P06-03 und liest unmittelbar danach die
+Istdrehzahl P0B-00 (measure_cycles). Schreiben und Lesen liegen damit im selben
+Zyklus auf dem festen Raster des CycleTimer; der Abstand zwischen Schreiben und
+Lesen wird je Zyklus gemessen und als Laufzeit aus der Phase herausgerechnet.
+
+Ausgewertet wird mit der H1-Schätzung H = Pxy / Pxx aus den Kreuz- und
+Autospektren der überlappenden, gefensterten Segmente (alle Segmente in einem
+Schritt mit np.fft.rfft) sowie der Kohärenz |Pxy|² / (Pxx * Pyy), die zeigt, bei
+welchen Frequenzen die Anregung für eine verlässliche Schätzung reicht.
+"""
+
+import time
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from custom_exceptions import ServoToolException
+from logger_config import logger
+from utils.cycle_timer import CycleTimer
+
+SPEED_COMMAND_ADDRESS = 1539   # P06-03
+SPEED_FEEDBACK_ADDRESS = 2816  # P0B-00
+
+SIGNAL_CHIRP = 'chirp'
+SIGNAL_PRBS = 'prbs'
+
+# Zyklen, mit denen vor der Messung die kürzeste erreichbare Periode bestimmt wird; sie dauern
+# mindestens SETTLE_TIME (s), damit der Antrieb den Arbeitspunkt erreicht hat
+PROBE_CYCLES = 20
+SETTLE_TIME = 1.0
+# Reserve auf die gemessene Zyklusdauer und Rundung der Periode (s)
+PERIOD_MARGIN = 1.2
+PERIOD_STEP = 0.0005
+
+# Aufeinanderfolgende Fehlzyklen, nach denen die Messung abbricht (eine verspätete Antwort
+# kann die folgenden ein bis zwei Zyklen mit stören)
+MAX_CONSECUTIVE_FAILURES = 5
+
+# Obere Frequenz des Gleitsinus als Anteil der Abtastrate (unter der Nyquist-Frequenz)
+MAX_FREQUENCY_FRACTION = 0.4
+
+# Rückkopplungspolynome maximaler Folgen (Ordnung: Abgriffe)
+PRBS_TAPS = {7: (7, 6), 9: (9, 5), 10: (10, 7), 11: (11, 9)}
+
+# Frequenzen mit geringerer Kohärenz gelten bei der Bandbreite als nicht gemessen
+MIN_COHERENCE = 0.8
+
+
+def chirp_signal(count, sample_rate, f_start, f_end, amplitude, offset=0.0):
+    """Exponentieller Gleitsinus von f_start bis f_end (Hz) über count Abtastungen"""
+    t = np.arange(count) / sample_rate
+    duration = count / sample_rate
+    rate = np.log(f_end / f_start) / duration
+    phase = 2 * np.pi * f_start * np.expm1(rate * t) / rate
+    return offset + amplitude * np.sin(phase)
+
+
+def prbs_signal(count, amplitude, offset=0.0, order=9, hold=1):
+    """
+    Pseudozufällige Binärfolge maximaler Länge (2^order - 1), periodisch fortgesetzt.
+
+    Args:
+        hold: Abtastungen je Bit (größere Werte verlagern die Leistung zu tiefen Frequenzen)
+    """
+    taps = PRBS_TAPS[order]
+    state = (1 << order) - 1
+    bits = np.empty((1 << order) - 1, dtype=np.int8)
+    for i in range(len(bits)):
+        bit = 0
+        for tap in taps:
+            bit ^= (state >> (tap - 1)) & 1
+        bits[i] = state & 1
+        state = (state >> 1) | (bit << (order - 1))
+    sequence = np.repeat(bits, hold)
+    sequence = np.resize(sequence, count)
+    return offset + amplitude * (2.0 * sequence - 1.0)
+
+
+def excitation(signal, count, sample_rate, amplitude, offset=0.0, f_start=1.0, f_end=None):
+    """
+    Anregung der Messung als ganzzahlige Sollwerte (rpm).
+
+    Returns:
+        tuple: (Sollwerte, angeregtes Frequenzband (f_min, f_max) in Hz)
+    """
+    if signal == SIGNAL_PRBS:
+        values = prbs_signal(count, amplitude, offset)
+        band = (0.0, sample_rate / 2)
+    else:
+        f_end = min(f_end or sample_rate, MAX_FREQUENCY_FRACTION * sample_rate)
+        f_start = min(f_start, f_end / 2)
+        values = chirp_signal(count, sample_rate, f_start, f_end, amplitude, offset)
+        band = (f_start, f_end)
+    return np.rint(values).astype(np.int64), band
+
+
+def _spectra(values, segment_length, step, window):
+    segments = sliding_window_view(values, segment_length)[::step]
+    segments = segments - segments.mean(axis=1, keepdims=True)
+    return np.fft.rfft(segments * window, axis=1)
+
+
+def frequency_response(command, response, sample_rate, segment_length=512, overlap=0.5, delay=0.0):
+    """
+    H1-Schätzung des Frequenzgangs von command nach response.
+
+    Args:
+        command: Sollwerte auf dem Abtastraster
+        response: Istwerte auf dem Abtastraster (jeweils delay nach dem Sollwert gelesen)
+        sample_rate: Abtastrate in Hz
+        segment_length: Abtastungen je Segment (höchstens die Länge der Messung)
+        overlap: Überlappung der Segmente
+        delay: Abstand zwischen Schreiben des Sollwerts und Lesen des Istwerts in s
+
+    Returns:
+        tuple: (Frequenzen in Hz, komplexer Frequenzgang, Kohärenz); ohne Gleichanteil
+    """
+    command = np.asarray(command, dtype=np.float64)
+    response = np.asarray(response, dtype=np.float64)
+    segment_length = min(int(segment_length), len(command))
+    step = max(1, segment_length - int(segment_length * overlap))
+    window = np.hanning(segment_length)
+    x = _spectra(command, segment_length, step, window)
+    y = _spectra(response, segment_length, step, window)
+    pxx = np.mean(np.abs(x) ** 2, axis=0)
+    pyy = np.mean(np.abs(y) ** 2, axis=0)
+    pxy = np.mean(np.conj(x) * y, axis=0)
+    freqs = np.fft.rfftfreq(segment_length, 1.0 / sample_rate)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        h = pxy / pxx
+        coherence = np.abs(pxy) ** 2 / (pxx * pyy)
+    # Der Istwert wird delay nach dem Sollwert gelesen und eilt daher scheinbar vor
+    h = h * np.exp(-2j * np.pi * freqs * delay)
+    return freqs[1:], h[1:], np.nan_to_num(coherence[1:])
+
+
+def bandwidth(freqs, h, coherence, min_coherence=MIN_COHERENCE):
+    """Erste Frequenz, bei der der Betrag 3 dB unter den Wert bei tiefen Frequenzen fällt (None, wenn nicht gemessen)"""
+    valid = coherence >= min_coherence
+    if not valid.any():
+        return None
+    magnitude = np.abs(h[valid])
+    reference = magnitude[:max(1, len(magnitude) // 20)].mean()
+    below = np.flatnonzero(magnitude < reference / np.sqrt(2))
+    return float(freqs[valid][below[0]]) if len(below) else None
+
+
+def probe_period(modbus_client, command, slave=None, cycles=PROBE_CYCLES, settle_time=SETTLE_TIME):
+    """
+    Fährt den Arbeitspunkt command an und bestimmt dabei die kürzeste Periode (s), in der
+    Schreiben und Lesen zuverlässig in einen Zyklus passen.
+    """
+    durations = []
+    failures = 0
+    end = time.perf_counter() + settle_time
+    while len(durations) < cycles or time.perf_counter() < end:
+        start = time.perf_counter()
+        try:
+            modbus_client.write_holding_register_fast(SPEED_COMMAND_ADDRESS, int(command) & 0xFFFF, slave=slave)
+            modbus_client.read_holding_register_fast(SPEED_FEEDBACK_ADDRESS, 1, slave=slave)
+        except ServoToolException:
+            failures += 1
+            if failures >= MAX_CONSECUTIVE_FAILURES:
+                raise
+            continue
+        failures = 0
+        durations.append(time.perf_counter() - start)
+    period = np.percentile(durations, 95) * PERIOD_MARGIN
+    return float(np.ceil(period / PERIOD_STEP) * PERIOD_STEP)
+
+
+def measure_cycles(modbus_client, commands, period, slave=None, should_stop=None, progress=None):
+    """
+    Schreibt je Zyklus einen Sollwert und liest direkt danach die Istdrehzahl.
+
+    Args:
+        modbus_client: ServoModbusClient
+        commands: Sollwerte in rpm (ganzzahlig)
+        period: Zyklusperiode in s
+        should_stop: Funktion ohne Argumente; True bricht die Messung ab
+        progress: Funktion (Zyklus, Anzahl), wird etwa zehnmal je Sekunde aufgerufen
+
+    Returns:
+        dict: write_times, read_times (Mitte der Transaktionen, perf_counter), commands,
+              feedback (rpm) und missed (übersprungene Rastertermine); nur ausgeführte Zyklen
+
+    Raises:
+        ServoToolException: Nach MAX_CONSECUTIVE_FAILURES Fehlzyklen in Folge
+    """
+    count = len(commands)
+    write_times = np.empty(count)
+    read_times = np.empty(count)
+    written = np.empty(count)
+    feedback = np.empty(count)
+    timer = CycleTimer(period)
+    done = 0
+    failures = 0
+    report_every = max(1, int(0.1 / period)) if period else 10
+    for k in range(count):
+        if should_stop is not None and should_stop():
+            break
+        timer.wait()
+        try:
+            t0 = time.perf_counter()
+            modbus_client.write_holding_register_fast(SPEED_COMMAND_ADDRESS, int(commands[k]) & 0xFFFF, slave=slave)
+            t1 = time.perf_counter()
+            raw = modbus_client.read_holding_register_fast(SPEED_FEEDBACK_ADDRESS, 1, slave=slave)[0]
+            t2 = time.perf_counter()
+        except ServoToolException as e:
+            failures += 1
+            logger.warning(f"Frequenzgang: Zyklus {k} fehlgeschlagen: {e}")
+            if failures >= MAX_CONSECUTIVE_FAILURES:
+                raise
+            timer.complete()
+            continue
+        failures = 0
+        timer.complete()
+        write_times[done] = (t0 + t1) / 2
+        read_times[done] = (t1 + t2) / 2
+        written[done] = commands[k]
+        feedback[done] = raw - 0x10000 if raw & 0x8000 else raw
+        done += 1
+        if progress is not None and k % report_every == 0:
+            progress(k, count)
+    return {
+        'write_times': write_times[:done],
+        'read_times': read_times[:done],
+        'commands': written[:done],
+        'feedback': feedback[:done],
+        'missed': timer.missed,
+    }
+
+
+def analyze_measurement(measurement, period, segment_length=512, band=None):
+    """
+    Legt eine Messung von measure_cycles auf das Zyklusraster und berechnet den Frequenzgang.
+
+    Args:
+        band: Angeregtes Frequenzband (f_min, f_max) in Hz; nur diese Frequenzen werden zurückgegeben
+
+    Returns:
+        dict: freqs, magnitude (dB), phase (Grad), coherence, sample_rate, delay (s),
+              bandwidth (Hz oder None), cycles, missed; None bei zu kurzer Messung
+    """
+    write_times = measurement['write_times']
+    read_times = measurement['read_times']
+    if len(write_times) < 16:
+        return None
+    delay = float(np.median(read_times - write_times))
+    count = int(round((write_times[-1] - write_times[0]) / period)) + 1
+    grid = write_times[0] + np.arange(count) * period
+    # Übersprungene Rastertermine aus den Nachbarn füllen
+    command = np.interp(grid, write_times, measurement['commands'])
+    response = np.interp(grid + delay, read_times, measurement['feedback'])
+    sample_rate = 1.0 / period
+    freqs, h, coherence = frequency_response(command, response, sample_rate, segment_length, delay=delay)
+    if band is not None:
+        # Außerhalb der Anregung ist H nur das Verhältnis von Leckeffekten und Rauschen
+        inside = (freqs >= band[0]) & (freqs <= band[1])
+        freqs, h, coherence = freqs[inside], h[inside], coherence[inside]
+    return {
+        'freqs': freqs,
+        'magnitude': 20 * np.log10(np.maximum(np.abs(h), 1e-12)),
+        'phase': np.degrees(np.unwrap(np.angle(h))),
+        'coherence': coherence,
+        'sample_rate': sample_rate,
+        'delay': delay,
+        'bandwidth': bandwidth(freqs, h, coherence),
+        'cycles': len(write_times),
+        'missed': measurement['missed'],
+    }
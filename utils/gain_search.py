@@ -0,0 +1,328 @@
+"""
+Suche der Drehzahlregler-Verstärkungen an einer simulierten Strecke.
+
+Aus einer aufgezeichneten Sprungantwort (Sollwert P0B-01, Istwert P0B-00) wird
+zuerst die Strecke angepasst: Mit den eingestellten Reglerparametern rechnet das
+ServoModel (simulator.servo_model) viele Kombinationen aus wahrer Lastträgheit und
+viskoser Reibung gleichzeitig, gewählt wird die mit der kleinsten Abweichung vom
+gemessenen Istwert (fit_plant). An dieser Strecke werden dann Kombinationen von
+P08-00 und P08-01 bewertet (search_gains): zuerst ein grobes Raster um die
+eingestellten Werte, danach in REFINE_ROUNDS Runden feinere Raster um die besten
+Kandidaten.
+
+Jede Simulation rechnet einen Block von Parametersätzen als Achsen eines
+ServoModel. Die Blöcke werden auf einen ProcessPoolExecutor verteilt (ein Prozess
+je Kern, create_executor); ohne Executor wird im aufrufenden Prozess gerechnet.
+
+Bewertung eines Kandidaten (kleiner ist besser):
+    IAE / Sprunghöhe (s)
+    + OVERSHOOT_WEIGHT * Überschwingen über MAX_OVERSHOOT (%)
+    + OSCILLATION_WEIGHT * Schwankung im letzten STEADY_STATE_FRACTION / Sprunghöhe
+
+Die Simulation kennt weder Messrauschen noch Resonanzen der Mechanik; die besten
+Kandidaten sind Vorschläge, die an der Maschine mit einem Sprung bestätigt werden.
+"""
+
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from simulator.servo_model import DEFAULT_PARAMETERS, RATED_TORQUE, RPM_TO_RAD_S, ServoModel
+from utils.step_response import STEADY_STATE_FRACTION, analyze_step
+
+# Abtastrate der Simulation in Hz (Drehmomentfilter und Rückführung brauchen kurze Schritte)
+SIMULATION_RATE = 4000.0
+
+# Raster der Streckenanpassung: wahre Lastträgheit (Vielfaches der Motorträgheit) und
+# viskose Reibung (Vielfaches des Standardwerts des Modells)
+FIT_INERTIA_RATIOS = np.concatenate(([0.0], np.geomspace(0.05, 50.0, 24)))
+FIT_FRICTION_FACTORS = np.array([0.25, 0.5, 1.0, 2.0, 4.0])
+FIT_REFINE_POINTS = 9
+DEFAULT_VISCOUS_FRICTION = 2.0e-4
+
+# Gesuchte Parameter und Faktoren des groben Rasters bezogen auf den eingestellten Wert
+GAIN_CODES = ('P08-00', 'P08-01')
+SEARCH_FACTORS = {
+    'P08-00': np.geomspace(0.5, 4.0, 10),
+    'P08-01': np.geomspace(0.25, 4.0, 10),
+}
+REFINE_ROUNDS = 2
+REFINE_TOP = 3
+REFINE_POINTS = 5
+
+# Bewertung
+MAX_OVERSHOOT = 5.0
+OVERSHOOT_WEIGHT = 0.01
+OSCILLATION_WEIGHT = 1.0
+TOP_CANDIDATES = 5
+
+# Vorgeschlagene Kandidaten unterscheiden sich in mindestens einem Parameter um diesen Anteil
+MIN_CANDIDATE_DISTANCE = 0.1
+
+# Parametersätze je Simulationsblock (höchstens)
+MAX_BLOCK_SIZE = 64
+
+
+def create_executor(max_workers=None):
+    """ProcessPoolExecutor mit einem Prozess je Kern"""
+    # spawn statt fork: ein geforkter Qt-Prozess mit laufenden Threads ist nicht sicher
+    return ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1,
+                               mp_context=multiprocessing.get_context('spawn'))
+
+
+def simulate_block(parameters, inertia_ratios, viscous_friction, reference, initial, sample_steps):
+    """
+    Rechnet einen Block von Parametersätzen mit dem aufgezeichneten Drehzahlsollwert.
+
+    Args:
+        parameters: {Code: Rohwert oder Array je Satz}
+        inertia_ratios: Wahre Lastträgheit je Satz
+        viscous_friction: Viskose Reibung je Satz in Nm/(rad/s)
+        reference: Drehzahlsollwert in rpm je Simulationsschritt
+        initial: Drehzahl zu Beginn in rpm (eingeschwungen)
+        sample_steps: Simulationsschritte, deren Werte zurückgegeben werden
+
+    Returns:
+        tuple: (Drehzahl in rpm, Form (Sätze, len(sample_steps)); Drehmoment in % Nennmoment)
+    """
+    inertia_ratios = np.asarray(inertia_ratios, dtype=float)
+    count = len(inertia_ratios)
+    model = ServoModel(n_axes=count, sample_rate=SIMULATION_RATE)
+    # Der aufgezeichnete Sollwert ist schon der Rampe gefolgt
+    model.set_parameters(dict(parameters, **{'P06-05': 0, 'P06-06': 0}))
+    model.set_load_inertia_ratio(inertia_ratios)
+    model.viscous_friction = np.asarray(viscous_friction, dtype=float)
+    _settle(model, initial)
+
+    reference = np.asarray(reference, dtype=float)
+    sample_steps = np.asarray(sample_steps)
+    speed = np.empty((count, len(sample_steps)))
+    torque = np.empty((count, len(sample_steps)))
+    k = 0
+    for i, rpm in enumerate(reference):
+        model.command_speed(rpm)
+        model.step()
+        while k < len(sample_steps) and sample_steps[k] == i:
+            speed[:, k] = model.speed_feedback
+            torque[:, k] = model.torque
+            k += 1
+    return speed / RPM_TO_RAD_S, torque * 100.0 / RATED_TORQUE
+
+
+def _settle(model, rpm):
+    """Setzt alle Achsen in den eingeschwungenen Zustand bei rpm (Integralanteil trägt die Reibung)"""
+    speed = float(rpm) * RPM_TO_RAD_S
+    for state in (model.speed_target, model.speed_ramped, model.speed_reference, model.speed, model.speed_feedback):
+        state[:] = speed
+    friction = model.viscous_friction * speed + model.coulomb_friction * math.tanh(speed * 50.0)
+    model.torque[:] = friction
+    model.integral[:] = friction / model._speed_gain
+
+
+def _blocks(count, workers):
+    """Grenzen der Simulationsblöcke: mindestens ein Block je Prozess, höchstens MAX_BLOCK_SIZE Sätze"""
+    blocks = max(workers, math.ceil(count / MAX_BLOCK_SIZE))
+    edges = np.linspace(0, count, min(blocks, count) + 1).astype(int)
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _simulate(parameters, inertia_ratios, viscous_friction, capture, executor=None):
+    """Verteilt die Parametersätze auf Blöcke (und Prozesse) und setzt die Ergebnisse zusammen"""
+    count = max(np.size(value) for value in (inertia_ratios, viscous_friction, *parameters.values()))
+    parameters = {code: np.broadcast_to(np.asarray(value, dtype=float), (count,)) for code, value in parameters.items()}
+    inertia_ratios = np.broadcast_to(np.asarray(inertia_ratios, dtype=float), (count,))
+    viscous_friction = np.broadcast_to(np.asarray(viscous_friction, dtype=float), (count,))
+    blocks = _blocks(count, executor._max_workers if executor is not None else 1)
+    args = [({code: value[a:b] for code, value in parameters.items()}, inertia_ratios[a:b], viscous_friction[a:b],
+             capture['reference_steps'], capture['initial'], capture['sample_steps']) for a, b in blocks]
+    if executor is None:
+        results = [simulate_block(*arg) for arg in args]
+    else:
+        results = list(executor.map(simulate_block, *zip(*args)))
+    return np.concatenate([r[0] for r in results]), np.concatenate([r[1] for r in results])
+
+
+def prepare_capture(times, reference, feedback, torque=None):
+    """
+    Bereitet eine aufgezeichnete Sprungantwort für die Simulation vor.
+
+    Args:
+        times: Zeitpunkte in s (aufsteigend)
+        reference: Drehzahlsollwert P0B-01 in rpm zu den Zeitpunkten
+        feedback: Istdrehzahl P0B-00 in rpm zu den Zeitpunkten
+        torque: Drehmoment P0B-02 in % (optional, nur für die Anzeige)
+
+    Returns:
+        dict: Aufzeichnung mit Sollwert je Simulationsschritt und Kennwerten der Messung,
+              oder None, wenn die Aufzeichnung keinen Sprung enthält
+    """
+    times = np.asarray(times, dtype=float)
+    reference = np.asarray(reference, dtype=float)
+    feedback = np.asarray(feedback, dtype=float)
+    metrics = analyze_step(times, reference, feedback, torque)
+    if metrics is None:
+        return None
+    elapsed = times - times[0]
+    steps = int(math.ceil(elapsed[-1] * SIMULATION_RATE)) + 1
+    sample_steps = np.minimum(np.rint(elapsed * SIMULATION_RATE).astype(int), steps - 1)
+    return {
+        'times': times,
+        'reference': reference,
+        'feedback': feedback,
+        'metrics': metrics,
+        'initial': float(feedback[0]),
+        'reference_steps': np.interp(np.arange(steps) / SIMULATION_RATE, elapsed, reference),
+        'sample_steps': sample_steps,
+    }
+
+
+def fit_plant(capture, parameters, executor=None):
+    """
+    Passt wahre Lastträgheit und viskose Reibung an die Aufzeichnung an.
+
+    Args:
+        capture: Ergebnis von prepare_capture
+        parameters: Eingestellte Reglerparameter als Rohwerte ({Code: Wert}, fehlende mit Standardwert)
+        executor: ProcessPoolExecutor oder None
+
+    Returns:
+        dict: load_inertia_ratio, viscous_friction (Nm/(rad/s)), rms_error (rpm)
+    """
+    def evaluate(inertia_ratios, viscous_friction):
+        speed, _ = _simulate(parameters, inertia_ratios, viscous_friction, capture, executor)
+        return np.sqrt(np.mean((speed - capture['feedback']) ** 2, axis=1))
+
+    inertia, friction = np.meshgrid(FIT_INERTIA_RATIOS, FIT_FRICTION_FACTORS * DEFAULT_VISCOUS_FRICTION, indexing='ij')
+    errors = evaluate(inertia.ravel(), friction.ravel())
+    best = int(np.nanargmin(errors))
+    best_inertia, best_friction = inertia.ravel()[best], friction.ravel()[best]
+
+    # Feineres Raster der Trägheit zwischen den Nachbarn des groben Rasters
+    i = int(np.searchsorted(FIT_INERTIA_RATIOS, best_inertia))
+    low = FIT_INERTIA_RATIOS[max(i - 1, 0)]
+    high = FIT_INERTIA_RATIOS[min(i + 1, len(FIT_INERTIA_RATIOS) - 1)]
+    fine = np.linspace(low, high, FIT_REFINE_POINTS)
+    fine_errors = evaluate(fine, best_friction)
+    j = int(np.nanargmin(fine_errors))
+    if fine_errors[j] < errors[best]:
+        best_inertia, error = fine[j], fine_errors[j]
+    else:
+        error = errors[best]
+    return {
+        'load_inertia_ratio': float(best_inertia),
+        'viscous_friction': float(best_friction),
+        'rms_error': float(error),
+    }
+
+
+def score(capture, speed):
+    """
+    Bewertet simulierte Istdrehzahlen (Form (Sätze, Zeitpunkte)) gegen den aufgezeichneten Sollwert.
+
+    Returns:
+        tuple: (Bewertung, Überschwingen in %) je Satz
+    """
+    metrics = capture['metrics']
+    times = capture['times']
+    amplitude = abs(metrics['amplitude'])
+    start = int(np.searchsorted(times, metrics['step_time']))
+    error = np.abs(capture['reference'][start:] - speed[:, start:])
+    iae = np.sum(error[:, :-1] * np.diff(times[start:]), axis=1) / amplitude
+    progress = (speed[:, start:] - metrics['initial']) / metrics['amplitude']
+    overshoot = np.maximum(0.0, progress.max(axis=1) - 1.0) * 100.0
+    tail = max(2, int(len(times) * STEADY_STATE_FRACTION))
+    oscillation = speed[:, -tail:].std(axis=1) / amplitude
+    cost = (iae + OVERSHOOT_WEIGHT * np.maximum(0.0, overshoot - MAX_OVERSHOOT)
+            + OSCILLATION_WEIGHT * oscillation)
+    return np.where(np.isfinite(cost), cost, np.inf), overshoot
+
+
+def _grid(centers, factors, bounds):
+    """Alle Kombinationen der Faktoren um jeden Mittelpunkt, gerundet, begrenzt und ohne Doppelte"""
+    axes = [np.asarray(factors[code]) for code in GAIN_CODES]
+    mesh = np.stack([m.ravel() for m in np.meshgrid(*axes, indexing='ij')], axis=1)
+    candidates = (np.asarray(centers, dtype=float)[:, None, :] * mesh[None, :, :]).reshape(-1, len(GAIN_CODES))
+    for column, code in enumerate(GAIN_CODES):
+        low, high = bounds[code]
+        candidates[:, column] = np.clip(np.rint(candidates[:, column]), max(low, 1), high)
+    return np.unique(candidates, axis=0)
+
+
+def search_gains(capture, parameters, plant, limits=None, executor=None, top=TOP_CANDIDATES,
+                 progress=None, should_stop=None):
+    """
+    Sucht Kombinationen von P08-00 und P08-01 an der angepassten Strecke.
+
+    Args:
+        capture: Ergebnis von prepare_capture
+        parameters: Eingestellte Reglerparameter als Rohwerte (Mittelpunkt des groben Rasters)
+        plant: Ergebnis von fit_plant
+        limits: {Code: (min, max)} der gesuchten Parameter
+        executor: ProcessPoolExecutor oder None
+        top: Anzahl der zurückgegebenen Kandidaten
+        progress: Funktion (bewertete Kandidaten, Runde); wird nach jeder Runde aufgerufen
+        should_stop: Funktion ohne Argumente; True bricht nach der laufenden Runde ab
+
+    Returns:
+        list: Kandidaten (beste zuerst) als dict mit den Parametern ({Code: Rohwert}), cost
+              und den Kennwerten der simulierten Sprungantwort (analyze_step)
+    """
+    current = np.array([[float(parameters.get(code, DEFAULT_PARAMETERS[code])) for code in GAIN_CODES]])
+    # Die feineren Runden bleiben im Bereich des groben Rasters (die Simulation belohnt sonst
+    # immer höhere Verstärkungen, die an der Maschine an Rauschen und Resonanzen scheitern)
+    bounds = {}
+    for column, code in enumerate(GAIN_CODES):
+        low, high = (limits or {}).get(code, (1, None))
+        span_low, span_high = current[0, column] * SEARCH_FACTORS[code].min(), current[0, column] * SEARCH_FACTORS[code].max()
+        bounds[code] = (max(low, math.floor(span_low)), math.ceil(span_high) if high is None else min(high, math.ceil(span_high)))
+    evaluated = {}  # (P08-00, P08-01) -> (cost, overshoot)
+    centers = current
+    factors = SEARCH_FACTORS
+    for round_index in range(REFINE_ROUNDS + 1):
+        candidates = np.array([c for c in _grid(centers, factors, bounds) if tuple(c) not in evaluated])
+        if len(candidates):
+            values = dict(parameters)
+            for column, code in enumerate(GAIN_CODES):
+                values[code] = candidates[:, column]
+            speed, _ = _simulate(values, plant['load_inertia_ratio'], plant['viscous_friction'], capture, executor)
+            costs, overshoots = score(capture, speed)
+            for candidate, cost, overshoot in zip(candidates, costs, overshoots):
+                evaluated[tuple(candidate)] = (float(cost), float(overshoot))
+        if progress is not None:
+            progress(len(evaluated), round_index)
+        if should_stop is not None and should_stop():
+            break
+        # Nächste Runde: engeres Raster um die besten Kandidaten
+        ranked = sorted(evaluated, key=lambda key: evaluated[key][0])
+        centers = np.array(ranked[:REFINE_TOP])
+        factors = {code: _narrow(steps) for code, steps in factors.items()}
+
+    ranked = []
+    for candidate in sorted(evaluated, key=lambda key: evaluated[key][0]):
+        if len(ranked) >= top or not np.isfinite(evaluated[candidate][0]):
+            break
+        if all(np.max(np.abs(np.array(candidate) / np.array(other) - 1.0)) >= MIN_CANDIDATE_DISTANCE
+               for other in ranked):
+            ranked.append(candidate)
+    if not ranked:
+        return []
+    # Kennwerte der besten Kandidaten mit vollständiger Zeitreihe
+    values = dict(parameters)
+    for column, code in enumerate(GAIN_CODES):
+        values[code] = np.array([candidate[column] for candidate in ranked])
+    speed, torque = _simulate(values, plant['load_inertia_ratio'], plant['viscous_friction'], capture, executor)
+    results = []
+    for i, candidate in enumerate(ranked):
+        metrics = analyze_step(capture['times'], capture['reference'], speed[i], torque[i]) or {}
+        results.append(dict(metrics, parameters={code: int(candidate[column]) for column, code in enumerate(GAIN_CODES)},
+                            cost=evaluated[candidate][0], speed=speed[i]))
+    return results
+
+
+def _narrow(factors):
+    """Faktoren der nächsten Runde: REFINE_POINTS Punkte zwischen den Nachbarn des bisherigen Rasters"""
+    ratio = math.sqrt(float(np.max(factors[1:] / factors[:-1]))) if len(factors) > 1 else 1.0
+    return np.geomspace(1.0 / ratio, ratio, REFINE_POINTS)
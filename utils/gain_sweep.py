@@ -0,0 +1,219 @@
+"""
+Verstärkungstest an der Maschine: Sprungantworten für mehrere Parametersätze.
+
+Vor dem ersten Satz werden die eingestellten Werte gelesen (read_parameters). Für
+jeden Satz läuft dann ohne Umweg über die Oberfläche:
+    1. Parameter schreiben; aufeinanderfolgende Register in einer Transaktion
+       (Funktionscode 16, write_parameters)
+    2. Anfangsdrehzahl nach P06-03 schreiben und SETTLE_TIME warten; dabei wird
+       weiter gelesen, damit die Verbindung wie bei der Aufzeichnung ausgelastet bleibt
+    3. Aufzeichnen (capture_step): PRE_TRIGGER lang nur lesen, dann den Sprung nach
+       P06-03 schreiben und weiterlesen; Istwert, Sollwert und Drehmoment
+       (P0B-00 bis P0B-02) mit einer Leseanfrage je Zyklus, so schnell wie der Bus erlaubt
+    4. Bewerten mit utils.step_response und derselben Bewertung wie die Reglersuche
+       (utils.gain_search.score), damit Vorhersage und Messung vergleichbar sind
+
+Nach dem letzten Satz, bei Abbruch und bei Fehlern werden die gelesenen Werte wieder
+geschrieben und P06-03 auf 0 gesetzt. Stabil ist ein Satz, dessen Istwert vor dem
+Ende der Aufzeichnung im Ausregelband bleibt; best_result wählt davon den mit der
+kürzesten Ausregelzeit.
+"""
+
+import time
+
+import numpy as np
+
+from custom_exceptions import ServoToolException
+from logger_config import logger
+from utils.gain_search import prepare_capture, score
+from utils.step_response import TORQUE_RAW_PER_PERCENT
+
+SPEED_COMMAND_ADDRESS = 1539   # P06-03
+CAPTURE_ADDRESS = 2816         # P0B-00 Istdrehzahl, P0B-01 Drehzahlsollwert, P0B-02 Drehmoment
+CAPTURE_COUNT = 3
+
+# Wartezeit nach dem Anfahren der Anfangsdrehzahl und Aufzeichnung vor dem Sprung (s)
+SETTLE_TIME = 1.0
+PRE_TRIGGER = 0.1
+
+# Fehlzyklen in Folge, nach denen die Aufzeichnung abbricht
+MAX_CONSECUTIVE_FAILURES = 5
+
+
+def _signed(value):
+    return value - 0x10000 if value & 0x8000 else value
+
+
+def coalesce(values):
+    """
+    Fasst Registerwerte zu Blöcken aufeinanderfolgender Adressen zusammen.
+
+    Args:
+        values: {Adresse: Wert}
+
+    Returns:
+        list: [(Startadresse, [Werte])], aufsteigend
+    """
+    blocks = []
+    for address in sorted(values):
+        if blocks and blocks[-1][0] + len(blocks[-1][1]) == address:
+            blocks[-1][1].append(values[address])
+        else:
+            blocks.append((address, [values[address]]))
+    return blocks
+
+
+def read_parameters(modbus_client, addresses, slave=None):
+    """Liest {Code: Adresse} als {Code: Rohwert}; je Block aufeinanderfolgender Register eine Transaktion"""
+    codes = {address: code for code, address in addresses.items()}
+    values = {}
+    for address, block in coalesce(codes):
+        registers = modbus_client.read_holding_register(address, count=len(block), slave=slave)
+        values.update(zip(block, registers))
+    return values
+
+
+def write_parameters(modbus_client, values, slave=None):
+    """Schreibt {Adresse: Rohwert}; je Block aufeinanderfolgender Register eine Transaktion"""
+    for address, block in coalesce(values):
+        if len(block) == 1:
+            modbus_client.write_holding_register(address, int(block[0]) & 0xFFFF, slave=slave)
+        else:
+            modbus_client.write_holding_registers(address, block, slave=slave)
+
+
+def _hold(modbus_client, duration, slave=None, should_stop=None):
+    """Liest duration lang den Aufzeichnungsblock, ohne die Werte zu verwenden"""
+    failures = 0
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        if should_stop is not None and should_stop():
+            return
+        try:
+            modbus_client.read_holding_register_fast(CAPTURE_ADDRESS, CAPTURE_COUNT, slave=slave)
+            failures = 0
+        except ServoToolException:
+            failures += 1
+            if failures >= MAX_CONSECUTIVE_FAILURES:
+                raise
+
+
+def capture_step(modbus_client, target_rpm, duration, pre_trigger=PRE_TRIGGER, slave=None, should_stop=None):
+    """
+    Zeichnet eine Sprungantwort auf: pre_trigger lang nur lesen, dann target_rpm nach P06-03
+    schreiben und bis duration nach dem Sprung weiterlesen.
+
+    Returns:
+        dict: times (s ab Aufzeichnungsbeginn), reference, feedback (rpm), torque (% Nennmoment), trigger_time (s)
+
+    Raises:
+        ServoToolException: Nach MAX_CONSECUTIVE_FAILURES Fehlzyklen in Folge oder wenn der Sprung nicht geschrieben werden kann
+    """
+    times, reference, feedback, torque = [], [], [], []
+    failures = 0
+    start = time.perf_counter()
+    trigger_time = None
+    end = start + pre_trigger + duration
+    while time.perf_counter() < end:
+        if should_stop is not None and should_stop():
+            break
+        if trigger_time is None and time.perf_counter() - start >= pre_trigger:
+            modbus_client.write_holding_register_fast(SPEED_COMMAND_ADDRESS, int(target_rpm) & 0xFFFF, slave=slave)
+            trigger_time = time.perf_counter() - start
+        try:
+            t0 = time.perf_counter()
+            registers = modbus_client.read_holding_register_fast(CAPTURE_ADDRESS, CAPTURE_COUNT, slave=slave)
+            t1 = time.perf_counter()
+        except ServoToolException as e:
+            failures += 1
+            logger.warning(f"Verstärkungstest: Lesen fehlgeschlagen: {e}")
+            if failures >= MAX_CONSECUTIVE_FAILURES:
+                raise
+            continue
+        failures = 0
+        times.append((t0 + t1) / 2 - start)
+        feedback.append(_signed(registers[0]))
+        reference.append(_signed(registers[1]))
+        torque.append(_signed(registers[2]) / TORQUE_RAW_PER_PERCENT)
+    return {
+        'times': np.array(times),
+        'reference': np.array(reference, dtype=float),
+        'feedback': np.array(feedback, dtype=float),
+        'torque': np.array(torque, dtype=float),
+        'trigger_time': trigger_time,
+    }
+
+
+def evaluate(trace):
+    """
+    Bewertet eine Aufzeichnung von capture_step.
+
+    Returns:
+        dict: Kennwerte von analyze_step, cost und stable; None ohne erkennbaren Sprung
+    """
+    capture = prepare_capture(trace['times'], trace['reference'], trace['feedback'], trace['torque'])
+    if capture is None:
+        return None
+    cost, _ = score(capture, trace['feedback'][None, :])
+    metrics = dict(capture['metrics'])
+    metrics['cost'] = float(cost[0])
+    metrics['stable'] = metrics['settling_time'] is not None
+    return metrics
+
+
+def run_sweep(modbus_client, parameter_sets, addresses, start_rpm, target_rpm, duration,
+              slave=None, should_stop=None, result_callback=None):
+    """
+    Nimmt für jeden Parametersatz eine Sprungantwort auf und bewertet sie.
+
+    Args:
+        modbus_client: ServoModbusClient
+        parameter_sets: Liste von {Code: Rohwert}
+        addresses: {Code: Registeradresse}; die Werte vor dem Test werden am Ende zurückgeschrieben
+        start_rpm, target_rpm: Drehzahl vor und nach dem Sprung
+        duration: Aufzeichnung nach dem Sprung in s
+        should_stop: Funktion ohne Argumente; True bricht nach dem laufenden Satz ab
+        result_callback: Funktion (Ergebnis), nach jedem Satz aufgerufen
+
+    Returns:
+        list: Ergebnisse als dict mit index, parameters, metrics (None ohne Sprung) und trace
+    """
+    baseline = read_parameters(modbus_client, addresses, slave)
+    logger.info(f"Verstärkungstest: Ausgangswerte {baseline}")
+    results = []
+    try:
+        for index, parameters in enumerate(parameter_sets):
+            if should_stop is not None and should_stop():
+                break
+            write_parameters(modbus_client, {addresses[code]: value for code, value in parameters.items()}, slave)
+            modbus_client.write_holding_register(SPEED_COMMAND_ADDRESS, int(start_rpm) & 0xFFFF, slave=slave)
+            _hold(modbus_client, SETTLE_TIME, slave, should_stop)
+            trace = capture_step(modbus_client, target_rpm, duration, slave=slave, should_stop=should_stop)
+            result = {'index': index, 'parameters': dict(parameters), 'metrics': evaluate(trace), 'trace': trace}
+            logger.info(f"Verstärkungstest {index + 1}/{len(parameter_sets)} {parameters}: {result['metrics']}")
+            results.append(result)
+            if result_callback is not None:
+                result_callback(result)
+    finally:
+        _restore(modbus_client, addresses, baseline, slave)
+    return results
+
+
+def _restore(modbus_client, addresses, baseline, slave):
+    """Schreibt die Ausgangswerte zurück und setzt P06-03 auf 0 (Fehler werden nur protokolliert)"""
+    try:
+        modbus_client.write_holding_register(SPEED_COMMAND_ADDRESS, 0, slave=slave)
+    except ServoToolException as e:
+        logger.error(f"Verstärkungstest: P06-03 konnte nicht auf 0 gesetzt werden: {e}")
+    try:
+        write_parameters(modbus_client, {addresses[code]: value for code, value in baseline.items()}, slave)
+    except ServoToolException as e:
+        logger.error(f"Verstärkungstest: Ausgangswerte {baseline} konnten nicht zurückgeschrieben werden: {e}")
+
+
+def best_result(results):
+    """Stabiles Ergebnis mit der kürzesten Ausregelzeit (bei Gleichstand die kleinere Bewertung), sonst None"""
+    stable = [r for r in results if r['metrics'] is not None and r['metrics']['stable']]
+    if not stable:
+        return None
+    return min(stable, key=lambda r: (r['metrics']['settling_time'], r['metrics']['cost']))
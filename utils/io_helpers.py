@@ -7,14 +7,18 @@ from custom_exceptions import (
 )
 from logger_config import logger
 from .modbus_helpers import ModbusHelper, UIHelper
+from .parameter_store import SOURCE_WRITE, ParameterStore
 
 
 class IOHelper:
     """Hilfsklasse für IO-Status-Operationen"""
     
-    def __init__(self, parameter_manager, modbus_client, io_tab, vdi_vdo_tab, status_label, tuning_tab=None):
+    def __init__(self, parameter_manager, modbus_client, io_tab, vdi_vdo_tab, status_label, tuning_tab=None,
+                 parameter_store=None):
         self.parameter_manager = parameter_manager
         self.modbus_client = modbus_client
+        # Gemeinsamer Parameterspeicher: Funktionszuweisungen und VDI-Zustand werden nur bei Bedarf gelesen
+        self.parameter_store = parameter_store if parameter_store is not None else ParameterStore()
         self.io_tab = io_tab
         self.vdi_vdo_tab = vdi_vdo_tab
         self.tuning_tab = tuning_tab
@@ -127,6 +131,7 @@ class IOHelper:
         try:
             val_di = self.modbus_client.read_holding_register(int(di_param.decimal), count=1)
             if val_di:
+                self.parameter_store.update(di_param.code, val_di[0])
                 print(f"DI-Status gelesen: {val_di[0]} (binär: {bin(val_di[0])})")
                 self.io_tab.set_di_labels(val_di[0])
                 UIHelper.keep_ui_responsive()
@@ -153,6 +158,7 @@ class IOHelper:
         try:
             val_do = self.modbus_client.read_holding_register(int(do_param.decimal), count=1)
             if val_do:
+                self.parameter_store.update(do_param.code, val_do[0])
                 print(f"DO-Status gelesen: {val_do[0]} (binär: {bin(val_do[0])})")
                 self.io_tab.set_do_labels(val_do[0])
                 UIHelper.keep_ui_responsive()
@@ -179,6 +185,7 @@ class IOHelper:
         try:
             val_vdi = self.modbus_client.read_holding_register(int(vdi_param.decimal), count=1)
             if val_vdi:
+                self.parameter_store.update(vdi_param.code, val_vdi[0])
                 print(f"VDI-Status gelesen: {val_vdi[0]} (binär: {bin(val_vdi[0])})")
                 self.vdi_vdo_tab.set_vdi_labels(val_vdi[0])
                 
@@ -215,6 +222,7 @@ class IOHelper:
         try:
             val_vdo = self.modbus_client.read_holding_register(int(vdo_param.decimal), count=1)
             if val_vdo:
+                self.parameter_store.update(vdo_param.code, val_vdo[0])
                 print(f"VDO-Status gelesen: {val_vdo[0]} (binär: {bin(val_vdo[0])})")
                 
                 # Aktualisiere die VDO-Labels im VDI/VDO-Tab nur, wenn gewünscht
@@ -487,14 +495,20 @@ class IOHelper:
             logger.error(f"Fehler beim Auslesen der VDI/VDO-Funktionen: {e}")
     
     def _read_function_params(self, function_params, io_type):
-        """Liest eine Liste von Funktionsparametern"""
+        """Liest eine Liste von Funktionsparametern; aktuelle Werte aus dem Parameterspeicher werden nicht erneut gelesen"""
         functions = []
         
         for param_code in function_params:
             param = self.parameter_manager.get_parameter(param_code)
             if param and param.decimal:
                 try:
-                    val = self.modbus_client.read_holding_register(int(param.decimal), count=1)
+                    known = self.parameter_store.fresh_value(param_code)
+                    if known is not None:
+                        val = [known]
+                    else:
+                        val = self.modbus_client.read_holding_register(int(param.decimal), count=1)
+                        if val:
+                            self.parameter_store.update(param_code, val[0])
                     if val:
                         # Hole den Funktionsnamen basierend auf dem Wert
                         function_value = str(val[0])
@@ -570,14 +584,16 @@ class IOHelper:
                 print(f"VDI{vdi_number} Toggle fehlgeschlagen: Parameter P31-00 nicht gefunden")
                 return
             
-            # Lese aktuellen VDI-Status
+            # Aktuellen VDI-Status direkt vor dem Schreiben lesen: das Wort wird beim Einschalten
+            # zurückgesetzt und kann von anderen Mastern geändert werden
             val_vdi = self.modbus_client.read_holding_register(int(vdi_param.decimal), count=1)
             if not val_vdi:
                 print(f"VDI{vdi_number} Toggle fehlgeschlagen: Konnte VDI-Status nicht lesen")
                 return
+            current_value = val_vdi[0]
+            self.parameter_store.update(vdi_param.code, current_value)
             
             # Berechne neuen Wert basierend auf dem VDI-Status und dem gewünschten Zustand
-            current_value = val_vdi[0]
             bit_position = vdi_number - 1  # VDI1 ist Bit 0, VDI2 ist Bit 1, etc.
             
             if state:
@@ -592,6 +608,7 @@ class IOHelper:
             # Schreibe neuen Wert
             result = self.modbus_client.write_holding_register(int(vdi_param.decimal), new_value)
             if result:
+                self.parameter_store.update(vdi_param.code, new_value, SOURCE_WRITE)
                 print(f"VDI{vdi_number} Toggle erfolgreich: Wert {new_value} geschrieben")
                 # Aktualisiere die Anzeige im VDI/VDO-Tab
                 self.vdi_vdo_tab.set_vdi_labels(new_value)
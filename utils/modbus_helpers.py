@@ -7,6 +7,7 @@ from custom_exceptions import (
     ModbusWriteException
 )
 from logger_config import logger
+from utils.parameter_store import SOURCE_WRITE
 
 
 class ModbusHelper:
@@ -108,8 +109,8 @@ class ModbusHelper:
         return True, ""
     
     @staticmethod
-    def read_parameter_safely(modbus_client, param, status_label=None):
-        """Liest einen Parameter sicher mit standardisierter Fehlerbehandlung"""
+    def read_parameter_safely(modbus_client, param, status_label=None, store=None):
+        """Liest einen Parameter sicher mit standardisierter Fehlerbehandlung (Ergebnis auch in store)"""
         try:
             # Validiere den Modbus-Client
             ModbusHelper._validate_modbus_client(modbus_client)
@@ -132,6 +133,8 @@ class ModbusHelper:
             
             if val is not None:
                 logger.debug(f"DEBUG: Parameter {param.code} erfolgreich gelesen: {val}")
+                if store is not None:
+                    store.update(param.code, val)
                 # Wandle den Rohwert in einen anzeigbaren Wert mit Dezimalstellen um
                 display_value = ModbusHelper._get_readable_value(val, param)
                 return val, display_value, None
@@ -148,8 +151,8 @@ class ModbusHelper:
             return None, None, error_msg
     
     @staticmethod
-    def write_parameter_safely(modbus_client, param, value, status_label=None):
-        """Schreibt einen Parameter sicher mit standardisierter Fehlerbehandlung"""
+    def write_parameter_safely(modbus_client, param, value, status_label=None, store=None):
+        """Schreibt einen Parameter sicher mit standardisierter Fehlerbehandlung (Wert auch in store)"""
         try:
             # Validiere den Modbus-Client
             ModbusHelper._validate_modbus_client(modbus_client)
@@ -170,6 +173,8 @@ class ModbusHelper:
             
             if success:
                 logger.debug(f"DEBUG: Parameter {param.code} erfolgreich geschrieben: {value}")
+                if store is not None:
+                    store.update(param.code, int(value), SOURCE_WRITE)
                 success_msg = f"{param.code} erfolgreich auf {int(value)} geschrieben."
                 if status_label:
                     status_label.setText(success_msg)
@@ -187,8 +192,8 @@ class ModbusHelper:
             return False, error_msg
     
     @staticmethod
-    def read_parameter(modbus_client, param, widget, status_label=None, disconnect_callback=None):
-        """Liest einen Parameter und aktualisiert das Widget"""
+    def read_parameter(modbus_client, param, widget, status_label=None, disconnect_callback=None, store=None):
+        """Liest einen Parameter und aktualisiert das Widget (Ergebnis auch in store)"""
         try:
             # Validiere den Modbus-Client
             ModbusHelper._validate_modbus_client(modbus_client)
@@ -211,6 +216,8 @@ class ModbusHelper:
             
             if val is not None:
                 logger.debug(f"DEBUG: Parameter {param.code} erfolgreich gelesen: {val}")
+                if store is not None:
+                    store.update(param.code, val)
                 
                 # Wandle den Rohwert in einen anzeigbaren Wert mit Dezimalstellen um
                 display_value = ModbusHelper._get_readable_value(val, param)
@@ -226,8 +233,9 @@ class ModbusHelper:
             ModbusHelper._handle_ui_error(e, param.code, "Lesen", status_label, disconnect_callback)
     
     @staticmethod
-    def write_parameter(modbus_client, param, value, status_label=None, disconnect_callback=None, display_text=None):
-        """Schreibt einen Parameterwert"""
+    def write_parameter(modbus_client, param, value, status_label=None, disconnect_callback=None, display_text=None,
+                        store=None):
+        """Schreibt einen Parameterwert (auch in store) und gibt True bei Erfolg zurück"""
         try:
             # Validiere den Modbus-Client
             ModbusHelper._validate_modbus_client(modbus_client)
@@ -248,19 +256,22 @@ class ModbusHelper:
             
             if success:
                 logger.debug(f"DEBUG: Parameter {param.code} erfolgreich geschrieben: {value}")
+                if store is not None:
+                    store.update(param.code, int(value), SOURCE_WRITE)
                 success_msg = f"{param.code} erfolgreich auf {display_text or value} geschrieben."
                 if status_label:
                     status_label.setText(success_msg)
-            else:
-                error_msg = f"Fehler beim Schreiben von {param.code}"
-                if status_label:
-                    status_label.setText(error_msg)
+                return True
+            error_msg = f"Fehler beim Schreiben von {param.code}"
+            if status_label:
+                status_label.setText(error_msg)
         except Exception as e:
             ModbusHelper._handle_ui_error(e, param.code, "Schreiben", status_label, disconnect_callback)
+        return False
     
     @staticmethod
-    def read_parameter_combobox(modbus_client, param, combobox, status_label=None, disconnect_callback=None):
-        """Liest einen Parameter und aktualisiert die Combobox"""
+    def read_parameter_combobox(modbus_client, param, combobox, status_label=None, disconnect_callback=None, store=None):
+        """Liest einen Parameter und aktualisiert die Combobox (Ergebnis auch in store)"""
         try:
             # Validiere den Modbus-Client
             ModbusHelper._validate_modbus_client(modbus_client)
@@ -283,6 +294,8 @@ class ModbusHelper:
             
             if val is not None:
                 logger.debug(f"DEBUG: Parameter {param.code} erfolgreich gelesen: {val}")
+                if store is not None:
+                    store.update(param.code, val)
                 # Finde den Index mit dem passenden Datenwert
                 index = combobox.findData(val)
                 if index >= 0:
@@ -368,33 +381,15 @@ class UIHelper:
         app.menuBar().clear()
         app.create_menu_bar()
         
-        # Update tab names
+        # Update tab names (auch für noch nicht aufgebaute Tabs)
         for i in range(app.tabs.count()):
-            tab = app.tabs.widget(i)
-            tab_name = ""
-            if tab == app.tuning_tab:
-                tab_name = language_manager.get_text("tab_tuning_plot")
-            elif tab == app.io_tab:
-                tab_name = language_manager.get_text("tab_io_status")
-            elif tab == app.vdi_vdo_tab:
-                tab_name = language_manager.get_text("tab_vdi_vdo")
-            elif tab == app.register_tab:
-                tab_name = language_manager.get_text("tab_register_overview")
-            elif tab == app.fault_tab:
-                tab_name = language_manager.get_text("tab_fault_list")
-            elif tab == app.connection_tab:
-                tab_name = language_manager.get_text("tab_modbus_connection")
-            
-            if tab_name:
-                app.tabs.setTabText(i, tab_name)
+            text_key = app.get_tab_text_key(app.tabs.widget(i))
+            if text_key:
+                app.tabs.setTabText(i, language_manager.get_text(text_key))
         
-        # Update tab content
-        app.tuning_tab.update_language(language_manager)
-        app.io_tab.update_language(language_manager)
-        app.vdi_vdo_tab.update_language(language_manager)
-        app.register_tab.update_language(language_manager)
-        app.fault_tab.update_language(language_manager)
-        app.connection_tab.update_language(language_manager)
+        # Update tab content - noch nicht aufgebaute Tabs übernehmen die Sprache beim Aufbau
+        for tab in app.get_created_tabs().values():
+            tab.update_language(language_manager)
         
         # Update status label if it contains translatable text
         current_status = app.status_label.text()
@@ -0,0 +1,318 @@
+"""
+Aufzeichnung und Wiedergabe von Modbus-Transaktionen.
+
+RecordingClient legt sich um den pymodbus-Client einer Verbindung und schreibt
+jede Transaktion in eine Datei: Anfrage- und Antwort-PDU (Funktionscode und
+Daten, ohne Slave-Adresse, Prüfsumme bzw. MBAP-Kopf), Zeitpunkt, Dauer sowie
+ausgebliebene Antworten und Fehler. ReplayClient ersetzt später den pymodbus-
+Client und beantwortet die Anfragen aus der Aufzeichnung - in der ursprünglichen
+Zeit, beschleunigt oder ohne Wartezeit, einschließlich Timeouts und Exception-
+Antworten. So lassen sich Plot, IO und Parameterzugriffe ohne Antrieb
+reproduzierbar gegen das Verhalten eines echten Antriebs messen.
+
+Dateiformat (JSON Lines), die erste Zeile ist der Kopf::
+
+    {"format": "servo-tool-modbus-recording", "version": 1, "transport": "serial", ...}
+    {"t": 0.1234, "slave": 1, "request": "030b000003", "response": "0306...", "duration": 0.0121}
+    {"t": 0.2345, "slave": 1, "request": "030b000003", "response": null, "duration": 0.5,
+     "error": "ModbusIOException", "message": "...", "raised": false}
+"""
+
+import json
+import re
+import struct
+import threading
+import time
+
+from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
+from pymodbus.pdu import ExceptionResponse
+from pymodbus.pdu.register_read_message import ReadHoldingRegistersResponse
+from pymodbus.pdu.register_write_message import WriteMultipleRegistersResponse, WriteSingleRegisterResponse
+
+from custom_exceptions import FileOperationException
+from logger_config import logger
+from modbus_client import FC_READ_HOLDING_REGISTERS, FC_WRITE_MULTIPLE_REGISTERS, FC_WRITE_SINGLE_REGISTER
+
+RECORDING_FORMAT = 'servo-tool-modbus-recording'
+RECORDING_VERSION = 1
+
+# Präfixe wie "Modbus Error: [Input/Output] ", die pymodbus beim Erzeugen voranstellt
+_ERROR_PREFIX = re.compile(r'^(?:Modbus Error: |\[[^\]]*\] )+')
+
+# Fehler, die bei der Wiedergabe wieder als pymodbus-Exception entstehen
+_ERROR_TYPES = {
+    'ModbusIOException': ModbusIOException,
+    'ConnectionException': ConnectionException,
+}
+
+
+def encode_request(function_code, address, count=1, values=None):
+    """Anfrage-PDU einer Transaktion (Funktionscode 3, 6 oder 16)."""
+    if function_code == FC_READ_HOLDING_REGISTERS:
+        return struct.pack('>BHH', function_code, address, count)
+    if function_code == FC_WRITE_SINGLE_REGISTER:
+        return struct.pack('>BHH', function_code, address, values[0] & 0xFFFF)
+    words = [value & 0xFFFF for value in values]
+    return (struct.pack('>BHHB', function_code, address, len(words), 2 * len(words))
+            + struct.pack(f'>{len(words)}H', *words))
+
+
+def encode_response(function_code, result):
+    """Antwort-PDU aus einer pymodbus-Antwort."""
+    if result.isError():
+        return bytes([function_code | 0x80, getattr(result, 'exception_code', 0) & 0xFF])
+    if function_code == FC_READ_HOLDING_REGISTERS:
+        registers = list(result.registers)
+        return struct.pack(f'>BB{len(registers)}H', function_code, 2 * len(registers), *registers)
+    if function_code == FC_WRITE_SINGLE_REGISTER:
+        return struct.pack('>BHH', function_code, result.address, result.value)
+    return struct.pack('>BHH', function_code, result.address, result.count)
+
+
+def decode_response(data, slave):
+    """pymodbus-Antwort aus einer aufgezeichneten Antwort-PDU."""
+    function_code = data[0]
+    if function_code & 0x80:
+        return ExceptionResponse(function_code & 0x7F, data[1], slave=slave)
+    if function_code == FC_READ_HOLDING_REGISTERS:
+        count = data[1] // 2
+        return ReadHoldingRegistersResponse(list(struct.unpack(f'>{count}H', data[2:2 + 2 * count])), slave=slave)
+    address, value = struct.unpack('>HH', data[1:5])
+    if function_code == FC_WRITE_SINGLE_REGISTER:
+        return WriteSingleRegisterResponse(address, value, slave=slave)
+    return WriteMultipleRegistersResponse(address, value, slave=slave)
+
+
+def _error_message(error):
+    """Fehlertext ohne den Präfix, den pymodbus beim Erzeugen wieder voranstellt."""
+    if error is None:
+        return "Keine Antwort"
+    message = getattr(error, 'string', None) or str(error)
+    return _ERROR_PREFIX.sub('', message)
+
+
+def _request_key(request):
+    """Anfrage-Kopf für die Zuordnung: Funktionscode, Adresse und (außer bei FC 6) Anzahl."""
+    return request[:3] if request[0] == FC_WRITE_SINGLE_REGISTER else request[:5]
+
+
+class TransactionRecorder:
+    """Schreibt Transaktionen in eine Aufzeichnungsdatei (eine JSON-Zeile je Transaktion)."""
+
+    def __init__(self, path, **info):
+        """
+        Args:
+            path: Zieldatei, wird überschrieben
+            info: Zusätzliche Angaben für den Dateikopf (z.B. transport, endpoint, serial_settings)
+
+        Raises:
+            FileOperationException: Wenn die Datei nicht angelegt werden kann
+        """
+        try:
+            self._file = open(path, 'w', encoding='utf-8')
+        except OSError as e:
+            raise FileOperationException(f"Aufzeichnung {path} kann nicht angelegt werden: {e}")
+        self.path = path
+        self.count = 0
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._write({'format': RECORDING_FORMAT, 'version': RECORDING_VERSION,
+                     'created': time.strftime('%Y-%m-%dT%H:%M:%S'), **info})
+
+    def _write(self, entry):
+        # Zeilenweise schreiben, damit die Aufzeichnung auch nach einem Absturz vollständig ist
+        self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+
+    def record(self, slave, request, start, duration, response=None, error=None, raised=False):
+        """
+        Zeichnet eine Transaktion auf.
+
+        Args:
+            slave: Slave-ID
+            request: Anfrage-PDU
+            start: Startzeitpunkt (time.perf_counter())
+            duration: Dauer in Sekunden
+            response: Antwort-PDU, None ohne Antwort
+            error: Ausgebliebene Antwort bzw. aufgetretener Fehler
+            raised: True, wenn der Fehler ausgelöst statt zurückgegeben wurde
+        """
+        entry = {
+            't': round(start - self._start, 6),
+            'slave': slave,
+            'request': request.hex(),
+            'response': response.hex() if response is not None else None,
+            'duration': round(duration, 6),
+        }
+        if response is None:
+            entry['error'] = type(error).__name__ if error is not None else 'ModbusIOException'
+            entry['message'] = _error_message(error)
+            entry['raised'] = raised
+        with self._lock:
+            if not self._file.closed:
+                self._write(entry)
+                self.count += 1
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class RecordingClient:
+    """
+    Leitet alle Zugriffe an den pymodbus-Client weiter und zeichnet die
+    Transaktionen auf. Attribute wie timeout, socket oder comm_params werden
+    unverändert durchgereicht.
+    """
+
+    def __init__(self, wrapped, recorder):
+        object.__setattr__(self, 'wrapped', wrapped)
+        object.__setattr__(self, 'recorder', recorder)
+
+    def __getattr__(self, name):
+        return getattr(self.wrapped, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.wrapped, name, value)
+
+    def read_holding_registers(self, address, count=1, slave=1, **kwargs):
+        request = encode_request(FC_READ_HOLDING_REGISTERS, address, count)
+        return self._transact(FC_READ_HOLDING_REGISTERS, request, slave,
+                              lambda: self.wrapped.read_holding_registers(address, count=count, slave=slave, **kwargs))
+
+    def write_register(self, address, value, slave=1, **kwargs):
+        request = encode_request(FC_WRITE_SINGLE_REGISTER, address, values=[value])
+        return self._transact(FC_WRITE_SINGLE_REGISTER, request, slave,
+                              lambda: self.wrapped.write_register(address, value, slave=slave, **kwargs))
+
+    def write_registers(self, address, values, slave=1, **kwargs):
+        request = encode_request(FC_WRITE_MULTIPLE_REGISTERS, address, values=values)
+        return self._transact(FC_WRITE_MULTIPLE_REGISTERS, request, slave,
+                              lambda: self.wrapped.write_registers(address, values, slave=slave, **kwargs))
+
+    def _transact(self, function_code, request, slave, call):
+        start = time.perf_counter()
+        try:
+            result = call()
+        except Exception as e:
+            self.recorder.record(slave, request, start, time.perf_counter() - start, error=e, raised=True)
+            raise
+        duration = time.perf_counter() - start
+        if result is None or isinstance(result, ModbusIOException):
+            # pymodbus meldet eine ausgebliebene Antwort teils als Rückgabewert
+            self.recorder.record(slave, request, start, duration, error=result)
+        else:
+            self.recorder.record(slave, request, start, duration, response=encode_response(function_code, result))
+        return result
+
+
+def load_recording(path):
+    """
+    Lädt eine Aufzeichnung.
+
+    Returns:
+        tuple: (Kopf als dict, Liste der Transaktionen)
+
+    Raises:
+        FileOperationException: Wenn die Datei fehlt oder keine Aufzeichnung ist
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = [line for line in f if line.strip()]
+        header = json.loads(lines[0]) if lines else {}
+        entries = [json.loads(line) for line in lines[1:]]
+    except (OSError, ValueError) as e:
+        raise FileOperationException(f"Aufzeichnung {path} kann nicht gelesen werden: {e}")
+    if header.get('format') != RECORDING_FORMAT:
+        raise FileOperationException(f"{path} ist keine Modbus-Aufzeichnung")
+    if header.get('version', 0) > RECORDING_VERSION:
+        raise FileOperationException(f"Aufzeichnung {path} hat die nicht unterstützte Version {header.get('version')}")
+    return header, entries
+
+
+class ReplayClient:
+    """
+    Ersetzt den pymodbus-Client und beantwortet Anfragen aus einer Aufzeichnung.
+
+    Anfragen werden über Slave-ID und Anfrage-Kopf (Funktionscode, Adresse,
+    Anzahl) den aufgezeichneten Transaktionen zugeordnet und je Kopf in
+    aufgezeichneter Reihenfolge beantwortet; ist eine Folge aufgebraucht, beginnt
+    sie von vorn. So bleibt die Wiedergabe auch dann reproduzierbar, wenn Plot und
+    IO-Abfragen ihre Zugriffe anders verschränken als bei der Aufnahme. Anfragen
+    ohne Aufzeichnung bleiben wie bei einem fehlenden Antrieb unbeantwortet.
+    """
+
+    def __init__(self, path, speed=1.0, loop=True):
+        """
+        Args:
+            path: Aufzeichnungsdatei
+            speed: Zeitfaktor der Wiedergabe (1 = Originalzeit, 10 = zehnfach schneller,
+                0 = ohne Wartezeit)
+            loop: Aufgebrauchte Folgen wiederholen; sonst bleiben weitere Anfragen unbeantwortet
+
+        Raises:
+            FileOperationException: Wenn die Aufzeichnung nicht gelesen werden kann
+        """
+        self.header, entries = load_recording(path)
+        self.path = path
+        self.speed = float(speed)
+        self.loop = loop
+        self.connected = False
+        # Attribute, die ServoModbusClient an echten Clients einstellt
+        self.timeout = None
+        self.comm_params = None
+        self.socket = None
+        self.replayed = 0
+        self.unmatched = 0
+        self._sequences = {}
+        self._positions = {}
+        self._lock = threading.Lock()
+        for entry in entries:
+            key = (entry['slave'], _request_key(bytes.fromhex(entry['request'])))
+            self._sequences.setdefault(key, []).append(entry)
+
+    def connect(self):
+        self.connected = True
+        return True
+
+    def close(self):
+        self.connected = False
+
+    def read_holding_registers(self, address, count=1, slave=1, **kwargs):
+        return self._transact(encode_request(FC_READ_HOLDING_REGISTERS, address, count), slave)
+
+    def write_register(self, address, value, slave=1, **kwargs):
+        return self._transact(encode_request(FC_WRITE_SINGLE_REGISTER, address, values=[value]), slave)
+
+    def write_registers(self, address, values, slave=1, **kwargs):
+        return self._transact(encode_request(FC_WRITE_MULTIPLE_REGISTERS, address, values=values), slave)
+
+    def _next_entry(self, key):
+        with self._lock:
+            sequence = self._sequences.get(key)
+            if not sequence:
+                return None
+            position = self._positions.get(key, 0)
+            if position >= len(sequence) and not self.loop:
+                return None
+            self._positions[key] = position + 1
+            return sequence[position % len(sequence)]
+
+    def _transact(self, request, slave):
+        if not self.connected:
+            raise ConnectionException("Wiedergabe nicht verbunden")
+        entry = self._next_entry((slave, _request_key(request)))
+        if entry is None:
+            self.unmatched += 1
+            logger.debug(f"DEBUG: Keine aufgezeichnete Antwort für Slave {slave}, Anfrage {request.hex()}")
+            return ModbusIOException(f"Keine aufgezeichnete Antwort für Slave {slave}")
+        self.replayed += 1
+        if self.speed > 0:
+            time.sleep(entry['duration'] / self.speed)
+        if entry['response'] is not None:
+            return decode_response(bytes.fromhex(entry['response']), slave)
+        error = _ERROR_TYPES.get(entry.get('error'), ModbusException)(entry.get('message', ''))
+        if entry.get('raised'):
+            raise error
+        return error
@@ -0,0 +1,107 @@
+"""
+Gemeinsamer Speicher der zuletzt bekannten Parameterwerte für alle Tabs.
+
+Jeder Eintrag (ParameterEntry) hält den Rohwert, den Zeitpunkt des Zugriffs
+(time.monotonic) und die Quelle: gelesen (SOURCE_READ) oder selbst geschrieben
+(SOURCE_WRITE). Lese- und Schreibzugriffe der Tabs tragen ihre Ergebnisse hier ein;
+wer einen Wert braucht, fragt zuerst fresh_value und liest nur, wenn dort nichts
+Aktuelles steht.
+
+Wie lange ein Wert als aktuell gilt, legt eine Frische-Regel (TTL in s) je Code
+oder Gruppe fest:
+    - Werte, die der Antrieb selbst oder ein anderer Master ändert (Überwachung P0B,
+      Hilfsfunktionen P0D, VDO-Zustand P17-32, VDI-Zustand P31 - beim Einschalten nach
+      P0C-10 zurückgesetzt), sind nie aktuell (TTL 0)
+    - Einstellparameter ändern sich nur durch Schreiben und bleiben bis zum Trennen
+      der Verbindung aktuell (TTL None)
+invalidate (z.B. beim Trennen) macht Werte veraltet, behält sie aber für die Anzeige.
+
+Tabs melden sich mit subscribe an und werden benachrichtigt, wenn sich ein Wert
+ändert. Die Benachrichtigung läuft im Thread des Aufrufers von update; eingetragen
+wird nur aus dem GUI-Thread.
+"""
+
+import time
+from collections import namedtuple
+
+SOURCE_READ = 'read'
+SOURCE_WRITE = 'write'
+
+# Frische-Regeln: exakter Code vor Gruppe (z.B. 'P0B'); nicht aufgeführte Codes gelten unbegrenzt
+DEFAULT_TTL = {'P0B': 0.0, 'P0D': 0.0, 'P17-32': 0.0, 'P31': 0.0}
+
+ParameterEntry = namedtuple('ParameterEntry', 'value timestamp source')
+
+
+class ParameterStore:
+    """Letzte bekannte Rohwerte je Parametercode mit Frische-Regeln und Änderungsmeldungen"""
+
+    def __init__(self, ttl=None):
+        """
+        Args:
+            ttl: Frische-Regeln {Code oder Gruppe: s oder None}, Standard DEFAULT_TTL
+        """
+        self._entries = {}
+        self._ttl = dict(DEFAULT_TTL if ttl is None else ttl)
+        self._subscribers = []
+
+    def set_ttl(self, code, seconds):
+        """Legt die Frische-Regel für einen Code oder eine Gruppe fest (None = bis zum Trennen)"""
+        self._ttl[code] = seconds
+
+    def ttl(self, code):
+        if code in self._ttl:
+            return self._ttl[code]
+        return self._ttl.get(code[:3])
+
+    def update(self, code, value, source=SOURCE_READ):
+        """Trägt einen gelesenen oder geschriebenen Rohwert ein und meldet Änderungen"""
+        previous = self._entries.get(code)
+        entry = ParameterEntry(value, time.monotonic(), source)
+        self._entries[code] = entry
+        if previous is None or previous.value != value:
+            for codes, callback in list(self._subscribers):
+                if codes is None or code in codes:
+                    callback(code, entry)
+
+    def get(self, code):
+        """Eintrag eines Codes oder None"""
+        return self._entries.get(code)
+
+    def value(self, code, default=None):
+        """Zuletzt bekannter Rohwert, auch wenn er veraltet ist"""
+        entry = self._entries.get(code)
+        return default if entry is None else entry.value
+
+    def fresh_value(self, code, max_age=None):
+        """
+        Rohwert, wenn er nach der Frische-Regel (oder max_age in s) noch aktuell ist, sonst None.
+        """
+        entry = self._entries.get(code)
+        if entry is None or entry.timestamp is None:
+            return None
+        ttl = self.ttl(code) if max_age is None else max_age
+        if ttl is not None and time.monotonic() - entry.timestamp > ttl:
+            return None
+        return entry.value
+
+    def invalidate(self, code=None):
+        """Macht einen Wert (ohne code alle) veraltet; die Werte bleiben für die Anzeige erhalten"""
+        codes = list(self._entries) if code is None else [code] if code in self._entries else []
+        for key in codes:
+            self._entries[key] = self._entries[key]._replace(timestamp=None)
+
+    def subscribe(self, callback, codes=None):
+        """
+        Meldet callback(code, entry) für geänderte Werte an.
+
+        Args:
+            callback: Funktion (Code, ParameterEntry)
+            codes: Nur diese Codes melden (None = alle)
+
+        Returns:
+            Funktion ohne Argumente, die die Anmeldung wieder aufhebt
+        """
+        subscription = (None if codes is None else frozenset(codes), callback)
+        self._subscribers.append(subscription)
+        return lambda: self._subscribers.remove(subscription) if subscription in self._subscribers else None
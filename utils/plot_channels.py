@@ -0,0 +1,186 @@
+"""
+Plot-Kanäle aus den Parameterdefinitionen.
+
+Jeder Überwachungsparameter der Gruppen P0B (Überwachung) und P30 (Kommunikation
+lesen) ist ein möglicher Plot-Kanal. Registerbreite, Vorzeichen, Skalierung und
+Wertebereich werden aus der Validierung in servo_parameter_definitions.json
+abgeleitet, neue Kanäle brauchen daher keine Codeänderung:
+
+* number_type 'signed_…'/'unsigned_…' und '16bit'/'32bit' bestimmen Breite und Vorzeichen,
+  two_complement: true kennzeichnet vorzeichenbehaftete Werte ohne number_type
+* decimal_places teilt den Rohwert durch 10^decimal_places
+* min/max (type 'range') begrenzen den plausiblen Wertebereich
+
+Zwei 32-Bit-Parameter "… (lower 32 bits)" und "… (upper 32 bits)" an
+aufeinanderfolgenden Adressen werden zu einem 64-Bit-Kanal unter dem Code des
+unteren Teils zusammengefasst (z.B. P0B-58/P0B-60, absolute Position).
+"""
+
+import json
+
+from custom_exceptions import FileOperationException
+from utils.block_planner import BlockItem, parse_number_type
+
+# Parametergruppen, deren Werte als Plot-Kanal wählbar sind
+MONITORING_GROUPS = ("P0B", "P30")
+
+# Plausible Bereiche von Kanälen ohne Wertebereich in den Parameterdefinitionen
+PLAUSIBLE_RANGES = {
+    "P0B-00": (-10000, 10000),  # Istdrehzahl in rpm
+    "P0B-01": (-10000, 10000),  # Drehzahlsollwert in rpm
+    "P0B-02": (-5000, 5000),    # Momentensollwert in 0,1 % des Nennmoments (bis 500 %)
+    "P0B-24": (0, 50000),       # Phasenstrom-Effektivwert in 0,01 A
+}
+
+_LOWER_SUFFIX = "(lower 32 bits)"
+_UPPER_SUFFIX = "(upper 32 bits)"
+
+
+class PlotChannel:
+    """Ein Überwachungswert mit Registerbeschreibung und Umrechnung."""
+
+    __slots__ = ('code', 'name', 'unit', 'address', 'width', 'is_signed', 'decimal_places', 'minimum', 'maximum')
+
+    def __init__(self, code, name, unit, address, width=1, is_signed=False, decimal_places=0,
+                 minimum=None, maximum=None):
+        self.code = code
+        self.name = name
+        self.unit = unit
+        self.address = address
+        self.width = width
+        self.is_signed = is_signed
+        self.decimal_places = decimal_places
+        # Grenzen in angezeigten Einheiten (bereits skaliert)
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def __repr__(self):
+        return f"PlotChannel({self.code}, address={self.address}, width={self.width}, signed={self.is_signed})"
+
+    @property
+    def label(self):
+        return f"{self.code} ({self.unit})"
+
+    @property
+    def item(self):
+        """BlockItem für die Blockplanung"""
+        return BlockItem(self.code, self.address, self.width, self.is_signed)
+
+    def convert(self, raw):
+        """
+        Wandelt den Rohwert aus ReadBlock.decode in den angezeigten Wert um.
+
+        ReadBlock.decode berücksichtigt das Vorzeichen nur bei 32- und 64-Bit-Werten,
+        16-Bit-Werte werden hier ins Zweierkomplement umgerechnet.
+        """
+        if self.width == 1 and self.is_signed and raw & 0x8000:
+            raw -= 0x10000
+        if self.decimal_places:
+            return raw / 10 ** self.decimal_places
+        return raw
+
+    def in_range(self, value):
+        """True, wenn der Wert im plausiblen Bereich liegt (ohne Grenzen immer)"""
+        if self.minimum is not None and value < self.minimum:
+            return False
+        if self.maximum is not None and value > self.maximum:
+            return False
+        return True
+
+    def format(self, value):
+        """Wert als Text mit den Nachkommastellen des Parameters"""
+        if self.decimal_places:
+            return f"{value:.{self.decimal_places}f}"
+        return str(value)
+
+
+def _channel_from_parameter(param):
+    try:
+        address = int(param.get('decimal'))
+    except (TypeError, ValueError):
+        return None
+    validation = param.get('validation') or {}
+    width, is_signed = parse_number_type(validation.get('number_type'))
+    if not is_signed and validation.get('two_complement'):
+        is_signed = True
+    try:
+        decimal_places = int(validation.get('decimal_places') or 0)
+    except (TypeError, ValueError):
+        decimal_places = 0
+    minimum = maximum = None
+    if validation.get('type') == 'range':
+        scale = 10 ** decimal_places
+        if validation.get('min') is not None:
+            minimum = validation['min'] / scale if decimal_places else validation['min']
+        if validation.get('max') is not None:
+            maximum = validation['max'] / scale if decimal_places else validation['max']
+    return PlotChannel(param.get('code'), param.get('name') or '', param.get('unit') or '', address,
+                       width, is_signed, decimal_places, minimum, maximum)
+
+
+class ChannelRegistry:
+    """Alle wählbaren Plot-Kanäle, nach Code abrufbar."""
+
+    def __init__(self, parameters, groups=MONITORING_GROUPS):
+        """
+        Args:
+            parameters: Parameterdefinitionen (Rohdaten aus der JSON-Datei)
+            groups: Parametergruppen, deren Werte als Kanal wählbar sind
+        """
+        channels = {}
+        for param in parameters:
+            code = param.get('code') or ''
+            if code[:3] not in groups:
+                continue
+            channel = _channel_from_parameter(param)
+            if channel is not None:
+                channels[code] = channel
+
+        by_address = {channel.address: channel for channel in channels.values()}
+        for channel in list(channels.values()):
+            if channel.width != 2 or not channel.name.endswith(_LOWER_SUFFIX):
+                continue
+            upper = by_address.get(channel.address + 2)
+            if upper is None or upper.width != 2 or not upper.name.endswith(_UPPER_SUFFIX):
+                continue
+            # Ein 64-Bit-Wert; die Grenzen der 32-Bit-Hälften gelten für ihn nicht
+            channels[channel.code] = PlotChannel(
+                channel.code, channel.name[:-len(_LOWER_SUFFIX)].rstrip(), channel.unit, channel.address,
+                width=4, is_signed=upper.is_signed, decimal_places=channel.decimal_places
+            )
+            channels.pop(upper.code, None)
+
+        self._channels = dict(sorted(channels.items(), key=lambda entry: entry[1].address))
+
+    @classmethod
+    def from_file(cls, json_file_path="servo_parameter_definitions.json"):
+        """
+        Liest die Kanäle direkt aus der Definitionsdatei (ohne ParameterManager).
+
+        Raises:
+            FileOperationException: Wenn die Datei nicht gelesen werden kann
+        """
+        from parameter_manager import resource_path
+        try:
+            with open(resource_path(json_file_path), 'r', encoding='utf-8') as f:
+                return cls(json.load(f))
+        except (OSError, json.JSONDecodeError) as e:
+            raise FileOperationException(f"Parameterdefinitionen konnten nicht gelesen werden: {e}")
+
+    def __contains__(self, code):
+        return code in self._channels
+
+    def __len__(self):
+        return len(self._channels)
+
+    def get(self, code):
+        """Kanal zum Parametercode oder None"""
+        return self._channels.get(code)
+
+    def codes(self):
+        """Alle Kanalcodes in Adressreihenfolge"""
+        return list(self._channels)
+
+    def channels(self):
+        """Alle Kanäle in Adressreihenfolge"""
+        return list(self._channels.values())
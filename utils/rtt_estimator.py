@@ -0,0 +1,139 @@
+"""
+Adaptive Timeout-Schätzung für Modbus-Transaktionen.
+
+Die Schätzung folgt dem Verfahren der TCP-Retransmission-Timeouts (RFC 6298):
+Für jede Kombination aus Funktionscode und Rahmengröße werden ein gleitender
+Mittelwert (EWMA) und die mittlere Abweichung der erfolgreichen Round-Trip-Zeiten
+geführt. Der Timeout ergibt sich aus ``SRTT + K * RTTVAR`` und wird auf einen
+konfigurierbaren Bereich begrenzt.
+"""
+
+import threading
+
+
+class RttEstimator:
+    """Schätzt Round-Trip-Zeiten je Transaktionstyp und leitet daraus Timeouts ab."""
+
+    ALPHA = 1.0 / 8.0  # Gewichtung neuer Messwerte für SRTT
+    BETA = 1.0 / 4.0   # Gewichtung neuer Messwerte für RTTVAR
+    K = 4              # Faktor für die Streuung
+
+    def __init__(self, min_timeout=0.02, max_timeout=2.0, initial_timeout=1.0, min_samples=3):
+        """
+        Initialisiert den Schätzer.
+
+        Args:
+            min_timeout: Untergrenze des abgeleiteten Timeouts in Sekunden
+            max_timeout: Obergrenze des abgeleiteten Timeouts in Sekunden
+            initial_timeout: Timeout, solange noch keine ausreichenden Messwerte vorliegen
+            min_samples: Anzahl der Messwerte, ab der der abgeleitete Timeout verwendet wird
+        """
+        self.min_timeout = float(min_timeout)
+        self.max_timeout = float(max_timeout)
+        self.initial_timeout = float(initial_timeout)
+        self.min_samples = int(min_samples)
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(function_code, count):
+        return (int(function_code), int(count))
+
+    def _clamp(self, value):
+        return max(self.min_timeout, min(self.max_timeout, value))
+
+    def get_timeout(self, function_code, count=1):
+        """
+        Liefert den aktuellen Timeout für einen Transaktionstyp.
+
+        Args:
+            function_code: Modbus-Funktionscode (z.B. 3 für Read Holding Registers)
+            count: Anzahl der Register (bestimmt die Rahmengröße)
+
+        Returns:
+            float: Timeout in Sekunden
+        """
+        with self._lock:
+            entry = self._stats.get(self._key(function_code, count))
+            if entry is None or entry['samples'] < self.min_samples:
+                base = self.initial_timeout
+            else:
+                base = entry['srtt'] + self.K * entry['rttvar']
+            if entry is not None:
+                base *= entry['backoff']
+            return self._clamp(base)
+
+    def record_success(self, function_code, count, rtt, timeout_used=None):
+        """
+        Verarbeitet die Round-Trip-Zeit einer erfolgreichen Transaktion.
+
+        Messwerte, die länger als der verwendete Timeout dauerten, stammen aus einer
+        Wiederholung der Anfrage und werden nach dem Karn-Algorithmus verworfen.
+
+        Args:
+            function_code: Modbus-Funktionscode
+            count: Anzahl der Register
+            rtt: Gemessene Round-Trip-Zeit in Sekunden
+            timeout_used: Für die Transaktion verwendeter Timeout in Sekunden
+        """
+        if rtt is None or rtt < 0:
+            return
+        with self._lock:
+            key = self._key(function_code, count)
+            entry = self._stats.get(key)
+            if entry is None:
+                entry = {'srtt': rtt, 'rttvar': rtt / 2.0, 'samples': 0,
+                         'backoff': 1.0, 'timeouts': 0, 'last_rtt': rtt}
+                self._stats[key] = entry
+            else:
+                if timeout_used is not None and rtt > timeout_used:
+                    # Mehrdeutiger Messwert (Wiederholung) - nur den Backoff zurücksetzen
+                    entry['backoff'] = 1.0
+                    return
+                entry['rttvar'] = (1 - self.BETA) * entry['rttvar'] + self.BETA * abs(entry['srtt'] - rtt)
+                entry['srtt'] = (1 - self.ALPHA) * entry['srtt'] + self.ALPHA * rtt
+            entry['samples'] += 1
+            entry['backoff'] = 1.0
+            entry['last_rtt'] = rtt
+
+    def record_timeout(self, function_code, count):
+        """
+        Verarbeitet einen Timeout: der Timeout für diesen Transaktionstyp wird verdoppelt,
+        bis wieder eine erfolgreiche Antwort eintrifft.
+
+        Args:
+            function_code: Modbus-Funktionscode
+            count: Anzahl der Register
+        """
+        with self._lock:
+            key = self._key(function_code, count)
+            entry = self._stats.get(key)
+            if entry is None:
+                return
+            entry['timeouts'] += 1
+            entry['backoff'] = min(entry['backoff'] * 2.0, 64.0)
+
+    def reset(self):
+        """Verwirft alle Messwerte, z.B. nach einem Verbindungswechsel."""
+        with self._lock:
+            self._stats.clear()
+
+    def get_statistics(self):
+        """
+        Gibt eine Momentaufnahme der Schätzwerte zurück.
+
+        Returns:
+            dict: {(function_code, count): {'srtt', 'rttvar', 'timeout', 'samples', 'timeouts'}}
+        """
+        with self._lock:
+            snapshot = {key: dict(entry) for key, entry in self._stats.items()}
+        result = {}
+        for key, entry in snapshot.items():
+            result[key] = {
+                'srtt': entry['srtt'],
+                'rttvar': entry['rttvar'],
+                'timeout': self.get_timeout(*key),
+                'samples': entry['samples'],
+                'timeouts': entry['timeouts'],
+            }
+        return result
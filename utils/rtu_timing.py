@@ -0,0 +1,158 @@
+"""
+Zeitverhalten von Modbus-RTU-Rahmen.
+
+Berechnet aus Baudrate, Datenbits, Parität und Stoppbits die theoretisch minimale
+Dauer einer Transaktion (Anfrage + Antwort auf der Leitung, Pausen zwischen den
+Rahmen, Antwortverzögerung des Antriebs) und vergleicht sie mit den gemessenen
+Zeiten. Das Verhältnis beider Werte ist die Effizienz der Verbindung.
+"""
+
+import threading
+
+# Rahmenaufbau: Adresse (1) + Funktionscode (1) + Daten + CRC (2)
+_FRAME_OVERHEAD = 4
+
+
+def char_time(baudrate, bytesize=8, parity='N', stopbits=1):
+    """
+    Dauer eines Zeichens auf der Leitung.
+
+    Args:
+        baudrate: Baudrate in bit/s
+        bytesize: Anzahl der Datenbits
+        parity: 'N', 'E' oder 'O'
+        stopbits: Anzahl der Stoppbits
+
+    Returns:
+        float: Zeichenzeit in Sekunden (Startbit + Daten + Parität + Stoppbits)
+    """
+    parity_bits = 0 if str(parity).upper() == 'N' else 1
+    return float(1 + int(bytesize) + parity_bits + int(stopbits)) / float(baudrate)
+
+
+def inter_frame_gap(baudrate, bytesize=8, parity='N', stopbits=1):
+    """
+    Minimale Pause zwischen zwei Rahmen laut Modbus-RTU-Spezifikation.
+
+    Bis 19200 Baud sind es 3,5 Zeichenzeiten, darüber fest 1,75 ms.
+
+    Returns:
+        float: Pause in Sekunden
+    """
+    if baudrate > 19200:
+        return 0.00175
+    return 3.5 * char_time(baudrate, bytesize, parity, stopbits)
+
+
+def request_frame_bytes(function_code, count=1):
+    """Länge des Anfragerahmens in Bytes."""
+    if function_code == 16:
+        # Startadresse (2) + Anzahl (2) + Bytezähler (1) + Daten
+        return _FRAME_OVERHEAD + 5 + 2 * count
+    # FC 3 und FC 6: Adresse (2) + Anzahl bzw. Wert (2)
+    return _FRAME_OVERHEAD + 4
+
+
+def response_frame_bytes(function_code, count=1):
+    """Länge des Antwortrahmens in Bytes."""
+    if function_code == 3:
+        # Bytezähler (1) + Daten
+        return _FRAME_OVERHEAD + 1 + 2 * count
+    # FC 6 und FC 16 wiederholen Adresse und Wert bzw. Anzahl
+    return _FRAME_OVERHEAD + 4
+
+
+def min_transaction_time(function_code, count, baudrate, bytesize=8, parity='N', stopbits=1,
+                         response_delay=0.0, inter_frame_delay=None):
+    """
+    Theoretisch minimale Dauer einer Transaktion.
+
+    Args:
+        function_code: Modbus-Funktionscode (3, 6 oder 16)
+        count: Anzahl der Register
+        baudrate, bytesize, parity, stopbits: Schnittstellenparameter
+        response_delay: Antwortverzögerung des Antriebs in Sekunden (P0C-25)
+        inter_frame_delay: Pause zwischen den Rahmen in Sekunden; None für den Normwert
+
+    Returns:
+        float: Dauer in Sekunden
+    """
+    t_char = char_time(baudrate, bytesize, parity, stopbits)
+    if inter_frame_delay is None:
+        inter_frame_delay = inter_frame_gap(baudrate, bytesize, parity, stopbits)
+    wire_bytes = request_frame_bytes(function_code, count) + response_frame_bytes(function_code, count)
+    # Der Antwortrahmen endet erst nach einer Pause, die Anfrage wartet vorher auf eine Pause
+    return wire_bytes * t_char + 2 * inter_frame_delay + response_delay
+
+
+class LinkTimingStats:
+    """Sammelt gemessene und theoretische Transaktionszeiten je Transaktionstyp."""
+
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, function_code, count, measured, theoretical):
+        """
+        Speichert eine erfolgreiche Transaktion.
+
+        Args:
+            function_code: Modbus-Funktionscode
+            count: Anzahl der Register
+            measured: Gemessene Dauer in Sekunden
+            theoretical: Theoretisch minimale Dauer in Sekunden
+        """
+        with self._lock:
+            entry = self._stats.setdefault((int(function_code), int(count)), {
+                'transactions': 0, 'measured_total': 0.0, 'theoretical_total': 0.0,
+                'measured_min': None, 'measured_last': 0.0, 'theoretical': theoretical
+            })
+            entry['transactions'] += 1
+            entry['measured_total'] += measured
+            entry['theoretical_total'] += theoretical
+            entry['measured_last'] = measured
+            entry['theoretical'] = theoretical
+            if entry['measured_min'] is None or measured < entry['measured_min']:
+                entry['measured_min'] = measured
+
+    def reset(self):
+        """Verwirft alle Messwerte."""
+        with self._lock:
+            self._stats.clear()
+
+    def get_efficiency(self):
+        """
+        Gesamteffizienz der Verbindung.
+
+        Returns:
+            float oder None: Summe der theoretischen Zeiten / Summe der gemessenen Zeiten
+        """
+        with self._lock:
+            measured = sum(e['measured_total'] for e in self._stats.values())
+            theoretical = sum(e['theoretical_total'] for e in self._stats.values())
+        if measured <= 0:
+            return None
+        return theoretical / measured
+
+    def get_statistics(self):
+        """
+        Gibt eine Momentaufnahme je Transaktionstyp zurück.
+
+        Returns:
+            dict: {(function_code, count): {'transactions', 'measured_avg', 'measured_min',
+                   'measured_last', 'theoretical', 'efficiency'}}
+        """
+        with self._lock:
+            snapshot = {key: dict(entry) for key, entry in self._stats.items()}
+        result = {}
+        for key, entry in snapshot.items():
+            measured_avg = entry['measured_total'] / entry['transactions']
+            result[key] = {
+                'transactions': entry['transactions'],
+                'measured_avg': measured_avg,
+                'measured_min': entry['measured_min'],
+                'measured_last': entry['measured_last'],
+                'theoretical': entry['theoretical'],
+                'efficiency': entry['theoretical'] / measured_avg if measured_avg > 0 else None,
+            }
+        return result
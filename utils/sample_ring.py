@@ -0,0 +1,178 @@
+"""
+Ringpuffer für Abtastwerte im gemeinsamen Speicher (multiprocessing.shared_memory).
+
+Ein Schreiber (der Erfassungsprozess) legt je Abtastung eine Zeile ab: den
+Abtasttermin (time.perf_counter, in allen Prozessen eines Rechners dieselbe
+Zeitbasis) und einen Wert je Kanal; nicht gelesene Kanäle sind NaN. Leser in
+anderen Prozessen greifen über NumPy-Views ohne Kopie auf die Zeilen zu.
+
+Aufbau des Speichers::
+
+    Kopf      HEADER_SLOTS x int64 (Schreibzähler, Kapazität, Spalten, Zustand, Zähler)
+    Fehler    ERROR_BYTES Byte UTF-8 (letzte Fehlermeldung des Schreibers)
+    Daten     Kapazität x Spalten float64 (Spalte 0: Termin, danach die Kanäle)
+
+Der Schreiber schreibt zuerst die Zeile und erhöht danach den Schreibzähler.
+Ein Leser merkt sich den zuletzt gelesenen Zählerstand und erhält bei read()
+nur die neuen Zeilen. Zeilen, die der Schreiber während des Lesens
+überschreiben könnte (die ältesten READ_MARGIN der Kapazität), gelten als
+verloren und werden gezählt, statt sie gemischt mit neuen Werten auszugeben.
+
+Werte werden als float64 abgelegt; ganzzahlige Kanäle sind bis 2^53 exakt.
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Kopfeinträge (int64)
+SEQ = 0          # Anzahl geschriebener Zeilen
+CAPACITY = 1     # Zeilen im Ring
+COLUMNS = 2      # Spalten je Zeile (Termin + Kanäle)
+STATE = 3        # STATE_…
+CYCLES = 4       # Abfragezyklen des Schreibers
+OVERRUNS = 5     # Zyklen länger als die Abtastperiode
+MISSED = 6       # ausgelassene Abtastungen
+FAILURES = 7     # aufeinanderfolgende Fehlzyklen
+MAX_CYCLE_TIME = 8   # längster Abfragezyklus in µs
+MAX_LATENESS = 9     # größte Verspätung gegenüber dem Abtasttermin in µs
+MEAN_LATENESS = 10   # mittlere Verspätung in µs
+HEADER_SLOTS = 16
+
+ERROR_BYTES = 256
+DATA_OFFSET = HEADER_SLOTS * 8 + ERROR_BYTES
+
+STATE_STARTING = 0
+STATE_RUNNING = 1
+STATE_STOPPED = 2
+STATE_FAILED = 3
+
+# Zeilen bei 1 kHz für gut 16 s
+DEFAULT_CAPACITY = 16384
+
+# Anteil der Kapazität, den ein Leser als möglicherweise überschrieben verwirft
+READ_MARGIN = 0.125
+
+
+class SampleRing:
+    """Ringpuffer im gemeinsamen Speicher mit einem Schreiber und beliebig vielen Lesern."""
+
+    def __init__(self, shm, owner=False):
+        """
+        Nicht direkt aufrufen, sondern create() bzw. attach() verwenden.
+
+        Args:
+            shm: SharedMemory-Block
+            owner: True, wenn dieser Prozess den Block angelegt hat (und ihn bei close() freigibt)
+        """
+        self._shm = shm
+        self._owner = owner
+        self.header = np.ndarray((HEADER_SLOTS,), dtype=np.int64, buffer=shm.buf)
+        self.capacity = int(self.header[CAPACITY])
+        self.columns = int(self.header[COLUMNS])
+        self.data = np.ndarray((self.capacity, self.columns), dtype=np.float64, buffer=shm.buf, offset=DATA_OFFSET)
+        self._read_seq = 0
+        self.lost = 0
+
+    @classmethod
+    def create(cls, channel_count, capacity=DEFAULT_CAPACITY):
+        """Legt einen neuen Ring für channel_count Kanäle an"""
+        columns = channel_count + 1
+        size = DATA_OFFSET + capacity * columns * 8
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        header = np.ndarray((HEADER_SLOTS,), dtype=np.int64, buffer=shm.buf)
+        header[:] = 0
+        header[CAPACITY] = capacity
+        header[COLUMNS] = columns
+        del header
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """Verbindet sich mit einem vorhandenen Ring (z.B. im Erfassungsprozess)"""
+        return cls(shared_memory.SharedMemory(name=name))
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @property
+    def channel_count(self):
+        return self.columns - 1
+
+    @property
+    def state(self):
+        return int(self.header[STATE])
+
+    def close(self):
+        """Löst die Views; der anlegende Prozess gibt den Speicher zusätzlich frei"""
+        self.header = None
+        self.data = None
+        self._shm.close()
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    # --- Schreiber ---
+
+    def append(self, timestamp, values):
+        """
+        Schreibt eine Zeile.
+
+        Args:
+            timestamp: Abtasttermin (time.perf_counter)
+            values: Werte je Kanal (Länge channel_count, NaN = nicht gelesen)
+        """
+        seq = int(self.header[SEQ])
+        row = self.data[seq % self.capacity]
+        row[0] = timestamp
+        row[1:] = values
+        # Erst nach der Zeile sichtbar machen
+        self.header[SEQ] = seq + 1
+
+    def set_state(self, state, error=None):
+        """Setzt den Zustand und optional die Fehlermeldung"""
+        if error is not None:
+            encoded = error.encode('utf-8')[:ERROR_BYTES - 1]
+            buf = self._shm.buf
+            buf[HEADER_SLOTS * 8:HEADER_SLOTS * 8 + len(encoded)] = encoded
+            buf[HEADER_SLOTS * 8 + len(encoded)] = 0
+        self.header[STATE] = state
+
+    def error(self):
+        """Letzte Fehlermeldung des Schreibers ('' ohne Fehler)"""
+        raw = bytes(self._shm.buf[HEADER_SLOTS * 8:DATA_OFFSET])
+        return raw.split(b'\0', 1)[0].decode('utf-8', errors='replace')
+
+    # --- Leser ---
+
+    def read(self):
+        """
+        Gibt die seit dem letzten Aufruf geschriebenen Zeilen zurück.
+
+        Returns:
+            list: Bis zu zwei Views (Zeilen x Spalten) in zeitlicher Reihenfolge; gültig,
+                  bis der Schreiber den Ring erneut umrundet hat
+        """
+        seq = int(self.header[SEQ])
+        oldest = seq - self.capacity + int(self.capacity * READ_MARGIN)
+        start = self._read_seq
+        if start < oldest:
+            self.lost += oldest - start
+            start = oldest
+        self._read_seq = seq
+        if start >= seq:
+            return []
+        first, last = start % self.capacity, seq % self.capacity
+        if first < last:
+            return [self.data[first:last]]
+        segments = [self.data[first:]]
+        if last:
+            segments.append(self.data[:last])
+        return segments
+
+    def skip(self):
+        """Verwirft alle bisher geschriebenen Zeilen (Lesen beginnt bei der nächsten)"""
+        self._read_seq = int(self.header[SEQ])
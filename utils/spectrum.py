@@ -0,0 +1,171 @@
+"""
+Leistungsdichtespektrum (Welch) für die Plot-Kanäle.
+
+Die Abtastungen der Plot-Erfassung liegen bei festem Abtastintervall auf einem
+Zeitraster (utils.cycle_timer). UniformResampler ordnet sie diesem Raster zu und
+füllt einzelne ausgelassene Rasterpunkte durch lineare Interpolation; nach einer
+längeren Lücke beginnt die Folge neu. IncrementalWelch zerlegt die Folge in
+überlappende Segmente (Hann-Fenster, Mittelwert abgezogen), berechnet die
+Periodogramme neuer Segmente in einem Schritt mit np.fft.rfft und mittelt die
+letzten max_segments Segmente. Bei jeder Aktualisierung werden nur die neu
+hinzugekommenen Segmente transformiert.
+"""
+
+from collections import deque
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Segmentlängen, die in der Oberfläche wählbar sind
+SEGMENT_LENGTHS = (128, 256, 512, 1024, 2048)
+DEFAULT_SEGMENT_LENGTH = 512
+
+# Gemittelte Segmente (ältere fallen heraus)
+DEFAULT_MAX_SEGMENTS = 32
+
+# Lücke in Abtastperioden, nach der die Folge neu beginnt
+MAX_GAP = 10
+
+
+class UniformResampler:
+    """Ordnet Abtastungen einem festen Zeitraster zu (fortlaufend über mehrere Aufrufe)."""
+
+    def __init__(self, period):
+        """
+        Args:
+            period: Abstand der Rasterpunkte in Sekunden
+        """
+        self.period = float(period)
+        self.reset()
+
+    def reset(self):
+        self._origin = None
+        self._last_index = -1
+        self._last_position = None
+        self._last_value = None
+
+    def add(self, times, values):
+        """
+        Args:
+            times: Abtastzeitpunkte in Sekunden (aufsteigend)
+            values: Werte
+
+        Returns:
+            tuple: (Werte der neu erreichten Rasterpunkte, True wenn die Folge wegen einer Lücke neu begonnen hat)
+        """
+        times = np.asarray(times, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        if not len(times):
+            return np.empty(0), False
+        if self._origin is None:
+            self._origin = times[0]
+        positions = (times - self._origin) / self.period
+
+        restarted = False
+        if self._last_position is not None:
+            gaps = np.diff(positions, prepend=self._last_position)
+            breaks = np.flatnonzero(gaps > MAX_GAP)
+            if len(breaks):
+                # Nur den Teil nach der letzten Lücke verwenden
+                start = breaks[-1]
+                self.reset()
+                self._origin = times[start]
+                positions = (times[start:] - self._origin) / self.period
+                values = values[start:]
+                restarted = True
+        if self._last_position is not None:
+            positions = np.concatenate(([self._last_position], positions))
+            values = np.concatenate(([self._last_value], values))
+
+        grid = np.arange(self._last_index + 1, int(np.floor(positions[-1])) + 1)
+        # Punkte vor dem ersten Zeitpunkt gibt es nur beim Start nicht
+        grid = grid[grid >= positions[0]]
+        resampled = np.interp(grid, positions, values)
+        if len(grid):
+            self._last_index = int(grid[-1])
+        self._last_position = positions[-1]
+        self._last_value = values[-1]
+        return resampled, restarted
+
+
+class IncrementalWelch:
+    """Welch-Schätzung, die mit jeder neuen Abtastung fortgeschrieben wird."""
+
+    def __init__(self, segment_length=DEFAULT_SEGMENT_LENGTH, overlap=0.5, max_segments=DEFAULT_MAX_SEGMENTS):
+        """
+        Args:
+            segment_length: Abtastungen je Segment (Frequenzauflösung = Abtastrate / segment_length)
+            overlap: Überlappung der Segmente (0 bis < 1)
+            max_segments: Anzahl der gemittelten Segmente
+        """
+        self.segment_length = int(segment_length)
+        self.step = max(1, self.segment_length - int(self.segment_length * overlap))
+        self.max_segments = int(max_segments)
+        self.window = np.hanning(self.segment_length)
+        self._window_power = float(np.sum(self.window ** 2))
+        self.reset()
+
+    def reset(self):
+        """Verwirft alle Segmente"""
+        self._pending = np.empty(0)
+        self._spectra = deque()
+        self._sum = np.zeros(self.segment_length // 2 + 1)
+
+    def discard_pending(self):
+        """Verwirft angefangene Segmente (nach einer Lücke in der Folge)"""
+        self._pending = np.empty(0)
+
+    @property
+    def segments(self):
+        return len(self._spectra)
+
+    def add(self, samples):
+        """Hängt gleichabständige Abtastungen an und transformiert alle neu vollständigen Segmente"""
+        data = np.concatenate((self._pending, np.asarray(samples, dtype=np.float64)))
+        n = self.segment_length
+        if len(data) < n:
+            self._pending = data
+            return
+        segments = sliding_window_view(data, n)[::self.step]
+        segments = segments - segments.mean(axis=1, keepdims=True)
+        spectra = np.abs(np.fft.rfft(segments * self.window, axis=1)) ** 2
+        # Nur die jüngsten max_segments Segmente werden gebraucht
+        spectra = spectra[-self.max_segments:]
+        self._sum += spectra.sum(axis=0)
+        self._spectra.extend(spectra)
+        while len(self._spectra) > self.max_segments:
+            self._sum -= self._spectra.popleft()
+        self._pending = data[len(segments) * self.step:]
+
+    def psd(self, sample_rate):
+        """
+        Einseitige Leistungsdichte.
+
+        Returns:
+            tuple: (Frequenzen in Hz, Leistungsdichte in Einheit²/Hz); leer ohne vollständiges Segment
+        """
+        if not self._spectra:
+            return np.empty(0), np.empty(0)
+        psd = self._sum / (len(self._spectra) * sample_rate * self._window_power)
+        # Negative Frequenzen auf die positiven falten (ohne Gleichanteil und Nyquist-Frequenz)
+        if self.segment_length % 2:
+            psd[1:] *= 2
+        else:
+            psd[1:-1] *= 2
+        return np.fft.rfftfreq(self.segment_length, 1.0 / sample_rate), psd
+
+
+def welch_psd(values, sample_rate, segment_length=DEFAULT_SEGMENT_LENGTH, overlap=0.5):
+    """Welch-Schätzung über eine vollständige Folge (alle Segmente gemittelt)"""
+    values = np.asarray(values, dtype=np.float64)
+    count = max(1, (len(values) - segment_length) // max(1, segment_length - int(segment_length * overlap)) + 1)
+    welch = IncrementalWelch(segment_length, overlap, max_segments=count)
+    welch.add(values)
+    return welch.psd(sample_rate)
+
+
+def peak_frequency(freqs, psd):
+    """Frequenz des größten Werts ohne Gleichanteil (None ohne Spektrum oder bei konstantem Signal)"""
+    if len(psd) < 2 or not np.nanmax(psd[1:]) > 0:
+        return None
+    return float(freqs[1 + int(np.argmax(psd[1:]))])
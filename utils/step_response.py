@@ -0,0 +1,111 @@
+"""
+Kennwerte einer Sprungantwort (Drehzahlregelung).
+
+Ausgewertet wird ein aufgezeichnetes Zeitfenster mit Sollwert (P0B-01), Istwert
+(P0B-00) und optional Drehmoment (P0B-02) auf einer gemeinsamen Zeitachse. Der
+Anfangswert ist der Istwert vor dem Sprung, der Endwert der Sollwert am Ende des
+Fensters. Der Sprung beginnt, sobald sich der Sollwert um mehr als
+START_FRACTION der Sprunghöhe ändert; beginnt das Fenster erst nach dem Sprung,
+gilt der erste Zeitpunkt.
+
+    Anstiegszeit        Istwert von RISE_LOW bis RISE_HIGH der Sprunghöhe
+    Überschwingen       größter Istwert über dem Endwert in % der Sprunghöhe
+    Ausregelzeit        ab Sprungbeginn, bis der Istwert im Band
+                        ±SETTLING_BAND der Sprunghöhe um den Endwert bleibt
+    Bleibende Abw.      Endwert - Mittelwert des Istwerts im letzten
+                        STEADY_STATE_FRACTION des Fensters
+    Drehmomentspitze    Drehmoment mit dem größten Betrag ab Sprungbeginn
+
+Das Drehmoment wird in % des Nennmoments erwartet; P0B-02 liefert 0,1 % je
+Einheit und wird vorher durch TORQUE_RAW_PER_PERCENT geteilt.
+"""
+
+import numpy as np
+
+START_FRACTION = 0.02
+RISE_LOW = 0.1
+RISE_HIGH = 0.9
+SETTLING_BAND = 0.02
+STEADY_STATE_FRACTION = 0.1
+
+# Rohwerte von P0B-02 je % Nennmoment
+TORQUE_RAW_PER_PERCENT = 10.0
+
+# Kleinere Sprünge (in Einheiten des Sollwerts) werden nicht ausgewertet
+MIN_STEP = 1.0
+
+
+def _crossing_time(times, progress, level):
+    """Erster Zeitpunkt, an dem progress level erreicht (linear interpoliert; None wenn nie)"""
+    reached = np.flatnonzero(progress >= level)
+    if not len(reached):
+        return None
+    i = reached[0]
+    if i == 0:
+        return float(times[0])
+    fraction = (level - progress[i - 1]) / (progress[i] - progress[i - 1])
+    return float(times[i - 1] + fraction * (times[i] - times[i - 1]))
+
+
+def analyze_step(times, reference, feedback, torque=None, settling_band=SETTLING_BAND):
+    """
+    Berechnet die Kennwerte einer Sprungantwort.
+
+    Args:
+        times: Zeitpunkte in s (aufsteigend)
+        reference: Sollwert zu den Zeitpunkten
+        feedback: Istwert zu den Zeitpunkten
+        torque: Drehmoment zu den Zeitpunkten (optional)
+        settling_band: Toleranzband der Ausregelzeit als Anteil der Sprunghöhe
+
+    Returns:
+        dict: step_time, initial, final, amplitude, rise_time, overshoot (%), settling_time,
+              steady_state_error, torque_peak (Zeiten in s; None, wenn nicht bestimmbar),
+              oder None, wenn im Fenster kein Sprung liegt
+    """
+    times = np.asarray(times, dtype=np.float64)
+    reference = np.asarray(reference, dtype=np.float64)
+    feedback = np.asarray(feedback, dtype=np.float64)
+    if len(times) < 3:
+        return None
+
+    tail = max(1, int(len(times) * STEADY_STATE_FRACTION))
+    final = float(np.median(reference[-tail:]))
+    moved = np.abs(reference - reference[0]) > START_FRACTION * abs(final - reference[0])
+    start = int(np.argmax(moved)) if moved.any() and final != reference[0] else 0
+    initial = float(np.mean(feedback[:start])) if start else float(feedback[0])
+    amplitude = final - initial
+    if abs(amplitude) < MIN_STEP:
+        return None
+
+    t = times[start:]
+    response = feedback[start:]
+    progress = (response - initial) / amplitude
+    t_low = _crossing_time(t, progress, RISE_LOW)
+    t_high = _crossing_time(t, progress, RISE_HIGH)
+
+    outside = np.flatnonzero(np.abs(response - final) > settling_band * abs(amplitude))
+    if not len(outside):
+        settling_time = 0.0
+    elif outside[-1] == len(response) - 1:
+        settling_time = None  # am Ende des Fensters noch außerhalb des Bands
+    else:
+        settling_time = float(t[outside[-1] + 1] - t[0])
+
+    torque_peak = None
+    if torque is not None:
+        torque = np.asarray(torque, dtype=np.float64)[start:]
+        if len(torque):
+            torque_peak = float(torque[np.argmax(np.abs(torque))])
+
+    return {
+        'step_time': float(t[0]),
+        'initial': initial,
+        'final': final,
+        'amplitude': amplitude,
+        'rise_time': t_high - t_low if t_low is not None and t_high is not None else None,
+        'overshoot': max(0.0, float(progress.max()) - 1.0) * 100.0,
+        'settling_time': settling_time,
+        'steady_state_error': final - float(np.mean(feedback[-tail:])),
+        'torque_peak': torque_peak,
+    }
@@ -0,0 +1,123 @@
+"""
+RAM-Modus für das Einstellen: Schreibzugriffe ohne EEPROM-Speicherung.
+
+P0C-13 legt fest, ob der Antrieb per Modbus geschriebene Parameter zusätzlich ins
+EEPROM übernimmt (1, Werkseinstellung; P0B und P0D nie) oder nur im RAM ändert (0).
+Beim schnellen Durchprobieren von Verstärkungen schont der RAM-Modus das EEPROM und
+verkürzt die Quittung der Schreibzugriffe.
+
+Ob ein Schreibzugriff ins EEPROM geht, entscheidet der Wert von P0C-13 vor dem
+Zugriff - das gilt auch für P0C-13 selbst:
+    start()   liest P0C-13, merkt den Wert und schreibt 0; bei P0C-13 = 1 landet die 0
+              dabei auch im EEPROM
+    record()  merkt einen im RAM-Modus geschriebenen Parameter als ungespeichert vor
+    commit()  schreibt P0C-13 = 1, alle vorgemerkten Werte erneut (und damit ins EEPROM)
+              und danach wieder P0C-13 = 0 (ebenfalls ins EEPROM)
+    stop()    schreibt den gemerkten Wert von P0C-13 zweimal: der erste Zugriff schaltet
+              die EEPROM-Speicherung wieder ein, erst der zweite speichert den Wert
+
+Ungespeicherte Werte gehen beim Ausschalten des Antriebs verloren. Wird der Antrieb
+ausgeschaltet oder die Verbindung unterbrochen, bevor stop() gelaufen ist, startet er mit
+P0C-13 = 0 und übernimmt danach keine Schreibzugriffe mehr ins EEPROM, bis P0C-13
+wieder auf 1 gesetzt wird.
+"""
+
+from custom_exceptions import ServoToolException
+from logger_config import logger
+
+EEPROM_UPDATE_ADDRESS = 3085  # P0C-13
+EEPROM_UPDATE_OFF = 0
+EEPROM_UPDATE_ON = 1
+
+
+class TuningSession:
+    """Schreibt während des Einstellens nur ins RAM und übernimmt die Werte gesammelt ins EEPROM"""
+
+    def __init__(self, modbus_client):
+        """
+        Args:
+            modbus_client: ServoModbusClient
+        """
+        self.modbus_client = modbus_client
+        self.active = False
+        self.previous_setting = EEPROM_UPDATE_ON
+        # Ungespeicherte Parameter: {Code: (Adresse, Rohwert, 32 Bit, vorzeichenbehaftet)}
+        self.dirty = {}
+
+    def start(self):
+        """
+        Schaltet den RAM-Modus ein.
+
+        Raises:
+            ServoToolException: Wenn P0C-13 nicht gelesen oder geschrieben werden kann
+        """
+        if self.active:
+            return
+        self.previous_setting = self.modbus_client.read_holding_register(EEPROM_UPDATE_ADDRESS)[0]
+        self.modbus_client.write_holding_register(EEPROM_UPDATE_ADDRESS, EEPROM_UPDATE_OFF)
+        self.active = True
+        logger.info(f"RAM-Modus eingeschaltet (P0C-13 war {self.previous_setting})")
+
+    def record(self, code, address, value, is_32bit=False, is_signed=False):
+        """Merkt einen im RAM-Modus geschriebenen Wert vor (außerhalb des RAM-Modus ohne Wirkung)"""
+        if self.active:
+            self.dirty[code] = (address, int(value), is_32bit, is_signed)
+
+    def dirty_codes(self):
+        return sorted(self.dirty)
+
+    def commit(self):
+        """
+        Übernimmt alle ungespeicherten Werte ins EEPROM; der RAM-Modus bleibt eingeschaltet.
+
+        Returns:
+            list: Codes der gespeicherten Parameter
+
+        Raises:
+            ServoToolException: Bei Schreibfehlern; noch nicht gespeicherte Parameter bleiben vorgemerkt
+        """
+        committed = []
+        if not self.dirty:
+            return committed
+        self.modbus_client.write_holding_register(EEPROM_UPDATE_ADDRESS, EEPROM_UPDATE_ON)
+        try:
+            for code in self.dirty_codes():
+                address, value, is_32bit, is_signed = self.dirty[code]
+                if is_32bit:
+                    self.modbus_client.write_holding_register_32bit(address, value, is_signed=is_signed)
+                else:
+                    self.modbus_client.write_holding_register(address, value)
+                del self.dirty[code]
+                committed.append(code)
+        finally:
+            if self.active:
+                self.modbus_client.write_holding_register(EEPROM_UPDATE_ADDRESS, EEPROM_UPDATE_OFF)
+            logger.info(f"Ins EEPROM übernommen: {committed}, ausstehend: {self.dirty_codes()}")
+        return committed
+
+    def stop(self):
+        """
+        Schaltet den RAM-Modus aus und stellt P0C-13 im RAM und im EEPROM wieder her.
+
+        Returns:
+            list: Codes der Parameter, die nur im RAM geändert wurden
+
+        Raises:
+            ServoToolException: Wenn P0C-13 nicht geschrieben werden kann (der RAM-Modus gilt dann als beendet)
+        """
+        if not self.active:
+            return []
+        uncommitted = self.dirty_codes()
+        self.active = False
+        self.dirty = {}
+        if uncommitted:
+            logger.warning(f"RAM-Modus beendet, nicht ins EEPROM übernommen: {uncommitted}")
+        try:
+            # Bei P0C-13 = 0 geht der erste Zugriff nur ins RAM; der zweite speichert den Wert
+            for _ in range(2):
+                self.modbus_client.write_holding_register(EEPROM_UPDATE_ADDRESS, self.previous_setting)
+        except ServoToolException as e:
+            logger.error(f"P0C-13 konnte nicht auf {self.previous_setting} zurückgesetzt werden: {e}")
+            raise
+        logger.info(f"RAM-Modus ausgeschaltet (P0C-13 = {self.previous_setting})")
+        return uncommitted
@@ -0,0 +1,233 @@
+"""
+Plot-Erfassung im eigenen Prozess mit der Schnittstelle des PlotDataWorker.
+
+Der Erfassungsprozess (utils.acquisition_process) schreibt die Abtastungen in
+einen Ringpuffer im gemeinsamen Speicher. Ein QTimer im GUI-Thread holt alle
+POLL_INTERVAL ms die neuen Zeilen und gibt sie als NumPy-Views mit
+samples_updated weiter; die Verbindung muss daher direkt (im GUI-Thread)
+erfolgen, damit die Views beim Empfänger noch gültig sind.
+"""
+
+import time
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from custom_exceptions import ServoToolException
+from logger_config import logger
+from modbus_client import TRANSPORT_SERIAL
+from utils.acquisition_process import AcquisitionProcess
+from utils.plot_channels import ChannelRegistry
+from utils.sample_ring import (
+    CYCLES, FAILURES, MAX_CYCLE_TIME, MAX_LATENESS, MEAN_LATENESS, MISSED, OVERRUNS, STATE_FAILED
+)
+from workers.plot_data_worker import DEFAULT_CHANNEL_RATES
+
+# Abstand, in dem die Oberfläche neue Abtastungen aus dem Ringpuffer holt (ms)
+POLL_INTERVAL = 33
+
+
+class AcquisitionProcessWorker(QObject):
+    """Steuert den Erfassungsprozess und reicht seine Abtastungen an die Oberfläche weiter"""
+    samples_updated = pyqtSignal(object, object)  # Abtastzeitpunkte (time.time), {Code: Werte}; NaN = nicht gelesen
+    data_updated = pyqtSignal(dict)  # Schnittstelle des PlotDataWorker, wird nicht verwendet
+    axis_data_updated = pyqtSignal(int, dict)  # Schnittstelle des PlotDataWorker, wird nicht verwendet
+    watchdog_triggered = pyqtSignal(str)  # Signal für Watchdog-Auslösung
+    cycle_overrun = pyqtSignal(float, int)  # Längster Buszyklus in s, neu ausgelassene Abtastungen
+
+    def __init__(self, modbus_client, parameter_manager, main_app=None):
+        super().__init__()
+        self.modbus_client = modbus_client
+        self.parameter_manager = parameter_manager
+        self.main_app = main_app
+        self.visible_lines = []
+        self.simulation_mode = False
+        self.slave_ids = []
+        self.channel_rates = dict(DEFAULT_CHANNEL_RATES)
+        self.sample_listeners = []  # Empfänger der Abtastungen mit perf_counter-Terminen (z.B. SpectrumWorker)
+
+        # Ringspalten: alle Plot-Kanäle, damit hinzugefügte Kanäle keinen Neustart brauchen
+        if parameter_manager is not None:
+            self.codes = ChannelRegistry(parameter_manager.raw_parameters).codes()
+        else:
+            self.codes = ChannelRegistry.from_file().codes()
+        self._columns = {code: index + 1 for index, code in enumerate(self.codes)}
+
+        self.config = {
+            'sample_interval': 0,  # ms - fester Abtastabstand, 0 = so schnell wie der Bus erlaubt
+            'watchdog_timeout': 10,  # s
+            'max_reconnect_attempts': 5,
+            'reconnect_delay': 5,  # s
+            'max_data_points': 1000000
+        }
+
+        self.process = None
+        self._clock_offset = 0.0  # time.time() - time.perf_counter()
+        self._last_cycles = 0
+        self._last_progress = 0.0
+        self._missed = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(POLL_INTERVAL)
+        self._timer.timeout.connect(self._poll)
+
+    def update_visible_lines(self, lines):
+        """Aktualisiert die Liste der sichtbaren Linien"""
+        self.visible_lines = list(lines)
+        self._send('set_visible', self.visible_lines)
+
+    def set_channel_rates(self, rates):
+        """Setzt die Abtastraten je Kanal in Hz (fehlende Kanäle: jeder Buszyklus)"""
+        self.channel_rates = dict(rates or {})
+        self._send('set_rates', self.channel_rates)
+
+    def set_slave_ids(self, slave_ids):
+        """Setzt die Achsen; der Erfassungsprozess fragt nur die erste ab"""
+        self.slave_ids = [int(s) for s in slave_ids] if slave_ids else []
+
+    def is_multi_axis(self):
+        return False
+
+    def set_simulation_mode(self, simulation_mode):
+        self.simulation_mode = simulation_mode
+
+    def update_config(self, new_config):
+        """Aktualisiert die Konfiguration des Workers"""
+        self.config.update(new_config)
+        if 'sample_interval' in new_config:
+            self._send('set_sample_interval', max(0, new_config['sample_interval']))
+        logger.info(f"Plot-Worker-Konfiguration aktualisiert: {new_config}")
+
+    def _send(self, method, *args):
+        """Leitet eine Einstellung an den laufenden Erfassungsprozess weiter"""
+        if self.process is None:
+            return
+        try:
+            getattr(self.process, method)(*args)
+        except ServoToolException as e:
+            logger.warning(f"Einstellung konnte nicht an den Erfassungsprozess übergeben werden: {e}")
+
+    @property
+    def consecutive_failures(self):
+        if self.process is None or self.process.ring is None:
+            return 0
+        return int(self.process.ring.header[FAILURES])
+
+    def get_timing_statistics(self):
+        """Statistik des Abtasttakts im Erfassungsprozess (wie PlotDataWorker.get_timing_statistics)"""
+        stats = {
+            'period': self.config['sample_interval'] / 1000.0,
+            'cycles': 0, 'overruns': 0, 'missed': 0,
+            'max_cycle_time': 0.0, 'max_lateness': 0.0, 'mean_lateness': 0.0, 'lost': 0,
+        }
+        if self.process is not None and self.process.ring is not None:
+            ring = self.process.ring
+            stats.update({
+                'cycles': int(ring.header[CYCLES]),
+                'overruns': int(ring.header[OVERRUNS]),
+                'missed': int(ring.header[MISSED]),
+                'max_cycle_time': int(ring.header[MAX_CYCLE_TIME]) / 1e6,
+                'max_lateness': int(ring.header[MAX_LATENESS]) / 1e6,
+                'mean_lateness': int(ring.header[MEAN_LATENESS]) / 1e6,
+                'lost': ring.lost,
+            })
+        return stats
+
+    def isRunning(self):
+        return self.process is not None
+
+    def wait(self, msecs=None):
+        """stop() wartet bereits auf das Prozessende"""
+        return True
+
+    def start(self):
+        """Startet den Erfassungsprozess mit den Verbindungseinstellungen der Hauptanwendung"""
+        if self.process is not None:
+            return
+        connection_params = getattr(self.main_app, 'connection_params', None)
+        if not connection_params:
+            self.watchdog_triggered.emit("Erfassungsprozess: Keine Verbindungseinstellungen")
+            return
+        process = AcquisitionProcess(self.codes)
+        # Eine serielle Schnittstelle kann nur ein Prozess öffnen
+        hand_over = connection_params.get('transport', TRANSPORT_SERIAL) == TRANSPORT_SERIAL
+        if hand_over:
+            self.modbus_client.hand_over_port(process)
+        try:
+            process.start(
+                connection_params,
+                visible=self.visible_lines,
+                rates=self.channel_rates,
+                sample_interval=self.config['sample_interval'],
+                timeouts={'default_timeout': self.modbus_client.default_timeout,
+                          'read_timeout': self.modbus_client.read_timeout},
+                inter_frame_delay=self.modbus_client.inter_frame_delay,
+            )
+        except ServoToolException as e:
+            logger.error(f"Erfassungsprozess konnte nicht gestartet werden: {e}")
+            if hand_over:
+                self._take_back_port()
+            self.watchdog_triggered.emit(f"Erfassungsprozess: {e}")
+            return
+
+        self.process = process
+        self._clock_offset = time.time() - time.perf_counter()
+        self._last_cycles = 0
+        self._last_progress = time.time()
+        self._missed = 0
+        self._timer.start()
+        logger.info("Plot-Erfassung im eigenen Prozess gestartet")
+
+    def stop(self):
+        """Beendet den Erfassungsprozess und übernimmt die Schnittstelle wieder"""
+        self._timer.stop()
+        if self.process is None:
+            return
+        process, self.process = self.process, None
+        lost = process.ring.lost if process.ring is not None else 0
+        process.stop()
+        self._take_back_port()
+        logger.info(f"Plot-Erfassung im eigenen Prozess beendet ({lost} verworfene Abtastungen)")
+
+    def _take_back_port(self):
+        try:
+            self.modbus_client.take_back_port()
+        except ServoToolException as e:
+            logger.error(f"Schnittstelle konnte nicht zurückgenommen werden: {e}")
+
+    def _emit_samples(self, ring):
+        """Gibt die neuen Zeilen als Views weiter (nur während des Aufrufs gültig)"""
+        columns = [(code, self._columns[code]) for code in self.visible_lines if code in self._columns]
+        for rows in ring.read():
+            values = {code: rows[:, column] for code, column in columns}
+            self.samples_updated.emit(rows[:, 0] + self._clock_offset, values)
+            for listener in self.sample_listeners:
+                listener.add_samples(rows[:, 0], values)
+
+    def _poll(self):
+        """Holt neue Abtastungen aus dem Ringpuffer und prüft den Erfassungsprozess"""
+        process = self.process
+        if process is None:
+            return
+        ring = process.ring
+        self._emit_samples(ring)
+
+        # Watchdog: der Erfassungsprozess muss weiter Abfragezyklen durchlaufen
+        now = time.time()
+        cycles = int(ring.header[CYCLES])
+        if cycles != self._last_cycles:
+            self._last_cycles = cycles
+            self._last_progress = now
+
+        missed = int(ring.header[MISSED])
+        if missed > self._missed:
+            self.cycle_overrun.emit(int(ring.header[MAX_CYCLE_TIME]) / 1e6, missed - self._missed)
+            self._missed = missed
+
+        if ring.state == STATE_FAILED or not process.is_alive():
+            message = ring.error() or "Erfassungsprozess beendet - Neustart erforderlich"
+            logger.error(f"Erfassungsprozess: {message}")
+            self.stop()
+            self.watchdog_triggered.emit(message)
+        elif now - self._last_progress > self.config['watchdog_timeout']:
+            logger.warning("Watchdog ausgelöst - Erfassungsprozess reagiert nicht")
+            self.stop()
+            self.watchdog_triggered.emit("Worker-Timeout - Neustart erforderlich")
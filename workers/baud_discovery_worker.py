@@ -0,0 +1,65 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+from custom_exceptions import ServoToolException, OperationCancelledException
+from logger_config import logger
+from utils.baud_discovery import discover, find_fastest_stable_baudrate
+
+
+class BaudDiscoveryWorker(QThread):
+    """Worker-Klasse für die Suche der Schnittstellenparameter und die Baudraten-Optimierung"""
+    progress_updated = pyqtSignal(str)
+    finished = pyqtSignal(str, dict)  # mode, result
+    error_occurred = pyqtSignal(str)
+
+    MODE_DISCOVER = "discover"
+    MODE_OPTIMIZE = "optimize"
+
+    def __init__(self, mode, port, slave_id, settings=None, soak_reads=200):
+        super().__init__()
+        self.mode = mode
+        self.port = port
+        self.slave_id = slave_id
+        self.settings = settings
+        self.soak_reads = soak_reads
+        self.is_running = True
+
+    def run(self):
+        """Führt die Suche bzw. Optimierung in einem separaten Thread durch"""
+        try:
+            if self.mode == self.MODE_DISCOVER:
+                result = discover(
+                    self.port,
+                    slave_id=self.slave_id,
+                    progress_callback=self._on_discover_progress,
+                    is_cancelled=self._is_cancelled
+                )
+                if result is None:
+                    self.error_occurred.emit("Kein Antrieb gefunden.")
+                    return
+            else:
+                result = find_fastest_stable_baudrate(
+                    self.port,
+                    self.settings,
+                    slave_id=self.slave_id,
+                    soak_reads=self.soak_reads,
+                    progress_callback=self.progress_updated.emit,
+                    is_cancelled=self._is_cancelled
+                )
+            self.finished.emit(self.mode, result)
+        except OperationCancelledException as e:
+            self.error_occurred.emit(str(e))
+        except ServoToolException as e:
+            logger.error(f"Fehler bei der Baudraten-Suche: {e}")
+            self.error_occurred.emit(str(e))
+        except Exception as e:
+            logger.error(f"Unerwarteter Fehler bei der Baudraten-Suche: {e}")
+            self.error_occurred.emit(f"Unerwarteter Fehler: {e}")
+
+    def _on_discover_progress(self, current, total, description):
+        self.progress_updated.emit(f"{current}/{total}: {description}")
+
+    def _is_cancelled(self):
+        return not self.is_running
+
+    def stop(self):
+        """Stoppt den Worker"""
+        self.is_running = False
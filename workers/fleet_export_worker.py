@@ -0,0 +1,34 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+from custom_exceptions import ServoToolException
+from logger_config import logger
+from utils.fleet_backup import run_fleet_backup
+
+
+class FleetExportWorker(QThread):
+    """Worker-Klasse für die parallele Sicherung mehrerer Antriebe an mehreren Ports"""
+    progress_updated = pyqtSignal(str)
+    finished = pyqtSignal(dict, str)  # index, archive_path
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, jobs, parameters, archive_path):
+        super().__init__()
+        self.jobs = jobs
+        self.parameters = parameters
+        self.archive_path = archive_path
+
+    def run(self):
+        """Führt die Flotten-Sicherung in einem separaten Thread durch"""
+        try:
+            index = run_fleet_backup(
+                self.jobs,
+                self.parameters,
+                self.archive_path,
+                progress_callback=self.progress_updated.emit
+            )
+            self.finished.emit(index, self.archive_path)
+        except ServoToolException as e:
+            logger.error(f"Flotten-Sicherung fehlgeschlagen: {e}")
+            self.error_occurred.emit(str(e))
+        except Exception as e:
+            logger.error(f"Unerwarteter Fehler bei der Flotten-Sicherung: {e}")
+            self.error_occurred.emit(f"Unerwarteter Fehler bei der Flotten-Sicherung: {e}")
@@ -0,0 +1,97 @@
+"""
+Frequenzgangmessung des Drehzahlregelkreises im Hintergrund (utils.frequency_response).
+
+Während der Messung gehört der Bus dem Worker: Die Plot-Erfassung muss vorher
+beendet sein. Nach der Messung, bei Abbruch und bei Fehlern wird der
+Drehzahlsollwert auf 0 gesetzt.
+"""
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from custom_exceptions import ServoToolException
+from logger_config import logger
+from utils.frequency_response import (
+    SIGNAL_CHIRP, SPEED_COMMAND_ADDRESS, analyze_measurement, excitation, measure_cycles, probe_period
+)
+
+
+class FrequencyResponseWorker(QThread):
+    """Regt den Drehzahlregelkreis über P06-03 an und berechnet den Frequenzgang"""
+    progress_updated = pyqtSignal(int, int)  # Zyklus, Anzahl
+    finished = pyqtSignal(dict)  # Ergebnis von analyze_measurement
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, modbus_client, signal=SIGNAL_CHIRP, offset=300, amplitude=100, duration=10.0,
+                 f_start=1.0, f_end=None, period=0.0, segment_length=256):
+        """
+        Args:
+            modbus_client: ServoModbusClient
+            signal: SIGNAL_CHIRP oder SIGNAL_PRBS
+            offset: Arbeitspunkt in rpm
+            amplitude: Amplitude der Anregung in rpm
+            duration: Messdauer in s
+            f_start, f_end: Frequenzbereich des Gleitsinus in Hz (f_end None = bis knapp unter Nyquist)
+            period: Zyklusperiode in s (0 = kürzeste erreichbare)
+            segment_length: Abtastungen je Segment der Auswertung
+        """
+        super().__init__()
+        self.modbus_client = modbus_client
+        self.signal = signal
+        self.offset = offset
+        self.amplitude = amplitude
+        self.duration = duration
+        self.f_start = f_start
+        self.f_end = f_end
+        self.period = period
+        self.segment_length = segment_length
+        self.is_running = True
+
+    def run(self):
+        try:
+            measurement, period, band = self._measure()
+            if not self.is_running:
+                self.error_occurred.emit("Frequenzgangmessung abgebrochen.")
+                return
+            result = analyze_measurement(measurement, period, self.segment_length, band)
+        except ServoToolException as e:
+            logger.error(f"Frequenzgangmessung fehlgeschlagen: {e}")
+            self.error_occurred.emit(str(e))
+            return
+        except Exception as e:
+            logger.error(f"Frequenzgangmessung: Unerwarteter Fehler: {e}", exc_info=True)
+            self.error_occurred.emit(f"Unerwarteter Fehler: {e}")
+            return
+        if result is None:
+            self.error_occurred.emit("Frequenzgangmessung: zu wenige Zyklen.")
+            return
+        logger.info(f"Frequenzgangmessung beendet: {result['cycles']} Zyklen, {result['missed']} ausgelassen, "
+                    f"Bandbreite {result['bandwidth']} Hz")
+        self.finished.emit(result)
+
+    def _measure(self):
+        """Regt an und misst; der Drehzahlsollwert wird danach immer auf 0 gesetzt"""
+        try:
+            # Die Probe fährt auch den Arbeitspunkt an und wird deshalb immer ausgeführt
+            shortest = probe_period(self.modbus_client, self.offset)
+            period = self.period or shortest
+            sample_rate = 1.0 / period
+            commands, band = excitation(self.signal, int(self.duration * sample_rate), sample_rate,
+                                        self.amplitude, self.offset, self.f_start, self.f_end)
+            logger.info(f"Frequenzgangmessung: {self.signal}, {self.offset}±{self.amplitude} rpm, "
+                        f"Periode {period * 1000:.1f} ms, {len(commands)} Zyklen")
+            measurement = measure_cycles(self.modbus_client, commands, period,
+                                         should_stop=lambda: not self.is_running,
+                                         progress=self.progress_updated.emit)
+            return measurement, period, band
+        finally:
+            self._stop_motor()
+
+    def _stop_motor(self):
+        try:
+            self.modbus_client.write_holding_register(SPEED_COMMAND_ADDRESS, 0)
+        except ServoToolException as e:
+            logger.error(f"Drehzahlsollwert konnte nach der Frequenzgangmessung nicht auf 0 gesetzt werden: {e}")
+
+    def stop(self):
+        self.is_running = False
+        self.wait()
@@ -0,0 +1,50 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+from logger_config import logger
+from utils.gain_search import create_executor, fit_plant, prepare_capture, search_gains
+
+
+class GainSearchWorker(QThread):
+    """Worker-Klasse für die Suche der Drehzahlregler-Verstärkungen an der simulierten Strecke"""
+    progress_updated = pyqtSignal(int, int)  # bewertete Kandidaten, Runde
+    finished = pyqtSignal(dict)  # plant, candidates
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, trace, parameters, limits=None):
+        """
+        Args:
+            trace: Aufgezeichnete Sprungantwort (times, reference, feedback, torque)
+            parameters: Eingestellte Reglerparameter als Rohwerte ({Code: Wert})
+            limits: {Code: (min, max)} der gesuchten Parameter
+        """
+        super().__init__()
+        self.trace = trace
+        self.parameters = parameters
+        self.limits = limits
+        self.is_running = True
+
+    def run(self):
+        """Passt die Strecke an und sucht die Verstärkungen in einem Prozess je Kern"""
+        capture = prepare_capture(self.trace['times'], self.trace['reference'], self.trace['feedback'],
+                                  self.trace.get('torque'))
+        if capture is None:
+            self.error_occurred.emit("Kein Sprung in der Aufzeichnung")
+            return
+        try:
+            with create_executor() as executor:
+                plant = fit_plant(capture, self.parameters, executor)
+                logger.info(f"Reglersuche: Strecke angepasst {plant}")
+                candidates = search_gains(capture, self.parameters, plant, self.limits, executor,
+                                          progress=self.progress_updated.emit,
+                                          should_stop=lambda: not self.is_running)
+        except Exception as e:
+            logger.error(f"Reglersuche fehlgeschlagen: {e}")
+            self.error_occurred.emit(str(e))
+            return
+        if not self.is_running:
+            return
+        logger.info(f"Reglersuche beendet: {[c['parameters'] for c in candidates]}")
+        self.finished.emit({'plant': plant, 'candidates': candidates})
+
+    def stop(self):
+        self.is_running = False
+        self.wait()
@@ -0,0 +1,69 @@
+"""
+Verstärkungstest an der Maschine im Hintergrund (utils.gain_sweep).
+
+Während des Tests gehört der Bus dem Worker: Die Plot-Erfassung muss vorher
+beendet sein. Nach dem Test, bei Abbruch und bei Fehlern werden die
+Ausgangswerte zurückgeschrieben und der Drehzahlsollwert auf 0 gesetzt.
+"""
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from custom_exceptions import ServoToolException
+from logger_config import logger
+from utils.gain_sweep import best_result, run_sweep
+
+
+class GainSweepWorker(QThread):
+    """Nimmt für jeden Parametersatz eine Sprungantwort an der Maschine auf"""
+    progress_updated = pyqtSignal(int, int)  # getestete Sätze, Anzahl
+    result_ready = pyqtSignal(dict)  # Ergebnis eines Satzes (index, parameters, metrics, trace)
+    finished = pyqtSignal(dict)  # results, best (Index oder None)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, modbus_client, parameter_sets, addresses, start_rpm, target_rpm, duration):
+        """
+        Args:
+            modbus_client: ServoModbusClient
+            parameter_sets: Liste von {Code: Rohwert}
+            addresses: {Code: Registeradresse}
+            start_rpm, target_rpm: Drehzahl vor und nach dem Sprung
+            duration: Aufzeichnung nach dem Sprung in s
+        """
+        super().__init__()
+        self.modbus_client = modbus_client
+        self.parameter_sets = parameter_sets
+        self.addresses = addresses
+        self.start_rpm = start_rpm
+        self.target_rpm = target_rpm
+        self.duration = duration
+        self.is_running = True
+
+    def run(self):
+        self.progress_updated.emit(0, len(self.parameter_sets))
+        try:
+            results = run_sweep(self.modbus_client, self.parameter_sets, self.addresses,
+                                self.start_rpm, self.target_rpm, self.duration,
+                                should_stop=lambda: not self.is_running,
+                                result_callback=self._on_result)
+            best = best_result(results)
+        except ServoToolException as e:
+            logger.error(f"Verstärkungstest fehlgeschlagen: {e}")
+            self.error_occurred.emit(str(e))
+            return
+        except Exception as e:
+            logger.error(f"Verstärkungstest: Unerwarteter Fehler: {e}", exc_info=True)
+            self.error_occurred.emit(f"Unerwarteter Fehler: {e}")
+            return
+        if not self.is_running:
+            self.error_occurred.emit("Verstärkungstest abgebrochen.")
+            return
+        logger.info(f"Verstärkungstest beendet: {len(results)} Sätze, bester {best and best['parameters']}")
+        self.finished.emit({'results': results, 'best': None if best is None else best['index']})
+
+    def _on_result(self, result):
+        self.result_ready.emit(result)
+        self.progress_updated.emit(result['index'] + 1, len(self.parameter_sets))
+
+    def stop(self):
+        self.is_running = False
+        self.wait()
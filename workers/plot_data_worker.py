@@ -8,15 +8,29 @@ from custom_exceptions import (
     ModbusTimeoutException
 )
 from logger_config import logger
-from pymodbus.payload import BinaryPayloadDecoder
-from pymodbus.constants import Endian
-import numpy as np
+from utils.acquisition_scheduler import AcquisitionScheduler
+from utils.axis_scheduler import FairAxisScheduler
+from utils.cycle_timer import CycleTimer
+from utils.plot_channels import PLAUSIBLE_RANGES, ChannelRegistry
 
+# Abtastraten in Hz; Kanäle ohne Eintrag werden in jedem Buszyklus gelesen
+DEFAULT_CHANNEL_RATES = {"P0B-24": 10, "P0B-58": 10}
+
+# Abtastrate nachträglich hinzugefügter Kanäle in Hz
+ADDED_CHANNEL_RATE = 10
+
+# Abstand der Simulationsdaten ohne festen Abtasttakt (ms)
+SIMULATION_INTERVAL = 5
+
+# Überläufe des Abtasttakts höchstens alle OVERRUN_LOG_INTERVAL Sekunden protokollieren
+OVERRUN_LOG_INTERVAL = 5.0
 
 class PlotDataWorker(QThread):
     """Worker-Klasse für kontinuierliche Modbus-Abfragen für Plot-Daten"""
     data_updated = pyqtSignal(dict)  # Signal für aktualisierte Daten
+    axis_data_updated = pyqtSignal(int, dict)  # Signal für Daten einer Achse im Multi-Drop-Betrieb (Slave-ID, Werte)
     watchdog_triggered = pyqtSignal(str)  # Signal für Watchdog-Auslösung
+    cycle_overrun = pyqtSignal(float, int)  # Buszyklus länger als die Abtastperiode (Zyklusdauer in s, ausgelassene Abtastungen)
     
     def __init__(self, modbus_client, parameter_manager, main_app=None):
         super().__init__()
@@ -27,10 +41,26 @@ class PlotDataWorker(QThread):
         self.visible_lines = []  # Welche Linien im Plot sichtbar sind
         self.simulation_mode = False
         
+        # Multi-Drop: mehrere Antriebe an einer Leitung, reihum mit gleichem Buszeit-Anteil
+        self.slave_ids = []
+        self.axis_scheduler = FairAxisScheduler()
+        
+        # Abfrageplan je Achse: schnelle Kanäle in jedem Zyklus, langsame nach ihrer Abtastrate
+        self.channel_rates = dict(DEFAULT_CHANNEL_RATES)
+        # Registerbreite, Vorzeichen und Skalierung der Kanäle aus den Parameterdefinitionen
+        if parameter_manager is not None:
+            self.channels = ChannelRegistry(parameter_manager.raw_parameters)
+        else:
+            self.channels = ChannelRegistry.from_file()
+        self._channel_items = []
+        self._schedulers = {}
+        # Blocklesezugriffe mit vorab berechneten Dekodiertabellen (utils.frame_decoder)
+        self._frame_reader = None
+        self.last_cycle_requests = 0
+        
         # Watchdog und Konfigurationsparameter
         self.config = {
-            'min_update_interval': 1,  # ms - minimales Intervall für maximale Geschwindigkeit
-            'max_update_interval': 10,  # ms - kurzes maximales Intervall
+            'sample_interval': 0,  # ms - fester Abtastabstand, 0 = so schnell wie der Bus erlaubt
             'watchdog_timeout': 10,  # s
             'max_reconnect_attempts': 5,
             'reconnect_delay': 5,  # s
@@ -43,9 +73,52 @@ class PlotDataWorker(QThread):
         self.consecutive_failures = 0
         self.max_consecutive_failures = 10
         
+        # Abtasttakt: feste Termine (perf_counter) statt Warteschleife; im Multi-Drop-Betrieb je Buszyklus
+        self.cycle_timer = CycleTimer(self.config['sample_interval'] / 1000.0)
+        self.last_sample_time = None  # Termin der letzten Abtastung (perf_counter)
+        self._last_overrun_log = 0.0
+        
+        # Empfänger der Abtastungen mit Termin im Erfassungsthread (z.B. SpectrumWorker.add_sample)
+        self.sample_listeners = []
+        
     def update_visible_lines(self, lines):
         """Aktualisiert die Liste der sichtbaren Linien"""
         self.visible_lines = lines
+        items = []
+        for code in lines:
+            channel = self.channels.get(code)
+            if channel is None:
+                logger.warning(f"Plot-Kanal {code} ist kein Überwachungsparameter")
+                continue
+            items.append(channel.item)
+        self._channel_items = items
+        for scheduler in list(self._schedulers.values()):
+            scheduler.set_channels(items)
+        
+    def set_channel_rates(self, rates):
+        """Setzt die Abtastraten je Kanal in Hz (fehlende Kanäle: jeder Buszyklus)"""
+        self.channel_rates = dict(rates or {})
+        for scheduler in list(self._schedulers.values()):
+            scheduler.set_rates(self.channel_rates)
+        
+    def _scheduler(self, slave):
+        """Abfrageplan einer Achse (die Termine der langsamen Kanäle gelten je Achse)"""
+        scheduler = self._schedulers.get(slave)
+        if scheduler is None:
+            scheduler = AcquisitionScheduler()
+            scheduler.set_rates(self.channel_rates)
+            scheduler.set_channels(self._channel_items)
+            self._schedulers[slave] = scheduler
+        return scheduler
+        
+    def set_slave_ids(self, slave_ids):
+        """Setzt die abzufragenden Achsen (eine Slave-ID = Einzelachsbetrieb)"""
+        self.slave_ids = [int(s) for s in slave_ids] if slave_ids else []
+        self.axis_scheduler.set_slave_ids(self.slave_ids)
+        
+    def is_multi_axis(self):
+        """True, wenn mehr als eine Achse abgefragt wird"""
+        return len(self.slave_ids) > 1
         
     def set_simulation_mode(self, simulation_mode):
         """Aktualisiert den Simulationsmodus"""
@@ -54,8 +127,26 @@ class PlotDataWorker(QThread):
     def update_config(self, new_config):
         """Aktualisiert die Konfiguration des Workers"""
         self.config.update(new_config)
+        if 'sample_interval' in new_config:
+            self.cycle_timer.set_period(max(0, new_config['sample_interval']) / 1000.0)
         logger.info(f"Plot-Worker-Konfiguration aktualisiert: {new_config}")
         
+    def get_timing_statistics(self):
+        """Statistik des Abtasttakts (Zyklen, Überläufe, ausgelassene Abtastungen, Verspätung)"""
+        return self.cycle_timer.get_statistics()
+        
+    def _report_overrun(self, skipped):
+        """Meldet einen Buszyklus, der länger als die Abtastperiode gedauert hat"""
+        cycle_time = self.cycle_timer.last_cycle_time
+        self.cycle_overrun.emit(cycle_time, skipped)
+        now = time.time()
+        if now - self._last_overrun_log >= OVERRUN_LOG_INTERVAL:
+            self._last_overrun_log = now
+            stats = self.cycle_timer.get_statistics()
+            logger.warning(f"Buszyklus ({cycle_time * 1000:.1f} ms) länger als die Abtastperiode "
+                           f"({stats['period'] * 1000:.1f} ms): {stats['overruns']} Überläufe, "
+                           f"{stats['missed']} ausgelassene Abtastungen")
+        
     def _restart_worker(self):
         """Startet den Worker intern neu"""
         logger.info("Plot-Worker wird neu gestartet")
@@ -69,7 +160,6 @@ class PlotDataWorker(QThread):
     def run(self):
         """Hauptmethode des Worker-Threads"""
         self.is_running = True
-        last_update_time = 0
         sim_start_time = 0  # Startzeit für die Simulation
         reconnect_attempts = 0
         
@@ -77,6 +167,7 @@ class PlotDataWorker(QThread):
         self.last_response_time = time.time()
         self.last_successful_update = time.time()
         self.consecutive_failures = 0
+        self.cycle_timer.reset()
         
         logger.info("Plot-Data-Worker gestartet")
         
@@ -99,34 +190,48 @@ class PlotDataWorker(QThread):
                 
             if self.modbus_client.connected:
                 try:
-                    current_time_ms = current_time * 1000  # Aktuelle Zeit in ms
-                    
-                    # Prüfe, ob seit dem letzten Update genug Zeit vergangen ist
-                    if current_time_ms - last_update_time >= self.config['min_update_interval']:
+                    # Bis zum nächsten Abtasttermin warten (ohne festen Takt sofort weiter)
+                    self.last_sample_time = self.cycle_timer.wait()
+                    if self.is_multi_axis():
+                        slave_id = self.axis_scheduler.next_slave()
+                        read_start = time.perf_counter()
+                        values = self._read_plot_values(slave_id)
+                        self.axis_scheduler.record(slave_id, time.perf_counter() - read_start)
+                    else:
                         values = self._read_plot_values()
-                        
-                        # Sende die aktualisierten Daten an den Haupt-Thread
-                        if values:
-                            self.data_updated.emit(values)
-                            last_update_time = current_time_ms
-                            self.last_successful_update = current_time
-                            self.consecutive_failures = 0  # Fehlerzähler zurücksetzen
-                            reconnect_attempts = 0  # Verbindungszähler zurücksetzen
+                    skipped = self.cycle_timer.complete()
+                    if skipped:
+                        self._report_overrun(skipped)
+                    
+                    # Sende die aktualisierten Daten an den Haupt-Thread
+                    if not values and not self.last_cycle_requests:
+                        # Nur langsame Kanäle sichtbar und gerade keiner fällig
+                        if not self.cycle_timer.period:
+                            self.msleep(1)
+                    elif values:
+                        if self.is_multi_axis():
+                            self.axis_data_updated.emit(slave_id, values)
                         else:
-                            self.consecutive_failures += 1
+                            self.data_updated.emit(values)
+                            for listener in self.sample_listeners:
+                                listener.add_sample(self.last_sample_time, values)
+                        self.last_successful_update = current_time
+                        self.consecutive_failures = 0  # Fehlerzähler zurücksetzen
+                        reconnect_attempts = 0  # Verbindungszähler zurücksetzen
                     else:
-                        # Warte, um die CPU zu entlasten
-                        self.msleep(5)
+                        self.consecutive_failures += 1
                         
                 except ModbusTimeoutException:
                     # Bei Timeout kurz warten und dann mit der nächsten Abfrage fortfahren
                     logger.warning("Modbus-Timeout im Plot-Worker")
+                    self.cycle_timer.resync()
                     self.consecutive_failures += 1
                     self.msleep(10)
                 except ModbusConnectionException:
                     # Bei Verbindungsproblemen versuche neu zu verbinden
                     logger.error("Modbus-Verbindungsfehler im Plot-Worker")
                     self.consecutive_failures += 1
+                    self.cycle_timer.resync()
                     if reconnect_attempts < self.config['max_reconnect_attempts']:
                         logger.info(f"Versuch {reconnect_attempts + 1} zur Neuverbindung...")
                         
@@ -141,7 +246,9 @@ class PlotDataWorker(QThread):
                             
                             # Verbindungseinstellungen aus der Hauptanwendung holen
                             if self.main_app and hasattr(self.main_app, 'connection_tab'):
-                                connection_params = self.main_app.connection_tab.get_connection_parameters()
+                                # Zuletzt verwendete Einstellungen (auch die des virtuellen Antriebs im Simulationsmodus)
+                                connection_params = (getattr(self.main_app, 'connection_params', None)
+                                                     or self.main_app.connection_tab.get_connection_parameters())
                                 
                                 # Timeouts konfigurieren, falls in den Verbindungseinstellungen angegeben
                                 if 'timeout' in connection_params:
@@ -185,142 +292,60 @@ class PlotDataWorker(QThread):
                     # Bei anderen Fehlern kurz warten und dann mit der nächsten Abfrage fortfahren
                     logger.error(f"Unerwarteter Fehler im Plot-Worker: {e}", exc_info=True)
                     self.consecutive_failures += 1
+                    self.cycle_timer.resync()
                     self.msleep(10)
             else:
                 # Prüfe, ob der Simulationsmodus aktiv ist
                 if self.simulation_mode:
-                    current_time_ms = current_time * 1000  # Aktuelle Zeit in ms
-                    
                     # Initialisiere die Simulationsstartzeit
                     if sim_start_time == 0:
                         sim_start_time = time.time()
                     
-                    # Prüfe, ob seit dem letzten Update genug Zeit vergangen ist
-                    if current_time_ms - last_update_time >= self.config['min_update_interval']:
-                        t = time.time() - sim_start_time
+                    self.last_sample_time = self.cycle_timer.wait()
+                    t = time.time() - sim_start_time
+                    
+                    # Sende die Simulationsdaten an den Haupt-Thread
+                    if self.is_multi_axis():
+                        slave_id = self.axis_scheduler.next_slave()
+                        self.axis_scheduler.record(slave_id, 0.001)
+                        # Jede Achse mit eigener Phasenlage simulieren
+                        sim_values = self._generate_simulation_data(t + self.slave_ids.index(slave_id) * 0.5)
+                        if sim_values:
+                            self.axis_data_updated.emit(slave_id, sim_values)
+                    else:
                         sim_values = self._generate_simulation_data(t)
-                        
-                        # Sende die Simulationsdaten an den Haupt-Thread
                         if sim_values:
                             self.data_updated.emit(sim_values)
-                            last_update_time = current_time_ms
-                            self.last_successful_update = current_time
-                            self.consecutive_failures = 0  # Fehlerzähler zurücksetzen
-                    else:
-                        # Warte, um die CPU zu entlasten
-                        self.msleep(5)
+                            for listener in self.sample_listeners:
+                                listener.add_sample(self.last_sample_time, sim_values)
+                    
+                    if sim_values:
+                        self.last_successful_update = current_time
+                        self.consecutive_failures = 0  # Fehlerzähler zurücksetzen
+                    self.cycle_timer.complete()
+                    if not self.cycle_timer.period:
+                        # Ohne festen Takt die Simulationsdaten begrenzen, um die CPU zu entlasten
+                        self.msleep(SIMULATION_INTERVAL)
                 else:
                     # Keine Verbindung und kein Simulationsmodus, kurz warten und erneut prüfen
                     self.msleep(100)  # 100ms warten bei getrennter Verbindung
+                    self.cycle_timer.resync()
                     
             # Aktualisiere die Watchdog-Zeit
             self.last_response_time = time.time()
     
-    def _read_plot_values(self):
-        """Liest die Plot-Werte von den Modbus-Registern"""
-        values = {}
+    def _read_plot_values(self, slave=None):
+        """Liest die fälligen Plot-Werte mit Blocklesezugriffen (optional von einer bestimmten Achse)"""
+        blocks = self._scheduler(slave).next_cycle(time.perf_counter())
+        self.last_cycle_requests = len(blocks)
         
-        try:
-            # Lese die Basis-Register (P0B-00, P0B-01, P0B-02) nur, wenn mindestens eine davon sichtbar ist
-            if any(code in self.visible_lines for code in ["P0B-00", "P0B-01", "P0B-02"]):
-                d = self.modbus_client.read_holding_register(2816, count=3)
-                if d and len(d) == 3:
-                    if "P0B-00" in self.visible_lines:
-                        value = self._twos_complement_to_int(d[0], 16)
-                        if self._validate_modbus_value("P0B-00", value):
-                            values["P0B-00"] = value
-                    if "P0B-01" in self.visible_lines:
-                        value = d[1]
-                        if self._validate_modbus_value("P0B-01", value):
-                            values["P0B-01"] = value
-                    if "P0B-02" in self.visible_lines:
-                        value = self._twos_complement_to_int(d[2], 16)
-                        if self._validate_modbus_value("P0B-02", value):
-                            values["P0B-02"] = value
-            
-            # Lese P0B-15 nur, wenn es sichtbar ist
-            if "P0B-15" in self.visible_lines:
-                try:
-                    v15 = self.modbus_client.read_holding_register_32bit(2831, is_signed=True)
-                    if v15 is not None and self._validate_modbus_value("P0B-15", v15):
-                        values["P0B-15"] = v15
-                except Exception as e:
-                    logger.error(f"Fehler beim Lesen von P0B-15: {e}", exc_info=True)
-                    # Verwende keinen Standardwert, um Fehler besser zu erkennen
-            
-            # Lese P0B-24 nur, wenn es sichtbar ist
-            if "P0B-24" in self.visible_lines:
-                try:
-                    v24 = self.modbus_client.read_holding_register(2840, count=1)
-                    if v24 and len(v24) > 0:
-                        value = v24[0]
-                        if self._validate_modbus_value("P0B-24", value):
-                            values["P0B-24"] = value
-                except Exception as e:
-                    logger.error(f"Fehler beim Lesen von P0B-24: {e}", exc_info=True)
-                    # Verwende keinen Standardwert, um Fehler besser zu erkennen
-            
-            # Lese P0B-58 (Absolute Position) nur, wenn es sichtbar ist
-            if "P0B-58" in self.visible_lines:
-                try:
-                    # Absolute Position ist ein 64-Bit-Wert, bestehend aus zwei 32-Bit-Registern
-                    # 2874 (Lower bits) und 2876 (Upper bits)
-                    abs_pos = self._read_32bit_pair_as_64bit(2874, 2876)
-                    if abs_pos is not None and self._validate_modbus_value("P0B-58", abs_pos):
-                        values["P0B-58"] = abs_pos
-                except Exception as e:
-                    logger.error(f"Fehler beim Lesen von P0B-58: {e}", exc_info=True)
-                    # Verwende keinen Standardwert, um Fehler besser zu erkennen
-        except Exception as e:
-            logger.error(f"Allgemeiner Fehler beim Lesen der Plot-Werte: {e}", exc_info=True)
-            # Bei einem allgemeinen Fehler leeres Dictionary zurückgeben
-            
-        return values
+        if not blocks:
+            return {}
+        if self._frame_reader is None:
+            from utils.frame_decoder import FrameReader  # NumPy erst beim ersten Plot laden
+            self._frame_reader = FrameReader(self.channels, limits=PLAUSIBLE_RANGES)
+        return self._frame_reader.read(self.modbus_client, blocks, slave)
     
-    def _twos_complement_to_int(self, val, bits):
-        """Konvertiert einen Wert von Zweierkomplement in einen vorzeichenbehafteten Integer."""
-        if val & (1 << (bits - 1)):  # Prüfe, ob das höchstwertige Bit gesetzt ist (negativ)
-            return val - (1 << bits)
-        return val
-
-    def _read_32bit_pair_as_64bit(self, lower_reg_addr, upper_reg_addr):
-        """Liest zwei 32-Bit-Register (insgesamt 4 16-Bit-Register) in einem atomaren Vorgang
-        und kombiniert sie zu einem 64-Bit-Wert.
-        """
-        # Die Register 2874 (Lower) und 2876 (Upper) sind 32-Bit-Werte,
-        # die jeweils 2 16-Bit-Register belegen.
-        # Um sie atomar zu lesen, müssen wir einen Block von 4 Registern lesen:
-        # 2874 (Lower-Word1), 2875 (Lower-Word2), 2876 (Upper-Word1), 2877 (Upper-Word2)
-        
-        # Startadresse ist 2874, Anzahl der Register ist 4
-        result = self.modbus_client.client.read_holding_registers(lower_reg_addr, count=4, slave=self.modbus_client.slave_id)
-        if result.isError():
-            logger.warning(f"Modbus-Fehler beim Lesen von Registern {lower_reg_addr} bis {lower_reg_addr + 3}: {result}")
-            return None
-        
-        registers = result.registers
-        if registers is None or len(registers) < 4:
-            logger.warning(f"Konnte nicht genügend Register für 64-Bit-Kombination lesen. Erhalten: {result}")
-            return None
-
-        # Die Rohregister sind 16-Bit-Werte. Wir müssen sie zu 32-Bit-Werten decodieren.
-        # Die Byte-Reihenfolge ist Big-Endian, Word-Reihenfolge ist Little-Endian (vom Benutzer bestätigt)
-        decoder = BinaryPayloadDecoder.fromRegisters(registers, byteorder=Endian.BIG, wordorder=Endian.LITTLE)
-
-        # Decodiere die beiden 32-Bit-Werte
-        # Das erste 32-Bit-Wort ist der Lower-Wert (unsigned)
-        lower_val = decoder.decode_32bit_uint()
-        # Das zweite 32-Bit-Wort ist der Upper-Wert (signed, da es das Vorzeichen des 64-Bit-Wertes trägt)
-        upper_val = decoder.decode_32bit_int()
-
-        # Kombiniere die beiden 32-Bit-Werte zu einem 64-Bit-Wert
-        # Das obere 32-Bit-Register wird um 32 Stellen nach links verschoben
-        # und mit dem unteren 32-Bit-Register ODER-verknüpft.
-        # Da upper_val bereits vorzeichenbehaftet ist, wird das Vorzeichen korrekt übertragen.
-        combined_val = (upper_val << 32) | lower_val
-        
-        return combined_val
-
     def _generate_simulation_data(self, t):
         """Generiert Simulationsdaten für den Plot"""
         sim_values = {}
@@ -344,54 +369,6 @@ class PlotDataWorker(QThread):
         
         return sim_values
     
-    def _validate_modbus_value(self, code, value):
-        """Validiert einen von Modbus gelesenen Wert"""
-        try:
-            # Prüfe, ob der Wert numerisch ist
-            if not isinstance(value, (int, float)):
-                return False
-            
-            # Prüfe auf NaN oder Infinity
-            if math.isnan(value) or math.isinf(value):
-                return False
-            
-            # Codespezifische Validierung basierend auf typischen Wertebereichen
-            if code == "P0B-00":  # Geschwindigkeit
-                # Typischer Bereich für Geschwindigkeit
-                if not (-10000 <= value <= 10000):
-                    logger.warning(f"P0B-00 Wert außerhalb des erwarteten Bereichs: {value}")
-                    return False
-            elif code == "P0B-01":  # Strom
-                # Typischer Bereich für Strom
-                if not (0 <= value <= 2000):
-                    logger.warning(f"P0B-01 Wert außerhalb des erwarteten Bereichs: {value}")
-                    return False
-            elif code == "P0B-02":  # Drehmoment
-                # Typischer Bereich für Drehmoment
-                if not (-1000 <= value <= 1000):
-                    logger.warning(f"P0B-02 Wert außerhalb des erwarteten Bereichs: {value}")
-                    return False
-            elif code == "P0B-15":  # Temperatur
-                # Typischer Bereich für Temperatur
-                if not (-50 <= value <= 200):
-                    logger.warning(f"P0B-15 Wert außerhalb des erwarteten Bereichs: {value}")
-                    return False
-            elif code == "P0B-24":  # Leistung
-                # Typischer Bereich für Leistung
-                if not (0 <= value <= 50000):
-                    logger.warning(f"P0B-24 Wert außerhalb des erwarteten Bereichs: {value}")
-                    return False
-            elif code == "P0B-58":  # Absolute Position
-                # Typischer Bereich für absolute Position (64-Bit)
-                if not (-2**63 <= value <= 2**63-1):
-                    logger.warning(f"P0B-58 Wert außerhalb des 64-Bit-Bereichs: {value}")
-                    return False
-            
-            return True
-        except Exception as e:
-            logger.error(f"Fehler bei der Validierung von {code}: {e}")
-            return False
-
     def stop(self):
         """Stoppt den Worker-Thread"""
         self.is_running = False
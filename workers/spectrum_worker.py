@@ -0,0 +1,152 @@
+"""
+Leistungsdichtespektrum eines Plot-Kanals im Hintergrund.
+
+Die Plot-Erfassung übergibt ihre Abtastungen mit den Abtastterminen
+(time.perf_counter) über add_sample() bzw. add_samples(); beides hängt nur an
+zwei Listen an und kostet den Erfassungsthread praktisch nichts. Der Thread
+holt die gesammelten Abtastungen mit der eingestellten Aktualisierungsrate ab,
+ordnet sie dem Zeitraster der Abtastperiode zu und schreibt die Welch-Schätzung
+fort (utils.spectrum).
+"""
+
+import threading
+
+import numpy as np
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from logger_config import logger
+from utils.spectrum import DEFAULT_SEGMENT_LENGTH, IncrementalWelch, UniformResampler, peak_frequency
+
+# Aktualisierungen des Spektrums je Sekunde
+DEFAULT_UPDATE_RATE = 2.0
+
+# Abtastungen, aus denen ohne feste Abtastperiode die Periode geschätzt wird
+PERIOD_ESTIMATE_SAMPLES = 64
+
+
+class SpectrumWorker(QThread):
+    """Berechnet fortlaufend das Welch-Spektrum eines Kanals"""
+    # Frequenzen in Hz, Leistungsdichte, Angaben (code, sample_rate, resolution, segments, peak, estimated)
+    spectrum_updated = pyqtSignal(object, object, dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.code = None
+        self.period = 0.0  # s, 0 = aus den Abtastterminen schätzen
+        self.segment_length = DEFAULT_SEGMENT_LENGTH
+        self.update_rate = DEFAULT_UPDATE_RATE
+        self.running = False
+        self._lock = threading.Lock()
+        self._times = []
+        self._values = []
+        self._reset_pending = True
+
+    def configure(self, code=None, period=None, segment_length=None, update_rate=None):
+        """Ändert Kanal, Abtastperiode (s), Segmentlänge oder Aktualisierungsrate (Hz); die Schätzung beginnt neu"""
+        with self._lock:
+            if code is not None:
+                self.code = code
+            if period is not None:
+                self.period = max(0.0, float(period))
+            if segment_length is not None:
+                self.segment_length = int(segment_length)
+            if update_rate is not None:
+                self.update_rate = max(0.1, float(update_rate))
+            self._times = []
+            self._values = []
+            self._reset_pending = True
+
+    def add_sample(self, sample_time, values):
+        """Übernimmt eine Abtastung (Termin in perf_counter-Sekunden, {Code: Wert}); aus dem Erfassungsthread"""
+        if not self.running or sample_time is None:
+            return
+        value = values.get(self.code)
+        if value is None:
+            return
+        with self._lock:
+            self._times.append(sample_time)
+            self._values.append(value)
+
+    def add_samples(self, times, columns):
+        """Übernimmt mehrere Abtastungen (Termine als Array, {Code: Werte}; NaN = nicht gelesen)"""
+        if not self.running:
+            return
+        values = columns.get(self.code)
+        if values is None:
+            return
+        valid = ~np.isnan(values)
+        with self._lock:
+            self._times.extend(times[valid].tolist())
+            self._values.extend(values[valid].tolist())
+
+    def start(self):
+        """Startet mit leerer Schätzung (running schon vor run(), damit ein sofortiges stop() greift)"""
+        with self._lock:
+            self._times = []
+            self._values = []
+            self._reset_pending = True
+        self.running = True
+        super().start()
+
+    def run(self):
+        resampler = None
+        welch = None
+        period = 0.0
+        estimated = False
+        pending_times = np.empty(0)
+        pending_values = np.empty(0)
+        logger.info("Spektrum-Worker gestartet")
+        while self.running:
+            self.msleep(int(1000 / self.update_rate))
+            with self._lock:
+                times, self._times = self._times, []
+                values, self._values = self._values, []
+                if self._reset_pending:
+                    self._reset_pending = False
+                    code, period = self.code, self.period
+                    estimated = not period
+                    resampler = UniformResampler(period) if period else None
+                    welch = IncrementalWelch(self.segment_length)
+                    pending_times = np.empty(0)
+                    pending_values = np.empty(0)
+            if not times:
+                continue
+            times = np.asarray(times, dtype=np.float64)
+            values = np.asarray(values, dtype=np.float64)
+
+            if resampler is None:
+                # Ohne feste Abtastperiode: Median der Abstände der ersten Abtastungen
+                pending_times = np.concatenate((pending_times, times))
+                pending_values = np.concatenate((pending_values, values))
+                if len(pending_times) < PERIOD_ESTIMATE_SAMPLES:
+                    continue
+                period = float(np.median(np.diff(pending_times)))
+                if period <= 0:
+                    pending_times = pending_times[-1:]
+                    pending_values = pending_values[-1:]
+                    continue
+                resampler = UniformResampler(period)
+                times, values = pending_times, pending_values
+                pending_times = pending_values = np.empty(0)
+
+            samples, restarted = resampler.add(times, values)
+            if restarted:
+                welch.discard_pending()
+            welch.add(samples)
+            if not welch.segments:
+                continue
+            sample_rate = 1.0 / period
+            freqs, psd = welch.psd(sample_rate)
+            self.spectrum_updated.emit(freqs, psd, {
+                'code': code,
+                'sample_rate': sample_rate,
+                'resolution': sample_rate / welch.segment_length,
+                'segments': welch.segments,
+                'peak': peak_frequency(freqs, psd),
+                'estimated': estimated,
+            })
+        logger.info("Spektrum-Worker beendet")
+
+    def stop(self):
+        self.running = False
+        self.wait()